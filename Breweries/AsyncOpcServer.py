@@ -0,0 +1,278 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import asyncio
+import datetime
+import threading
+
+#########################################################################
+# OPC UA asyncio Library provided by - https://github.com/FreeOpcUa/opcua-asyncio (optional)
+try:
+    from asyncua import sync as uasync, ua
+except ImportError:
+    uasync = None
+    ua = None
+#########################################################################
+
+# Python conversion of the values written to a variable of the variant type, i.e. an integer to a Double variable
+Conversions = {"Boolean": bool, "Double": float, "Float": float, "Int16": int, "Int32": int, "Int64": int,
+               "UInt16": int, "UInt32": int, "UInt64": int, "String": str}
+
+def variant(Value, VariantType):
+    """
+    variant - Returns the Variant of a value for a variable of VariantType, the value is converted to the variant
+              type when it can be, otherwise its own type is kept (and the write is refused by the server)
+    """
+    if VariantType is None:
+        return ua.Variant(Value)
+    conversion = Conversions.get(VariantType.name)
+    try:
+        return ua.Variant(conversion(Value) if conversion is not None else Value, VariantType)
+    except (ValueError, TypeError):
+        return ua.Variant(Value)
+
+class AsyncOpcNode:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used for an object node of the address space of an AsyncOpcServer, with the node methods of
+    python-opcua used to build the address space of the simulator (add_object, add_variable, get_children,
+    get_child).
+
+    Attributes
+    ----------
+
+    Server (AsyncOpcServer of the node)
+    Node (asyncua SyncNode)
+    nodeid (NodeId of the node)
+
+    """
+
+    # Class Constructor
+    def __init__(self, Server, Node):
+
+        self.Server = Server
+        self.Node = Node
+        self.nodeid = Node.nodeid
+
+    def add_object(self, Namespace, Name):
+
+        return AsyncOpcNode(self.Server, self.Node.add_object(Namespace, Name))
+
+    # VariantType is a python-opcua or asyncua VariantType, both are matched by name
+    def add_variable(self, Namespace, Name, Value, VariantType=None):
+
+        variantType = ua.VariantType[VariantType.name] if VariantType is not None else None
+        return AsyncOpcVariable(self.Server, self.Node.add_variable(Namespace, Name, variant(Value, variantType)), variantType, Value)
+
+    def get_children(self):
+
+        return [AsyncOpcNode(self.Server, child) for child in self.Node.get_children()]
+
+    # Variables are returned as the AsyncOpcVariable they were added as, so their values can be set
+    def get_child(self, Path):
+
+        child = self.Node.get_child(Path)
+        variable = self.Server.Variables.get(child.nodeid)
+        return variable if variable is not None else AsyncOpcNode(self.Server, child)
+
+class AsyncOpcVariable(AsyncOpcNode):
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used for a variable node of an AsyncOpcServer. set_value() does not write the value, it is only
+    collected in the batch of the scan, written on the event loop of the server once the scan calls Flush().
+
+    Attributes
+    ----------
+
+    VariantType (asyncua VariantType of the variable, None to keep the type of the values)
+
+    """
+
+    # Class Constructor
+    def __init__(self, Server, Node, VariantType, Value):
+
+        super().__init__(Server, Node)
+        self.VariantType = VariantType
+        Server.Values[self.nodeid] = Value
+        Server.Variables[self.nodeid] = self
+
+    def set_value(self, Value):
+
+        self.Server.Write(self.nodeid, self.VariantType, Value)
+
+    # Last value written by the simulation, it may not be written to the address space yet
+    def get_value(self):
+
+        return self.Server.Values[self.nodeid]
+
+class AsyncOpcServer:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to serve the simulator address space with asyncua, the asyncio implementation of python-opcua.
+    The server runs on an asyncio event loop on its own thread, where the sessions, reads and subscriptions of
+    the OPC UA Clients are served. The simulation scan keeps its own thread and never waits for the server:
+    set_value() only collects the changed values of the scan, and Flush() hands the whole batch over to the
+    event loop at once, where a single writer task writes them to the address space (and so to the
+    subscriptions) with the time of the scan as SourceTimestamp. When the event loop falls behind, a value
+    changed again before it was written only keeps its latest value (counted in Coalesced).
+
+    It supports the subset of the python-opcua Server API used by the simulator, so the address space is built
+    the same way with both servers. OPC UA HistoryRead is not supported.
+
+    Attributes
+    ----------
+
+    Server (asyncua sync Server, the asyncio Server and its event loop thread)
+    Values (Dictionary of NodeId to the last value written by the simulation)
+    Variables (Dictionary of NodeId to AsyncOpcVariable)
+    Batches (Number of batches handed over to the event loop)
+    Written (Number of values written to the address space)
+    Coalesced (Number of values replaced by a newer value before they were written)
+    WriteErrors (Number of values refused by the address space, i.e. a string written to a Double variable)
+
+    Methods
+    -------
+
+    __init__(self) - Class Constructor
+    set_endpoint, set_server_name, set_security_policy, register_namespace, get_objects_node - as python-opcua
+    start(self) - starts the server and the writer task on the event loop
+    stop(self) - stops the writer task, the server and its event loop
+    Write(self, NodeId, VariantType, Value) - adds a value to the batch of the scan when it changed
+    Flush(self) - hands the batch of the scan over to the event loop
+
+    """
+
+    # Class Constructor
+    def __init__(self):
+
+        if uasync is None:
+            raise ImportError("The asyncua OPC UA server requires asyncua, install it with: pip3 install asyncua")
+
+        self.Server = uasync.Server()
+        self.Values = {}
+        self.Variables = {}
+        self.Batches = 0
+        self.Written = 0
+        self.Coalesced = 0
+        self.WriteErrors = 0
+        self._batch = {}
+        self._batchTime = None
+        self._pending = {}
+        self._lock = threading.Lock()
+        self._signalled = False
+        self._wake = None
+        self._writerTask = None
+
+    def set_endpoint(self, Url):
+
+        self.Server.set_endpoint(Url)
+
+    def set_server_name(self, Name):
+
+        self.Server.set_server_name(Name)
+
+    # Policies are python-opcua or asyncua SecurityPolicyType, both are matched by name
+    def set_security_policy(self, Policies):
+
+        self.Server.set_security_policy([ua.SecurityPolicyType[policy.name] for policy in Policies])
+
+    def register_namespace(self, Uri):
+
+        return self.Server.register_namespace(Uri)
+
+    def get_objects_node(self):
+
+        return AsyncOpcNode(self, self.Server.nodes.objects)
+
+    def start(self):
+
+        self.Server.start()
+        self.Server.tloop.post(self._startWriter())
+
+    def stop(self):
+
+        if self._writerTask is not None:
+            self.Server.tloop.post(self._stopWriter())
+        self.Server.stop()
+
+    async def _startWriter(self):
+
+        self._wake = asyncio.Event()
+        self._writerTask = asyncio.ensure_future(self._writer())
+
+    async def _stopWriter(self):
+
+        self._writerTask.cancel()
+        self._writerTask = None
+
+    # Writes the batches to the address space, one batch at a time so values are written in scan order
+    async def _writer(self):
+
+        aspace = self.Server.aio_obj.iserver.aspace
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            with self._lock:
+                pending = self._pending
+                self._pending = {}
+                self._signalled = False
+
+            now = datetime.datetime.now(datetime.timezone.utc)
+            for nodeid, [variantType, value, sourceTime] in pending.items():
+                datavalue = ua.DataValue(variant(value, variantType), SourceTimestamp=sourceTime, ServerTimestamp=now)
+                status = await aspace.write_attribute_value(nodeid, ua.AttributeIds.Value, datavalue)
+                if not status.is_good():
+                    self.WriteErrors = self.WriteErrors + 1
+            self.Written = self.Written + len(pending)
+
+    def Write(self, NodeId, VariantType, Value):
+
+        if self.Values[NodeId] != Value:
+            # The values of the scan are time stamped with the time of its first value, like python-opcua does
+            if not self._batch:
+                self._batchTime = datetime.datetime.now(datetime.timezone.utc)
+            self.Values[NodeId] = Value
+            self._batch[NodeId] = [VariantType, Value]
+
+    def Flush(self):
+
+        if (not self._batch) or (self._wake is None):
+            return
+
+        batch = self._batch
+        self._batch = {}
+        sourceTime = self._batchTime
+        with self._lock:
+            pending = self._pending
+            for nodeid, [variantType, value] in batch.items():
+                if nodeid in pending:
+                    self.Coalesced = self.Coalesced + 1
+                pending[nodeid] = [variantType, value, sourceTime]
+            signal = not self._signalled
+            self._signalled = True
+
+        if signal:
+            self.Server.tloop.loop.call_soon_threadsafe(self._wake.set)
+        self.Batches = self.Batches + 1
@@ -12,16 +12,15 @@
 # ---------------------------------------------------------------------------
 # Imports
 # ---------------------------------------------------------------------------
-import datetime
-import random
 from random import randint, choice
 from Motor import Motor
 from Timer import Timer
 from Valve import Valve
 from pidLoop import pidLoop
-from GlobalVariables import NewStateEnum, NewStatusEnum, UtilizationList, UtilizationStateList
+from StateMachine import StateMachine
+from GlobalVariables import NewStateEnum, NewStatusEnum, CommandEnum
 
-class BoilKettle:   
+class BoilKettle(StateMachine):
 
     """
     The Boil Kettle is a brewhouse vessel where wort is boiled and reduced for approximately 60 to 90 minutes. During boil, 
@@ -99,9 +98,15 @@ class BoilKettle:
     
     __init__(self, EquipmentName) - Class Constructor
     Run(self) - method to simulate equipment data
+    StartAction(self) - run when the start command is accepted
+    StateX(self) - run every scan in state X, registered in StateHandlers
+    PhaseX(self) - run every scan in phase X while Running, registered in PhaseHandlers
 
     """ 
 
+    # Attributes changed by the runtime configuration, see RuntimeConfig
+    Tunables = ("PerformanceTargetPercent",)
+
     # Class Constructor
     def __init__(self, EquipmentName):
 
@@ -174,247 +179,11 @@ class BoilKettle:
     # Run method to simulate equipment data 
     def Run(self):                   
 
-        if self.StartCmd:
-            self.StartCmd = False
-            if self.NewState == NewStateEnum.Ready:
-                # Measures passed from upstream Mash Asset
-                self.MaterialID = "{0}{1}".format("Brewed Wort ", self.Next_ItemID)
-                self.Prod_BrewedWort_Item = self.MaterialID
-                self.ProductionID = self.Next_ProductionID
-
-                self.DownStream_ItemID = self.Next_ItemID
-                self.DownStream_ProductionID = self.ProductionID
-
-                uniquePre = choice(self.HopsNames)
-
-                now = datetime.datetime.now()
-                self.Prod_BrewedWort_ToLot = "{0}{1}{2}".format("BW-", self.EquipmentName[-3], now.strftime("%m%d%S%M")) 
-                self.Cons_Hops_Item = "{0}{1}".format(uniquePre," Hops")                   
-                self.Cons_Hops_FromLot = "{0}{1}{2}".format("HL-A", self.EquipmentName[-3], now.strftime("%d%M%S%m"))
-
-                self.NewState = NewStateEnum.Running
-
-        if self.RestartCmd:
-            self.RestartCmd = False
-            if self.NewState == NewStateEnum.Paused:
-                self.NewState = NewStateEnum.Running
-
-        if self.StopCmd:
-            self.StopCmd = False
-            if self.NewState == NewStateEnum.Running:
-                self.NewState = NewStateEnum.Paused
-
-        if self.EStopCmd:        
-            if self.NewState == NewStateEnum.Running:
-                self.NewState = NewStateEnum.Paused
-
-        if self.ResetCmd:    
-            self.ResetCmd = False    
-            if self.NewState == NewStateEnum.Done or self.NewState == NewStateEnum.Aborted:
-                self.NewState = NewStateEnum.Ready
-
-        if self.AbortCmd:
-            self.AbortCmd = False
-            if self.NewState == NewStateEnum.Paused:
-                self.NewState = NewStateEnum.Aborted
-
-        match self.NewState:
-
-            case NewStateEnum.Aborted:                
-                self.BrewedWortPV = 0.0
-                self.HoldTime.Enabled = False
-                self.HopsPV = 0.0
-                self.HopsAuger.CmdStart = False
-                self.InletValve.CmdOpen = False
-                self.OutletPump.CmdStart = False
-                self.OutletValve.CmdOpen = False
-                self.ShipComplete = False
-                self.AllowMashWort = False
-                self.SteamValve.CmdOpen = False
-                self.TemperaturePV = self.TemperatureSafe
-                self.WortPV = 0.0
-                self.WortSP = 5000.0
-
-            case NewStateEnum.Done:                
-                self.SteamValve.CmdOpen = False
-                self.OutletPump.CmdStart = False
-                self.OutletValve.CmdOpen = False
-                self.HoldTime.Enabled = False
-                self.ShipComplete = True
-                self.HoldTime.RST = True
-                self.ReadyOS = False
-
-                self.SettleTime.Enabled = True
-                if (self.SettleTime.DN):
-
-                    self.SettleTime.Enabled = False
-                    self.SettleTime.RST = True                                        
-
-                    self.NewState = NewStateEnum.Ready
-                    self.NewStatus = NewStatusEnum.Idle
-
-            case NewStateEnum.Paused:                 
-                self.HopsAuger.CmdStart = False
-                self.InletValve.CmdOpen = False
-                self.OutletPump.CmdStart = False
-                self.OutletValve.CmdOpen = False
-                self.SteamValve.CmdOpen = False
-                self.HoldTime.Enabled = False
-                self.CheckDownTime.Enabled = False
-
-                if (self.WortPV > 100) and (self.Scrap < self.WortPV):
-                    self.newScrap = self.WortPV * 0.00001
-                    self.Scrap = round(self.Scrap + self.newScrap, 2)
-
-                self.DownTime.Enabled = True
-                if (self.DownTime.DN):
-                    self.RestartCmd = True
-                    self.UtilizationState = "Runtime"
-                    self.Utilization = "Running (Normal)"
-                    self.DownTime.RST = True
-
-            case NewStateEnum.Ready:
-                self.NewStatus = NewStatusEnum.Idle
-
-                if (not self.ReadyOS):
-                    # Reset inital values for next production run
-                    self.ReadyOS = True
-                    self.SettleTime.RST = False
-                    self.SettleTime.PT = randint(10,25) 
-                    self.TemperatureSP = 100
-                    self.TemperaturePV = self.TemperatureSafe
-                    self.ScanDelta = 0.81
-                    self.HoldTime.RST = True                    
-                    self.BrewedWortPV = 0.0
-                    self.HopsSP = 75.0
-                    self.HopsPV = 0.0
-                    self.LevelPV = 0.0
-                    self.Scrap = 0.0
-                    self.newScrap = 0.0
-                    self.Cons_Wort_Item = ""
-                    self.Cons_Wort_FromLot = ""
-                    self.Prod_BrewedWort_ToLot = ""
-                    self.Prod_BrewedWort_Item = ""
-                    self.Cons_Hops_FromLot = ""
-                    self.Cons_Hops_Item = ""
-                    self.ProductionID = ""
-                    self.MaterialID = ""
-                    self.HopsAuger.CmdStart = False
-                    self.InletValve.CmdOpen = False
-                    self.OutletPump.CmdStart = False
-                    self.OutletValve.CmdOpen = False
-                    self.ShipComplete = False
-                    self.AllowMashWort = True
-                    self.SteamValve.CmdOpen = False                    
-                    self.WortPV = 0.0
-                    self.WortSP = 5000.0
-
-                    self.HoldTime.PT = randint(6,11) * 60                                       
-
-            case NewStateEnum.Running:
-
-                match self.NewStatus:
-
-                    case NewStatusEnum.Idle:
-                        self.ReadyOS = False
-                        self.NewStatus = NewStatusEnum.Filling
-
-                    case NewStatusEnum.Filling:
-                        # Ramp up the Wort
-                        if (self.MashShipComplete):
-                            self.WortSP = self.WortPV
-                            self.InletValve.CmdOpen = False
-                            self.WortLoss = (self.HopsPV * 0.833) / self.WortPV
-                            self.AllowMashWort = False
-                        else:
-                            self.InletValve.CmdOpen = True
-                            self.TemperaturePV = 150.0
-
-                        # Setup Hops levels to dynamically fill based on amount of wort in tank 
-                        self.HopsSP = round(self.WortPV * 0.02, 2)
-                        if (self.MashShipComplete):
-                            if (self.HopsPV <= self.HopsSP):
-                                self.HopsAuger.CmdStart = True
-                                self.HopsPV = round(self.HopsPV + ((self.ScanTime/100) * 0.57), 2)
-                                if (self.TemperaturePV > self.TemperatureSafe):
-                                    self.TemperaturePV = round(self.TemperaturePV - ((self.ScanTime/100) * 1.7139), 2)
-
-                        if (self.MashShipComplete) and (self.HopsPV >= self.HopsSP):
-                            self.HopsAuger.CmdStart = False
-
-                            if (self.HoldTime.PT <= 0):
-                                self.HoldTime.PT = self.BrewTime
-
-                            # Initiate next phase
-                            self.TemperatureSP = 212
-                            self.NewStatus = NewStatusEnum.RampingUp
-
-                    case NewStatusEnum.RampingUp:
-                        # Ramp up the Temperature
-                        self.SteamValve.CmdOpen = True
-
-                        if (self.TemperaturePV >= self.TemperatureSP):
-                            self.SteamValve.CmdOpen = False
-                            self.NewStatus = NewStatusEnum.Holding
-                            self.HoldTime.RST = False
-
-                    case NewStatusEnum.Holding:
-                        self.HoldTime.Enabled = True
-
-                        if (self.TemperaturePV < (self.TemperatureSP - 2.1)):
-                            self.SteamValve.CmdOpen = True
-
-                        if (self.TemperaturePV >= self.TemperatureSP):
-                            self.SteamValve.CmdOpen = False                        
-
-                        if (self.HoldTime.DN and self.FermenterReady):
-                            self.HoldTime.Enabled = False
-                            self.NewStatus = NewStatusEnum.Draining 
-
-                    case NewStatusEnum.Draining:
-                        # Drain the Wort
-                        self.SteamValve.CmdOpen = False
-
-                        if (self.WortPV >= 0.0):
-                            self.WortPV = round(self.WortPV - ((self.ScanTime/100) * 2.0), 2)
-
-                            # Show a little loss on transfer
-                            self.BrewedWortPV = round(self.BrewedWortPV + ((self.ScanTime/100) * 2.0) - self.WortLoss * 2.0, 2)
-                            self.OutletValve.CmdOpen = True
-                            self.OutletPump.CmdStart = True
-                        else:
-                            self.OutletValve.CmdOpen = False
-                            self.OutletPump.CmdStart = False
-                            self.ShipComplete = True
-                            self.NewState = NewStateEnum.Done
-
-                # Check for a downtime condition while running once every minute
-                self.CheckDownTime.RST = False
-                self.CheckDownTime.Enabled = True
-                if (self.CheckDownTime.DN) and (self.NewStatus != NewStatusEnum.Filling) and (self.NewStatus != NewStatusEnum.Draining):
-                    dtNow = datetime.datetime.now()
-                    random.seed(int(self.EquipmentName[-3]) + int(dtNow.strftime("%f")))
-                    dtTest = random.random()
-                    self.CheckDownTime.RST = True
-
-                    if (dtTest > (self.PerformanceTargetPercent/100)):
-                        # Downtime has occured, put system into pause and randomize downtime timer
-                        self.StopCmd = True  
-                        dtMin = randint(97,121)
-                        dtMax = randint(173,600)
-                        self.DownTime.PT = randint(dtMin,dtMax) 
-                        self.DownTime.RST = False                       
-
-                        # Assign a random dowtime for the asset
-                        self.UtilizationState = choice(UtilizationStateList)
-
-                        match self.UtilizationState:
-                            case "Demand":
-                                self.Utilization = UtilizationList[randint(0,2)]
-                            case "Downtime":
-                                self.Utilization = UtilizationList[randint(3,8)]
-                            case "Maintenance":
-                                self.Utilization = UtilizationList[randint(9,10)]                
+        # Commands are only evaluated when one is set
+        if self.Commands:
+            self.RunCommands()
+
+        self.RunState()
 
         # Emulate a PI Loop
         if (self.NewState != NewStateEnum.Paused):
@@ -446,4 +215,213 @@ class BoilKettle:
         self.InletValve.Run()
         self.OutletValve.Run()  
         self.SteamValve.Run()  
-        self.OutletPump.Run()
\ No newline at end of file
+        self.OutletPump.Run()
+
+    # Command actions
+
+    def StartAction(self):
+        # Measures passed from upstream Mash Asset
+        self.MaterialID = "{0}{1}".format("Brewed Wort ", self.Next_ItemID)
+        self.Prod_BrewedWort_Item = self.MaterialID
+        self.ProductionID = self.Next_ProductionID
+
+        self.DownStream_ItemID = self.Next_ItemID
+        self.DownStream_ProductionID = self.ProductionID
+
+        uniquePre = choice(self.HopsNames)
+
+        self.Prod_BrewedWort_ToLot = self.LotNumbers.Next("BW-", self.EquipmentName[-3])
+        self.Cons_Hops_Item = "{0}{1}".format(uniquePre," Hops")
+        self.Cons_Hops_FromLot = self.LotNumbers.Next("HL-", self.EquipmentName[-3])
+
+    # State handlers
+
+    def StateAborted(self):
+        self.BrewedWortPV = 0.0
+        self.HoldTime.Enabled = False
+        self.HopsPV = 0.0
+        self.HopsAuger.CmdStart = False
+        self.InletValve.CmdOpen = False
+        self.OutletPump.CmdStart = False
+        self.OutletValve.CmdOpen = False
+        self.ShipComplete = False
+        self.AllowMashWort = False
+        self.SteamValve.CmdOpen = False
+        self.TemperaturePV = self.TemperatureSafe
+        self.WortPV = 0.0
+        self.WortSP = 5000.0
+
+    def StateDone(self):
+        self.SteamValve.CmdOpen = False
+        self.OutletPump.CmdStart = False
+        self.OutletValve.CmdOpen = False
+        self.HoldTime.Enabled = False
+        self.ShipComplete = True
+        self.HoldTime.RST = True
+        self.ReadyOS = False
+
+        self.SettleTime.Enabled = True
+        if (self.SettleTime.DN):
+
+            self.SettleTime.Enabled = False
+            self.SettleTime.RST = True
+
+            self.NewState = NewStateEnum.Ready
+            self.NewStatus = NewStatusEnum.Idle
+
+    def StatePaused(self):
+        self.HopsAuger.CmdStart = False
+        self.InletValve.CmdOpen = False
+        self.OutletPump.CmdStart = False
+        self.OutletValve.CmdOpen = False
+        self.SteamValve.CmdOpen = False
+        self.HoldTime.Enabled = False
+        self.CheckDownTime.Enabled = False
+
+        if (self.WortPV > 100) and (self.Scrap < self.WortPV):
+            self.newScrap = self.WortPV * 0.00001
+            self.Scrap = round(self.Scrap + self.newScrap, 2)
+
+        self.WaitForDowntime()
+
+    def StateReady(self):
+        self.NewStatus = NewStatusEnum.Idle
+
+        if (not self.ReadyOS):
+            # Reset inital values for next production run
+            self.ReadyOS = True
+            self.SettleTime.RST = False
+            self.SettleTime.PT = randint(10,25)
+            self.TemperatureSP = 100
+            self.TemperaturePV = self.TemperatureSafe
+            self.ScanDelta = 0.81
+            self.HoldTime.RST = True
+            self.BrewedWortPV = 0.0
+            self.HopsSP = 75.0
+            self.HopsPV = 0.0
+            self.LevelPV = 0.0
+            self.Scrap = 0.0
+            self.newScrap = 0.0
+            self.Cons_Wort_Item = ""
+            self.Cons_Wort_FromLot = ""
+            self.Prod_BrewedWort_ToLot = ""
+            self.Prod_BrewedWort_Item = ""
+            self.Cons_Hops_FromLot = ""
+            self.Cons_Hops_Item = ""
+            self.ProductionID = ""
+            self.MaterialID = ""
+            self.HopsAuger.CmdStart = False
+            self.InletValve.CmdOpen = False
+            self.OutletPump.CmdStart = False
+            self.OutletValve.CmdOpen = False
+            self.ShipComplete = False
+            self.AllowMashWort = True
+            self.SteamValve.CmdOpen = False
+            self.WortPV = 0.0
+            self.WortSP = 5000.0
+
+            self.HoldTime.PT = randint(6,11) * 60
+
+    def StateRunning(self):
+        self.RunPhase()
+
+        # Check for a downtime condition while running once every minute
+        self.CheckForDowntime()
+
+    # Phase handlers (while Running)
+
+    def PhaseIdle(self):
+        self.ReadyOS = False
+        self.NewStatus = NewStatusEnum.Filling
+
+    def PhaseFilling(self):
+        # Ramp up the Wort
+        if (self.MashShipComplete):
+            self.WortSP = self.WortPV
+            self.InletValve.CmdOpen = False
+            self.WortLoss = (self.HopsPV * 0.833) / self.WortPV
+            self.AllowMashWort = False
+        else:
+            self.InletValve.CmdOpen = True
+            self.TemperaturePV = 150.0
+
+        # Setup Hops levels to dynamically fill based on amount of wort in tank
+        self.HopsSP = round(self.WortPV * 0.02, 2)
+        if (self.MashShipComplete):
+            if (self.HopsPV <= self.HopsSP):
+                self.HopsAuger.CmdStart = True
+                self.HopsPV = round(self.HopsPV + ((self.ScanTime/100) * 0.57), 2)
+                if (self.TemperaturePV > self.TemperatureSafe):
+                    self.TemperaturePV = round(self.TemperaturePV - ((self.ScanTime/100) * 1.7139), 2)
+
+        if (self.MashShipComplete) and (self.HopsPV >= self.HopsSP):
+            self.HopsAuger.CmdStart = False
+
+            if (self.HoldTime.PT <= 0):
+                self.HoldTime.PT = self.BrewTime
+
+            # Initiate next phase
+            self.TemperatureSP = 212
+            self.NewStatus = NewStatusEnum.RampingUp
+
+    def PhaseRampingUp(self):
+        # Ramp up the Temperature
+        self.SteamValve.CmdOpen = True
+
+        if (self.TemperaturePV >= self.TemperatureSP):
+            self.SteamValve.CmdOpen = False
+            self.NewStatus = NewStatusEnum.Holding
+            self.HoldTime.RST = False
+
+    def PhaseHolding(self):
+        self.HoldTime.Enabled = True
+
+        if (self.TemperaturePV < (self.TemperatureSP - 2.1)):
+            self.SteamValve.CmdOpen = True
+
+        if (self.TemperaturePV >= self.TemperatureSP):
+            self.SteamValve.CmdOpen = False
+
+        if (self.HoldTime.DN and self.FermenterReady):
+            self.HoldTime.Enabled = False
+            self.NewStatus = NewStatusEnum.Draining
+
+    def PhaseDraining(self):
+        # Drain the Wort
+        self.SteamValve.CmdOpen = False
+
+        if (self.WortPV >= 0.0):
+            self.WortPV = round(self.WortPV - ((self.ScanTime/100) * 2.0), 2)
+
+            # Show a little loss on transfer
+            self.BrewedWortPV = round(self.BrewedWortPV + ((self.ScanTime/100) * 2.0) - self.WortLoss * 2.0, 2)
+            self.OutletValve.CmdOpen = True
+            self.OutletPump.CmdStart = True
+        else:
+            self.OutletValve.CmdOpen = False
+            self.OutletPump.CmdStart = False
+            self.ShipComplete = True
+            self.NewState = NewStateEnum.Done
+
+    CommandActions = {
+        CommandEnum.Start: StartAction
+    }
+
+    # The Boil Kettle is not put into downtime while transferring wort
+    DowntimeExcluded = (NewStatusEnum.Filling, NewStatusEnum.Draining)
+
+    StateHandlers = {
+        NewStateEnum.Aborted: StateAborted,
+        NewStateEnum.Done: StateDone,
+        NewStateEnum.Paused: StatePaused,
+        NewStateEnum.Ready: StateReady,
+        NewStateEnum.Running: StateRunning
+    }
+
+    PhaseHandlers = {
+        NewStatusEnum.Idle: PhaseIdle,
+        NewStatusEnum.Filling: PhaseFilling,
+        NewStatusEnum.RampingUp: PhaseRampingUp,
+        NewStatusEnum.Holding: PhaseHolding,
+        NewStatusEnum.Draining: PhaseDraining
+    }
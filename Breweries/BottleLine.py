@@ -12,15 +12,14 @@
 # ---------------------------------------------------------------------------
 # Imports
 # ---------------------------------------------------------------------------
-import datetime
-import random
-from random import randint, choice
+from random import randint
 from Motor import Motor
 from Timer import Timer
 from Valve import Valve
-from GlobalVariables import NewStateEnum, NewStatusEnum, UtilizationList, UtilizationStateList
+from StateMachine import StateMachine
+from GlobalVariables import NewStateEnum, NewStatusEnum, CommandEnum
 
-class BottleLine:
+class BottleLine(StateMachine):
 
     """
     Packaging of bottled beer typically involves drawing the product from a holding tank (Bright Tank) and filling it into bottles in a filling machine (filler), 
@@ -87,9 +86,15 @@ class BottleLine:
     
     __init__(self, EquipmentName) - Class Constructor
     Run(self) - method to simulate equipment data
+    StartAction(self) - run when the start command is accepted
+    StateX(self) - run every scan in state X, registered in StateHandlers
+    PhaseX(self) - run every scan in phase X while Running, registered in PhaseHandlers
 
     """    
 
+    # Attributes changed by the runtime configuration, see RuntimeConfig
+    Tunables = ("PerformanceTargetPercent", "SpeedSPRange")
+
     # Class Constructor
     def __init__(self, EquipmentName):
 
@@ -129,6 +134,8 @@ class BottleLine:
         self.BottlesUsed = 0
         self.ScanTime = 100
         self.PerformanceTargetPercent = 98
+        # Range the speed setpoint of every production run is drawn from
+        self.SpeedSPRange = (700, 1051)
         self.AllocatedFrom = -1
         self.ProductionID = ""
         self.Next_ProductionID = ""
@@ -168,271 +175,11 @@ class BottleLine:
     # Run method to simulate equipment data 
     def Run(self):        
 
-        if self.StartCmd:
-            self.StartCmd = False
-            if (self.NewState == NewStateEnum.Ready) and (self.NewStatus == NewStatusEnum.Holding):
-                
-                #                     % in tank       max in tank   oz   oz per bottle
-                self.newMax = int((((self.LevelPV / 100) * 4400) * 128) / 12.6)
-                self.newMin = int(self.newMax * 0.9)
-
-                self.BottleSP = randint(self.newMin, self.newMax)                
-                
-                self.NewState = NewStateEnum.Running
-                self.NewStatus = NewStatusEnum.Draining
-
-        if self.RestartCmd:
-            self.RestartCmd = False
-            if self.NewState == NewStateEnum.Paused:
-                self.NewState = NewStateEnum.Running
-
-        if self.StopCmd:
-            self.StopCmd = False
-            if self.NewState == NewStateEnum.Running:
-                self.NewState = NewStateEnum.Paused
-
-        if self.EStopCmd:        
-            if self.NewState == NewStateEnum.Running:
-                self.NewState = NewStateEnum.Paused
-
-        if self.ResetCmd:    
-            self.ResetCmd = False    
-            if self.NewState == NewStateEnum.Done or self.NewState == NewStateEnum.Aborted:
-                self.NewState = NewStateEnum.Ready
-                self.NewStatus = NewStatusEnum.Idle
-
-            if (self.NewStatus == NewStatusEnum.Allocated):
-                self.NewStatus = NewStatusEnum.Idle
-
-        if self.AbortCmd:
-            self.AbortCmd = False
-            if self.NewState == NewStateEnum.Paused:
-                self.NewState = NewStateEnum.Aborted
-
-        match self.NewState:
-
-            case NewStateEnum.Aborted:
-                self.SpeedPV = 0.0
-                self.HoldTime.Enabled = False
-                self.ChillWaterValve.CmdOpen = False
-                self.InletValve.CmdOpen = False
-                self.OutletValve.CmdOpen = False
-                self.OutletPump.CmdStart = False                
-
-            case NewStateEnum.Done:     
-                self.SpeedPV = 0.0
-                self.HoldTime.Enabled = False
-                self.ChillWaterValve.CmdOpen = False
-                self.InletValve.CmdOpen = False
-                self.OutletValve.CmdOpen = False
-                self.OutletPump.CmdStart = False                
-                self.ReadyOS = False
-                self.AllocatedFrom = -1
-
-                self.SettleTime.Enabled = True
-                self.SettleTime.RST = False
-                if (self.SettleTime.DN):
-
-                    self.SettleTime.Enabled = False
-                    self.SettleTime.RST = True                                        
-                    
-                    self.NewState = NewStateEnum.Ready
-                    self.NewStatus = NewStatusEnum.Idle
-
-            case NewStateEnum.Paused:
-                self.CheckDownTime.Enabled = False
-
-                if (self.BottlePV > 100) and (self.Scrap < self.BottlePV):
-                    self.newScrap = self.BottlePV * 0.00001
-                    self.Scrap = round(self.Scrap + self.newScrap, 2)
-
-                self.DownTime.Enabled = True
-                self.DownTime.RST = False
-                if (self.DownTime.DN):
-                    self.RestartCmd = True
-                    self.UtilizationState = "Runtime"
-                    self.Utilization = "Running (Normal)"
-                    self.DownTime.RST = True
-
-            case NewStateEnum.Ready:
-
-                # Reset inital values for next production run
-                if (not self.ReadyOS):
-                    self.ReadyOS = True                    
-                    self.SettleTime.RST = False
-                    self.SettleTime.PT = randint(10,25)
-                    self.HoldTime.RST = True
-                    self.FillingOS = False                    
-                    self.Scrap = 0.0                    
-                    self.newScrap = 0.0                    
-                    self.TemperatureSP = 70
-                    self.InletValve.CmdOpen = False
-                    self.OutletValve.CmdOpen = False                    
-                    self.LevelPV = 0.0                    
-                    self.ScanDelta = 1.2
-                    self.ProductionID = ""                    
-                    self.MaterialID = ""                    
-                    self.Cons_Beer_Item = ""
-                    self.Cons_Beer_FromLot = ""
-                    self.Prod_BottledBeer_Item = ""
-                    self.Prod_BottledBeer_ToLot = ""
-                    self.Cons_Bottle_Item = ""
-                    self.Cons_Bottle_FromLot = ""
-                    self.Cons_Cap_Item = ""
-                    self.Cons_Cap_FromLot = ""
-                    self.Cons_Label_Item = ""
-                    self.Cons_Label_FromLot = ""                    
-
-                    self.HoldTime.PT = randint(5,12)
-                
-                self.BottlePV = 0
-                self.BeerShipped = 0
-                self.BottleFraction = 0
-                self.CapFraction = 0
-                self.LabelFraction = 0
-                self.BottlesUsed = 0
-
-                if (self.NewStatus != NewStatusEnum.Filling) and (self.NewStatus != NewStatusEnum.Holding):                    
-                    self.BeerPV = 0.0
-
-                if (self.NewStatus == NewStatusEnum.Filling):
-
-                    if (not self.FillingOS):
-                        self.FillingOS = True                        
-                        # Measures passed from upstream from Storage Tank Asset
-                        self.MaterialID = "{0}{1}".format(self.Next_ItemID, " Bottles")
-                        self.Prod_BottledBeer_Item = self.MaterialID
-                        self.ProductionID = self.Next_ProductionID                
-
-                        now = datetime.datetime.now()
-                        self.Prod_BottledBeer_ToLot = "{0}{1}{2}".format("FB-", self.EquipmentName[-3], now.strftime("%m%d%S%M"))
-
-                        self.Cons_Bottle_Item = "Clean Bottle"
-                        self.Cons_Bottle_FromLot = "{0}{1}".format("BO-A", str(randint(1,10001)).zfill(5))
-
-                        self.Cons_Cap_Item = "12 oz Cap"
-                        self.Cons_Cap_FromLot = "{0}{1}".format("CA-A", str(randint(1,10001)).zfill(5))
-
-                        self.Cons_Label_Item = "Dated Label"
-                        self.Cons_Label_FromLot = "{0}{1}".format("LA-A", str(randint(1,10001)).zfill(5))
-
-                        # Update speed setpoint for variety in production speed
-                        self.SpeedSP = randint(700,1051)                
-
-                    if (self.StorageShipComplete):                        
-                        self.BeerShippedFromStorage = 0.0
-                        self.InletValve.CmdOpen = False                        
-                        self.FillingOS = False                        
-                        self.NewStatus = NewStatusEnum.Holding
-                    else:
-                        self.InletValve.CmdOpen = True
-                        self.BeerPV = round(self.BeerShippedFromStorage, 2)
-                        self.TemperaturePV = 68.0
-
-            case NewStateEnum.Running:
-
-                if (self.LabelJam) or (self.CapperJam) or (self.BottleBroken):
-
-                    if (self.LabelJam):
-                        self.LabelFraction = self.LabelFraction + 1
-
-                    if (self.CapperJam):
-                        self.CapFraction = self.CapFraction + 1
-
-                    if (self.BottleBroken):
-                        self.BottlesUsed = self.BottlesUsed + 1
-
-                    self.NewState = NewStateEnum.Paused
-                else:
-                    self.NewState = NewStateEnum.Running
-
-                match self.NewStatus:
-
-                    case NewStatusEnum.Holding:
-                        self.HoldTime.Enabled = True
-
-                        if (self.TemperaturePV > self.TemperatureSP):
-                            self.ChillWaterValve.CmdOpen = True
-
-                        if (self.TemperaturePV <= self.TemperatureSP):
-                            self.ChillWaterValve.CmdOpen = False
-
-                        if (self.ChillWaterValve.OLS):
-                            self.TemperaturePV = self.TemperaturePV - abs(self.ScanDelta * 0.05) 
-
-                        if (self.ChillWaterValve.CLS):
-                            self.TemperaturePV = self.TemperaturePV + abs(self.ScanDelta * 0.001)                        
-
-                    case NewStatusEnum.Draining:
-
-                        self.ReadyOS = False
-                        
-                        # Temperature Control
-                        if (self.TemperaturePV > self.TemperatureSP):
-                            self.ChillWaterValve.CmdOpen = True
-
-                        if (self.TemperaturePV <= self.TemperatureSP):
-                            self.ChillWaterValve.CmdOpen = False
-
-                        if (self.ChillWaterValve.OLS):
-                            self.TemperaturePV = self.TemperaturePV - abs(self.ScanDelta * 0.05) 
-
-                        if (self.ChillWaterValve.CLS):
-                            self.TemperaturePV = self.TemperaturePV + abs(self.ScanDelta * 0.001)
-
-                        # Drain the Beer
-                        self.OutletValve.CmdOpen = True
-
-                        if (self.BeerPV >= 0.0) and (self.OutletValve.OLS):
-                            self.OutletPump.CmdStart = True
-
-                            self.BottleFraction = round(self.BottleFraction + ((self.SpeedPV/60000) * self.ScanTime), 2)
-                            self.BottlePV = int(self.BottleFraction)
-
-                            self.CapFraction = round(self.CapFraction + ((self.SpeedPV/60000) * self.ScanTime), 2)
-                            self.CapPV = int(self.CapFraction)
-
-                            self.LabelFraction = round(self.LabelFraction + ((self.SpeedPV/60000) * self.ScanTime), 2)
-                            self.LabelPV = int(self.LabelFraction)
-
-                            self.BeerShipped = self.BeerShipped + (((self.SpeedPV/60000 * self.ScanTime) * 0.09375))
-                            self.BeerPV = round(self.BeerPV - ((((self.SpeedPV/60000) * self.ScanTime) * 0.09375) + 0.001137), 2)
-                        else:
-                            self.OutletPump.CmdStart = False
-
-                        if (self.BeerPV <= 0.0):
-                            self.BeerPV = 0.0
+        # Commands are only evaluated when one is set
+        if self.Commands:
+            self.RunCommands()
 
-                        if (self.BottlePV >= self.BottleSP):                            
-                            self.NewState = NewStateEnum.Done
-
-                # Check for a downtime condition while running once every minute
-                self.CheckDownTime.RST = False
-                self.CheckDownTime.Enabled = True
-                if (self.CheckDownTime.DN) and (self.NewStatus != NewStatusEnum.Filling) and (self.NewStatus != NewStatusEnum.Draining):
-                    dtNow = datetime.datetime.now()
-                    random.seed(int(self.EquipmentName[-3]) + int(dtNow.strftime("%f")))
-                    dtTest = random.random()
-                    self.CheckDownTime.RST = True
-
-                    if (dtTest > (self.PerformanceTargetPercent/100)):
-                        # Downtime has occured, put system into pause and randomize downtime timer
-                        self.StopCmd = True  
-                        dtMin = randint(97,121)
-                        dtMax = randint(173,600)
-                        self.DownTime.PT = randint(dtMin,dtMax) 
-                        self.DownTime.RST = False                          
-
-                        # Assign a random dowtime for the asset
-                        self.UtilizationState = choice(UtilizationStateList)
-
-                        match self.UtilizationState:
-                            case "Demand":
-                                self.Utilization = UtilizationList[randint(0,2)]
-                            case "Downtime":
-                                self.Utilization = UtilizationList[randint(3,8)]
-                            case "Maintenance":
-                                self.Utilization = UtilizationList[randint(9,10)]
+        self.RunState()
 
         if (self.BeerShippedFromStorage > 0.0) and (not self.StorageShipComplete):            
             self.NewStatus = NewStatusEnum.Filling
@@ -468,4 +215,237 @@ class BottleLine:
         self.OutletPump.Run()       
         self.InletValve.Run()
         self.OutletValve.Run()
-        self.ChillWaterValve.Run() 
\ No newline at end of file
+        self.ChillWaterValve.Run()
+
+    # Command actions
+
+    def StartAction(self):
+        #                     % in tank       max in tank   oz   oz per bottle
+        self.newMax = int((((self.LevelPV / 100) * 4400) * 128) / 12.6)
+        self.newMin = int(self.newMax * 0.9)
+
+        self.BottleSP = randint(self.newMin, self.newMax)
+
+    # State handlers
+
+    def StateAborted(self):
+        self.SpeedPV = 0.0
+        self.HoldTime.Enabled = False
+        self.ChillWaterValve.CmdOpen = False
+        self.InletValve.CmdOpen = False
+        self.OutletValve.CmdOpen = False
+        self.OutletPump.CmdStart = False
+
+    def StateDone(self):
+        self.SpeedPV = 0.0
+        self.HoldTime.Enabled = False
+        self.ChillWaterValve.CmdOpen = False
+        self.InletValve.CmdOpen = False
+        self.OutletValve.CmdOpen = False
+        self.OutletPump.CmdStart = False
+        self.ReadyOS = False
+        self.AllocatedFrom = -1
+
+        self.SettleTime.Enabled = True
+        self.SettleTime.RST = False
+        if (self.SettleTime.DN):
+
+            self.SettleTime.Enabled = False
+            self.SettleTime.RST = True
+
+            self.NewState = NewStateEnum.Ready
+            self.NewStatus = NewStatusEnum.Idle
+
+    def StatePaused(self):
+        self.CheckDownTime.Enabled = False
+
+        if (self.BottlePV > 100) and (self.Scrap < self.BottlePV):
+            self.newScrap = self.BottlePV * 0.00001
+            self.Scrap = round(self.Scrap + self.newScrap, 2)
+
+        self.DownTime.RST = False
+        self.WaitForDowntime()
+
+    def StateReady(self):
+        # Reset inital values for next production run
+        if (not self.ReadyOS):
+            self.ReadyOS = True
+            self.SettleTime.RST = False
+            self.SettleTime.PT = randint(10,25)
+            self.HoldTime.RST = True
+            self.FillingOS = False
+            self.Scrap = 0.0
+            self.newScrap = 0.0
+            self.TemperatureSP = 70
+            self.InletValve.CmdOpen = False
+            self.OutletValve.CmdOpen = False
+            self.LevelPV = 0.0
+            self.ScanDelta = 1.2
+            self.ProductionID = ""
+            self.MaterialID = ""
+            self.Cons_Beer_Item = ""
+            self.Cons_Beer_FromLot = ""
+            self.Prod_BottledBeer_Item = ""
+            self.Prod_BottledBeer_ToLot = ""
+            self.Cons_Bottle_Item = ""
+            self.Cons_Bottle_FromLot = ""
+            self.Cons_Cap_Item = ""
+            self.Cons_Cap_FromLot = ""
+            self.Cons_Label_Item = ""
+            self.Cons_Label_FromLot = ""
+
+            self.HoldTime.PT = randint(5,12)
+
+        self.BottlePV = 0
+        self.BeerShipped = 0
+        self.BottleFraction = 0
+        self.CapFraction = 0
+        self.LabelFraction = 0
+        self.BottlesUsed = 0
+
+        if (self.NewStatus != NewStatusEnum.Filling) and (self.NewStatus != NewStatusEnum.Holding):
+            self.BeerPV = 0.0
+
+        if (self.NewStatus == NewStatusEnum.Filling):
+
+            if (not self.FillingOS):
+                self.FillingOS = True
+                # Measures passed from upstream from Storage Tank Asset
+                self.MaterialID = "{0}{1}".format(self.Next_ItemID, " Bottles")
+                self.Prod_BottledBeer_Item = self.MaterialID
+                self.ProductionID = self.Next_ProductionID
+
+                self.Prod_BottledBeer_ToLot = self.LotNumbers.Next("FB-", self.EquipmentName[-3])
+
+                self.Cons_Bottle_Item = "Clean Bottle"
+                self.Cons_Bottle_FromLot = "{0}{1}".format("BO-A", str(randint(1,10001)).zfill(5))
+
+                self.Cons_Cap_Item = "12 oz Cap"
+                self.Cons_Cap_FromLot = "{0}{1}".format("CA-A", str(randint(1,10001)).zfill(5))
+
+                self.Cons_Label_Item = "Dated Label"
+                self.Cons_Label_FromLot = "{0}{1}".format("LA-A", str(randint(1,10001)).zfill(5))
+
+                # Update speed setpoint for variety in production speed
+                self.SpeedSP = randint(*self.SpeedSPRange)
+
+            if (self.StorageShipComplete):
+                self.BeerShippedFromStorage = 0.0
+                self.InletValve.CmdOpen = False
+                self.FillingOS = False
+                self.NewStatus = NewStatusEnum.Holding
+            else:
+                self.InletValve.CmdOpen = True
+                self.BeerPV = round(self.BeerShippedFromStorage, 2)
+                self.TemperaturePV = 68.0
+
+    def StateRunning(self):
+        if (self.LabelJam) or (self.CapperJam) or (self.BottleBroken):
+
+            if (self.LabelJam):
+                self.LabelFraction = self.LabelFraction + 1
+
+            if (self.CapperJam):
+                self.CapFraction = self.CapFraction + 1
+
+            if (self.BottleBroken):
+                self.BottlesUsed = self.BottlesUsed + 1
+
+            self.NewState = NewStateEnum.Paused
+        else:
+            self.NewState = NewStateEnum.Running
+
+        self.RunPhase()
+
+        # Check for a downtime condition while running once every minute
+        self.CheckForDowntime()
+
+    # Phase handlers (while Running)
+
+    def PhaseHolding(self):
+        self.HoldTime.Enabled = True
+
+        if (self.TemperaturePV > self.TemperatureSP):
+            self.ChillWaterValve.CmdOpen = True
+
+        if (self.TemperaturePV <= self.TemperatureSP):
+            self.ChillWaterValve.CmdOpen = False
+
+        if (self.ChillWaterValve.OLS):
+            self.TemperaturePV = self.TemperaturePV - abs(self.ScanDelta * 0.05)
+
+        if (self.ChillWaterValve.CLS):
+            self.TemperaturePV = self.TemperaturePV + abs(self.ScanDelta * 0.001)
+
+    def PhaseDraining(self):
+        self.ReadyOS = False
+
+        # Temperature Control
+        if (self.TemperaturePV > self.TemperatureSP):
+            self.ChillWaterValve.CmdOpen = True
+
+        if (self.TemperaturePV <= self.TemperatureSP):
+            self.ChillWaterValve.CmdOpen = False
+
+        if (self.ChillWaterValve.OLS):
+            self.TemperaturePV = self.TemperaturePV - abs(self.ScanDelta * 0.05)
+
+        if (self.ChillWaterValve.CLS):
+            self.TemperaturePV = self.TemperaturePV + abs(self.ScanDelta * 0.001)
+
+        # Drain the Beer
+        self.OutletValve.CmdOpen = True
+
+        if (self.BeerPV >= 0.0) and (self.OutletValve.OLS):
+            self.OutletPump.CmdStart = True
+
+            self.BottleFraction = round(self.BottleFraction + ((self.SpeedPV/60000) * self.ScanTime), 2)
+            self.BottlePV = int(self.BottleFraction)
+
+            self.CapFraction = round(self.CapFraction + ((self.SpeedPV/60000) * self.ScanTime), 2)
+            self.CapPV = int(self.CapFraction)
+
+            self.LabelFraction = round(self.LabelFraction + ((self.SpeedPV/60000) * self.ScanTime), 2)
+            self.LabelPV = int(self.LabelFraction)
+
+            self.BeerShipped = self.BeerShipped + (((self.SpeedPV/60000 * self.ScanTime) * 0.09375))
+            self.BeerPV = round(self.BeerPV - ((((self.SpeedPV/60000) * self.ScanTime) * 0.09375) + 0.001137), 2)
+        else:
+            self.OutletPump.CmdStart = False
+
+        if (self.BeerPV <= 0.0):
+            self.BeerPV = 0.0
+
+        if (self.BottlePV >= self.BottleSP):
+            self.NewState = NewStateEnum.Done
+
+    CommandActions = {
+        CommandEnum.Start: StartAction
+    }
+
+    # The Bottle Line is only started once the beer is held in its Bright Tank, a reset also releases the allocation
+    Transitions = (
+        (CommandEnum.Start, (NewStateEnum.Ready,), NewStatusEnum.Holding, NewStateEnum.Running, NewStatusEnum.Draining),
+        StateMachine.Transitions[1],
+        StateMachine.Transitions[2],
+        StateMachine.Transitions[3],
+        (CommandEnum.Reset, (NewStateEnum.Done, NewStateEnum.Aborted), None, NewStateEnum.Ready, NewStatusEnum.Idle),
+        (CommandEnum.Reset, None, NewStatusEnum.Allocated, None, NewStatusEnum.Idle),
+        StateMachine.Transitions[5]
+    )
+
+    # The Bottle Line is not put into downtime while transferring beer
+    DowntimeExcluded = (NewStatusEnum.Filling, NewStatusEnum.Draining)
+
+    StateHandlers = {
+        NewStateEnum.Aborted: StateAborted,
+        NewStateEnum.Done: StateDone,
+        NewStateEnum.Paused: StatePaused,
+        NewStateEnum.Ready: StateReady,
+        NewStateEnum.Running: StateRunning
+    }
+
+    PhaseHandlers = {
+        NewStatusEnum.Holding: PhaseHolding,
+        NewStatusEnum.Draining: PhaseDraining
+    }
@@ -0,0 +1,1349 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# This program benchmarks parts of the Brewery simulation offline, without
+# an AWS account or OPC UA Clients. Every benchmark prints its results as
+# JSON so results can be compared across releases.
+#
+#   python3 BrewSimBenchmark.py mqtt --qos=1 --format=json --scangroup=10
+#   python3 BrewSimBenchmark.py shm
+#   python3 BrewSimBenchmark.py history
+#   python3 BrewSimBenchmark.py run
+#   python3 BrewSimBenchmark.py plant --allocationpolicy=lru
+#   python3 BrewSimBenchmark.py oee --scans=36000
+#   python3 BrewSimBenchmark.py genealogy --days=90
+#   python3 BrewSimBenchmark.py lotnumbers --days=365
+#   python3 BrewSimBenchmark.py opc
+#   python3 BrewSimBenchmark.py opcclients --server=both --clients=0,1,4,8
+#   python3 BrewSimBenchmark.py opcload --sessions=1,2,4,8,16 --items=100
+#   python3 BrewSimBenchmark.py sitewise --interval=5 --reportbyexception=True
+#   python3 BrewSimBenchmark.py --label=release-1.2 --output=release-1.2.json all
+#   python3 BrewSimBenchmark.py compare release-1.1.json release-1.2.json
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import argparse
+import contextlib
+import datetime
+import hashlib
+import json
+import multiprocessing
+import os
+import platform
+import random
+import shutil
+import socketserver
+import sys
+import tempfile
+import threading
+import time
+import types
+from Sink import Tag, Snapshot
+
+class MqttCountingBroker(socketserver.ThreadingTCPServer):
+
+    """
+
+    Class Overview
+    ----------
+
+    A minimal local MQTT 3.1.1 broker used to benchmark the MQTT sink without an external broker. It accepts
+    connections, acknowledges CONNECT, QoS 1 PUBLISH and PINGREQ packets and counts the published messages and
+    payload bytes. Messages are not delivered to subscribers.
+
+    Attributes
+    ----------
+
+    Messages (Number of PUBLISH packets received)
+    Bytes (Number of PUBLISH payload bytes received)
+
+    """
+
+    daemon_threads = True
+    allow_reuse_address = True
+
+    # Class Constructor
+    def __init__(self, Port=0):
+
+        super().__init__(("127.0.0.1", Port), MqttCountingHandler)
+        self.Messages = 0
+        self.Bytes = 0
+        self.Lock = threading.Lock()
+
+class MqttCountingHandler(socketserver.BaseRequestHandler):
+
+    def read(self, count):
+        data = b""
+        while len(data) < count:
+            chunk = self.request.recv(count - len(data))
+            if not chunk:
+                raise ConnectionError()
+            data = data + chunk
+        return data
+
+    def handle(self):
+        try:
+            while True:
+                header = self.read(1)[0]
+                # Remaining length is encoded in up to 4 bytes, 7 bits each
+                length = 0
+                multiplier = 1
+                while True:
+                    byte = self.read(1)[0]
+                    length = length + (byte & 0x7F) * multiplier
+                    multiplier = multiplier * 128
+                    if not (byte & 0x80):
+                        break
+                body = self.read(length)
+
+                match header >> 4:
+                    case 1:
+                        # CONNECT -> CONNACK
+                        self.request.sendall(b"\x20\x02\x00\x00")
+                    case 3:
+                        # PUBLISH -> PUBACK for QoS 1
+                        qos = (header >> 1) & 0x03
+                        topicLength = int.from_bytes(body[0:2], "big")
+                        payloadStart = 2 + topicLength + (2 if qos > 0 else 0)
+                        with self.server.Lock:
+                            self.server.Messages = self.server.Messages + 1
+                            self.server.Bytes = self.server.Bytes + len(body) - payloadStart
+                        if qos > 0:
+                            self.request.sendall(b"\x40\x02" + body[2 + topicLength:4 + topicLength])
+                    case 12:
+                        # PINGREQ -> PINGRESP
+                        self.request.sendall(b"\xd0\x00")
+                    case 14:
+                        # DISCONNECT
+                        return
+        except (ConnectionError, OSError):
+            return
+
+class SimulatedClock:
+
+    """
+
+    Class Overview
+    ----------
+
+    A simulated clock used to run the equipment offline as fast as possible and reproducibly. Install() replaces
+    the clock of the Timers and of the lot numbers, and the datetime.now() of the equipment (used to seed the
+    downtimes) with the simulated time, which only moves with Advance(). With the same random seed, two runs go
+    through exactly the same states and lot numbers.
+
+    Attributes
+    ----------
+
+    Start (Simulated time of the first scan in epoch seconds)
+    Ticks (Number of 100 millisecond scans since Start)
+
+    """
+
+    Modules = ("StateMachine",)
+
+    # Class Constructor
+    def __init__(self, Start=1700000000):
+
+        self.Start = Start
+        self.Ticks = 0
+
+    def time(self):
+
+        return self.Start + self.Ticks / 10
+
+    def now(self):
+
+        return datetime.datetime(1970, 1, 1) + datetime.timedelta(seconds=self.Start, milliseconds=self.Ticks * 100)
+
+    def Advance(self):
+
+        self.Ticks = self.Ticks + 1
+
+    def Install(self):
+
+        import importlib
+        import Timer
+        import LotNumberGenerator
+
+        Timer.time = self
+        LotNumberGenerator.time = self
+        simulatedDatetime = types.SimpleNamespace(datetime=types.SimpleNamespace(now=self.now))
+        for name in self.Modules:
+            importlib.import_module(name).datetime = simulatedDatetime
+
+class FakeSiteWiseClient:
+
+    """
+
+    Class Overview
+    ----------
+
+    A local stand in for the boto3 IoT SiteWise client used to benchmark the SiteWise sink offline. It accepts
+    BatchPutAssetPropertyValue requests, optionally waits Latency seconds like a round trip to the service, and
+    counts the calls, entries and request bytes.
+
+    Attributes
+    ----------
+
+    Latency (Seconds to wait per call)
+    Calls (Number of BatchPutAssetPropertyValue calls)
+    Entries (Number of entries received)
+    Bytes (Number of JSON request bytes received)
+
+    """
+
+    # Class Constructor
+    def __init__(self, Latency=0.0):
+
+        self.Latency = Latency
+        self.Calls = 0
+        self.Entries = 0
+        self.Bytes = 0
+
+    def batch_put_asset_property_value(self, entries):
+
+        self.Calls = self.Calls + 1
+        self.Entries = self.Entries + len(entries)
+        self.Bytes = self.Bytes + len(json.dumps({"entries": entries}))
+        if self.Latency > 0:
+            time.sleep(self.Latency)
+        return {"errorEntries": []}
+
+# Namespace of the OPC UA benchmark address space
+OpcNamespace = "http://brewsim.benchmark"
+
+def environment():
+    """
+    environment - Describes the host of the benchmark, so results are only compared between comparable hosts
+    """
+    return {"python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "processor": platform.processor()}
+
+def summary(values):
+    """
+    summary - Returns the mean, p50, p99 and max of a list of durations in nanoseconds
+    """
+    values = sorted(values)
+    return {"mean_ns": round(sum(values) / len(values), 1),
+            "p50_ns": values[len(values) // 2],
+            "p99_ns": values[int(len(values) * 0.99)],
+            "max_ns": values[-1]}
+
+def clock_overhead(calls=100000):
+    """
+    clock_overhead - Returns the cost in nanoseconds of the perf_counter_ns() pair measuring a call, included in
+                     every duration measured per call
+    """
+    values = []
+    for call in range(calls):
+        start = time.perf_counter_ns()
+        values.append(time.perf_counter_ns() - start)
+    values.sort()
+    return values[len(values) // 2]
+
+def synthetic_tags(assets=18, properties=28):
+    """
+    synthetic_tags - Creates a tag list shaped like the Brewery (18 assets with about 28 properties each,
+                     a third of them strings)
+    """
+    tags = []
+    for asset in range(assets):
+        asset_name = "Asset{0}".format(100 + asset)
+        for prop in range(properties):
+            datatype = "string" if prop % 3 == 0 else "double"
+            property_name = "Property{0}".format(prop)
+            tags.append(Tag("Area", asset_name, property_name, datatype, "/Breweries/IrvinePlant/Area/{0}/{1}".format(asset_name, property_name)))
+    return tags
+
+def synthetic_snapshot(scan, tags, rng):
+    """
+    synthetic_snapshot - Creates a Snapshot with random values for the tag list
+    """
+    values = ["Lot-{0}".format(rng.randint(1, 5)) if tag.DataType == "string" else round(rng.uniform(0, 5000), 2) for tag in tags]
+    return Snapshot(scan, time.time(), values)
+
+def changing_snapshots(scans, tags, rate, rng, start):
+    """
+    changing_snapshots - Creates Snapshots 100 milliseconds apart where only a fraction (rate) of the values
+                         change from one scan to the next, like the values of the plant
+    """
+    values = synthetic_snapshot(0, tags, rng).Values
+    snapshots = []
+    for scan in range(scans):
+        values = list(values)
+        for index, tag in enumerate(tags):
+            if rng.random() < rate:
+                values[index] = "Lot-{0}".format(rng.randint(1, 5)) if tag.DataType == "string" else round(rng.uniform(0, 5000), 2)
+        snapshots.append(Snapshot(scan, start + scan / 10, values))
+    return snapshots
+
+def benchmark_mqtt(args):
+    """
+    benchmark_mqtt - Publishes scans through the MQTT sink to a local broker and measures messages per second
+    """
+    from MqttSink import MqttSink
+
+    broker = None
+    if args.broker == "local":
+        broker = MqttCountingBroker()
+        threading.Thread(target=broker.serve_forever, daemon=True).start()
+        host, port = broker.server_address
+    else:
+        host, port = args.broker.rsplit(":", 1)
+        port = int(port)
+
+    rng = random.Random(args.seed)
+    tags = synthetic_tags()
+    snapshots = [synthetic_snapshot(scan, tags, rng) for scan in range(args.scans)]
+
+    sink = MqttSink(host, port, args.qos, args.format, args.scangroup, QueueSize=args.scans + 1, Policy="block")
+    sink.Start(tags)
+    deadline = time.time() + 10
+    while (not sink.Client.is_connected()) and (time.time() < deadline):
+        time.sleep(0.01)
+
+    start = time.perf_counter()
+    for snapshot in snapshots:
+        sink.Put(snapshot)
+    sink.Stop()
+    elapsed = time.perf_counter() - start
+
+    result = {"benchmark": "mqtt",
+              "broker": args.broker,
+              "qos": args.qos,
+              "format": args.format,
+              "scangroup": args.scangroup,
+              "tags": len(tags),
+              "scans": args.scans,
+              "messages": sink.Messages,
+              "publish_errors": sink.PublishErrors,
+              "seconds": round(elapsed, 4),
+              "messages_per_second": round(sink.Messages / elapsed, 1),
+              "scans_per_second": round(args.scans / elapsed, 1)}
+
+    if broker is not None:
+        result["broker_messages"] = broker.Messages
+        result["broker_bytes"] = broker.Bytes
+        broker.shutdown()
+
+    return result
+
+def shm_reader(path, seconds, results):
+    """
+    shm_reader - Reads the shared tag table in a loop in another process and reports the read cost
+    """
+    from SharedTagTableReader import SharedTagTableReader
+
+    reader = SharedTagTableReader(path)
+    alias = reader.Aliases[1]
+    reads = 0
+    start = time.perf_counter()
+    while (time.perf_counter() - start) < seconds:
+        reader.Read()
+        reads = reads + 1
+    readSeconds = time.perf_counter() - start
+
+    gets = 0
+    start = time.perf_counter()
+    while (time.perf_counter() - start) < seconds:
+        reader.Get(alias)
+        gets = gets + 1
+    getSeconds = time.perf_counter() - start
+
+    results.put({"reads": reads,
+                 "read_us": round(readSeconds / reads * 1e6, 2),
+                 "gets": gets,
+                 "get_us": round(getSeconds / gets * 1e6, 3),
+                 "retries": reader.Retries})
+    reader.Close()
+
+def benchmark_shm(args):
+    """
+    benchmark_shm - Writes scans to the shared tag table while another process reads it, and measures
+                    the cost of a scan write, a consistent full table read and a single tag read
+    """
+    from SharedMemorySink import SharedMemorySink
+
+    rng = random.Random(args.seed)
+    tags = synthetic_tags()
+    snapshots = [synthetic_snapshot(scan, tags, rng) for scan in range(100)]
+
+    sink = SharedMemorySink(args.path)
+    sink.Tags = tags
+    sink.Open()
+    sink.Write(snapshots[0])
+
+    results = multiprocessing.Queue()
+    reader = multiprocessing.Process(target=shm_reader, args=(sink.Path, args.seconds, results))
+    reader.start()
+
+    # Keep writing while the reader is running, so reads race with writes
+    writes = 0
+    start = time.perf_counter()
+    while reader.is_alive() and results.empty():
+        sink.Write(snapshots[writes % len(snapshots)])
+        writes = writes + 1
+        if args.scanrate > 0:
+            time.sleep(1.0 / args.scanrate)
+    elapsed = time.perf_counter() - start
+    readerResults = results.get()
+    reader.join()
+    sink.Close()
+
+    result = {"benchmark": "shm",
+              "tags": len(tags),
+              "writes": writes,
+              "write_us": round(elapsed / writes * 1e6, 2) if args.scanrate == 0 else None,
+              "scanrate": args.scanrate}
+    result.update(readerResults)
+    return result
+
+def benchmark_history(args):
+    """
+    benchmark_history - Writes scans to the tag history and measures the cost of a scan write, and of a
+                        backfill reading the last minutes of every tag (memory and spilled segments)
+    """
+    from HistorySink import HistorySink
+
+    rng = random.Random(args.seed)
+    tags = synthetic_tags()
+    snapshots = [synthetic_snapshot(scan, tags, rng) for scan in range(600)]
+    path = tempfile.mkdtemp(prefix="brewery_history")
+
+    sink = HistorySink(path, 600, args.memoryminutes, args.minutes)
+    sink.Tags = tags
+    sink.Open()
+
+    # Scans are written with simulated times 100 milliseconds apart
+    start = time.perf_counter()
+    startTime = time.time() - args.minutes * 60
+    for scan in range(args.minutes * 600):
+        snapshot = snapshots[scan % len(snapshots)]
+        sink.Write(Snapshot(scan, startTime + scan * 0.1, snapshot.Values))
+    writeSeconds = time.perf_counter() - start
+
+    # Backfill - read the last backfill minutes of every tag
+    endTime = startTime + args.minutes * 60
+    start = time.perf_counter()
+    values = 0
+    for index in range(len(tags)):
+        values = values + len(sink.Read(index, endTime - args.backfillminutes * 60, endTime))
+    readSeconds = time.perf_counter() - start
+
+    diskBytes = sum(os.path.getsize(file_name) for start, end, file_name in sink.Files)
+    shutil.rmtree(path)
+
+    return {"benchmark": "history",
+            "tags": len(tags),
+            "scans": args.minutes * 600,
+            "write_us": round(writeSeconds / (args.minutes * 600) * 1e6, 2),
+            "segments_in_memory": len(sink.Segments),
+            "segments_on_disk": len(sink.Files),
+            "disk_bytes_per_segment": int(diskBytes / len(sink.Files)) if sink.Files else 0,
+            "raw_bytes_per_segment": 600 * len(tags) * 8,
+            "backfill_minutes": args.backfillminutes,
+            "backfill_values": values,
+            "backfill_seconds": round(readSeconds, 3),
+            "backfill_values_per_second": round(values / readSeconds, 1)}
+
+def benchmark_run(args):
+    """
+    benchmark_run - Runs every equipment class, pidLoop and Timer for a number of scans and measures the cost of
+                    Run() per call. Timers run on a simulated clock advancing 100 milliseconds per scan, so the
+                    assets go through their states and downtimes as they do in the plant
+    """
+    from Roaster import Roaster
+    from MaltMill import MaltMill
+    from Mash import Mash
+    from BoilKettle import BoilKettle
+    from Fermenter import Fermenter
+    from BrightTank import BrightTank
+    from BottleLine import BottleLine
+    from pidLoop import pidLoop
+    from Timer import Timer
+    from GlobalVariables import NewStateNames
+
+    random.seed(args.seed)
+    clock = SimulatedClock()
+    clock.Install()
+
+    equipment = [Roaster("Roaster100"), MaltMill("MaltMill100"), Mash("MashTun100"), BoilKettle("BoilKettle100"),
+                 Fermenter("Fermenter100"), BrightTank("BrightTank301"), BottleLine("BottleLine401")]
+    times = {asset.EquipmentName: [] for asset in equipment}
+    states = {asset.EquipmentName: set() for asset in equipment}
+
+    # The Roaster temperature loop heating from ambient, and a 15 second Timer restarted once done
+    loop = pidLoop("TemperatureControl", 0.1, 4, 1.0, 15000, 1.0)
+    loop.Enabled = True
+    timer = Timer("HoldTime")
+    timer.PT = 15
+    timer.Enabled = True
+    components = {"pidLoop": [], "Timer": []}
+
+    pv = 80.0
+    for scan in range(args.scans):
+        for asset in equipment:
+            start = time.perf_counter_ns()
+            asset.Run()
+            times[asset.EquipmentName].append(time.perf_counter_ns() - start)
+            states[asset.EquipmentName].add(asset.NewState)
+
+        start = time.perf_counter_ns()
+        pv = loop.Run(350.0, pv)
+        components["pidLoop"].append(time.perf_counter_ns() - start)
+        if pv >= 349.0:
+            pv = 80.0
+
+        start = time.perf_counter_ns()
+        timer.Run()
+        components["Timer"].append(time.perf_counter_ns() - start)
+        timer.RST = timer.DN
+
+        clock.Advance()
+
+    result = {"benchmark": "run", "scans": args.scans, "seed": args.seed, "clock_overhead_ns": clock_overhead(), "equipment": {}, "components": {}}
+    total = 0
+    for name, values in times.items():
+        total = total + sum(values)
+        result["equipment"][name] = summary(values)
+        result["equipment"][name]["states"] = [NewStateNames[state] for state in sorted(states[name])]
+    for name, values in components.items():
+        result["components"][name] = summary(values)
+    result["scan_ns"] = round(total / args.scans, 1)
+    return result
+
+def benchmark_plant(args):
+    """
+    benchmark_plant - Runs the scan of the whole plant (allocations, material transfers and the Run() of the 18
+                      assets) on a simulated clock and measures the cost of a scan. The digest of the final state
+                      of the assets tells whether two runs simulated the same plant, the plant is always named A
+                      so its ProductionIDs in the digest do not depend on the host
+    """
+    from Plant import Plant
+    from GlobalVariables import NewStateNames
+
+    random.seed(args.seed)
+    clock = SimulatedClock()
+    clock.Install()
+
+    plant = Plant(args.allocationpolicy, args.wipcapacity, args.wippolicy, "A")
+    times = []
+    start = time.perf_counter()
+    for scan in range(args.scans):
+        scanStart = time.perf_counter_ns()
+        plant.Run()
+        times.append(time.perf_counter_ns() - scanStart)
+        clock.Advance()
+    elapsed = time.perf_counter() - start
+
+    # The MaltMills have no ProductionID, they run the lots of their MashTun
+    final = [[name, asset.NewState, asset.NewStatus, getattr(asset, "ProductionID", "")] for name, asset in plant.Assets.items()]
+    result = {"benchmark": "plant",
+              "scans": args.scans,
+              "seed": args.seed,
+              "allocationpolicy": args.allocationpolicy,
+              "wipcapacity": args.wipcapacity,
+              "wippolicy": args.wippolicy,
+              "assets": len(plant.Assets),
+              "scans_per_second": round(args.scans / elapsed, 1),
+              "scan": summary(times),
+              "states": {name: NewStateNames[asset.NewState] for name, asset in plant.Assets.items()},
+              "digest": hashlib.sha1(repr(final).encode()).hexdigest()}
+    return result
+
+def benchmark_genealogy(args):
+    """
+    benchmark_genealogy - Records the lot genealogy of the plant run on a simulated clock, then appends --days of
+                          synthetic production (the lot chain of the plant, raw material lots drawn from pools
+                          like the assets do) to the edge log, and measures the capture cost per scan, the time
+                          to read the edge log back and the latency of trace back and trace forward queries
+    """
+    from Plant import Plant
+    from LotGenealogy import LotGenealogy
+
+    random.seed(args.seed)
+    clock = SimulatedClock()
+    clock.Install()
+
+    directory = tempfile.mkdtemp(prefix="brewsim_genealogy_")
+    path = os.path.join(directory, "genealogy.ndjson")
+    try:
+        plant = Plant(PlantName="A")
+        genealogy = LotGenealogy(path, plant.Assets)
+        captureTimes = []
+        for scan in range(args.scans):
+            plant.Run()
+            captureStart = time.perf_counter_ns()
+            genealogy.Capture(clock.time())
+            captureTimes.append(time.perf_counter_ns() - captureStart)
+            clock.Advance()
+        plantTransfers = len(genealogy.Edges)
+
+        # Synthetic production - [asset, material, consumed lot or raw material pool, produced lot prefix]
+        batchTime = clock.time()
+        finalLots = []
+        rawLots = []
+        for batch in range(args.days * args.batchesperday):
+            line = batch % 2 + 1
+            batchTime = batchTime + 86400 / args.batchesperday
+            productionId = "PR-A{0}{1:08d}".format(line, batch)
+            raw = "BL-A{0:05d}".format(random.randint(1, 10001))
+            rawLots.append(raw)
+            roasted = "RB-{0}{1:08d}".format(line, batch)
+            wort = "GW-{0}{1:08d}".format(line, batch)
+            brewed = "BW-{0}{1:08d}".format(line, batch)
+            green = "GB-{0}{1:08d}".format(line, batch)
+            beer = "MB-{0}{1:08d}".format(random.randint(301, 305), batch)
+            bottled = "FB-{0}{1:08d}".format(random.randint(401, 403), batch)
+            for asset, material, fromLot, toLot in [["Roaster10{0}".format(line), "RawBarley", raw, roasted],
+                                                    ["MashTun10{0}".format(line), "Malt", roasted, wort],
+                                                    ["BoilKettle10{0}".format(line), "Wort", wort, brewed],
+                                                    ["BoilKettle10{0}".format(line), "Hops", "HL-A{0}{1:08d}".format(line, batch), brewed],
+                                                    ["Fermenter10{0}".format(line), "BrewedWort", brewed, green],
+                                                    ["Fermenter10{0}".format(line), "Yeast", "YL-A{0}{1:08d}".format(line, batch), green],
+                                                    ["BrightTank{0}".format(beer[3:6]), "GreenBeer", green, beer],
+                                                    ["BottleLine{0}".format(bottled[3:6]), "Beer", beer, bottled],
+                                                    ["BottleLine{0}".format(bottled[3:6]), "Bottle", "BO-A{0:05d}".format(random.randint(1, 10001)), bottled],
+                                                    ["BottleLine{0}".format(bottled[3:6]), "Cap", "CA-A{0:05d}".format(random.randint(1, 10001)), bottled],
+                                                    ["BottleLine{0}".format(bottled[3:6]), "Label", "LA-A{0:05d}".format(random.randint(1, 10001)), bottled]]:
+                genealogy.Add(round(batchTime, 3), asset, productionId, material, fromLot, toLot)
+            finalLots.append(bottled)
+        genealogy.Close()
+        logBytes = os.path.getsize(path)
+
+        loadStart = time.perf_counter()
+        genealogy = LotGenealogy(path, {})
+        loadSeconds = time.perf_counter() - loadStart
+        genealogy.Close()
+
+        backTimes = []
+        forwardTimes = []
+        for query in range(args.queries):
+            start = time.perf_counter_ns()
+            genealogy.Trace(random.choice(finalLots), "back")
+            backTimes.append(time.perf_counter_ns() - start)
+            start = time.perf_counter_ns()
+            genealogy.Trace(random.choice(rawLots), "forward")
+            forwardTimes.append(time.perf_counter_ns() - start)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    result = {"benchmark": "genealogy",
+              "scans": args.scans,
+              "seed": args.seed,
+              "plant_transfers": plantTransfers,
+              "days": args.days,
+              "batches": args.days * args.batchesperday,
+              "lots": len(genealogy.Lots),
+              "transfers": len(genealogy.Edges),
+              "log_bytes": logBytes,
+              "capture": summary(captureTimes),
+              "load_seconds": round(loadSeconds, 3),
+              "trace_back": summary(backTimes),
+              "trace_forward": summary(forwardTimes)}
+    return result
+
+def benchmark_lotnumbers(args):
+    """
+    benchmark_lotnumbers - Numbers --lotsperday lots per simulated day for --days, the way the assets used to
+                           (datetime.now() and strftime() of the month, day, second and minute) and with the
+                           LotNumberGenerator, and counts the numbers given to more than one lot. The cost per
+                           number of both is measured on the real clock. --restarts simulator restarts within a
+                           second that already has numbers are counted with and without the lot number file
+    """
+    from LotNumberGenerator import LotNumberGenerator
+
+    overhead = clock_overhead()
+    generator = LotNumberGenerator("A")
+    strftimeTimes = []
+    generatorTimes = []
+    for number in range(args.costnumbers):
+        start = time.perf_counter_ns()
+        "{0}{1}{2}".format("GB-", "1", datetime.datetime.now().strftime("%m%d%S%M"))
+        strftimeTimes.append(time.perf_counter_ns() - start - overhead)
+        start = time.perf_counter_ns()
+        generator.Next("GB-", "1")
+        generatorTimes.append(time.perf_counter_ns() - start - overhead)
+
+    # Lots are numbered at random times of the simulated days
+    random.seed(args.seed)
+    clock = SimulatedClock()
+    clock.Install()
+    generator = LotNumberGenerator("A")
+    ticks = sorted(random.randrange(args.days * 864000) for lot in range(args.days * args.lotsperday))
+    strftimeNumbers = set()
+    generatorNumbers = set()
+    for tick in ticks:
+        clock.Ticks = tick
+        strftimeNumbers.add("{0}{1}{2}".format("GB-", "1", clock.now().strftime("%m%d%S%M")))
+        generatorNumbers.add(generator.Next("GB-", "1"))
+
+    # A generator numbers lots, then the simulator restarts in the same second
+    directory = tempfile.mkdtemp(prefix="brewsim_lotnumbers_")
+    restartCollisions = {}
+    try:
+        for reserve in (False, True):
+            path = os.path.join(directory, "lotnumbers.json") if reserve else None
+            restartNumbers = []
+            for restart in range(args.restarts):
+                clock.Ticks = restart * 864000 + random.randrange(10)
+                for run in range(2):
+                    generator = LotNumberGenerator("A", path)
+                    restartNumbers.extend(generator.Next("GB-", "1") for lot in range(3))
+            restartCollisions[reserve] = len(restartNumbers) - len(set(restartNumbers))
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+
+    result = {"benchmark": "lotnumbers",
+              "seed": args.seed,
+              "days": args.days,
+              "lots": len(ticks),
+              "strftime_collisions": len(ticks) - len(strftimeNumbers),
+              "generator_collisions": len(ticks) - len(generatorNumbers),
+              "restarts": args.restarts,
+              "restart_collisions": restartCollisions[False],
+              "restart_collisions_reserved": restartCollisions[True],
+              "strftime": summary(strftimeTimes),
+              "generator": summary(generatorTimes)}
+    return result
+
+def benchmark_oee(args):
+    """
+    benchmark_oee - Runs the plant on a simulated clock with the streaming OEE calculator and measures the cost of
+                    its update per scan. The measures of every window are validated against the same measures
+                    recomputed at the end from every scan kept in memory, over the span the window covers. The
+                    downtimes of the assets are seeded from the clock and do not occur on the simulated clock, so
+                    plant wide emergency stops are scheduled to exercise the availability and the scrap
+    """
+    from Plant import Plant
+    from BurstGenerator import BurstGenerator
+    from OeeCalculator import OeeCalculator, oee_measures, FIELDS, PLANNED, RUNTIME, ACTUAL, IDEAL, GOOD, SCRAP
+
+    random.seed(args.seed)
+    clock = SimulatedClock()
+    clock.Install()
+
+    areas = {"Roaster": "Roasting", "MaltMill": "Mashing", "Mash": "Mashing", "BoilKettle": "Brewing", "Fermenter": "Fermentation", "BrightTank": "BeerStorage", "BottleLine": "Bottling"}
+    plant = Plant(args.allocationpolicy, args.wipcapacity, args.wippolicy, "A")
+    assets = [[areas[type(asset).__name__], name, asset] for name, asset in plant.Assets.items()]
+    oee = OeeCalculator(assets, "/Breweries/IrvinePlant", args.shifthours, args.interval)
+    estops = BurstGenerator("estop", plant.Assets, [], args.estopevery, args.estopduration, args.estopevery) if args.estopevery > 0 else None
+
+    times = []
+    scans = []
+    for scan in range(args.scans):
+        plant.Run()
+        now = clock.time()
+        if (estops is not None):
+            estops.Run(now)
+        scanStart = time.perf_counter_ns()
+        oee.Update(now)
+        times.append(time.perf_counter_ns() - scanStart)
+        scans.append([now, [oee._read(asset) for area, name, asset in assets]])
+        clock.Advance()
+
+    # Recompute the counters of every window from the scans, from the start of its oldest bucket
+    differences = []
+    for number, (area, name, asset) in enumerate(assets):
+        for window in oee.AssetWindows[number]:
+            start = window.End - window.Width * len(window.Buckets)
+            totals = [0.0] * FIELDS
+            for (previousTime, previous), (now, current) in zip(scans, scans[1:]):
+                if now < start:
+                    continue
+                elapsed = now - previousTime
+                utilizationState, running, speed, setpoint, production, scrap = previous[number]
+                totals[PLANNED] = totals[PLANNED] + (elapsed if utilizationState in oee.PlannedStates else 0.0)
+                totals[RUNTIME] = totals[RUNTIME] + (elapsed if utilizationState == "Runtime" else 0.0)
+                totals[ACTUAL] = totals[ACTUAL] + speed * elapsed
+                totals[IDEAL] = totals[IDEAL] + setpoint * elapsed
+                totals[GOOD] = totals[GOOD] + max(0.0, current[number][4] - production)
+                totals[SCRAP] = totals[SCRAP] + max(0.0, current[number][5] - scrap)
+            differences.append(max(abs(streamed - recomputed) for streamed, recomputed in zip(oee_measures(window.Totals), oee_measures(totals))))
+
+    result = {"benchmark": "oee",
+              "scans": args.scans,
+              "seed": args.seed,
+              "simulated_seconds": round(args.scans / 10, 1),
+              "assets": len(assets),
+              "estops": estops.Bursts if estops is not None else 0,
+              "tags": len(oee.Tags),
+              "update": summary(times),
+              "max_difference_percent": round(max(differences), 4),
+              "areas": {area: {"OEE_{0}".format(windowName): oee_measures(window.Totals)[3] for (windowName, length), window in zip(oee.Windows, oee.AreaWindows[area])} for area in oee.Areas}}
+    return result
+
+def opc_address_space(server, tags):
+    """
+    opc_address_space - Creates one OPC UA object per asset and one variable per tag on a python-opcua Server or
+                        an AsyncOpcServer, returns the variables in tag order
+    """
+    from opcua import ua
+
+    addspace = server.register_namespace(OpcNamespace)
+    objects = server.get_objects_node()
+    assetNodes = {}
+    variables = []
+    for tag in tags:
+        assetNode = assetNodes.get(tag.Asset)
+        if assetNode is None:
+            assetNode = assetNodes[tag.Asset] = objects.add_object(addspace, tag.Asset)
+        if tag.DataType == "string":
+            variables.append(assetNode.add_variable(addspace, tag.Property, "", ua.VariantType.String))
+        else:
+            variables.append(assetNode.add_variable(addspace, tag.Property, 0.0, ua.VariantType.Double))
+    return variables
+
+def benchmark_opc(args):
+    """
+    benchmark_opc - Writes scans to OPC UA variables shaped like the address space of the simulator (18 assets,
+                    28 values each) with set_value(), as the simulator does on every scan, and measures the cost
+                    of the update. The server is not started, so no client is involved
+    """
+    from opcua import Server
+
+    rng = random.Random(args.seed)
+    tags = synthetic_tags(properties=args.properties)
+    snapshots = [synthetic_snapshot(scan, tags, rng) for scan in range(100)]
+
+    server = Server()
+    variables = opc_address_space(server, tags)
+
+    times = []
+    for scan in range(args.scans):
+        values = snapshots[scan % len(snapshots)].Values
+        start = time.perf_counter_ns()
+        for variable, value in zip(variables, values):
+            variable.set_value(value)
+        times.append(time.perf_counter_ns() - start)
+
+    result = {"benchmark": "opc",
+              "tags": len(tags),
+              "scans": args.scans,
+              "seed": args.seed,
+              "update": summary(times),
+              "set_value_ns": round(sum(times) / (args.scans * len(tags)), 1)}
+    return result
+
+def opc_clients(url, nodeids, count, ready, stop, results):
+    """
+    opc_clients - Connects count OPC UA Clients (asyncua, one event loop) subscribing to every variable with a 100
+                  millisecond publishing interval, like collectors, and reports the data change notifications received
+    """
+    import asyncio
+    from asyncua import Client
+
+    class Handler:
+        def __init__(self):
+            self.Notifications = 0
+        def datachange_notification(self, node, value, data):
+            self.Notifications = self.Notifications + 1
+
+    async def run():
+        handler = Handler()
+        clients = []
+        for number in range(count):
+            client = Client(url)
+            await client.connect()
+            subscription = await client.create_subscription(100, handler)
+            await subscription.subscribe_data_change([client.get_node(nodeid) for nodeid in nodeids])
+            clients.append(client)
+        ready.set()
+        while not stop.is_set():
+            await asyncio.sleep(0.1)
+        results.put(handler.Notifications)
+        for client in clients:
+            await client.disconnect()
+
+    asyncio.run(run())
+
+def benchmark_opcclients(args):
+    """
+    benchmark_opcclients - Runs the OPC UA update of the scan at the 100 millisecond scan rate on a started server
+                           (python-opcua and/or asyncua) with an increasing number of subscribed OPC UA Clients in
+                           another process, and measures the cost of the update and the scan jitter (how late the
+                           scans start)
+    """
+    from opcua import Server
+    from AsyncOpcServer import AsyncOpcServer
+
+    rng = random.Random(args.seed)
+    tags = synthetic_tags(properties=args.properties)
+    scans = int(args.seconds * 10)
+    snapshots = changing_snapshots(min(scans, 600), tags, args.changerate, rng, 0)
+    implementations = ["opcua", "asyncua"] if args.server == "both" else [args.server]
+
+    results = []
+    run = 0
+    for implementation in implementations:
+        for count in [int(count) for count in args.clients.split(",")]:
+            # A new port per run, the previous one may still be in TIME_WAIT
+            url = "opc.tcp://127.0.0.1:{0}/brewsim/".format(args.port + run)
+            run = run + 1
+            server = AsyncOpcServer() if implementation == "asyncua" else Server()
+            server.set_endpoint(url)
+            variables = opc_address_space(server, tags)
+            server.start()
+
+            ready = multiprocessing.Event()
+            stop = multiprocessing.Event()
+            notifications = multiprocessing.Queue()
+            clients = None
+            if count > 0:
+                clients = multiprocessing.Process(target=opc_clients, args=(url, [variable.nodeid.to_string() for variable in variables], count, ready, stop, notifications))
+                clients.start()
+                ready.wait(120)
+
+            updates = []
+            lateness = []
+            overruns = 0
+            deadline = time.perf_counter()
+            for scan in range(scans):
+                late = time.perf_counter() - deadline
+                start = time.perf_counter_ns()
+                for variable, value in zip(variables, snapshots[scan % len(snapshots)].Values):
+                    variable.set_value(value)
+                if implementation == "asyncua":
+                    server.Flush()
+                update = time.perf_counter_ns() - start
+                updates.append(update)
+                lateness.append(int(late * 1e9))
+                if (late + update / 1e9) > 0.1:
+                    overruns = overruns + 1
+                deadline = deadline + 0.1
+                time.sleep(max(0.0, deadline - time.perf_counter()))
+
+            received = 0
+            if clients is not None:
+                stop.set()
+                received = notifications.get(timeout=60)
+                clients.join()
+            server.stop()
+
+            result = {"server": implementation,
+                      "clients": count,
+                      "update": summary(updates),
+                      "jitter": summary(lateness),
+                      "overruns": overruns,
+                      "notifications_per_second": round(received / args.seconds, 1)}
+            if implementation == "asyncua":
+                result["coalesced"] = server.Coalesced
+                result["write_errors"] = server.WriteErrors
+            results.append(result)
+
+    return {"benchmark": "opcclients",
+            "tags": len(tags),
+            "seconds": args.seconds,
+            "changerate": args.changerate,
+            "seed": args.seed,
+            "results": results}
+
+def opc_load_sessions(url, sessions, items, nodeids, first, publishinginterval, connected, measure, stop, results):
+    """
+    opc_load_sessions - Opens sessions OPC UA Client sessions (asyncua, one event loop) with a subscription of items
+                        monitored items each, and records the latency from the SourceTimestamp of every data change
+                        notification (the time of the scan of the simulator) to its receipt while measure is set
+    """
+    import asyncio
+    from asyncua import Client
+    from Histogram import Histogram
+
+    class Handler:
+        def __init__(self):
+            self.Latency = Histogram()
+            self.Notifications = 0
+            self.Untimed = 0
+        def datachange_notification(self, node, value, data):
+            if not measure.is_set():
+                return
+            sourceTime = data.monitored_item.Value.SourceTimestamp
+            if sourceTime is None:
+                self.Untimed = self.Untimed + 1
+                return
+            if sourceTime.tzinfo is None:
+                sourceTime = sourceTime.replace(tzinfo=datetime.timezone.utc)
+            self.Latency.Record(int((time.time() - sourceTime.timestamp()) * 1e6))
+            self.Notifications = self.Notifications + 1
+
+    async def run():
+        handler = Handler()
+        clients = []
+        errors = 0
+        for session in range(first, first + sessions):
+            try:
+                client = Client(url)
+                await client.connect()
+                subscription = await client.create_subscription(publishinginterval, handler)
+                await subscription.subscribe_data_change([client.get_node(nodeids[(session * items + item) % len(nodeids)]) for item in range(items)])
+                clients.append(client)
+            except Exception:
+                errors = errors + 1
+        connected.put(len(clients))
+        while not stop.is_set():
+            await asyncio.sleep(0.1)
+        results.put([handler.Latency, handler.Notifications, handler.Untimed, errors])
+        for client in clients:
+            try:
+                await client.disconnect()
+            except Exception:
+                pass
+
+    asyncio.run(run())
+
+def benchmark_opcload(args):
+    """
+    benchmark_opcload - Load test of the OPC UA Server of a running simulator on this host: for every number of
+                        sessions, opens the sessions with their monitored items (spread over worker processes) and
+                        reports the data change notifications per second and their latency from the scan of the
+                        simulator (SourceTimestamp) to their receipt
+    """
+    import asyncio
+    import ipaddress
+    import socket
+    import urllib.parse
+    from asyncua import Client, ua
+    from Histogram import Histogram
+
+    # The latency compares the clock of the simulator with the clock of the clients, they must be the same clock
+    host = urllib.parse.urlparse(args.url).hostname
+    if not ipaddress.ip_address(socket.gethostbyname(host)).is_loopback:
+        raise ValueError("The OPC UA load test only runs against a simulator on this host (loopback), not {0}".format(host))
+
+    # Variables of the simulator address space, the monitored items of the sessions are spread over them
+    async def browse():
+        async with Client(args.url) as client:
+            namespace = await client.get_namespace_index(args.namespace)
+            variables = []
+            nodes = [await client.nodes.objects.get_child(["{0}:{1}".format(namespace, args.root)])]
+            while nodes:
+                children = []
+                for node in nodes:
+                    for child in await node.get_children():
+                        nodeClass = await child.read_node_class()
+                        if nodeClass == ua.NodeClass.Variable:
+                            variables.append(child.nodeid.to_string())
+                        elif nodeClass == ua.NodeClass.Object:
+                            children.append(child)
+                nodes = children
+            return variables
+
+    nodeids = asyncio.run(browse())
+    results = []
+    for sessions in [int(sessions) for sessions in args.sessions.split(",")]:
+        processes = max(1, min(sessions, args.processes))
+        connected = multiprocessing.Queue()
+        received = multiprocessing.Queue()
+        measure = multiprocessing.Event()
+        stop = multiprocessing.Event()
+
+        workers = []
+        first = 0
+        start = time.perf_counter()
+        for worker in range(processes):
+            count = sessions // processes + (1 if worker < sessions % processes else 0)
+            workers.append(multiprocessing.Process(target=opc_load_sessions, args=(args.url, count, args.items, nodeids, first, args.publishinginterval, connected, measure, stop, received)))
+            first = first + count
+        for worker in workers:
+            worker.start()
+        opened = sum(connected.get(timeout=600) for worker in workers)
+        connectSeconds = time.perf_counter() - start
+
+        # The initial values of the subscriptions are older than the scan, they are not measured
+        time.sleep(args.warmup)
+        measure.set()
+        time.sleep(args.seconds)
+        measure.clear()
+        stop.set()
+
+        latency = Histogram()
+        notifications = 0
+        untimed = 0
+        errors = 0
+        for worker in workers:
+            histogram, count, workerUntimed, workerErrors = received.get(timeout=60)
+            latency.Merge(histogram)
+            notifications = notifications + count
+            untimed = untimed + workerUntimed
+            errors = errors + workerErrors
+        for worker in workers:
+            worker.join()
+
+        results.append({"sessions": sessions,
+                        "sessions_opened": opened,
+                        "session_errors": errors,
+                        "monitored_items": opened * args.items,
+                        "connect_seconds": round(connectSeconds, 2),
+                        "notifications": notifications,
+                        "notifications_per_second": round(notifications / args.seconds, 1),
+                        "notifications_without_source_timestamp": untimed,
+                        "latency_ms": {"mean": round(latency.Mean() / 1000, 2),
+                                       "p50": round(latency.Percentile(50) / 1000, 2),
+                                       "p90": round(latency.Percentile(90) / 1000, 2),
+                                       "p99": round(latency.Percentile(99) / 1000, 2),
+                                       "max": round(latency.Max / 1000, 2)}})
+
+    return {"benchmark": "opcload",
+            "url": args.url,
+            "variables": len(nodeids),
+            "items": args.items,
+            "publishinginterval": args.publishinginterval,
+            "seconds": args.seconds,
+            "results": results}
+
+def benchmark_sitewise(args):
+    """
+    benchmark_sitewise - Writes scans to the SiteWise sink publishing to a local fake SiteWise client and measures
+                         the cost of a scan and of a publish, the number of BatchPutAssetPropertyValue calls and the
+                         entries per call
+    """
+    from SiteWiseSink import SiteWiseSink
+    from ReportByException import ReportByException
+
+    rng = random.Random(args.seed)
+    tags = synthetic_tags()
+    startTime = 1700000000
+    snapshots = changing_snapshots(args.scans, tags, args.changerate, rng, startTime)
+
+    client = FakeSiteWiseClient(args.latency)
+    rbe = ReportByException(args.deadband, args.heartbeat) if args.reportbyexception == "True" else None
+    aggregateProperties = sorted({tag.Property for tag in tags if tag.DataType == "double"}) if args.aggregate == "True" else None
+    sink = SiteWiseSink(client, args.interval, rbe, aggregateProperties)
+    sink.Tags = tags
+    # Open() prints to the console, the console only receives the JSON results
+    with contextlib.redirect_stdout(sys.stderr):
+        sink.Open()
+    sink.LastPublishTime = startTime
+
+    scanTimes = []
+    publishTimes = []
+    for snapshot in snapshots:
+        calls = sink.ApiCalls
+        start = time.perf_counter_ns()
+        sink.Write(snapshot)
+        duration = time.perf_counter_ns() - start
+        if sink.ApiCalls != calls:
+            publishTimes.append(duration)
+        else:
+            scanTimes.append(duration)
+
+    publishes = len(publishTimes)
+    result = {"benchmark": "sitewise",
+              "tags": len(tags),
+              "scans": args.scans,
+              "seed": args.seed,
+              "interval": args.interval,
+              "reportbyexception": args.reportbyexception,
+              "aggregate": args.aggregate,
+              "changerate": args.changerate,
+              "latency": args.latency,
+              "publishes": publishes,
+              "api_calls": client.Calls,
+              "entries": client.Entries,
+              "entries_per_call": round(client.Entries / client.Calls, 2) if client.Calls else 0,
+              "entries_per_publish": round(client.Entries / publishes, 1) if publishes else 0,
+              "raw_entries_per_publish": len(tags),
+              "request_bytes_per_call": int(client.Bytes / client.Calls) if client.Calls else 0,
+              "scan": summary(scanTimes) if scanTimes else None,
+              "publish": summary(publishTimes) if publishTimes else None}
+    return result
+
+def benchmark_all(args):
+    """
+    benchmark_all - Runs the offline benchmarks of the simulation (run, plant, opc and sitewise) with their
+                    default parameters, the OPC UA benchmark only when the opcua library is installed
+    """
+    results = []
+    for name in ["run", "plant", "opc", "sitewise"]:
+        benchmarkArgs = args.parser.parse_args(["--seed", str(args.seed), name])
+        try:
+            results.append(benchmarkArgs.function(benchmarkArgs))
+        except ImportError as e:
+            results.append({"benchmark": name, "skipped": str(e)})
+    return {"benchmark": "all", "seed": args.seed, "results": results}
+
+def metric_values(result, path=""):
+    """
+    metric_values - Returns the timings (_ns, _us and _seconds, lower is better) and rates (_per_second, higher is
+                    better) of a result as a dictionary of path to value, results of "all" keyed by benchmark name
+    """
+    values = {}
+    if isinstance(result, list):
+        for index, item in enumerate(result):
+            key = item.get("benchmark", str(index)) if isinstance(item, dict) else str(index)
+            values.update(metric_values(item, path + key + "."))
+    elif isinstance(result, dict):
+        for key, value in result.items():
+            if isinstance(value, (dict, list)):
+                values.update(metric_values(value, path + key + "."))
+            elif isinstance(value, (int, float)) and not isinstance(value, bool) and key.endswith(("_ns", "_us", "_seconds", "_per_second")):
+                values[path + key] = value
+    return values
+
+def benchmark_compare(args):
+    """
+    benchmark_compare - Compares the timings and rates of two results of the benchmarks (i.e. of two releases),
+                        a change worse than the threshold percentage is reported as a regression
+    """
+    with open(args.base) as file:
+        base = json.load(file)
+    with open(args.new) as file:
+        new = json.load(file)
+
+    baseValues = metric_values(base)
+    newValues = metric_values(new)
+    metrics = {}
+    regressions = []
+    for path, baseValue in baseValues.items():
+        newValue = newValues.get(path)
+        if (newValue is None) or (baseValue == 0):
+            continue
+        change = (newValue - baseValue) / baseValue * 100
+        # Rates regress when they go down, timings when they go up
+        worse = -change if path.endswith("_per_second") else change
+        metrics[path] = {"base": baseValue, "new": newValue, "change_percent": round(change, 1)}
+        # The max of a run is a single outlier (i.e. a garbage collection), it is compared but not a regression
+        if (worse > args.threshold) and (not path.endswith("max_ns")):
+            regressions.append(path)
+
+    return {"benchmark": "compare",
+            "base": args.base,
+            "base_label": base.get("label"),
+            "new": args.new,
+            "new_label": new.get("label"),
+            "threshold_percent": args.threshold,
+            "regressions": regressions,
+            "metrics": metrics}
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description='Brewery Simulation Benchmarks')
+    parser.add_argument('--seed', dest='seed', default=1, type=int, help='Random seed (default=1)')
+    parser.add_argument('--label', dest='label', default=None, type=str, help='Label of the results, i.e. the release or engine benchmarked (default=None)')
+    parser.add_argument('--output', dest='output', default=None, type=str, help='File to write the JSON results to, in addition to the console (default=None)')
+    subparsers = parser.add_subparsers(dest='benchmark', required=True)
+
+    mqtt_parser = subparsers.add_parser('mqtt', help='MQTT sink messages per second')
+    mqtt_parser.add_argument('--broker', dest='broker', default="local", type=str, help='"local" for the built in counting broker or host:port of a Mosquitto compatible broker (default=local)')
+    mqtt_parser.add_argument('--qos', dest='qos', default=0, type=int, choices=(0, 1), help='MQTT QoS (default=0)')
+    mqtt_parser.add_argument('--format', dest='format', default="json", choices=('json', 'cbor'), help='Payload format (default=json)')
+    mqtt_parser.add_argument('--scangroup', dest='scangroup', default=10, type=int, help='Scans per message (default=10)')
+    mqtt_parser.add_argument('--scans', dest='scans', default=1000, type=int, help='Number of scans to publish (default=1000)')
+    mqtt_parser.set_defaults(function=benchmark_mqtt)
+
+    shm_parser = subparsers.add_parser('shm', help='Shared tag table write and read cost')
+    shm_parser.add_argument('--path', dest='path', default=None, type=str, help='Shared tag table path (default=/dev/shm/brewery_tags)')
+    shm_parser.add_argument('--seconds', dest='seconds', default=1.0, type=float, help='Seconds to read (default=1)')
+    shm_parser.add_argument('--scanrate', dest='scanrate', default=0, type=float, help='Writes per second while reading, 0 for as fast as possible (default=0)')
+    shm_parser.set_defaults(function=benchmark_shm)
+
+    history_parser = subparsers.add_parser('history', help='Tag history write and backfill cost')
+    history_parser.add_argument('--minutes', dest='minutes', default=20, type=int, help='Minutes of scans to write (default=20)')
+    history_parser.add_argument('--memoryminutes', dest='memoryminutes', default=10, type=int, help='Minutes of raw history kept in memory (default=10)')
+    history_parser.add_argument('--backfillminutes', dest='backfillminutes', default=15, type=int, help='Minutes of history read for every tag (default=15)')
+    history_parser.set_defaults(function=benchmark_history)
+
+    run_parser = subparsers.add_parser('run', help='Equipment Run() cost per scan')
+    run_parser.add_argument('--scans', dest='scans', default=100000, type=int, help='Scans to run every equipment class (default=100000)')
+    run_parser.set_defaults(function=benchmark_run)
+
+    plant_parser = subparsers.add_parser('plant', help='Full plant scan cost')
+    plant_parser.add_argument('--scans', dest='scans', default=100000, type=int, help='Scans to run the plant (default=100000)')
+    plant_parser.add_argument('--allocationpolicy', dest='allocationpolicy', default="lru", choices=('firstfit', 'roundrobin', 'lru', 'leastused'), help='Bright Tank and Bottling Line allocation policy (default=lru)')
+    plant_parser.add_argument('--wipcapacity', dest='wipcapacity', default=21, type=int, help='Roaster lots buffered per MashTun (default=21)')
+    plant_parser.add_argument('--wippolicy', dest='wippolicy', default="fifo", choices=('fifo', 'random', 'priority'), help='Order the MashTuns consume the buffered lots (default=fifo)')
+    plant_parser.set_defaults(function=benchmark_plant)
+
+    genealogy_parser = subparsers.add_parser('genealogy', help='Lot genealogy capture, load and trace query cost')
+    genealogy_parser.add_argument('--scans', dest='scans', default=36000, type=int, help='Scans to run the plant, 10 per simulated second (default=36000)')
+    genealogy_parser.add_argument('--days', dest='days', default=90, type=int, help='Days of synthetic production appended to the edge log (default=90)')
+    genealogy_parser.add_argument('--batchesperday', dest='batchesperday', default=100, type=int, help='Batches of synthetic production per day (default=100)')
+    genealogy_parser.add_argument('--queries', dest='queries', default=1000, type=int, help='Trace back and trace forward queries (default=1000)')
+    genealogy_parser.set_defaults(function=benchmark_genealogy)
+
+    lotnumbers_parser = subparsers.add_parser('lotnumbers', help='Lot number collisions and cost per number')
+    lotnumbers_parser.add_argument('--days', dest='days', default=365, type=int, help='Simulated days of lots (default=365)')
+    lotnumbers_parser.add_argument('--lotsperday', dest='lotsperday', default=200, type=int, help='Lots numbered per simulated day (default=200)')
+    lotnumbers_parser.add_argument('--restarts', dest='restarts', default=100, type=int, help='Simulator restarts within a second that already has numbers (default=100)')
+    lotnumbers_parser.add_argument('--costnumbers', dest='costnumbers', default=100000, type=int, help='Numbers generated to measure the cost per number (default=100000)')
+    lotnumbers_parser.set_defaults(function=benchmark_lotnumbers)
+
+    oee_parser = subparsers.add_parser('oee', help='Streaming OEE update cost and validation')
+    oee_parser.add_argument('--scans', dest='scans', default=36000, type=int, help='Scans to run the plant, 10 per simulated second (default=36000)')
+    oee_parser.add_argument('--shifthours', dest='shifthours', default=8, type=float, help='Length of the shift window in hours (default=8)')
+    oee_parser.add_argument('--interval', dest='interval', default=5, type=int, help='Seconds between updates of the measures (default=5)')
+    oee_parser.add_argument('--estopevery', dest='estopevery', default=900, type=float, help='Simulated seconds between plant wide emergency stops, 0 for none (default=900)')
+    oee_parser.add_argument('--estopduration', dest='estopduration', default=120, type=float, help='Simulated seconds of an emergency stop (default=120)')
+    oee_parser.add_argument('--allocationpolicy', dest='allocationpolicy', default="lru", choices=('firstfit', 'roundrobin', 'lru', 'leastused'), help='Bright Tank and Bottling Line allocation policy (default=lru)')
+    oee_parser.add_argument('--wipcapacity', dest='wipcapacity', default=21, type=int, help='Roaster lots buffered per MashTun (default=21)')
+    oee_parser.add_argument('--wippolicy', dest='wippolicy', default="fifo", choices=('fifo', 'random', 'priority'), help='Order the MashTuns consume the buffered lots (default=fifo)')
+    oee_parser.set_defaults(function=benchmark_oee)
+
+    opc_parser = subparsers.add_parser('opc', help='OPC UA variables update cost per scan')
+    opc_parser.add_argument('--scans', dest='scans', default=2000, type=int, help='Scans to write (default=2000)')
+    opc_parser.add_argument('--properties', dest='properties', default=28, type=int, help='Variables per asset (default=28)')
+    opc_parser.set_defaults(function=benchmark_opc)
+
+    opcclients_parser = subparsers.add_parser('opcclients', help='OPC UA update cost and scan jitter per number of subscribed clients')
+    opcclients_parser.add_argument('--server', dest='server', default="both", choices=('opcua', 'asyncua', 'both'), help='OPC UA Server implementation (default=both)')
+    opcclients_parser.add_argument('--clients', dest='clients', default="0,1,4,8", type=str, help='Comma separated numbers of subscribed clients (default=0,1,4,8)')
+    opcclients_parser.add_argument('--seconds', dest='seconds', default=10.0, type=float, help='Seconds to run the scan per number of clients (default=10)')
+    opcclients_parser.add_argument('--properties', dest='properties', default=28, type=int, help='Variables per asset (default=28)')
+    opcclients_parser.add_argument('--changerate', dest='changerate', default=0.3, type=float, help='Fraction of the values changing every scan (default=0.3)')
+    opcclients_parser.add_argument('--port', dest='port', default=4850, type=int, help='First port of the OPC UA Servers, one port per run (default=4850)')
+    opcclients_parser.set_defaults(function=benchmark_opcclients)
+
+    opcload_parser = subparsers.add_parser('opcload', help='Load test of the OPC UA Server of a simulator running on this host')
+    opcload_parser.add_argument('--url', dest='url', default="opc.tcp://127.0.0.1:4841/server/", type=str, help='OPC UA endpoint of the simulator, on this host only (default=opc.tcp://127.0.0.1:4841/server/)')
+    opcload_parser.add_argument('--sessions', dest='sessions', default="1,2,4,8,16", type=str, help='Comma separated numbers of client sessions (default=1,2,4,8,16)')
+    opcload_parser.add_argument('--items', dest='items', default=100, type=int, help='Monitored items per session (default=100)')
+    opcload_parser.add_argument('--publishinginterval', dest='publishinginterval', default=100, type=int, help='Publishing interval of the subscriptions in milliseconds (default=100)')
+    opcload_parser.add_argument('--seconds', dest='seconds', default=10.0, type=float, help='Seconds to measure per number of sessions (default=10)')
+    opcload_parser.add_argument('--warmup', dest='warmup', default=2.0, type=float, help='Seconds between the subscriptions and the measure (default=2)')
+    opcload_parser.add_argument('--processes', dest='processes', default=os.cpu_count() or 1, type=int, help='Client processes the sessions are spread over (default=number of CPUs)')
+    opcload_parser.add_argument('--namespace', dest='namespace', default="OPCUA_Breweries_Server", type=str, help='Namespace of the simulator address space (default=OPCUA_Breweries_Server)')
+    opcload_parser.add_argument('--root', dest='root', default="Breweries", type=str, help='Object of the Objects folder holding the variables (default=Breweries)')
+    opcload_parser.set_defaults(function=benchmark_opcload)
+
+    sitewise_parser = subparsers.add_parser('sitewise', help='SiteWise sink batching against a local fake SiteWise client')
+    sitewise_parser.add_argument('--scans', dest='scans', default=6000, type=int, help='Scans to write, 10 per simulated second (default=6000)')
+    sitewise_parser.add_argument('--interval', dest='interval', default=5, type=int, help='Publish interval in seconds (default=5)')
+    sitewise_parser.add_argument('--reportbyexception', dest='reportbyexception', default="True", choices=('True', 'False'), help='Only publish values that changed (default=True)')
+    sitewise_parser.add_argument('--deadband', dest='deadband', default=0.0, type=float, help='Report by exception deadband (default=0.0)')
+    sitewise_parser.add_argument('--heartbeat', dest='heartbeat', default=600, type=int, help='Report by exception heartbeat in seconds (default=600)')
+    sitewise_parser.add_argument('--aggregate', dest='aggregate', default="False", choices=('True', 'False'), help='Publish the numeric values as interval aggregates (default=False)')
+    sitewise_parser.add_argument('--changerate', dest='changerate', default=0.01, type=float, help='Fraction of the values changing every scan (default=0.01)')
+    sitewise_parser.add_argument('--latency', dest='latency', default=0.0, type=float, help='Seconds the fake client waits per call (default=0.0)')
+    sitewise_parser.set_defaults(function=benchmark_sitewise)
+
+    all_parser = subparsers.add_parser('all', help='run, plant, opc and sitewise benchmarks with their default parameters')
+    all_parser.set_defaults(function=benchmark_all, parser=parser)
+
+    compare_parser = subparsers.add_parser('compare', help='Compare two results of the benchmarks')
+    compare_parser.add_argument('base', type=str, help='JSON results of the baseline')
+    compare_parser.add_argument('new', type=str, help='JSON results to compare with the baseline')
+    compare_parser.add_argument('--threshold', dest='threshold', default=10.0, type=float, help='Change in percent reported as a regression (default=10.0)')
+    compare_parser.set_defaults(function=benchmark_compare)
+
+    args = parser.parse_args()
+    result = args.function(args)
+    if args.benchmark != "compare":
+        result["label"] = args.label
+        result["environment"] = environment()
+
+    print(json.dumps(result, indent=2))
+    if args.output is not None:
+        with open(args.output, "w") as file:
+            json.dump(result, file, indent=2)
@@ -12,16 +12,15 @@
 # ---------------------------------------------------------------------------
 # Imports
 # ---------------------------------------------------------------------------
-import datetime
-import random
-from random import randint, choice
+from random import randint
 from Motor import Motor
 from Timer import Timer
 from Valve import Valve
 from pidLoop import pidLoop
-from GlobalVariables import NewStateEnum, NewStatusEnum, UtilizationList, UtilizationStateList
+from StateMachine import StateMachine
+from GlobalVariables import NewStateEnum, NewStatusEnum, CommandEnum
 
-class BrightTank:    
+class BrightTank(StateMachine):
 
     """
     A Bright Tank is a dish-bottomed pressure-rated temperature-controlled tank used to hold beer in preparation for packaging. 
@@ -93,9 +92,15 @@ class BrightTank:
     
     __init__(self, EquipmentName) - Class Constructor
     Run(self) - method to simulate equipment data
+    StartAction(self) - run when the start command is accepted
+    StateX(self) - run every scan in state X, registered in StateHandlers
+    PhaseX(self) - run every scan in phase X while Running, registered in PhaseHandlers
 
     """
 
+    # Attributes changed by the runtime configuration, see RuntimeConfig
+    Tunables = ("PerformanceTargetPercent",)
+
     # Class Constructor
     def __init__(self, EquipmentName):
 
@@ -158,208 +163,11 @@ class BrightTank:
     # Run method to simulate equipment data 
     def Run(self):        
 
-        if self.StartCmd:
-            self.StartCmd = False
-            if (self.NewState == NewStateEnum.Ready) and (self.NewStatus == NewStatusEnum.Allocated):
-                # Measures passed from upstream Fermenter Asset
-                self.MaterialID = "{0}{1}".format("Beer ", self.Next_ItemID)
-                self.Prod_Beer_Item = self.MaterialID
-                self.ProductionID = self.Next_ProductionID
-
-                self.DownStream_ItemID = self.Next_ItemID
-                self.DownStream_ProductionID = self.ProductionID
-
-                now = datetime.datetime.now()
-                self.Prod_Beer_ToLot = "{0}{1}{2}".format("MB-", self.EquipmentName[-3], now.strftime("%m%d%S%M"))             
-                
-                self.NewState = NewStateEnum.Running
-
-        if self.RestartCmd:
-            self.RestartCmd = False
-            if self.NewState == NewStateEnum.Paused:
-                self.NewState = NewStateEnum.Running
-
-        if self.StopCmd:
-            self.StopCmd = False
-            if self.NewState == NewStateEnum.Running:
-                self.NewState = NewStateEnum.Paused
-
-        if self.EStopCmd:        
-            if self.NewState == NewStateEnum.Running:
-                self.NewState = NewStateEnum.Paused
-
-        if self.ResetCmd:    
-            self.ResetCmd = False    
-            if self.NewState == NewStateEnum.Done or self.NewState == NewStateEnum.Aborted:
-                self.NewState = NewStateEnum.Ready
-                self.NewStatus = NewStatusEnum.Idle
-
-            if (self.NewStatus == NewStatusEnum.Allocated):
-                self.NewStatus = NewStatusEnum.Idle
-
-        if self.AbortCmd:
-            self.AbortCmd = False
-            if self.NewState == NewStateEnum.Paused:
-                self.NewState = NewStateEnum.Aborted
-
-        match self.NewState:
-
-            case NewStateEnum.Aborted:
-                self.BeerSP = 5000.0
-                self.BeerPV = 0.0
-                self.BeerShipped = 0.0
-                self.HoldTime.Enabled = False
-                self.ShipToShipCmd = False
-                self.ShipToAllocated = False
-                self.ShipToAutoAllocateCmd = False
-                self.InletValve.CmdOpen = False
-                self.OutletValve.CmdOpen = False
-                self.OutletPump.CmdStart = False                
-
-            case NewStateEnum.Done:                  
-                self.InletValve.CmdOpen = False
-                self.OutletValve.CmdOpen = False
-                self.OutletPump.CmdStart = False                               
-                self.ChillWaterValve.CmdOpen = False
-                self.HoldTime.Enabled = False                 
-                self.BeerShippedFromFermenter = 0.0  
-                self.BeerPV = 0.0
-                self.ShipToAllocated = False
-                self.ShipToShipCmd = False
-                self.ShipToShipComplete = False
-                self.HoldTime.RST = True
-                self.BeerSP = 5000.0 
-                self.TemperatureSP = 70
-                self.TemperaturePV = 70.0
-                self.LevelPV = 0.0                
-                self.HoldTime.RST = True
-                self.BeerShipped = 0.0
-                self.ShipToTank = -1 
-                self.AllocatedFrom = -1    
-                self.ProductionID = ""
-                self.MaterialID = ""
-                self.Prod_Beer_Item = ""
-                self.Prod_Beer_ToLot = ""
-                self.Cons_GreenBeer_Item = ""
-                self.Cons_GreenBeer_FromLot = ""                         
-
-                self.SettleTime.RST = False
-                self.SettleTime.Enabled = True                
-                if (self.SettleTime.DN):
-
-                    self.SettleTime.Enabled = False
-                    self.SettleTime.RST = True
-                       
-                    self.SettleTime.PT = randint(5,10)
-                    self.HoldTime.PT = randint(7,13) * 60                    
-
-                    self.NewState = NewStateEnum.Ready                    
-
-            case NewStateEnum.Paused:                
-                self.CheckDownTime.Enabled = False                
-                self.InletValve.CmdOpen = False
-                self.OutletPump.CmdStart = False
-                self.OutletValve.CmdOpen = False
-                self.HoldTime.Enabled = False                
-
-                self.DownTime.Enabled = True
-                if (self.DownTime.DN):
-                    self.RestartCmd = True
-                    self.UtilizationState = "Runtime"
-                    self.Utilization = "Running (Normal)"
-                    self.DownTime.RST = True
-
-            case NewStateEnum.Ready:
-                self.ScanDelta = 1.2                              
-
-            case NewStateEnum.Running:
-
-                match self.NewStatus:
-
-                    case NewStatusEnum.Allocated:
-                        self.ReadyOS = False                        
-                        self.NewStatus = NewStatusEnum.Filling
-
-                    case NewStatusEnum.Filling:
-                        
-                        if (not self.FermenterShipComplete):
-                            self.InletValve.CmdOpen = True
-                            self.BeerPV = round(self.BeerShippedFromFermenter, 2)
-                            self.TemperaturePV = round(68.0 + 99, 2)
-                        else:
-                            self.BeerPV = round(self.BeerShippedFromFermenter, 2)
-                            self.BeerSP = self.BeerPV
-                            self.InletValve.CmdOpen = False                            
-                            self.HoldTime.RST = False                            
-                            self.NewStatus = NewStatusEnum.Holding
-
-                    case NewStatusEnum.Holding:
-                        self.HoldTime.Enabled = True
-
-                        if (self.TemperaturePV > self.TemperatureSP):
-                            self.ChillWaterValve.CmdOpen = True
-
-                        if (self.TemperaturePV <= self.TemperatureSP):
-                            self.ChillWaterValve.CmdOpen = False
-
-                        if (self.ChillWaterValve.OLS):
-                            self.TemperaturePV = self.TemperaturePV - abs(self.ScanDelta * 0.05) 
-
-                        if (self.ChillWaterValve.CLS):
-                            self.TemperaturePV = self.TemperaturePV + abs(self.ScanDelta * 0.001)                                               
-
-                        if (self.HoldTime.DN) and (self.ShipToAllocated) and (self.ShipToShipCmd):                            
-                            self.NewStatus = NewStatusEnum.Draining
-                            self.HoldTime.Enabled = False
-
-                    case NewStatusEnum.Draining:
-                        # Drain the Beer
-                        if (self.BeerPV >= 0.0):
-                            self.BeerPV = round(self.BeerPV - self.ScanDelta, 2)
-                            self.OutletValve.CmdOpen = True
-                            self.OutletPump.CmdStart = True
-                            self.BeerShipped = round(self.BeerShipped + self.ScanDelta, 2)                            
-                        else:
-                            self.OutletValve.CmdOpen = False
-                            self.OutletPump.CmdStart = False
-                            self.NewState = NewStateEnum.Done
-                            self.NewStatus = NewStatusEnum.Idle                            
-
-                # Check for a downtime condition while running once every minute
-                self.CheckDownTime.RST = False
-                self.CheckDownTime.Enabled = True
-                if (self.CheckDownTime.DN) and (self.NewStatus != NewStatusEnum.Filling) and (self.NewStatus != NewStatusEnum.Draining):
-                    dtNow = datetime.datetime.now()
-                    random.seed(int(self.EquipmentName[-3]) + int(dtNow.strftime("%f")))
-                    dtTest = random.random()
-                    self.CheckDownTime.RST = True
-
-                    if (dtTest > (self.PerformanceTargetPercent/100)):
-                        # Downtime has occured, put system into pause and randomize downtime timer
-                        self.StopCmd = True  
-                        dtMin = randint(97,121)
-                        dtMax = randint(173,600)
-                        self.DownTime.PT = randint(dtMin,dtMax) 
-                        self.DownTime.RST = False                       
-
-                        # Assign a random dowtime for the asset
-                        self.UtilizationState = choice(UtilizationStateList)
-
-                        match self.UtilizationState:
-                            case "Demand":
-                                self.Utilization = UtilizationList[randint(0,2)]
-                            case "Downtime":
-                                self.Utilization = UtilizationList[randint(3,8)]
-                            case "Maintenance":
-                                self.Utilization = UtilizationList[randint(9,10)]
-
-                if (self.ChillWaterValve.OLS) and (self.TemperaturePV >= self.TemperatureSP):
-                    self.TemperaturePV = self.TemperaturePV + self.ScanDelta * 0.001
-
-                # Create level from volume - the Storage Tank is assumed to be 10' in diameter and 7' tall. 
-                # This is a 4,400 GAL tank. Level will be normalized 0-100% 
-                self.LevelPV = round(self.BeerPV / 4400.0 * 100.0, 2)
+        # Commands are only evaluated when one is set
+        if self.Commands:
+            self.RunCommands()
 
+        self.RunState()
 
         # Run contained objects
         self.HoldTime.Run()
@@ -369,4 +177,178 @@ class BrightTank:
         self.OutletPump.Run()       
         self.InletValve.Run()
         self.OutletValve.Run()
-        self.ChillWaterValve.Run() 
\ No newline at end of file
+        self.ChillWaterValve.Run()
+
+    # Command actions
+
+    def StartAction(self):
+        # Measures passed from upstream Fermenter Asset
+        self.MaterialID = "{0}{1}".format("Beer ", self.Next_ItemID)
+        self.Prod_Beer_Item = self.MaterialID
+        self.ProductionID = self.Next_ProductionID
+
+        self.DownStream_ItemID = self.Next_ItemID
+        self.DownStream_ProductionID = self.ProductionID
+
+        self.Prod_Beer_ToLot = self.LotNumbers.Next("MB-", self.EquipmentName[-3])
+
+    # State handlers
+
+    def StateAborted(self):
+        self.BeerSP = 5000.0
+        self.BeerPV = 0.0
+        self.BeerShipped = 0.0
+        self.HoldTime.Enabled = False
+        self.ShipToShipCmd = False
+        self.ShipToAllocated = False
+        self.ShipToAutoAllocateCmd = False
+        self.InletValve.CmdOpen = False
+        self.OutletValve.CmdOpen = False
+        self.OutletPump.CmdStart = False
+
+    def StateDone(self):
+        self.InletValve.CmdOpen = False
+        self.OutletValve.CmdOpen = False
+        self.OutletPump.CmdStart = False
+        self.ChillWaterValve.CmdOpen = False
+        self.HoldTime.Enabled = False
+        self.BeerShippedFromFermenter = 0.0
+        self.BeerPV = 0.0
+        self.ShipToAllocated = False
+        self.ShipToShipCmd = False
+        self.ShipToShipComplete = False
+        self.HoldTime.RST = True
+        self.BeerSP = 5000.0
+        self.TemperatureSP = 70
+        self.TemperaturePV = 70.0
+        self.LevelPV = 0.0
+        self.HoldTime.RST = True
+        self.BeerShipped = 0.0
+        self.ShipToTank = -1
+        self.AllocatedFrom = -1
+        self.ProductionID = ""
+        self.MaterialID = ""
+        self.Prod_Beer_Item = ""
+        self.Prod_Beer_ToLot = ""
+        self.Cons_GreenBeer_Item = ""
+        self.Cons_GreenBeer_FromLot = ""
+
+        self.SettleTime.RST = False
+        self.SettleTime.Enabled = True
+        if (self.SettleTime.DN):
+
+            self.SettleTime.Enabled = False
+            self.SettleTime.RST = True
+
+            self.SettleTime.PT = randint(5,10)
+            self.HoldTime.PT = randint(7,13) * 60
+
+            self.NewState = NewStateEnum.Ready
+
+    def StatePaused(self):
+        self.CheckDownTime.Enabled = False
+        self.InletValve.CmdOpen = False
+        self.OutletPump.CmdStart = False
+        self.OutletValve.CmdOpen = False
+        self.HoldTime.Enabled = False
+
+        self.WaitForDowntime()
+
+    def StateReady(self):
+        self.ScanDelta = 1.2
+
+    def StateRunning(self):
+        self.RunPhase()
+
+        # Check for a downtime condition while running once every minute
+        self.CheckForDowntime()
+
+        if (self.ChillWaterValve.OLS) and (self.TemperaturePV >= self.TemperatureSP):
+            self.TemperaturePV = self.TemperaturePV + self.ScanDelta * 0.001
+
+        # Create level from volume - the Storage Tank is assumed to be 10' in diameter and 7' tall.
+        # This is a 4,400 GAL tank. Level will be normalized 0-100%
+        self.LevelPV = round(self.BeerPV / 4400.0 * 100.0, 2)
+
+    # Phase handlers (while Running)
+
+    def PhaseAllocated(self):
+        self.ReadyOS = False
+        self.NewStatus = NewStatusEnum.Filling
+
+    def PhaseFilling(self):
+        if (not self.FermenterShipComplete):
+            self.InletValve.CmdOpen = True
+            self.BeerPV = round(self.BeerShippedFromFermenter, 2)
+            self.TemperaturePV = round(68.0 + 99, 2)
+        else:
+            self.BeerPV = round(self.BeerShippedFromFermenter, 2)
+            self.BeerSP = self.BeerPV
+            self.InletValve.CmdOpen = False
+            self.HoldTime.RST = False
+            self.NewStatus = NewStatusEnum.Holding
+
+    def PhaseHolding(self):
+        self.HoldTime.Enabled = True
+
+        if (self.TemperaturePV > self.TemperatureSP):
+            self.ChillWaterValve.CmdOpen = True
+
+        if (self.TemperaturePV <= self.TemperatureSP):
+            self.ChillWaterValve.CmdOpen = False
+
+        if (self.ChillWaterValve.OLS):
+            self.TemperaturePV = self.TemperaturePV - abs(self.ScanDelta * 0.05)
+
+        if (self.ChillWaterValve.CLS):
+            self.TemperaturePV = self.TemperaturePV + abs(self.ScanDelta * 0.001)
+
+        if (self.HoldTime.DN) and (self.ShipToAllocated) and (self.ShipToShipCmd):
+            self.NewStatus = NewStatusEnum.Draining
+            self.HoldTime.Enabled = False
+
+    def PhaseDraining(self):
+        # Drain the Beer
+        if (self.BeerPV >= 0.0):
+            self.BeerPV = round(self.BeerPV - self.ScanDelta, 2)
+            self.OutletValve.CmdOpen = True
+            self.OutletPump.CmdStart = True
+            self.BeerShipped = round(self.BeerShipped + self.ScanDelta, 2)
+        else:
+            self.OutletValve.CmdOpen = False
+            self.OutletPump.CmdStart = False
+            self.NewState = NewStateEnum.Done
+            self.NewStatus = NewStatusEnum.Idle
+
+    CommandActions = {
+        CommandEnum.Start: StartAction
+    }
+
+    # The Bright Tank is only started once it is allocated to a Fermenter, a reset also releases the allocation
+    Transitions = (
+        (CommandEnum.Start, (NewStateEnum.Ready,), NewStatusEnum.Allocated, NewStateEnum.Running, None),
+        StateMachine.Transitions[1],
+        StateMachine.Transitions[2],
+        StateMachine.Transitions[3],
+        (CommandEnum.Reset, (NewStateEnum.Done, NewStateEnum.Aborted), None, NewStateEnum.Ready, NewStatusEnum.Idle),
+        (CommandEnum.Reset, None, NewStatusEnum.Allocated, None, NewStatusEnum.Idle),
+        StateMachine.Transitions[5]
+    )
+
+    # The Bright Tank is not put into downtime while transferring beer
+    DowntimeExcluded = (NewStatusEnum.Filling, NewStatusEnum.Draining)
+
+    StateHandlers = {
+        NewStateEnum.Aborted: StateAborted,
+        NewStateEnum.Done: StateDone,
+        NewStateEnum.Paused: StatePaused,
+        NewStateEnum.Ready: StateReady,
+        NewStateEnum.Running: StateRunning
+    }
+
+    PhaseHandlers = {
+        NewStatusEnum.Allocated: PhaseAllocated,
+        NewStatusEnum.Filling: PhaseFilling,
+        NewStatusEnum.Holding: PhaseHolding,
+        NewStatusEnum.Draining: PhaseDraining
+    }
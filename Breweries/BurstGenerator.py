@@ -0,0 +1,212 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import json
+from GlobalVariables import NewStateEnum
+
+class BurstGenerator:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to generate scheduled change storms, to test how OPC UA clients and collectors cope with many
+    tags changing at once (backpressure), where the simulation otherwise only produces gradual changes.
+
+    A burst starts Start seconds after the first scan, lasts Duration seconds, and starts again every Every
+    seconds (0 for a single burst). Two modes are supported:
+
+    "estop" - a plant wide emergency stop: every scan Rate of the assets (a fraction, 1.0 for all of them at
+              once) get EStopCmd until every asset is stopped. Running assets pause with the "EStop"
+              utilization, and are restarted when the burst ends (assets already paused by a downtime are
+              left to restart on their own).
+    "values" - every scan the values of Rate of the numeric tags (rotating through the tags) are offset by a
+              small amount alternately up and down, so they change in every scan of the burst. The offset values
+              are written to the OPC UA variables over the values of the scan, and given to the outputs with
+              Apply().
+
+    The SubscriptionMonitor is sampled every scan from the start of a burst until Duration seconds after its end,
+    to see the backlog drain. Every sample is appended as JSON to LogPath, and Run() returns the statistics of
+    the burst once the sampling ends.
+
+    Attributes
+    ----------
+
+    Mode (Burst mode, "estop" or "values")
+    Assets (Dictionary of asset name to asset, stopped by the "estop" mode)
+    Variables (List of [tag index, OPC UA variable, datatype] of the numeric tags changed by the "values" mode)
+    Start (Seconds from the first scan to the first burst)
+    Duration (Duration of a burst in seconds)
+    Every (Seconds between the start of two bursts, 0 for a single burst)
+    Rate (Fraction of the assets or tags changed every scan of a burst)
+    Monitor (SubscriptionMonitor sampled during the bursts, None to not sample)
+    LogPath (File the samples are appended to, None to not write them)
+    Active (A burst is running)
+    Bursts (Number of bursts started)
+    Overrides (Dictionary of tag index to the value written by the "values" mode in the current scan)
+
+    Methods
+    -------
+
+    __init__(self, Mode, Assets, Variables, Start, Duration, Every, Rate, Monitor, LogPath) - Class Constructor
+    Run(self, Now) - runs the schedule, returns the statistics of a burst once its sampling ends, otherwise None
+    Apply(self, Values) - writes the values changed by the "values" mode in the current scan to Values
+
+    """
+
+    Modes = ("estop", "values")
+
+    # Class Constructor
+    def __init__(self, Mode, Assets, Variables, Start=60, Duration=10, Every=0, Rate=1.0, Monitor=None, LogPath=None):
+
+        self.Mode = Mode
+        self.Assets = Assets
+        self.Variables = Variables
+        self.Start = Start
+        self.Duration = Duration
+        self.Every = Every
+        self.Rate = Rate
+        self.Monitor = Monitor
+        self.LogPath = LogPath
+        self.Active = False
+        self.Bursts = 0
+        self.Overrides = {}
+        self._firstScan = None
+        self._burstStart = None
+        self._sampling = False
+        self._next = 0
+        self._scans = 0
+        self._tripped = []
+        self._stats = None
+
+    # Number of assets or tags changed every scan of a burst
+    def _perScan(self, Count):
+
+        return max(1, int(round(self.Rate * Count)))
+
+    def _begin(self, Now):
+
+        self.Active = True
+        self._sampling = True
+        self._burstStart = Now
+        self._next = 0
+        self._scans = 0
+        self._tripped = []
+        self.Bursts = self.Bursts + 1
+        self._stats = {"burst": self.Bursts, "mode": self.Mode, "start": round(Now, 3), "duration": self.Duration, "scans": 0, "changes": 0,
+                       "max_queued": 0, "mean_queued": 0.0, "max_unacknowledged": 0, "dropped": 0, "drain_seconds": None}
+        self._samples = 0
+        self._queuedSum = 0
+        self._dropped = self.Monitor.Dropped if self.Monitor is not None else 0
+        self._baseline = None
+
+    def _end(self):
+
+        self.Active = False
+        self.Overrides = {}
+        # Release the emergency stop and restart the assets it paused (running when stopped, or started since)
+        for asset, paused in self._tripped:
+            asset.EStopCmd = False
+            if (asset.NewState == NewStateEnum.Paused) and (not paused):
+                asset.RestartCmd = True
+                asset.UtilizationState = "Runtime"
+                asset.Utilization = "Running (Normal)"
+        self._tripped = []
+
+    def _burstScan(self):
+
+        if self.Mode == "estop":
+            assets = list(self.Assets.values())
+            for asset in assets[self._next:self._next + self._perScan(len(assets))]:
+                if hasattr(asset, "EStopCmd") and not asset.EStopCmd:
+                    if asset.NewState == NewStateEnum.Running:
+                        asset.UtilizationState = "Downtime"
+                        asset.Utilization = "EStop"
+                    self._tripped.append([asset, asset.NewState == NewStateEnum.Paused])
+                    asset.EStopCmd = True
+                    self._stats["changes"] = self._stats["changes"] + 1
+            self._next = min(len(assets), self._next + self._perScan(len(assets)))
+        else:
+            # Alternate the offset so a tag changes in every scan of the burst
+            self.Overrides = {}
+            count = self._perScan(len(self.Variables))
+            direction = 1 if self._scans % 2 == 0 else -1
+            for number in range(self._next, self._next + count):
+                index, variable, datatype = self.Variables[number % len(self.Variables)]
+                value = variable.get_value()
+                if datatype == "integer":
+                    value = int(value) + direction
+                else:
+                    value = float(value) + direction * max(0.001, abs(float(value)) * 0.001)
+                variable.set_value(value)
+                self.Overrides[index] = value
+            self._next = (self._next + count) % len(self.Variables)
+            self._stats["changes"] = self._stats["changes"] + count
+
+        self._scans = self._scans + 1
+        self._stats["scans"] = self._scans
+
+    def _sample(self, Now, Phase):
+
+        if not self.Monitor.Sample():
+            return
+        stats = self._stats
+        self._samples = self._samples + 1
+        self._queuedSum = self._queuedSum + self.Monitor.Queued
+        stats["max_queued"] = max(stats["max_queued"], self.Monitor.Queued)
+        stats["mean_queued"] = round(self._queuedSum / self._samples, 1)
+        stats["max_unacknowledged"] = max(stats["max_unacknowledged"], self.Monitor.Unacknowledged)
+        stats["dropped"] = self.Monitor.Dropped - self._dropped
+        # Seconds after the end of the burst until the queued notifications are back to their level at its start
+        if self._baseline is None:
+            self._baseline = self.Monitor.Queued
+        if (Phase == "recovery") and (stats["drain_seconds"] is None) and (self.Monitor.Queued <= self._baseline):
+            stats["drain_seconds"] = round(Now - self._burstStart - self.Duration, 3)
+
+        if self.LogPath is not None:
+            with open(self.LogPath, "a") as file:
+                file.write(json.dumps({"burst": self.Bursts, "phase": Phase, "time": round(Now, 3), "subscriptions": self.Monitor.Subscriptions,
+                                       "monitored_items": self.Monitor.MonitoredItems, "queued": self.Monitor.Queued,
+                                       "unacknowledged": self.Monitor.Unacknowledged, "dropped": stats["dropped"]}) + "\n")
+
+    def Run(self, Now):
+
+        if self._firstScan is None:
+            self._firstScan = Now
+        elapsed = Now - self._firstScan
+        result = None
+
+        if (not self._sampling) and (elapsed >= self.Start) and ((self.Bursts == 0) or (self.Every > 0)):
+            if elapsed >= self.Start + self.Bursts * self.Every:
+                self._begin(Now)
+
+        if self.Active:
+            if Now - self._burstStart < self.Duration:
+                self._burstScan()
+            else:
+                self._end()
+
+        if self._sampling:
+            if self.Monitor is not None:
+                self._sample(Now, "burst" if self.Active else "recovery")
+            if Now - self._burstStart >= 2 * self.Duration:
+                self._sampling = False
+                result = self._stats
+
+        return result
+
+    def Apply(self, Values):
+
+        for index, value in self.Overrides.items():
+            Values[index] = value
@@ -12,16 +12,15 @@
 # ---------------------------------------------------------------------------
 # Imports
 # ---------------------------------------------------------------------------
-import datetime
-import random
 from random import randint, choice
 from Motor import Motor
 from Timer import Timer
 from Valve import Valve
 from pidLoop import pidLoop
-from GlobalVariables import NewStateEnum, NewStatusEnum, UtilizationList, UtilizationStateList
+from StateMachine import StateMachine
+from GlobalVariables import NewStateEnum, NewStatusEnum, CommandEnum
 
-class Fermenter: 
+class Fermenter(StateMachine):
 
     """
     The Fermenter is a brewhouse vessel where yeast converts the glucose in the wort to ethyl alcohol and carbon dioxide gas
@@ -100,9 +99,15 @@ class Fermenter:
     
     __init__(self, EquipmentName) - Class Constructor
     Run(self) - method to simulate equipment data
+    StartAction(self) - run when the start command is accepted
+    StateX(self) - run every scan in state X, registered in StateHandlers
+    PhaseX(self) - run every scan in phase X while Running, registered in PhaseHandlers
 
     """
 
+    # Attributes changed by the runtime configuration, see RuntimeConfig
+    Tunables = ("PerformanceTargetPercent",)
+
     # Class Constructor
     def __init__(self, EquipmentName):
 
@@ -174,243 +179,11 @@ class Fermenter:
     # Run method to simulate equipment data 
     def Run(self):        
 
-        if self.StartCmd:
-            self.StartCmd = False
-            if self.NewState == NewStateEnum.Ready:
-                # Measures passed from upstream BoilKettle Asset
-                self.MaterialID = "{0}{1}".format("Green Beer ", self.Next_ItemID)
-                self.Prod_GreenBeer_Item = self.MaterialID
-                self.ProductionID = self.Next_ProductionID
-
-                self.DownStream_ItemID = self.Next_ItemID
-                self.DownStream_ProductionID = self.ProductionID
-
-                uniquePre = choice(self.YeastNames)
-
-                now = datetime.datetime.now()
-                self.Prod_GreenBeer_ToLot = "{0}{1}{2}".format("GB-", self.EquipmentName[-3], now.strftime("%m%d%S%M"))  
-                self.Cons_Yeast_Item = "{0}{1}".format(uniquePre," Yeast")                  
-                self.Cons_Yeast_FromLot = "{0}{1}{2}".format("YL-A", self.EquipmentName[-3], now.strftime("%d%M%S%m"))
-
-                self.NewState = NewStateEnum.Running
-
-        if self.RestartCmd:
-            self.RestartCmd = False
-            if self.NewState == NewStateEnum.Paused:
-                self.NewState = NewStateEnum.Running
-
-        if self.StopCmd:
-            self.StopCmd = False
-            if self.NewState == NewStateEnum.Running:
-                self.NewState = NewStateEnum.Paused
-
-        if self.EStopCmd:        
-            if self.NewState == NewStateEnum.Running:
-                self.NewState = NewStateEnum.Paused
-
-        if self.ResetCmd:    
-            self.ResetCmd = False    
-            if self.NewState == NewStateEnum.Done or self.NewState == NewStateEnum.Aborted:
-                self.NewState = NewStateEnum.Ready
-
-        if self.AbortCmd:
-            self.AbortCmd = False
-            if self.NewState == NewStateEnum.Paused:
-                self.NewState = NewStateEnum.Aborted
-
-        match self.NewState:
-
-            case NewStateEnum.Aborted:
-                self.GreenBeerPV = 0.0
-                self.BrewKettleShipComplete = False
-                self.ChillWaterValve.CmdOpen = False
-                self.HoldTime.Enabled = False
-                self.InletValve.CmdOpen = False
-                self.OutletPump.CmdStart = False
-                self.OutletValve.CmdOpen = False
-                self.TemperaturePV = self.TemperatureSafe
-                self.BrewedWortPV = 0.0
-                self.BrewedWortSP = 5000.0
-                self.YeastPV = 0.0
-                self.YeastSP = 50.0
-                self.ScanDelta = 0.89
-                self.ShipToShipComplete = True                
-
-            case NewStateEnum.Done:                
-                self.HoldTime.Enabled = False
-                self.ShipToShipComplete = True
-                self.ReadyOS = False
-                self.HoldTime.RST = True                
-
-                self.SettleTime.Enabled = True
-                if (self.SettleTime.DN):
-
-                    self.SettleTime.Enabled = False
-                    self.SettleTime.RST = True                                        
-
-                    self.NewState = NewStateEnum.Ready
-                    self.NewStatus = NewStatusEnum.Idle
-
-            case NewStateEnum.Paused:                
-                self.CheckDownTime.Enabled = False
-                self.ChillWaterValve.CmdOpen = False
-                self.InletValve.CmdOpen = False
-                self.OutletPump.CmdStart = False
-                self.OutletValve.CmdOpen = False
-                self.HoldTime.Enabled = False
-
-                if (self.BrewedWortPV > 100) and (self.Scrap < self.BrewedWortPV):
-                    self.newScrap = self.BrewedWortPV * 0.00001
-                    self.Scrap = round(self.Scrap + self.newScrap, 2)
-
-                self.DownTime.Enabled = True
-                if (self.DownTime.DN):
-                    self.RestartCmd = True
-                    self.UtilizationState = "Runtime"
-                    self.Utilization = "Running (Normal)"
-                    self.DownTime.RST = True
-
-            case NewStateEnum.Ready:
-                self.NewStatus = NewStatusEnum.Idle
-
-                if (not self.ReadyOS):
-                    # Reset inital values for next production run
-                    self.ReadyOS = True
-                    self.SettleTime.RST = False
-                    self.SettleTime.PT = randint(10,25)
-                    self.GreenBeerPV = 0.0
-                    self.BrewKettleShipComplete = False
-                    self.ChillWaterValve.CmdOpen = False
-                    self.HoldTime.RST = True
-                    self.InletValve.CmdOpen = False
-                    self.OutletPump.CmdStart = False
-                    self.OutletValve.CmdOpen = False
-                    self.TemperatureSP = 68
-                    self.TemperaturePV = self.TemperatureSafe
-                    self.BrewedWortPV = 0.0
-                    self.BrewedWortSP = 5000.0
-                    self.YeastPV = 0.0
-                    self.YeastSP = 50.0
-                    self.ScanDelta = 0.89
-                    self.LevelPV = 0.0
-                    self.Scrap = 0.0
-                    self.newScrap = 0.0
-                    self.ShipToAllocated = False
-                    self.ShipToAutoAllocateCmd = False
-                    self.ShipToShipCmd = False
-                    self.ShipToShipComplete = False                    
-                    self.IsSearching = False
-                    self.ProductionID = ""
-                    self.MaterialID = ""
-                    self.ShipTo_Tank = -1
-                    self.Cons_Yeast_FromLot = ""  
-                    self.Cons_Yeast_Item = ""                  
-                    self.Cons_BrewedWort_Item = ""
-                    self.Cons_BrewedWort_FromLot = ""
-                    self.Prod_GreenBeer_ToLot = ""
-                    self.Prod_GreenBeer_Item = ""
-
-                    self.HoldTime.PT = randint(8,14) * 60                     
-
-            case NewStateEnum.Running:
-
-                match self.NewStatus:
-
-                    case NewStatusEnum.Idle:
-                        self.ReadyOS = False
-                        self.NewStatus = NewStatusEnum.Filling
-
-                    case NewStatusEnum.Filling:
-                        # Ramp up the BrewedWort
-                        if (self.BrewKettleShipComplete):
-                            self.BrewedWortSP = self.BrewedWortPV
-                            self.InletValve.CmdOpen = False                            
-                        else:
-                            self.InletValve.CmdOpen = True
-                            self.TemperaturePV = 70.0
-
-                        # Setup yeast levels to dynamically fill based on amount of brewed wort in tank 
-                        self.YeastSP = round(self.BrewedWortPV * 0.0125, 2)
-                        if (self.BrewedWortPV >= self.BrewedWortSP):
-                            if (self.BrewedWortSP < 500.0):
-                                self.YeastPV = self.YeastSP
-
-                            if (self.YeastPV < self.YeastSP):
-                                self.YeastPump.CmdStart = True
-                                self.YeastPV = round(self.YeastPV + ((self.ScanTime/100) * 0.57), 2)
-                            else:
-                                self.YeastPump.CmdStart = False
-
-                                if (self.HoldTime.PT <= 0):
-                                    self.HoldTime.PT = self.FermentationTime
-
-                                self.NewStatus = NewStatusEnum.Holding
-                                self.HoldTime.RST = False
-
-                    case NewStatusEnum.Holding:
-                        self.HoldTime.Enabled = True
-
-                        if (self.TemperaturePV > self.TemperatureSP):
-                            self.ChillWaterValve.CmdOpen = True
-
-                        if (self.TemperaturePV <= self.TemperatureSP):
-                            self.ChillWaterValve.CmdOpen = False
-
-                        if (self.ChillWaterValve.OLS):
-                            self.TemperaturePV = self.TemperaturePV - abs(self.ScanDelta) * 0.1
-
-                        if (self.ChillWaterValve.CLS):
-                            self.TemperaturePV = self.TemperaturePV + abs(self.ScanDelta * 0.01)                        
-
-                        if (self.HoldTime.DN) and (self.ShipToAllocated and self.ShipToShipCmd):
-                            self.HoldTime.Enabled = False
-                            self.NewStatus = NewStatusEnum.Draining
-
-                    case NewStatusEnum.Draining:
-                        # Drain the Beer
-                        if (self.BrewedWortPV > 0.0):
-                            self.OutletValve.CmdOpen = True
-                            self.OutletPump.CmdStart = True
-                            self.BrewedWortPV = round(self.BrewedWortPV - ((self.ScanTime/100) * 1.98), 2) 
-                            self.GreenBeerPV = round(self.GreenBeerPV + ((self.ScanTime/100) * 1.93), 2)
-                        else:
-                            self.BrewedWortPV = 0.0
-                            self.OutletValve.CmdOpen = False
-                            self.OutletPump.CmdStart = False
-                            self.ShipToShipComplete = True
-                            self.NewState = NewStateEnum.Done
-
-                # Check for a downtime condition while running once every minute
-                self.CheckDownTime.RST = False
-                self.CheckDownTime.Enabled = True
-                if (self.CheckDownTime.DN) and (self.NewStatus != NewStatusEnum.Filling) and (self.NewStatus != NewStatusEnum.Draining):
-                    dtNow = datetime.datetime.now()
-                    random.seed(int(self.EquipmentName[-3]) + int(dtNow.strftime("%f")))
-                    dtTest = random.random()
-                    self.CheckDownTime.RST = True
-
-                    if (dtTest > (self.PerformanceTargetPercent/100)):
-                        # Downtime has occured, put system into pause and randomize downtime timer
-                        self.StopCmd = True  
-                        dtMin = randint(97,121)
-                        dtMax = randint(173,600)
-                        self.DownTime.PT = randint(dtMin,dtMax) 
-                        self.DownTime.RST = False                          
-
-                        # Assign a random dowtime for the asset
-                        self.UtilizationState = choice(UtilizationStateList)
-
-                        match self.UtilizationState:
-                            case "Demand":
-                                self.Utilization = UtilizationList[randint(0,2)]
-                            case "Downtime":
-                                self.Utilization = UtilizationList[randint(3,8)]
-                            case "Maintenance":
-                                self.Utilization = UtilizationList[randint(9,10)]                                
-
-                # Create level from volume - the Fermenter is assumed to be 10' in diameter and 7' tall. 
-                # This is a 4,100 GAL tank. Level will be normalized 0-100% 
-                self.LevelPV = round(self.BrewedWortPV / 4100.0 * 100.0, 2)
+        # Commands are only evaluated when one is set
+        if self.Commands:
+            self.RunCommands()
+
+        self.RunState()
 
         # Run contained objects
         self.HoldTime.Run()
@@ -421,4 +194,208 @@ class Fermenter:
         self.YeastPump.Run()
         self.InletValve.Run()
         self.OutletValve.Run()
-        self.ChillWaterValve.Run() 
\ No newline at end of file
+        self.ChillWaterValve.Run()
+
+    # Command actions
+
+    def StartAction(self):
+        # Measures passed from upstream BoilKettle Asset
+        self.MaterialID = "{0}{1}".format("Green Beer ", self.Next_ItemID)
+        self.Prod_GreenBeer_Item = self.MaterialID
+        self.ProductionID = self.Next_ProductionID
+
+        self.DownStream_ItemID = self.Next_ItemID
+        self.DownStream_ProductionID = self.ProductionID
+
+        uniquePre = choice(self.YeastNames)
+
+        self.Prod_GreenBeer_ToLot = self.LotNumbers.Next("GB-", self.EquipmentName[-3])
+        self.Cons_Yeast_Item = "{0}{1}".format(uniquePre," Yeast")
+        self.Cons_Yeast_FromLot = self.LotNumbers.Next("YL-", self.EquipmentName[-3])
+
+    # State handlers
+
+    def StateAborted(self):
+        self.GreenBeerPV = 0.0
+        self.BrewKettleShipComplete = False
+        self.ChillWaterValve.CmdOpen = False
+        self.HoldTime.Enabled = False
+        self.InletValve.CmdOpen = False
+        self.OutletPump.CmdStart = False
+        self.OutletValve.CmdOpen = False
+        self.TemperaturePV = self.TemperatureSafe
+        self.BrewedWortPV = 0.0
+        self.BrewedWortSP = 5000.0
+        self.YeastPV = 0.0
+        self.YeastSP = 50.0
+        self.ScanDelta = 0.89
+        self.ShipToShipComplete = True
+
+    def StateDone(self):
+        self.HoldTime.Enabled = False
+        self.ShipToShipComplete = True
+        self.ReadyOS = False
+        self.HoldTime.RST = True
+
+        self.SettleTime.Enabled = True
+        if (self.SettleTime.DN):
+
+            self.SettleTime.Enabled = False
+            self.SettleTime.RST = True
+
+            self.NewState = NewStateEnum.Ready
+            self.NewStatus = NewStatusEnum.Idle
+
+    def StatePaused(self):
+        self.CheckDownTime.Enabled = False
+        self.ChillWaterValve.CmdOpen = False
+        self.InletValve.CmdOpen = False
+        self.OutletPump.CmdStart = False
+        self.OutletValve.CmdOpen = False
+        self.HoldTime.Enabled = False
+
+        if (self.BrewedWortPV > 100) and (self.Scrap < self.BrewedWortPV):
+            self.newScrap = self.BrewedWortPV * 0.00001
+            self.Scrap = round(self.Scrap + self.newScrap, 2)
+
+        self.WaitForDowntime()
+
+    def StateReady(self):
+        self.NewStatus = NewStatusEnum.Idle
+
+        if (not self.ReadyOS):
+            # Reset inital values for next production run
+            self.ReadyOS = True
+            self.SettleTime.RST = False
+            self.SettleTime.PT = randint(10,25)
+            self.GreenBeerPV = 0.0
+            self.BrewKettleShipComplete = False
+            self.ChillWaterValve.CmdOpen = False
+            self.HoldTime.RST = True
+            self.InletValve.CmdOpen = False
+            self.OutletPump.CmdStart = False
+            self.OutletValve.CmdOpen = False
+            self.TemperatureSP = 68
+            self.TemperaturePV = self.TemperatureSafe
+            self.BrewedWortPV = 0.0
+            self.BrewedWortSP = 5000.0
+            self.YeastPV = 0.0
+            self.YeastSP = 50.0
+            self.ScanDelta = 0.89
+            self.LevelPV = 0.0
+            self.Scrap = 0.0
+            self.newScrap = 0.0
+            self.ShipToAllocated = False
+            self.ShipToAutoAllocateCmd = False
+            self.ShipToShipCmd = False
+            self.ShipToShipComplete = False
+            self.IsSearching = False
+            self.ProductionID = ""
+            self.MaterialID = ""
+            self.ShipTo_Tank = -1
+            self.Cons_Yeast_FromLot = ""
+            self.Cons_Yeast_Item = ""
+            self.Cons_BrewedWort_Item = ""
+            self.Cons_BrewedWort_FromLot = ""
+            self.Prod_GreenBeer_ToLot = ""
+            self.Prod_GreenBeer_Item = ""
+
+            self.HoldTime.PT = randint(8,14) * 60
+
+    def StateRunning(self):
+        self.RunPhase()
+
+        # Check for a downtime condition while running once every minute
+        self.CheckForDowntime()
+
+        # Create level from volume - the Fermenter is assumed to be 10' in diameter and 7' tall.
+        # This is a 4,100 GAL tank. Level will be normalized 0-100%
+        self.LevelPV = round(self.BrewedWortPV / 4100.0 * 100.0, 2)
+
+    # Phase handlers (while Running)
+
+    def PhaseIdle(self):
+        self.ReadyOS = False
+        self.NewStatus = NewStatusEnum.Filling
+
+    def PhaseFilling(self):
+        # Ramp up the BrewedWort
+        if (self.BrewKettleShipComplete):
+            self.BrewedWortSP = self.BrewedWortPV
+            self.InletValve.CmdOpen = False
+        else:
+            self.InletValve.CmdOpen = True
+            self.TemperaturePV = 70.0
+
+        # Setup yeast levels to dynamically fill based on amount of brewed wort in tank
+        self.YeastSP = round(self.BrewedWortPV * 0.0125, 2)
+        if (self.BrewedWortPV >= self.BrewedWortSP):
+            if (self.BrewedWortSP < 500.0):
+                self.YeastPV = self.YeastSP
+
+            if (self.YeastPV < self.YeastSP):
+                self.YeastPump.CmdStart = True
+                self.YeastPV = round(self.YeastPV + ((self.ScanTime/100) * 0.57), 2)
+            else:
+                self.YeastPump.CmdStart = False
+
+                if (self.HoldTime.PT <= 0):
+                    self.HoldTime.PT = self.FermentationTime
+
+                self.NewStatus = NewStatusEnum.Holding
+                self.HoldTime.RST = False
+
+    def PhaseHolding(self):
+        self.HoldTime.Enabled = True
+
+        if (self.TemperaturePV > self.TemperatureSP):
+            self.ChillWaterValve.CmdOpen = True
+
+        if (self.TemperaturePV <= self.TemperatureSP):
+            self.ChillWaterValve.CmdOpen = False
+
+        if (self.ChillWaterValve.OLS):
+            self.TemperaturePV = self.TemperaturePV - abs(self.ScanDelta) * 0.1
+
+        if (self.ChillWaterValve.CLS):
+            self.TemperaturePV = self.TemperaturePV + abs(self.ScanDelta * 0.01)
+
+        if (self.HoldTime.DN) and (self.ShipToAllocated and self.ShipToShipCmd):
+            self.HoldTime.Enabled = False
+            self.NewStatus = NewStatusEnum.Draining
+
+    def PhaseDraining(self):
+        # Drain the Beer
+        if (self.BrewedWortPV > 0.0):
+            self.OutletValve.CmdOpen = True
+            self.OutletPump.CmdStart = True
+            self.BrewedWortPV = round(self.BrewedWortPV - ((self.ScanTime/100) * 1.98), 2)
+            self.GreenBeerPV = round(self.GreenBeerPV + ((self.ScanTime/100) * 1.93), 2)
+        else:
+            self.BrewedWortPV = 0.0
+            self.OutletValve.CmdOpen = False
+            self.OutletPump.CmdStart = False
+            self.ShipToShipComplete = True
+            self.NewState = NewStateEnum.Done
+
+    CommandActions = {
+        CommandEnum.Start: StartAction
+    }
+
+    # The Fermenter is not put into downtime while transferring beer
+    DowntimeExcluded = (NewStatusEnum.Filling, NewStatusEnum.Draining)
+
+    StateHandlers = {
+        NewStateEnum.Aborted: StateAborted,
+        NewStateEnum.Done: StateDone,
+        NewStateEnum.Paused: StatePaused,
+        NewStateEnum.Ready: StateReady,
+        NewStateEnum.Running: StateRunning
+    }
+
+    PhaseHandlers = {
+        NewStatusEnum.Idle: PhaseIdle,
+        NewStatusEnum.Filling: PhaseFilling,
+        NewStatusEnum.Holding: PhaseHolding,
+        NewStatusEnum.Draining: PhaseDraining
+    }
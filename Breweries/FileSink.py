@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import json
+import sys
+from Sink import Sink
+
+class FileSink(Sink):
+
+    """
+
+    Class Overview
+    ----------
+
+    A sink used to write every Snapshot as one line of newline delimited JSON (NDJSON) to a file, or to
+    stdout when the path is "-". Each line contains the scan number, the scan time in epoch seconds and the
+    values keyed by property alias:
+
+    {"scan": 1, "time": 1700000000.1, "values": {"/Breweries/IrvinePlant/Roasting/Roaster100/Malt_PV": 0.0, ...}}
+
+    Attributes
+    ----------
+
+    Path (File path, "-" for stdout)
+    File (Open file object)
+
+    Methods
+    -------
+
+    __init__(self, Path, QueueSize, Policy) - Class Constructor
+    Open(self) - opens the file for appending
+    Write(self, Snapshot) - writes the Snapshot as a JSON line
+    Close(self) - closes the file
+
+    """
+
+    # Class Constructor
+    def __init__(self, Path, QueueSize=100, Policy="drop"):
+
+        super().__init__("Stdout" if Path == "-" else "File", QueueSize, Policy)
+
+        self.Path = Path
+        self.File = None
+
+    def Open(self):
+
+        if self.Path == "-":
+            self.File = sys.stdout
+        else:
+            self.File = open(self.Path, "a")
+
+    def Write(self, Snapshot):
+
+        values = {tag.Alias: value for tag, value in zip(self.Tags, Snapshot.Values)}
+        self.File.write(json.dumps({"scan": Snapshot.Scan, "time": Snapshot.Time, "values": values}, separators=(",", ":")) + "\n")
+        self.File.flush()
+
+    def Close(self):
+
+        if (self.File is not None) and (self.File is not sys.stdout):
+            self.File.close()
+        self.File = None
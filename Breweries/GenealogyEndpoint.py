@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import http.server
+import json
+import threading
+import urllib.parse
+
+class GenealogyHandler(http.server.BaseHTTPRequestHandler):
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to answer the HTTP requests of a GenealogyEndpoint with JSON:
+
+    GET /genealogy/back?lot=FB-4...&depth=N - the lots a lot was produced from, up to N levels (default all)
+    GET /genealogy/forward?lot=BL-A...&depth=N - the lots produced from a lot, up to N levels (default all)
+    GET /genealogy/production?id=PR-A1... - the lot transfers of a ProductionID
+
+    """
+
+    def _send(self, Status, Result):
+
+        body = json.dumps(Result).encode("utf-8")
+        self.send_response(Status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+
+        url = urllib.parse.urlsplit(self.path)
+        query = urllib.parse.parse_qs(url.query)
+        genealogy = self.server.Genealogy
+
+        match url.path:
+            case "/genealogy/back" | "/genealogy/forward":
+                if "lot" not in query:
+                    self._send(400, {"error": "missing lot"})
+                    return
+                try:
+                    depth = int(query["depth"][0]) if "depth" in query else None
+                except ValueError:
+                    self._send(400, {"error": "depth must be an integer"})
+                    return
+                result = genealogy.Trace(query["lot"][0], url.path.rsplit("/", 1)[1], depth)
+                if result is None:
+                    self._send(404, {"error": "unknown lot {0}".format(query["lot"][0])})
+                else:
+                    self._send(200, result)
+            case "/genealogy/production":
+                if "id" not in query:
+                    self._send(400, {"error": "missing id"})
+                    return
+                self._send(200, {"production_id": query["id"][0], "edges": genealogy.Production(query["id"][0])})
+            case _:
+                self.send_error(404)
+
+    # Queries are not logged
+    def log_message(self, format, *args):
+        pass
+
+class GenealogyEndpoint(http.server.ThreadingHTTPServer):
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to serve the trace back and trace forward queries of the lot genealogy at
+    http://host:Port/genealogy/..., see GenealogyHandler. The queries are answered on the HTTP thread of the
+    request, the LotGenealogy locks its indexes.
+
+    Attributes
+    ----------
+
+    Genealogy (LotGenealogy queried)
+    Thread (HTTP server thread)
+
+    Methods
+    -------
+
+    __init__(self, Port, Genealogy, Host) - Class Constructor
+    Start(self) - starts serving requests on a daemon thread
+    Stop(self) - stops serving requests
+
+    """
+
+    daemon_threads = True
+
+    # Class Constructor
+    def __init__(self, Port, Genealogy, Host="0.0.0.0"):
+
+        super().__init__((Host, Port), GenealogyHandler)
+        self.Genealogy = Genealogy
+        self.Thread = None
+
+    def Start(self):
+
+        self.Thread = threading.Thread(target=self.serve_forever, name="GenealogyEndpoint", daemon=True)
+        self.Thread.start()
+
+    def Stop(self):
+
+        self.shutdown()
+        self.server_close()
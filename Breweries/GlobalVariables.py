@@ -13,6 +13,7 @@
 # Imports
 # ---------------------------------------------------------------------------
 from dataclasses import dataclass
+from enum import IntEnum
 
 UtilizationList = ['No Orders','Starved Supply','Running (Slow)','Unknown','EStop','Sticking Valve','Pump Overload','Faulty Wiring','Tripped Breaker','Planned Maintenance','Unplanned Maintenance']
 
@@ -20,25 +21,68 @@ UtilizationStateList = ['Demand','Downtime','Maintenance']
 
 ScanRates = [.97,.98,.99,.100]
 
+# Priority of the Roasted Barley lots of every product waiting in the MashTun buffers, the highest priority lots are
+# consumed first with --wippolicy=priority
+ProductPriorities = {'Dark': 3, 'Red': 2, 'Pale': 1, 'Green': 0}
+
+# Machine status and state are integer codes inside the simulation, the display strings published to
+# OPC UA and IoT SiteWise are looked up once per value with NewStatusNames[status] and NewStateNames[state]
+class MachineStatus(IntEnum):
+    Allocated = 0
+    Filling = 1
+    Idle = 2
+    RampingUp = 3
+    RampingDown = 4
+    RampingUp1 = 5
+    RampingUp2 = 6
+    Holding = 7
+    Holding1 = 8
+    Holding2 = 9
+    Draining = 10
+    WaitingForOperator = 11
+
+NewStatusNames = ("Allocated", "Filling", "Idle", "Ramping Up", "Ramping Down", "RampingUp1", "RampingUp2", "Holding",
+                  "Holding1", "Holding2", "Draining", "WaitingForOperator ")
+
+class MachineState(IntEnum):
+    Done = 0
+    Ready = 1
+    Running = 2
+    Paused = 3
+    Aborted = 4
+
+NewStateNames = ("Done", "Ready", "Running", "Paused", "Aborted")
+
+# Reading a member from an Enum class goes through EnumType.__getattr__ and costs several times a plain
+# class attribute, so the equipment classes and the main loop read the members from these classes
 @dataclass
 class NewStatusEnum:
-    Allocated: str = "Allocated"
-    Filling: str = "Filling"
-    Idle: str = "Idle"
-    RampingUp: str = "Ramping Up"
-    RampingDown: str = "Ramping Down"
-    RampingUp1: str = "RampingUp1"
-    RampingUp2: str = "RampingUp2"
-    Holding: str = "Holding"
-    Holding1: str = "Holding1"
-    Holding2: str = "Holding2"
-    Draining: str = "Draining"
-    WaitingForOperator: str = "WaitingForOperator " 
+    Allocated: MachineStatus = MachineStatus.Allocated
+    Filling: MachineStatus = MachineStatus.Filling
+    Idle: MachineStatus = MachineStatus.Idle
+    RampingUp: MachineStatus = MachineStatus.RampingUp
+    RampingDown: MachineStatus = MachineStatus.RampingDown
+    RampingUp1: MachineStatus = MachineStatus.RampingUp1
+    RampingUp2: MachineStatus = MachineStatus.RampingUp2
+    Holding: MachineStatus = MachineStatus.Holding
+    Holding1: MachineStatus = MachineStatus.Holding1
+    Holding2: MachineStatus = MachineStatus.Holding2
+    Draining: MachineStatus = MachineStatus.Draining
+    WaitingForOperator: MachineStatus = MachineStatus.WaitingForOperator
 
 @dataclass
 class NewStateEnum:
-    Done: str = "Done"
-    Ready: str = "Ready"
-    Running: str = "Running"
-    Paused: str = "Paused"
-    Aborted: str = "Aborted"
\ No newline at end of file
+    Done: MachineState = MachineState.Done
+    Ready: MachineState = MachineState.Ready
+    Running: MachineState = MachineState.Running
+    Paused: MachineState = MachineState.Paused
+    Aborted: MachineState = MachineState.Aborted
+
+@dataclass
+class CommandEnum:
+    Start: int = 1
+    Restart: int = 2
+    Stop: int = 4
+    EStop: int = 8
+    Reset: int = 16
+    Abort: int = 32
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+class Histogram:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to record durations (or any positive integer values) in log linear buckets like an HDR histogram:
+    every power of two is split into 2^SubBucketBits buckets, so a percentile is reported with a relative error
+    of at most 1/2^SubBucketBits (6.25% with the default 4 bits) whatever the range of the values, with a few
+    hundred counters and a constant time Record().
+
+    Attributes
+    ----------
+
+    SubBucketBits (Number of bits of the value kept in the bucket index)
+    Counts (Number of values recorded per bucket index)
+    Count (Number of values recorded)
+    Sum (Sum of the values recorded)
+    Min (Smallest value recorded)
+    Max (Largest value recorded)
+
+    Methods
+    -------
+
+    __init__(self, SubBucketBits) - Class Constructor
+    Record(self, Value) - records a value
+    Percentile(self, Percent) - returns the value below which Percent % of the values were recorded
+    Mean(self) - returns the mean of the values recorded
+    Merge(self, Other) - adds the values recorded by another histogram with the same SubBucketBits
+    Reset(self) - clears the values recorded
+
+    """
+
+    # Class Constructor
+    def __init__(self, SubBucketBits=4):
+
+        self.SubBucketBits = SubBucketBits
+        self._subBuckets = 1 << SubBucketBits
+        self.Reset()
+
+    def Reset(self):
+
+        self.Counts = []
+        self.Count = 0
+        self.Sum = 0
+        self.Min = 0
+        self.Max = 0
+
+    # Bucket index of a value - values below 2^SubBucketBits have their own bucket
+    def _index(self, Value):
+
+        shift = Value.bit_length() - self.SubBucketBits - 1
+        if shift < 0:
+            return Value
+        return ((shift + 1) << self.SubBucketBits) + (Value >> shift) - self._subBuckets
+
+    # Highest value of the bucket at index
+    def _value(self, Index):
+
+        if Index < self._subBuckets:
+            return Index
+        shift = (Index >> self.SubBucketBits) - 1
+        return (((Index & (self._subBuckets - 1)) + self._subBuckets + 1) << shift) - 1
+
+    def Record(self, Value):
+
+        if Value < 0:
+            Value = 0
+        index = self._index(Value)
+        counts = self.Counts
+        if index >= len(counts):
+            counts.extend([0] * (index + 1 - len(counts)))
+        counts[index] = counts[index] + 1
+
+        if (self.Count == 0) or (Value < self.Min):
+            self.Min = Value
+        if Value > self.Max:
+            self.Max = Value
+        self.Count = self.Count + 1
+        self.Sum = self.Sum + Value
+
+    def Percentile(self, Percent):
+
+        if self.Count == 0:
+            return 0
+
+        rank = max(1, -(-self.Count * Percent // 100))
+        total = 0
+        for index, count in enumerate(self.Counts):
+            total = total + count
+            if total >= rank:
+                return min(self._value(index), self.Max)
+        return self.Max
+
+    def Mean(self):
+
+        return (self.Sum / self.Count) if self.Count else 0.0
+
+    def Merge(self, Other):
+
+        if Other.Count == 0:
+            return
+        if len(Other.Counts) > len(self.Counts):
+            self.Counts.extend([0] * (len(Other.Counts) - len(self.Counts)))
+        for index, count in enumerate(Other.Counts):
+            self.Counts[index] = self.Counts[index] + count
+
+        if (self.Count == 0) or (Other.Min < self.Min):
+            self.Min = Other.Min
+        if Other.Max > self.Max:
+            self.Max = Other.Max
+        self.Count = self.Count + Other.Count
+        self.Sum = self.Sum + Other.Sum
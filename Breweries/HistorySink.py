@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import array
+import bisect
+import glob
+import json
+import os
+import struct
+import threading
+import zlib
+from Sink import Sink
+from StreamingAggregate import StreamingAggregate
+
+class RingBuffer:
+
+    """
+
+    Class Overview
+    ----------
+
+    A fixed capacity ring buffer used to keep the most recent values of one column, the oldest value is
+    overwritten once the buffer is full. Numeric columns are stored in an array (i.e. TypeCode "d" for doubles),
+    other columns in a list.
+
+    Attributes
+    ----------
+
+    Capacity (Maximum number of values)
+    Buffer (Values, array or list)
+    Count (Number of values in the buffer)
+    Position (Index of the next value to write)
+
+    Methods
+    -------
+
+    __init__(self, Capacity, TypeCode) - Class Constructor
+    Append(self, Value) - appends a value, overwriting the oldest value when full
+    Items(self) - returns the values from oldest to newest
+
+    """
+
+    # Class Constructor
+    def __init__(self, Capacity, TypeCode=None):
+
+        self.Capacity = Capacity
+        if TypeCode is None:
+            self.Buffer = [None] * Capacity
+        else:
+            self.Buffer = array.array(TypeCode, [0] * Capacity)
+        self.Count = 0
+        self.Position = 0
+
+    def Append(self, Value):
+
+        self.Buffer[self.Position] = Value
+        self.Position = (self.Position + 1) % self.Capacity
+        if self.Count < self.Capacity:
+            self.Count = self.Count + 1
+
+    def Items(self):
+
+        if self.Count < self.Capacity:
+            return self.Buffer[:self.Count]
+        return self.Buffer[self.Position:] + self.Buffer[:self.Position]
+
+class HistorySink(Sink):
+
+    """
+
+    Class Overview
+    ----------
+
+    A sink used to keep the history of every tag in process, so OPC UA Clients (i.e. the IoT SiteWise OPC UA
+    Collector reconnecting after an outage) can backfill with HistoryRead, see HistoryStorage.
+
+    Raw values are stored in columns (one array per tag plus one shared time column) in segments of
+    SegmentScans scans. The most recent MemorySegments segments are kept in memory, older segments are spilled
+    to compressed segment files in Path (one zlib stream per column, so a tag is read without decompressing the
+    other tags) and removed after DiskSegments segments.
+
+    Numeric tags are also rolled up to 1 second and 1 minute Min/Max/Avg (see StreamingAggregate), other tags to
+    their last value, and kept in ring buffers of SecondRollups and MinuteRollups intervals. Reads older than the
+    raw history are answered from the 1 second and then the 1 minute rollups.
+
+    Attributes
+    ----------
+
+    Path (Directory of the spilled segment files)
+    SegmentScans (Number of scans per segment)
+    MemorySegments (Number of segments kept in memory)
+    DiskSegments (Number of segment files kept on disk)
+    Lock (Lock shared by the sink thread and the OPC UA HistoryRead requests)
+    Times (Time column of the current segment)
+    Columns (Value columns of the current segment)
+    Segments (Segments in memory, [start, end, times, columns] from oldest to newest)
+    Files (Segment files, [start, end, file name] from oldest to newest)
+    Rollups (Dictionary of tier name ("1s" or "1m") to rollup ring buffers)
+    Spilled (Number of segments spilled to disk)
+
+    Methods
+    -------
+
+    __init__(self, Path, SegmentScans, MemorySegments, DiskSegments, SecondRollups, MinuteRollups, QueueSize, Policy) - Class Constructor
+    Open(self) - removes stale segment files and creates the columns and rollups
+    Write(self, Snapshot) - appends the Snapshot to the raw columns and updates the rollups
+    Read(self, Index, Start, End) - returns [[time, value], ...] of one tag between Start and End (inclusive, None for open)
+    ReadRollup(self, Index, Tier, Start, End) - returns [[time, min, max, avg], ...] of one numeric tag from the "1s" or "1m" rollups
+
+    """
+
+    # Rollup tiers - name, interval in seconds
+    Tiers = (("1s", 1), ("1m", 60))
+
+    # Class Constructor
+    def __init__(self, Path="history", SegmentScans=600, MemorySegments=10, DiskSegments=60, SecondRollups=10800, MinuteRollups=10080, QueueSize=600, Policy="drop"):
+
+        super().__init__("History", QueueSize, Policy)
+
+        self.Path = Path
+        self.SegmentScans = max(1, SegmentScans)
+        self.MemorySegments = max(1, MemorySegments)
+        self.DiskSegments = DiskSegments
+        self.Capacity = {"1s": SecondRollups, "1m": MinuteRollups}
+        self.Lock = threading.Lock()
+        self.Times = array.array("d")
+        self.Columns = []
+        self.Segments = []
+        self.Files = []
+        self.Rollups = {}
+        self.Spilled = 0
+
+    def Open(self):
+
+        os.makedirs(self.Path, exist_ok=True)
+
+        # Segments of a previous run may have a different tag list
+        for file_name in glob.glob(os.path.join(self.Path, "*.seg")):
+            os.remove(file_name)
+
+        self.Numeric = [tag.DataType in ("double", "integer") for tag in self.Tags]
+        self.Strings = [tag.DataType == "string" for tag in self.Tags]
+        self.Times, self.Columns = self._columns()
+        self.Segments = []
+        self.Files = []
+
+        # Rollups - a shared time column and per tag Min/Max/Avg columns (numeric tags) or last value column
+        self.Rollups = {}
+        for tier, seconds in self.Tiers:
+            capacity = self.Capacity[tier]
+            columns = []
+            for index, tag in enumerate(self.Tags):
+                if self.Numeric[index]:
+                    # Rollups are rounded to 2 decimals, so single precision is enough and halves the memory
+                    columns.append([RingBuffer(capacity, "f"), RingBuffer(capacity, "f"), RingBuffer(capacity, "f")])
+                else:
+                    columns.append(RingBuffer(capacity))
+            self.Rollups[tier] = {"Seconds": seconds,
+                                  "Interval": None,
+                                  "Times": RingBuffer(capacity, "d"),
+                                  "Columns": columns,
+                                  "Aggregates": [StreamingAggregate(tag.Alias) if self.Numeric[index] else None for index, tag in enumerate(self.Tags)]}
+
+    # Return an empty time column and value columns for a new segment
+    def _columns(self):
+
+        return array.array("d"), [list() if isString else array.array("d") for isString in self.Strings]
+
+    def Write(self, Snapshot):
+
+        values = Snapshot.Values
+        now = Snapshot.Time
+
+        with self.Lock:
+            self._rollup(now)
+
+            self.Times.append(now)
+            for column, value in zip(self.Columns, values):
+                column.append(value)
+
+            for tier in self.Rollups.values():
+                for aggregate, value in zip(tier["Aggregates"], values):
+                    if aggregate is not None:
+                        aggregate.Add(value, now)
+                tier["Last"] = values
+
+            if len(self.Times) >= self.SegmentScans:
+                self.Segments.append([self.Times[0], self.Times[-1], self.Times, self.Columns])
+                self.Times, self.Columns = self._columns()
+                if len(self.Segments) > self.MemorySegments:
+                    self._spill(self.Segments.pop(0))
+
+    # Close the rollup intervals that ended before Now
+    def _rollup(self, Now):
+
+        for tier in self.Rollups.values():
+            interval = int(Now // tier["Seconds"]) * tier["Seconds"]
+            if tier["Interval"] is None:
+                tier["Interval"] = interval
+                continue
+            if interval == tier["Interval"]:
+                continue
+
+            tier["Times"].Append(tier["Interval"])
+            for index, (aggregate, column) in enumerate(zip(tier["Aggregates"], tier["Columns"])):
+                if aggregate is None:
+                    column.Append(tier["Last"][index])
+                    continue
+                result = aggregate.Take(interval)
+                minimum, maximum, average = column
+                minimum.Append(result["Min"])
+                maximum.Append(result["Max"])
+                average.Append(result["Avg"])
+            tier["Interval"] = interval
+
+    # Write a segment to a compressed segment file and remove the oldest segment files
+    def _spill(self, Segment):
+
+        start, end, times, columns = Segment
+        blobs = [zlib.compress(times.tobytes(), 1)]
+        for column, isString in zip(columns, self.Strings):
+            if isString:
+                blobs.append(zlib.compress(json.dumps(column).encode("utf-8"), 1))
+            else:
+                blobs.append(zlib.compress(column.tobytes(), 1))
+
+        # Header - JSON list of [offset, size] per column (time column first)
+        offsets = []
+        offset = 0
+        for blob in blobs:
+            offsets.append([offset, len(blob)])
+            offset = offset + len(blob)
+        header = json.dumps(offsets).encode("utf-8")
+
+        file_name = os.path.join(self.Path, "{0:.0f}.seg".format(start * 1000))
+        with open(file_name, "wb") as file:
+            file.write(struct.pack("<I", len(header)))
+            file.write(header)
+            for blob in blobs:
+                file.write(blob)
+
+        self.Files.append([start, end, file_name])
+        self.Spilled = self.Spilled + 1
+        while len(self.Files) > self.DiskSegments:
+            os.remove(self.Files.pop(0)[2])
+
+    # Read the time column and the column of one tag from a segment file
+    def _load(self, FileName, Index):
+
+        with open(FileName, "rb") as file:
+            size = struct.unpack("<I", file.read(4))[0]
+            offsets = json.loads(file.read(size).decode("utf-8"))
+            base = 4 + size
+
+            columns = []
+            for number in (0, Index + 1):
+                offset, length = offsets[number]
+                file.seek(base + offset)
+                columns.append(zlib.decompress(file.read(length)))
+
+        times = array.array("d")
+        times.frombytes(columns[0])
+        if self.Strings[Index]:
+            return times, json.loads(columns[1].decode("utf-8"))
+        values = array.array("d")
+        values.frombytes(columns[1])
+        return times, values
+
+    # Convert a stored value back to the datatype of the tag
+    def _value(self, Index, Value):
+
+        match self.Tags[Index].DataType:
+            case "integer":
+                return int(Value)
+            case "boolean":
+                return bool(Value)
+            case _:
+                return Value
+
+    def Read(self, Index, Start=None, End=None):
+
+        with self.Lock:
+            files = list(self.Files)
+            segments = [[start, end, times, columns[Index]] for start, end, times, columns in self.Segments]
+            if self.Times:
+                segments.append([self.Times[0], self.Times[-1], self.Times[:], self.Columns[Index][:]])
+
+        raw_start = files[0][0] if files else (segments[0][0] if segments else None)
+
+        result = []
+        if raw_start is None or (Start is None) or (Start < raw_start):
+            # Older than the raw history - answer from the rollups, finest tier first
+            rollup_end = raw_start if End is None or (raw_start is not None and End >= raw_start) else None
+            result = self._rollup_values(Index, Start, End, rollup_end)
+
+        for start, end, file_name in files:
+            if ((Start is None) or (end >= Start)) and ((End is None) or (start <= End)):
+                times, values = self._load(file_name, Index)
+                result.extend(self._slice(Index, times, values, Start, End))
+
+        for start, end, times, values in segments:
+            if ((Start is None) or (end >= Start)) and ((End is None) or (start <= End)):
+                result.extend(self._slice(Index, times, values, Start, End))
+
+        return result
+
+    # Return the [time, value] of a segment between Start and End
+    def _slice(self, Index, Times, Values, Start, End):
+
+        first = 0 if Start is None else bisect.bisect_left(Times, Start)
+        last = len(Times) if End is None else bisect.bisect_right(Times, End)
+        return [[Times[number], self._value(Index, Values[number])] for number in range(first, last)]
+
+    # Return [time, value] from the rollups between Start and End, before the raw history starts (Before)
+    def _rollup_values(self, Index, Start, End, Before):
+
+        result = []
+        for tier, seconds in self.Tiers:
+            with self.Lock:
+                times = self.Rollups[tier]["Times"].Items()
+                column = self.Rollups[tier]["Columns"][Index]
+                values = column[2].Items() if self.Numeric[Index] else column.Items()
+
+            # Every tier is only used before the finer tier (or the raw history) starts
+            for time, value in zip(times, values):
+                if (Start is not None) and (time < Start):
+                    continue
+                if ((End is not None) and (time > End)) or ((Before is not None) and (time >= Before)):
+                    break
+                result.append([time, self._value(Index, value)])
+
+            if times:
+                Before = times[0] if Before is None else min(Before, times[0])
+
+        result.sort(key=lambda entry: entry[0])
+        return result
+
+    def ReadRollup(self, Index, Tier, Start=None, End=None):
+
+        if not self.Numeric[Index]:
+            raise ValueError("{0} is not numeric".format(self.Tags[Index].Alias))
+
+        with self.Lock:
+            times = self.Rollups[Tier]["Times"].Items()
+            minimum, maximum, average = [ring.Items() for ring in self.Rollups[Tier]["Columns"][Index]]
+
+        return [[time, minimum[number], maximum[number], average[number]]
+                for number, time in enumerate(times)
+                if ((Start is None) or (time >= Start)) and ((End is None) or (time <= End))]
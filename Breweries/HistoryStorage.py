@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+from datetime import datetime, timedelta
+
+#########################################################################
+# OPC UA Library provided by - https://github.com/FreeOpcUa/python-opcua
+from opcua import ua
+from opcua.server.history import HistoryStorageInterface
+#########################################################################
+
+class HistoryStorage(HistoryStorageInterface):
+
+    """
+
+    Class Overview
+    ----------
+
+    A python-opcua history backend used to answer OPC UA HistoryRead (raw) requests from the in process tag
+    history of a HistorySink. The HistorySink is fed with every scan by the simulation, so nodes are registered
+    with Register() instead of being historized with a python-opcua subscription, and values are never saved
+    through save_node_value(). Events are not historized.
+
+    Attributes
+    ----------
+
+    History (HistorySink holding the tag history)
+    Nodes (Dictionary of node id to [tag index, variant type])
+
+    Methods
+    -------
+
+    __init__(self, History) - Class Constructor
+    Register(self, Node, Index) - enables HistoryRead of an OPC UA variable node backed by the tag at Index
+    read_node_history(self, node_id, start, end, nb_values) - returns the DataValues and continuation point of a node
+
+    """
+
+    # OPC UA DateTime has no value before this date, used by clients for an open start or end time
+    Epoch = datetime(1601, 1, 1)
+    UnixEpoch = datetime(1970, 1, 1)
+
+    # Class Constructor
+    def __init__(self, History):
+
+        self.History = History
+        self.Nodes = {}
+
+    # Enable HistoryRead of a variable node backed by the tag at Index of the HistorySink
+    def Register(self, Node, Index):
+
+        Node.set_attribute(ua.AttributeIds.Historizing, ua.DataValue(True))
+        Node.set_attr_bit(ua.AttributeIds.AccessLevel, ua.AccessLevel.HistoryRead)
+        Node.set_attr_bit(ua.AttributeIds.UserAccessLevel, ua.AccessLevel.HistoryRead)
+        self.Nodes[Node.nodeid] = [Index, Node.get_data_type_as_variant_type()]
+
+    # Convert an OPC UA DateTime to epoch seconds, None for an open start or end time
+    def _seconds(self, Time):
+
+        if (Time is None) or (Time <= self.Epoch):
+            return None
+        return (Time - self.UnixEpoch).total_seconds()
+
+    # Create a DataValue of the variant type of the node
+    def _datavalue(self, Time, Value, VariantType):
+
+        match VariantType:
+            case ua.VariantType.Double:
+                Value = float(Value)
+            case ua.VariantType.Int64:
+                Value = int(Value)
+            case ua.VariantType.Boolean:
+                Value = bool(Value)
+            case ua.VariantType.String:
+                Value = str(Value)
+
+        datavalue = ua.DataValue(ua.Variant(Value, VariantType))
+        datavalue.SourceTimestamp = self.UnixEpoch + timedelta(seconds=Time)
+        datavalue.ServerTimestamp = datavalue.SourceTimestamp
+        return datavalue
+
+    def read_node_history(self, node_id, start, end, nb_values):
+
+        if node_id not in self.Nodes:
+            return [], None
+        index, varianttype = self.Nodes[node_id]
+
+        # Values are returned newest first when only the end time is given or the start time is after the end time
+        startSeconds = self._seconds(start)
+        endSeconds = self._seconds(end)
+        reverse = (startSeconds is None) and (endSeconds is not None)
+        if (startSeconds is not None) and (endSeconds is not None) and (startSeconds > endSeconds):
+            startSeconds, endSeconds = endSeconds, startSeconds
+            reverse = True
+
+        values = self.History.Read(index, startSeconds, endSeconds)
+        if reverse:
+            values.reverse()
+
+        # Return at most nb_values values, the continuation point is the time of the first value not returned
+        continuation = None
+        if nb_values and (len(values) > nb_values):
+            continuation = self.UnixEpoch + timedelta(seconds=values[nb_values][0])
+            values = values[:nb_values]
+
+        return [self._datavalue(time, value, varianttype) for time, value in values], continuation
+
+    def new_historized_node(self, node_id, period, count=0):
+        pass
+
+    def save_node_value(self, node_id, datavalue):
+        pass
+
+    def new_historized_event(self, source_id, evtypes, period, count=0):
+        pass
+
+    def save_event(self, event):
+        pass
+
+    def read_event_history(self, source_id, start, end, nb_values, evfilter):
+        return [], None
+
+    def stop(self):
+        pass
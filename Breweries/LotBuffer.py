@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import heapq
+from random import randrange
+
+class LotBuffer:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used as the bounded work in progress inventory between two assets (i.e. the Roasted Barley lots
+    produced by a Roaster waiting to be consumed by a MashTun). Lots are kept in a ring buffer of Capacity slots,
+    a lot put into a full buffer is not stored and counted in Overflow.
+
+    Lots are consumed according to Policy:
+
+        fifo     - oldest lot first
+        random   - any lot, the slot is refilled with the oldest lot
+        priority - highest Priority first, oldest first for equal priorities (kept in a heap instead of the ring)
+
+    Attributes
+    ----------
+
+    Name (Buffer name, i.e. "MashTun100.ConsList")
+    Capacity (Maximum number of lots held)
+    Policy (Consumption policy - "fifo", "random", "priority")
+    Count (Number of lots held)
+    Received (Number of lots put into the buffer, including overflow)
+    Consumed (Number of lots taken from the buffer)
+    Overflow (Number of lots not stored because the buffer was full)
+    HighWater (Highest Count reached)
+
+    Methods
+    -------
+
+    __init__(self, Name, Capacity, Policy) - Class Constructor
+    Put(self, Lot, Priority) - stores a lot, returns False and counts the overflow when the buffer is full
+    Get(self) - takes a lot according to the policy, None when the buffer is empty
+
+    """
+
+    Policies = ("fifo", "random", "priority")
+
+    # Class Constructor
+    def __init__(self, Name, Capacity=21, Policy="fifo"):
+
+        if Policy not in self.Policies:
+            raise ValueError("Unknown buffer policy {0}, expected one of {1}".format(Policy, ", ".join(self.Policies)))
+        if Capacity < 1:
+            raise ValueError("Buffer capacity must be at least 1")
+
+        self.Name = Name
+        self.Capacity = Capacity
+        self.Policy = Policy
+        self.Count = 0
+        self.Received = 0
+        self.Consumed = 0
+        self.Overflow = 0
+        self.HighWater = 0
+
+        self._slots = [None] * Capacity
+        self._head = 0
+        self._heap = []
+        self._sequence = 0
+
+    def __len__(self):
+
+        return self.Count
+
+    # Store a lot, higher Priority lots are consumed first by the "priority" policy
+    def Put(self, Lot, Priority=0):
+
+        self.Received = self.Received + 1
+        if self.Count >= self.Capacity:
+            self.Overflow = self.Overflow + 1
+            return False
+
+        if self.Policy == "priority":
+            heapq.heappush(self._heap, (-Priority, self._sequence, Lot))
+            self._sequence = self._sequence + 1
+        else:
+            self._slots[(self._head + self.Count) % self.Capacity] = Lot
+
+        self.Count = self.Count + 1
+        if self.Count > self.HighWater:
+            self.HighWater = self.Count
+        return True
+
+    # Take a lot according to the policy, None when the buffer is empty
+    def Get(self):
+
+        if self.Count == 0:
+            return None
+
+        if self.Policy == "priority":
+            lot = heapq.heappop(self._heap)[2]
+        else:
+            head = self._head
+            if self.Policy == "random":
+                # Take any slot and move the oldest lot into it, the oldest lot's slot is then released
+                slot = (head + randrange(self.Count)) % self.Capacity
+                self._slots[slot], self._slots[head] = self._slots[head], self._slots[slot]
+            lot = self._slots[head]
+            self._slots[head] = None
+            self._head = (head + 1) % self.Capacity
+
+        self.Count = self.Count - 1
+        self.Consumed = self.Consumed + 1
+        return lot
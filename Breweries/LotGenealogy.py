@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import json
+import operator
+import os
+import re
+import threading
+import time
+
+class LotGenealogy:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to keep the genealogy of the lots of the plant, the graph of which lots were consumed to produce
+    which lots (i.e. Cons_Malt_FromLot -> Prod_Wort_ToLot of a MashTun), for trace back (where did a lot come
+    from) and trace forward (where did a lot go) queries.
+
+    Capture() reads the consumed (Cons_{material}_FromLot) and produced (Prod_{material}_ToLot) lots of every asset
+    once per scan, and only does work when they changed: every new pair of a consumed and a produced lot is an
+    edge, appended to the edge log at Path (one JSON array per line: [time, asset, ProductionID, material, from
+    lot, to lot]) and added to the indexes. Lots are numbered in the order they are first seen, and the edges of
+    every lot are indexed in both directions (adjacency lists), and by ProductionID, so a trace only visits the
+    edges it returns, whatever the size of the genealogy. The edge log is read back when the simulator starts, so
+    the genealogy covers every run.
+
+    The queries are answered on other threads (i.e. the GenealogyEndpoint), the indexes are protected by Lock.
+
+    Attributes
+    ----------
+
+    Path (Edge log file, None to only keep the genealogy in memory)
+    Assets (List of [asset name, asset, getter, produced materials, consumed materials, lots of the last scan])
+    Lots (List of the lot names, by lot number)
+    LotNumbers (Dictionary of lot name to lot number)
+    Edges (List of [time, asset, ProductionID, material, from lot number, to lot number], by edge number)
+    Forward (Edge numbers from every lot, by lot number)
+    Backward (Edge numbers to every lot, by lot number)
+    Productions (Dictionary of ProductionID to edge numbers)
+    Pairs (Set of (from lot number, to lot number) of the edges)
+    Loaded (Number of edges read from the edge log)
+    Lock (Lock of the indexes)
+
+    Methods
+    -------
+
+    __init__(self, Path, Assets) - Class Constructor, reads the edge log
+    Capture(self, Now) - adds the new lot transfers of the assets
+    Add(self, Time, Asset, ProductionID, Material, FromLot, ToLot) - adds an edge, returns False when already known
+    Trace(self, Lot, Direction, MaxDepth) - returns the edges reached from a lot, "back" or "forward"
+    Production(self, ProductionID) - returns the edges of a ProductionID
+    Close(self) - closes the edge log
+
+    """
+
+    ConsumedPattern = re.compile(r"^Cons_(\w+)_FromLot$")
+    ProducedPattern = re.compile(r"^Prod_(\w+)_ToLot$")
+
+    # Class Constructor
+    def __init__(self, Path, Assets):
+
+        self.Path = Path
+        self.Lots = []
+        self.LotNumbers = {}
+        self.Edges = []
+        self.Forward = []
+        self.Backward = []
+        self.Productions = {}
+        self.Pairs = set()
+        self.Loaded = 0
+        self.Lock = threading.Lock()
+
+        # Lot attributes of every asset - [name, asset, getter of the produced then consumed lots, produced materials,
+        # consumed materials, last lots]
+        self.Assets = []
+        for name, asset in Assets.items():
+            produced = sorted(attribute for attribute in vars(asset) if self.ProducedPattern.match(attribute))
+            consumed = sorted(attribute for attribute in vars(asset) if self.ConsumedPattern.match(attribute))
+            if produced and consumed:
+                self.Assets.append([name, asset, operator.attrgetter(*(produced + consumed)),
+                                    [self.ProducedPattern.match(attribute).group(1) for attribute in produced],
+                                    [self.ConsumedPattern.match(attribute).group(1) for attribute in consumed], None])
+
+        if (Path is not None) and os.path.exists(Path):
+            with open(Path) as file:
+                for line in file:
+                    try:
+                        edgeTime, asset, productionId, material, fromLot, toLot = json.loads(line)
+                    except ValueError:
+                        # Line cut short when the simulator was stopped
+                        continue
+                    if self._add(edgeTime, asset, productionId, material, fromLot, toLot):
+                        self.Loaded = self.Loaded + 1
+
+        self.File = open(Path, "a") if Path is not None else None
+
+    # Number of a lot, numbered in the order they are first seen
+    def _lot(self, Lot):
+
+        number = self.LotNumbers.get(Lot)
+        if number is None:
+            number = self.LotNumbers[Lot] = len(self.Lots)
+            self.Lots.append(Lot)
+            self.Forward.append([])
+            self.Backward.append([])
+        return number
+
+    def _add(self, Time, Asset, ProductionID, Material, FromLot, ToLot):
+
+        with self.Lock:
+            fromNumber = self._lot(FromLot)
+            toNumber = self._lot(ToLot)
+            if (fromNumber, toNumber) in self.Pairs:
+                return False
+            self.Pairs.add((fromNumber, toNumber))
+            number = len(self.Edges)
+            self.Edges.append([Time, Asset, ProductionID, Material, fromNumber, toNumber])
+            self.Forward[fromNumber].append(number)
+            self.Backward[toNumber].append(number)
+            self.Productions.setdefault(ProductionID, []).append(number)
+        return True
+
+    def Add(self, Time, Asset, ProductionID, Material, FromLot, ToLot):
+
+        if not self._add(Time, Asset, ProductionID, Material, FromLot, ToLot):
+            return False
+        if self.File is not None:
+            self.File.write(json.dumps([Time, Asset, ProductionID, Material, FromLot, ToLot]) + "\n")
+            self.File.flush()
+        return True
+
+    def Capture(self, Now):
+
+        for entry in self.Assets:
+            lots = entry[2](entry[1])
+            if lots == entry[5]:
+                continue
+            entry[5] = lots
+
+            name, asset, getter, produced, consumed = entry[:5]
+            productionId = getattr(asset, "ProductionID", "")
+            for toLot in lots[:len(produced)]:
+                if not toLot:
+                    continue
+                for material, fromLot in zip(consumed, lots[len(produced):]):
+                    if fromLot:
+                        self.Add(round(Now, 3), name, productionId, material, fromLot, toLot)
+
+    # Edge of the index as returned by the queries
+    def _edge(self, Number, Depth):
+
+        edgeTime, asset, productionId, material, fromNumber, toNumber = self.Edges[Number]
+        return {"time": edgeTime, "asset": asset, "production_id": productionId, "material": material,
+                "from": self.Lots[fromNumber], "to": self.Lots[toNumber], "depth": Depth}
+
+    def Trace(self, Lot, Direction="back", MaxDepth=None):
+
+        start = time.perf_counter()
+        with self.Lock:
+            number = self.LotNumbers.get(Lot)
+            if number is None:
+                return None
+            adjacency = self.Backward if Direction == "back" else self.Forward
+            # Breadth first, every lot is visited once even when it is reached by several paths
+            visited = {number}
+            frontier = [number]
+            edges = []
+            depth = 0
+            while frontier and ((MaxDepth is None) or (depth < MaxDepth)):
+                depth = depth + 1
+                following = []
+                for lot in frontier:
+                    for edge in adjacency[lot]:
+                        edges.append(self._edge(edge, depth))
+                        nextLot = self.Edges[edge][4] if Direction == "back" else self.Edges[edge][5]
+                        if nextLot not in visited:
+                            visited.add(nextLot)
+                            following.append(nextLot)
+                frontier = following
+
+        return {"lot": Lot, "direction": Direction, "lots": len(visited) - 1, "edges": edges,
+                "milliseconds": round((time.perf_counter() - start) * 1000, 3)}
+
+    def Production(self, ProductionID):
+
+        with self.Lock:
+            return [self._edge(number, 0) for number in self.Productions.get(ProductionID, [])]
+
+    def Close(self):
+
+        if self.File is not None:
+            self.File.close()
+            self.File = None
@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import json
+import os
+import socket
+import string
+import sys
+import time
+import zlib
+
+Digits = string.digits + string.ascii_uppercase
+
+def base36(Number, Width):
+    """
+    base36 - Returns Number in base 36 (0-9, A-Z), left padded with 0 to Width digits
+    """
+    digits = ""
+    while Number > 0:
+        Number, digit = divmod(Number, 36)
+        digits = Digits[digit] + digits
+    return digits.rjust(Width, "0")
+
+def host_plant_name():
+    """
+    host_plant_name - Returns the default plant name of this host, 4 base 36 digits of the CRC-32 of the host name
+    """
+    return base36(zlib.crc32(socket.gethostname().encode("utf-8")) % (36 ** 4), 4)
+
+class LotNumberGenerator:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to number the lots and ProductionIDs of a plant. A number is the prefix of the material, the
+    plant, the line, the second it was generated at and a sequence within that second:
+
+    GB-A1-0KX3F201 - Green Beer lot of line 1 of plant A, second 0KX3F2 since January 1 2020, sequence 01
+
+    The plant name defaults to a name derived from the host name (host_plant_name()), so simulators on different
+    hosts number their lots apart without configuration. A host runs one simulator on the OPC UA endpoint port,
+    simulators sharing a host (i.e. benchmarks) need their own plant name.
+
+    The second and sequence are in base 36 (6 digits for the second cover 69 years, 2 digits for the sequence
+    1296 numbers per second), so numbers sort in the order they were generated. The second is read from the clock
+    of the Timers (time.time(), simulated by the benchmarks), and never goes backwards: when the clock does, or
+    the sequence of a second is exhausted, the next number borrows the following second. Numbers are unique
+    within a generator, and across plants as long as every running simulator has its own plant name (the default
+    is per host).
+
+    A new generator restarts the sequence, so a simulator restarted within a second it already numbered lots in
+    would give them again. With a Path, the generator reserves the seconds it numbers in ReserveSeconds at a
+    time, written to the file before they are used, and a generator created on the same file starts after the
+    seconds reserved by the previous one. The numbers of a restarted simulator are then unique too, their second
+    runs ahead of the clock by up to ReserveSeconds until the clock catches up. Without a Path (benchmarks, assets
+    outside of a Plant) nothing is reserved.
+
+    The second is encoded once per second and the file written once per ReserveSeconds, so a number costs a clock
+    read and a string concatenation.
+
+    Attributes
+    ----------
+
+    Plant (Plant name, letters and digits, host_plant_name() by default)
+    Path (File of the seconds reserved by the generator, None to not reserve them)
+    Reserved (Last second since Epoch reserved in Path)
+    Generated (Number of numbers generated)
+
+    Methods
+    -------
+
+    __init__(self, Plant, Path) - Class Constructor, starts after the seconds reserved in Path
+    Next(self, Prefix, Line) - returns the next number of a line, i.e. Next("GB-", "1")
+
+    """
+
+    # January 1 2020 in epoch seconds
+    Epoch = 1577836800
+
+    # Seconds reserved in the file at a time
+    ReserveSeconds = 60
+
+    Sequences = [base36(sequence, 2) for sequence in range(36 * 36)]
+
+    # Class Constructor
+    def __init__(self, Plant=None, Path=None):
+
+        if Plant is None:
+            Plant = host_plant_name()
+        if (not Plant) or (not Plant.isalnum()):
+            raise ValueError("Invalid plant name '{0}', expected letters and digits".format(Plant))
+
+        self.Plant = Plant
+        self.Path = Path
+        self.Generated = 0
+        self._second = -1
+        self._stamp = ""
+        self._sequence = 0
+
+        # Without a file every second is reserved
+        self.Reserved = sys.maxsize
+        if Path is not None:
+            self.Reserved = self._load()
+            if self.Reserved >= 0:
+                # The first number takes sequence 00 of the second after the reserved ones
+                self._second = self.Reserved + 1
+                self._stamp = base36(self._second, 6)
+                self._sequence = -1
+
+    # Last second reserved in the file, -1 without a file
+    def _load(self):
+
+        try:
+            with open(self.Path) as file:
+                document = json.load(file)
+        except FileNotFoundError:
+            return -1
+        except (OSError, ValueError) as e:
+            raise ValueError("Invalid lot number file {0}: {1}".format(self.Path, e)) from e
+        reserved = document.get("reserved") if isinstance(document, dict) else None
+        if isinstance(reserved, bool) or not isinstance(reserved, int):
+            raise ValueError("Invalid lot number file {0}: expected {{\"reserved\": second}}".format(self.Path))
+        return reserved
+
+    # Reserve the next ReserveSeconds from the second in use, written to a new file then renamed over the old one
+    def _reserve(self):
+
+        self.Reserved = self._second + self.ReserveSeconds
+        temporary = self.Path + ".tmp"
+        with open(temporary, "w") as file:
+            json.dump({"plant": self.Plant, "reserved": self.Reserved}, file)
+        os.replace(temporary, self.Path)
+
+    def Next(self, Prefix, Line):
+
+        second = int(time.time()) - self.Epoch
+        if second > self._second:
+            self._second = second
+            self._sequence = 0
+            self._stamp = base36(second, 6)
+        else:
+            self._sequence = self._sequence + 1
+            if self._sequence == len(self.Sequences):
+                self._second = self._second + 1
+                self._sequence = 0
+                self._stamp = base36(self._second, 6)
+        if self._second > self.Reserved:
+            self._reserve()
+
+        self.Generated = self.Generated + 1
+        return Prefix + self.Plant + Line + "-" + self._stamp + self.Sequences[self._sequence]
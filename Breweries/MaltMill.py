@@ -12,14 +12,13 @@
 # ---------------------------------------------------------------------------
 # Imports
 # ---------------------------------------------------------------------------
-import datetime
-import random
-from random import randint, choice
+from random import randint
 from Motor import Motor
 from Timer import Timer
-from GlobalVariables import NewStateEnum, NewStatusEnum, UtilizationList, UtilizationStateList
+from StateMachine import StateMachine
+from GlobalVariables import NewStateEnum, NewStatusEnum
 
-class MaltMill:    
+class MaltMill(StateMachine):    
 
     """
     The Malt Mill is a machine to squeezing of malt grains before the wort brewing process on 
@@ -66,9 +65,13 @@ class MaltMill:
     
     __init__(self, EquipmentName) - Class Constructor
     Run(self) - method to simulate equipment data
+    StateX(self) - run every scan in state X, registered in StateHandlers
 
     """
 
+    # Attributes changed by the runtime configuration, see RuntimeConfig
+    Tunables = ("PerformanceTargetPercent",)
+
     # Class Constructor
     def __init__(self, EquipmentName):
         self.EquipmentName = EquipmentName 
@@ -104,120 +107,78 @@ class MaltMill:
     # Run method to simulate equipment data 
     def Run(self):        
 
-        if self.StartCmd:
-                self.StartCmd = False
-                if self.NewState == NewStateEnum.Ready:
-                    self.NewState = NewStateEnum.Running
-
-        if self.RestartCmd:
-            self.RestartCmd = False
-            if self.NewState == NewStateEnum.Paused:
-                self.NewState = NewStateEnum.Running
-
-        if self.StopCmd:
-            self.StopCmd = False
-            if self.NewState == NewStateEnum.Running:
-                self.NewState = NewStateEnum.Paused
-
-        if self.AbortCmd:
-            self.AbortCmd = False
-            if self.NewState == NewStateEnum.Paused:
-                self.NewState = NewStateEnum.Aborted
-
-        if self.ResetCmd:    
-            self.ResetCmd = False    
-            if self.NewState == NewStateEnum.Done or self.NewState == NewStateEnum.Aborted:
-                self.NewState = NewStateEnum.Ready
-
-        if self.EStopCmd:        
-            if self.NewState == NewStateEnum.Running:
-                self.NewState = NewStateEnum.Paused
-
-        match self.NewState:
-
-            case NewStateEnum.Aborted:
-                # Put everything in safe state
-                self.MaltMill.CmdStart = False
-                self.MaltAuger.CmdStart = False
-                self.MaltPV = 0.0
-                self.MaltMillComplete = False
-
-            case NewStateEnum.Done:
-                self.MaltMill.CmdStart = False
-                self.MaltAuger.CmdStart = False
-                self.StartCmd = False
-                self.SettleTime.RST = False
-                self.SettleTime.PT = randint(10,25)
-                self.NewState = NewStateEnum.Ready
-                self.NewStatus = NewStatusEnum.Idle
-
-            case NewStateEnum.Ready:
-                self.MaltPV = 0.0
-                self.NewStatus = NewStatusEnum.Idle
-                self.MaltAuger.CmdStart = False
-                self.MaltMill.CmdStart = False
-                self.MaltMillComplete = False
-
-                self.SettleTime.Enabled = True
-                if (self.SettleTime.DN):
-                    self.SettleTime.Enabled = False
-                    self.SettleTime.RST = True
-                    self.NewState = NewStateEnum.Running
-
-            case NewStateEnum.Paused:
-                self.MaltMill.CmdStart = False
-                self.MaltAuger.CmdStart = False
-                self.CheckDownTime.Enabled = False
-
-                self.DownTime.Enabled = True
-                if (self.DownTime.DN):                    
-                    self.RestartCmd = True
-                    self.UtilizationState = "Runtime"
-                    self.Utilization = "Running (Normal)"
-                    self.DownTime.RST = True
-
-            case NewStateEnum.Running:
-                if (self.MaltPV <= self.MaltSP):
-                    self.MaltMill.CmdStart = True
-                    self.MaltAuger.CmdStart = True
-                    self.MaltPV = round(self.MaltPV + ((self.ScanTime/100) * 1.1031), 2)
-                else:
-                    self.MaltAuger.CmdStart = False
-                    self.MaltMillComplete = True
-                    if(self.MashTunComplete):
-                        self.NewState = NewStateEnum.Done
-
-                # Check for a downtime condition while running once every minute
-                self.CheckDownTime.RST = False
-                self.CheckDownTime.Enabled = True
-                if self.CheckDownTime.DN:
-                    dtNow = datetime.datetime.now()
-                    random.seed(int(self.EquipmentName[-3]) + int(dtNow.strftime("%f")))
-                    dtTest = random.random()
-                    self.CheckDownTime.RST = True
-
-                    if (dtTest > (self.PerformanceTargetPercent/100)):
-                        # Downtime has occured, put system into pause and randomize downtime timer                        
-                        self.StopCmd = True  
-                        dtMin = randint(97,121)
-                        dtMax = randint(173,600)
-                        self.DownTime.PT = randint(dtMin,dtMax) 
-                        self.DownTime.RST = False                       
-
-                        # Assign a random dowtime for the asset
-                        self.UtilizationState = choice(UtilizationStateList)
-
-                        match self.UtilizationState:
-                            case "Demand":
-                                self.Utilization = UtilizationList[randint(0,2)]
-                            case "Downtime":
-                                self.Utilization = UtilizationList[randint(3,8)]
-                            case "Maintenance":
-                                self.Utilization = UtilizationList[randint(9,10)]
+        # Commands are only evaluated when one is set
+        if self.Commands:
+            self.RunCommands()
+
+        self.RunState()
 
         # Run contained objects
         self.MaltMill.Run()
         self.MaltAuger.Run()
         self.SettleTime.Run()
         self.CheckDownTime.Run()
-        self.DownTime.Run()
\ No newline at end of file
+        self.DownTime.Run()
+
+    # State handlers
+
+    def StateAborted(self):
+        # Put everything in safe state
+        self.MaltMill.CmdStart = False
+        self.MaltAuger.CmdStart = False
+        self.MaltPV = 0.0
+        self.MaltMillComplete = False
+
+    def StateDone(self):
+        self.MaltMill.CmdStart = False
+        self.MaltAuger.CmdStart = False
+        self.StartCmd = False
+        self.SettleTime.RST = False
+        self.SettleTime.PT = randint(10,25)
+        self.NewState = NewStateEnum.Ready
+        self.NewStatus = NewStatusEnum.Idle
+
+    def StateReady(self):
+        self.MaltPV = 0.0
+        self.NewStatus = NewStatusEnum.Idle
+        self.MaltAuger.CmdStart = False
+        self.MaltMill.CmdStart = False
+        self.MaltMillComplete = False
+
+        self.SettleTime.Enabled = True
+        if (self.SettleTime.DN):
+            self.SettleTime.Enabled = False
+            self.SettleTime.RST = True
+            self.NewState = NewStateEnum.Running
+
+    def StatePaused(self):
+        self.MaltMill.CmdStart = False
+        self.MaltAuger.CmdStart = False
+        self.CheckDownTime.Enabled = False
+
+        self.WaitForDowntime()
+
+    def StateRunning(self):
+        if (self.MaltPV <= self.MaltSP):
+            self.MaltMill.CmdStart = True
+            self.MaltAuger.CmdStart = True
+            self.MaltPV = round(self.MaltPV + ((self.ScanTime/100) * 1.1031), 2)
+        else:
+            self.MaltAuger.CmdStart = False
+            self.MaltMillComplete = True
+            if(self.MashTunComplete):
+                self.NewState = NewStateEnum.Done
+
+        # Check for a downtime condition while running once every minute
+        self.CheckForDowntime()
+
+    # The Malt Mill evaluates AbortCmd and ResetCmd before EStopCmd
+    Transitions = tuple(StateMachine.Transitions[number] for number in (0, 1, 2, 5, 4, 3))
+
+    StateHandlers = {
+        NewStateEnum.Aborted: StateAborted,
+        NewStateEnum.Done: StateDone,
+        NewStateEnum.Ready: StateReady,
+        NewStateEnum.Paused: StatePaused,
+        NewStateEnum.Running: StateRunning
+    }
@@ -12,15 +12,16 @@
 # ---------------------------------------------------------------------------
 # Imports
 # ---------------------------------------------------------------------------
-import datetime
 from random import randint, choice
 from Motor import Motor
 from Timer import Timer
 from pidLoop import pidLoop
 from Valve import Valve
-from GlobalVariables import NewStateEnum, NewStatusEnum, UtilizationList, UtilizationStateList
+from StateMachine import StateMachine
+from LotBuffer import LotBuffer
+from GlobalVariables import NewStateEnum, NewStatusEnum
 
-class Mash:
+class Mash(StateMachine):
 
     """
     The Mash Tun is a brewhouse vessel used for mixing the ground malt (grist) with temperature-controlled water. 
@@ -48,7 +49,7 @@ class Mash:
     ----------
 
     Upstream - Soft dependency on the Roaster (100/200), if no production(s) from the Roaster exists, it will randomly generate a consumption 
-               item and from lot, otherwise it will randomly pull from an existing list of consumption items from the Roaster (100/200)
+               item and from lot, otherwise it will pull the next consumption item from the ConsList buffer of Roaster (100/200) lots
     Downstream - The BoilKettle must be in Ready/Idle for the MashTun to be able to Drain, else it will Hold.    
 
     Attributes (exposed to OPC UA Client)
@@ -61,6 +62,8 @@ class Mash:
     Agitator.PV (The Agitator motors actual state - Started/Stopped)
     Cons_Malt_FromLot (Consumed Roasted Barley/Malt inventory lot/location attained from Roaster)
     Cons_Malt_Item (Consumed Roasted Barley/Malt Item/Material from Roaster)
+    ConsList.Count (Roasted Barley/Malt lots from the Roaster waiting to be consumed)
+    ConsList.Overflow (Roasted Barley/Malt lots from the Roaster dropped because the ConsList buffer was full)
     HoldTime.PT (Holdtime Timer Preset Time)
     HoldTime.ET (Holdtime Timer Elapsed Time)
     LevelPV (Level Process Variable in %)
@@ -104,9 +107,14 @@ class Mash:
     
     __init__(self, EquipmentName) - Class Constructor
     Run(self) - method to simulate equipment data
+    StateX(self) - run every scan in state X, registered in StateHandlers
+    PhaseX(self) - run every scan in phase X while Running, registered in PhaseHandlers
 
     """
 
+    # Attributes changed by the runtime configuration, see RuntimeConfig
+    Tunables = ("WaterSPRange", "SoakTempSP1Range", "SoakTempSP2Range")
+
     # Class Constructor
     def __init__(self, EquipmentName):
         self.EquipmentName = EquipmentName 
@@ -127,6 +135,10 @@ class Mash:
         self.SoakTempSP2 = 0
         self.SoakTimeSP1 = 0
         self.SoakTimeSP2 = 0
+        # Ranges the setpoints of every production run are drawn from
+        self.WaterSPRange = (2500, 3500)
+        self.SoakTempSP1Range = (120, 141)
+        self.SoakTempSP2Range = (150, 201)
         self.TemperatureSP = 0
         self.TemperaturePV = 0.0
         self.LevelPV = 0.0
@@ -140,7 +152,7 @@ class Mash:
         self.Prod_Wort_ToLot = ""
         self.Prod_Wort_Item = ""
         self.Scrap_ToLot = ""
-        self.ConsList = []
+        self.ConsList = LotBuffer(EquipmentName + ".ConsList")
         self.ProductNames = ['Red','Pale','Dark','Green']
 
         # Create contained assets
@@ -155,199 +167,7 @@ class Mash:
     # Run method to simulate equipment data 
     def Run(self):        
 
-        match self.NewState:
-
-            case NewStateEnum.Aborted:
-                self.Agitator.CmdStart = False
-                self.SteamValve.CmdOpen = False
-                self.OutletPump.CmdStart = False
-                self.OutletValve.CmdOpen = False
-                self.ShipComplete = True
-                self.WaterPV = 0.0
-                self.TemperatureSP = 120
-                self.WortPV = 0.0
-                self.HoldTime.Enabled = False
-
-            case NewStateEnum.Done:
-                self.Agitator.CmdStart = False
-                self.SteamValve.CmdOpen = False
-                self.OutletPump.CmdStart = False
-                self.OutletValve.CmdOpen = False
-                self.HoldTime.Enabled = False                
-
-            case NewStateEnum.Paused:
-                self.Agitator.CmdStart = False
-                self.OutletPump.CmdStart = False
-                self.OutletValve.CmdOpen = False
-                self.SteamValve.CmdOpen = False
-                self.WaterValve.CmdOpen = False
-                self.HoldTime.Enabled = False                
-
-                if (self.WaterPV > 100) and (self.Scrap < self.WaterPV):
-                    self.newScrap = self.WaterPV * 0.00001
-                    self.Scrap = round(self.Scrap + self.newScrap, 2)                 
-
-            case NewStateEnum.Ready:
-                self.NewStatus = NewStatusEnum.Idle
-
-                if (not self.ReadyOS):
-                    # Reset inital values for next production run
-                    self.ReadyOS = True
-                    self.WaterSP = 0
-                    self.Scrap = 0.0
-                    self.newScrap = 0.0
-                    self.SoakTempSP1 = 0
-                    self.SoakTempSP2 = 0
-                    self.SoakTimeSP1 = 0
-                    self.SoakTimeSP2 = 0
-                    self.TemperatureSP = 90
-                    self.TemperaturePV = 90.0
-                    self.WortPV = 0.0
-                    self.LevelPV = 0.0
-                    self.ProductionID = ""
-                    self.MaterialID = ""
-                    self.Wort_Item = ""
-                    self.Cons_Malt_Item = ""
-                    self.Cons_Malt_FromLot = ""
-                    self.Prod_Wort_ToLot = ""
-                    self.Prod_Wort_Item = ""
-                    self.Scrap_ToLot = ""                    
-                    self.HoldTime.RST = True
-                    self.MaltMillComplete = False
-                    self.MashComplete = False
-                    self.ShipComplete = False                    
-                    
-                    # Randomize measurements for next Production Run
-                    self.WaterSP = randint(2500,3500)  
-                    self.SoakTempSP1 = randint(120,141)
-                    self.SoakTempSP2 = randint(150,201) 
-                    self.SoakTimeSP1 = randint(5,12) * 60    
-                    self.SoakTimeSP2 = randint(7,14) * 60 
-
-                    self.HoldTime.PT = self.SoakTimeSP1  
-
-                    if (len(self.ConsList) > 0):
-                        roasterProdDict = choice(self.ConsList)
-                        uniquePre = roasterProdDict["SelectedProduct"]
-                        self.Cons_Malt_Item = "{0}".format(roasterProdDict["RoastedBarley_Item"])
-                        self.Cons_Malt_FromLot = "{0}".format(roasterProdDict["RoastedBarley_ToLot"])
-                        self.ConsList.remove(roasterProdDict)
-                    else:
-                        uniquePre = choice(self.ProductNames)
-                        self.Cons_Malt_Item = "{0}{1}".format(uniquePre," Malt")
-                        self.Cons_Malt_FromLot = "{0}{1}".format("RBB-", str(randint(1,10000)).zfill(5))                               
-
-                    #uniquePre = choice(self.ProductNames)                  
-                    fullMatID = "{0}{1}".format(uniquePre," Ale")
-                    self.Wort_Item = fullMatID
-                    self.MaterialID = "{0}{1}".format("Wort ", fullMatID)
-                    self.Prod_Wort_Item = self.MaterialID                                                            
-
-                    now = datetime.datetime.now()
-                    self.ProductionID = "{0}{1}{2}".format("PR-A", self.EquipmentName[-3], now.strftime("%m%d%S%M"))
-
-                    lotNo = "{0}{1}{2}".format("GW-", self.EquipmentName[-3], now.strftime("%d%M%S%m"))
-                    self.Prod_Wort_ToLot = lotNo
-                    self.Scrap_ToLot = lotNo
-                        
-            case NewStateEnum.Running:
-
-                match self.NewStatus:
-
-                    case NewStatusEnum.Idle:
-                        # Automatically set it to the first phase, Filling
-                        self.ReadyOS = False
-                        self.NewStatus = NewStatusEnum.Filling
-
-                    case NewStatusEnum.Filling:
-                        # Ramp up the Water
-                        if (self.WaterPV <= self.WaterSP):
-                            self.WaterValve.CmdOpen = True
-
-                            if self.WaterValve.OLS:
-                                self.WaterPV = round(self.WaterPV + ((self.ScanTime/100) * 3.367), 2)
-                                self.TemperaturePV = 90.0
-                        else:
-                            self.WaterValve.CmdOpen = False
-
-                            # Complete the phase
-                            if (self.WaterValve.CLS and self.MaltMillComplete):
-                                # Configure Setpoint for next phase
-                                self.TemperatureSP = self.SoakTempSP1
-
-                                # Initiate next phase
-                                self.NewStatus = NewStatusEnum.RampingUp1
-
-                    case NewStatusEnum.RampingUp1:
-                        # Ramp up the temperature
-                        self.Agitator.CmdStart = True 
-                        self.SteamValve.CmdOpen = True
-
-                        if (self.TemperaturePV >= self.TemperatureSP):
-                            self.Agitator.CmdStart = False
-                            self.SteamValve.CmdOpen = False
-
-                            # Initiate next phase
-                            self.NewStatus = NewStatusEnum.Holding1
-                            self.HoldTime.RST = False
-
-                    case NewStatusEnum.Holding1:
-                         self.HoldTime.Enabled = True
-
-                         if(self.HoldTime.DN):
-                             self.HoldTime.Enabled = False
-                             self.HoldTime.RST = True
-                             self.HoldTime.PT = self.SoakTimeSP2
-
-                             # Initiate next phase
-                             self.NewStatus = NewStatusEnum.RampingUp2
-                             self.TemperatureSP = self.SoakTempSP2
-
-                    case NewStatusEnum.RampingUp2:
-                        # Ramp up the temperature
-                        self.Agitator.CmdStart = True
-                        self.SteamValve.CmdOpen = True
-
-                        if (self.TemperaturePV >= self.TemperatureSP):
-                            self.Agitator.CmdStart = False
-                            self.SteamValve.CmdOpen = False
-
-                            # Initiate next phase
-                            self.NewStatus = NewStatusEnum.Holding2
-                            self.HoldTime.RST = False
-
-                    case NewStatusEnum.Holding2:
-                        self.HoldTime.Enabled = True                        
-
-                        if (self.HoldTime.DN and self.BrewKettleReady):
-                            self.HoldTime.Enabled = False
-                            self.NewStatus = NewStatusEnum.Draining
-
-                    case NewStatusEnum.Draining:
-                        self.OutletValve.CmdOpen = True
-                        self.OutletPump.CmdStart = True
-
-                        if (self.WaterPV >= 0.0):
-                            if (self.WaterPV >= 1000.0):
-                                self.WaterPV = round(self.WaterPV - ((self.ScanTime/100) * 1.91), 2)
-                                # Going to lose some moisture to the Mash
-                                self.WortPV = round(self.WortPV + ((self.ScanTime/100) * 1.90), 2)
-
-                            if(self.WaterPV <= 1000.0):
-                                self.WaterValve.CmdOpen = True
-                                self.WaterPV = round(self.WaterPV - ((self.ScanTime/100) * 1.31), 2)
-                                # Going to lose some moisture to the Mash
-                                self.WortPV = round(self.WortPV + ((self.ScanTime/100) * 1.30), 2)
-                            if ((self.WaterValve.CmdOpen) and (self.TemperaturePV > 120.0)):
-                                self.TemperaturePV = round(self.TemperaturePV - (0.93 * 0.9), 2)
-                        else:
-                            self.OutletValve.CmdOpen = False
-                            self.OutletPump.CmdStart = False
-                            self.ShipComplete = True 
-                            self.WaterValve.CmdOpen = False
-
-                            # Because of the interaction between Malt and Mash, this entity only sets a bit for completion
-                            self.MashComplete = True                
+        self.RunState()
 
         if (self.NewState != NewStateEnum.Paused) and (self.SteamValve.CmdOpen) and (self.WaterValve.CmdOpen == False) and (self.TemperaturePV >= 90.0):
             self.TemperaturePV = round(self.TemperaturePV - 0.93 * 0.001, 2)
@@ -374,4 +194,215 @@ class Mash:
         self.SteamValve.Run()
         self.OutletValve.Run()
         self.Agitator.Run()
-        self.OutletPump.Run()  
\ No newline at end of file
+        self.OutletPump.Run()
+
+    # State handlers
+
+    def StateAborted(self):
+        self.Agitator.CmdStart = False
+        self.SteamValve.CmdOpen = False
+        self.OutletPump.CmdStart = False
+        self.OutletValve.CmdOpen = False
+        self.ShipComplete = True
+        self.WaterPV = 0.0
+        self.TemperatureSP = 120
+        self.WortPV = 0.0
+        self.HoldTime.Enabled = False
+
+    def StateDone(self):
+        self.Agitator.CmdStart = False
+        self.SteamValve.CmdOpen = False
+        self.OutletPump.CmdStart = False
+        self.OutletValve.CmdOpen = False
+        self.HoldTime.Enabled = False
+
+    def StatePaused(self):
+        self.Agitator.CmdStart = False
+        self.OutletPump.CmdStart = False
+        self.OutletValve.CmdOpen = False
+        self.SteamValve.CmdOpen = False
+        self.WaterValve.CmdOpen = False
+        self.HoldTime.Enabled = False
+
+        if (self.WaterPV > 100) and (self.Scrap < self.WaterPV):
+            self.newScrap = self.WaterPV * 0.00001
+            self.Scrap = round(self.Scrap + self.newScrap, 2)
+
+    def StateReady(self):
+        self.NewStatus = NewStatusEnum.Idle
+
+        if (not self.ReadyOS):
+            # Reset inital values for next production run
+            self.ReadyOS = True
+            self.WaterSP = 0
+            self.Scrap = 0.0
+            self.newScrap = 0.0
+            self.SoakTempSP1 = 0
+            self.SoakTempSP2 = 0
+            self.SoakTimeSP1 = 0
+            self.SoakTimeSP2 = 0
+            self.TemperatureSP = 90
+            self.TemperaturePV = 90.0
+            self.WortPV = 0.0
+            self.LevelPV = 0.0
+            self.ProductionID = ""
+            self.MaterialID = ""
+            self.Wort_Item = ""
+            self.Cons_Malt_Item = ""
+            self.Cons_Malt_FromLot = ""
+            self.Prod_Wort_ToLot = ""
+            self.Prod_Wort_Item = ""
+            self.Scrap_ToLot = ""
+            self.HoldTime.RST = True
+            self.MaltMillComplete = False
+            self.MashComplete = False
+            self.ShipComplete = False
+
+            # Randomize measurements for next Production Run
+            self.WaterSP = randint(*self.WaterSPRange)
+            self.SoakTempSP1 = randint(*self.SoakTempSP1Range)
+            self.SoakTempSP2 = randint(*self.SoakTempSP2Range)
+            self.SoakTimeSP1 = randint(5,12) * 60
+            self.SoakTimeSP2 = randint(7,14) * 60
+
+            self.HoldTime.PT = self.SoakTimeSP1
+
+            roasterProdDict = self.ConsList.Get()
+            if (roasterProdDict is not None):
+                uniquePre = roasterProdDict["SelectedProduct"]
+                self.Cons_Malt_Item = "{0}".format(roasterProdDict["RoastedBarley_Item"])
+                self.Cons_Malt_FromLot = "{0}".format(roasterProdDict["RoastedBarley_ToLot"])
+            else:
+                uniquePre = choice(self.ProductNames)
+                self.Cons_Malt_Item = "{0}{1}".format(uniquePre," Malt")
+                self.Cons_Malt_FromLot = "{0}{1}".format("RBB-", str(randint(1,10000)).zfill(5))
+
+            #uniquePre = choice(self.ProductNames)
+            fullMatID = "{0}{1}".format(uniquePre," Ale")
+            self.Wort_Item = fullMatID
+            self.MaterialID = "{0}{1}".format("Wort ", fullMatID)
+            self.Prod_Wort_Item = self.MaterialID
+
+            self.ProductionID = self.LotNumbers.Next("PR-", self.EquipmentName[-3])
+
+            lotNo = self.LotNumbers.Next("GW-", self.EquipmentName[-3])
+            self.Prod_Wort_ToLot = lotNo
+            self.Scrap_ToLot = lotNo
+
+    def StateRunning(self):
+        self.RunPhase()
+
+    # Phase handlers (while Running)
+
+    def PhaseIdle(self):
+        # Automatically set it to the first phase, Filling
+        self.ReadyOS = False
+        self.NewStatus = NewStatusEnum.Filling
+
+    def PhaseFilling(self):
+        # Ramp up the Water
+        if (self.WaterPV <= self.WaterSP):
+            self.WaterValve.CmdOpen = True
+
+            if self.WaterValve.OLS:
+                self.WaterPV = round(self.WaterPV + ((self.ScanTime/100) * 3.367), 2)
+                self.TemperaturePV = 90.0
+        else:
+            self.WaterValve.CmdOpen = False
+
+            # Complete the phase
+            if (self.WaterValve.CLS and self.MaltMillComplete):
+                # Configure Setpoint for next phase
+                self.TemperatureSP = self.SoakTempSP1
+
+                # Initiate next phase
+                self.NewStatus = NewStatusEnum.RampingUp1
+
+    def PhaseRampingUp1(self):
+        # Ramp up the temperature
+        self.Agitator.CmdStart = True
+        self.SteamValve.CmdOpen = True
+
+        if (self.TemperaturePV >= self.TemperatureSP):
+            self.Agitator.CmdStart = False
+            self.SteamValve.CmdOpen = False
+
+            # Initiate next phase
+            self.NewStatus = NewStatusEnum.Holding1
+            self.HoldTime.RST = False
+
+    def PhaseHolding1(self):
+        self.HoldTime.Enabled = True
+
+        if(self.HoldTime.DN):
+            self.HoldTime.Enabled = False
+            self.HoldTime.RST = True
+            self.HoldTime.PT = self.SoakTimeSP2
+
+            # Initiate next phase
+            self.NewStatus = NewStatusEnum.RampingUp2
+            self.TemperatureSP = self.SoakTempSP2
+
+    def PhaseRampingUp2(self):
+        # Ramp up the temperature
+        self.Agitator.CmdStart = True
+        self.SteamValve.CmdOpen = True
+
+        if (self.TemperaturePV >= self.TemperatureSP):
+            self.Agitator.CmdStart = False
+            self.SteamValve.CmdOpen = False
+
+            # Initiate next phase
+            self.NewStatus = NewStatusEnum.Holding2
+            self.HoldTime.RST = False
+
+    def PhaseHolding2(self):
+        self.HoldTime.Enabled = True
+
+        if (self.HoldTime.DN and self.BrewKettleReady):
+            self.HoldTime.Enabled = False
+            self.NewStatus = NewStatusEnum.Draining
+
+    def PhaseDraining(self):
+        self.OutletValve.CmdOpen = True
+        self.OutletPump.CmdStart = True
+
+        if (self.WaterPV >= 0.0):
+            if (self.WaterPV >= 1000.0):
+                self.WaterPV = round(self.WaterPV - ((self.ScanTime/100) * 1.91), 2)
+                # Going to lose some moisture to the Mash
+                self.WortPV = round(self.WortPV + ((self.ScanTime/100) * 1.90), 2)
+
+            if(self.WaterPV <= 1000.0):
+                self.WaterValve.CmdOpen = True
+                self.WaterPV = round(self.WaterPV - ((self.ScanTime/100) * 1.31), 2)
+                # Going to lose some moisture to the Mash
+                self.WortPV = round(self.WortPV + ((self.ScanTime/100) * 1.30), 2)
+            if ((self.WaterValve.CmdOpen) and (self.TemperaturePV > 120.0)):
+                self.TemperaturePV = round(self.TemperaturePV - (0.93 * 0.9), 2)
+        else:
+            self.OutletValve.CmdOpen = False
+            self.OutletPump.CmdStart = False
+            self.ShipComplete = True
+            self.WaterValve.CmdOpen = False
+
+            # Because of the interaction between Malt and Mash, this entity only sets a bit for completion
+            self.MashComplete = True
+
+    StateHandlers = {
+        NewStateEnum.Aborted: StateAborted,
+        NewStateEnum.Done: StateDone,
+        NewStateEnum.Paused: StatePaused,
+        NewStateEnum.Ready: StateReady,
+        NewStateEnum.Running: StateRunning
+    }
+
+    PhaseHandlers = {
+        NewStatusEnum.Idle: PhaseIdle,
+        NewStatusEnum.Filling: PhaseFilling,
+        NewStatusEnum.RampingUp1: PhaseRampingUp1,
+        NewStatusEnum.Holding1: PhaseHolding1,
+        NewStatusEnum.RampingUp2: PhaseRampingUp2,
+        NewStatusEnum.Holding2: PhaseHolding2,
+        NewStatusEnum.Draining: PhaseDraining
+    }
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import ast
+import builtins
+from GlobalVariables import NewStateEnum, MachineState, MachineStatus
+
+# Rules of a Transfer - [kind, condition, statements, statements when the condition is false]
+def Always(*Statements):
+    """
+    Always - runs the statements every time the transfer is evaluated
+    """
+    return ["Always", None, list(Statements), []]
+
+def While(When, *Statements, Otherwise=()):
+    """
+    While - runs the statements while the condition is true, and the Otherwise statements while it is false
+    """
+    return ["While", When, list(Statements), list(Otherwise)]
+
+def OnEntry(When, *Statements):
+    """
+    OnEntry - runs the statements once, when the condition becomes true
+    """
+    return ["OnEntry", When, list(Statements), []]
+
+class Transfer:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to describe one edge of the material transfer graph, the hand over of material, lot and production
+    information and handshake signals between an upstream and a downstream asset (i.e. MashTun100 -> BoilKettle100).
+
+    The rules are Python conditions and statements on "up" and "down" (the upstream and downstream asset), states
+    and status are referred to by name (i.e. "up.NewStatus == Draining and up.NewState == Running"). The rules are
+    compiled into one function when the transfer is added to a TransferGraph:
+
+        Always(Statement, ...)                            - runs the statements on every evaluation
+        While(Condition, Statement, ..., Otherwise=[...]) - runs the statements while the condition is true,
+                                                            the Otherwise statements while it is false
+        OnEntry(Condition, Statement, ...)                - runs the statements once when the condition
+                                                            becomes true
+
+    A condition is one Python expression and a statement one Python assignment (i.e. "down.WortPV = up.WortPV")
+    or expression, usually a method call (i.e. "down.ConsList.Put(...)"), on the names:
+
+        up, down                  - the upstream and downstream asset
+        Running, Draining ...     - the members of MachineState and MachineStatus (GlobalVariables)
+        True, False, round ...    - the Python builtins
+
+    The Handshake condition follows the same grammar. "memory" (the OnEntry conditions of the last evaluation,
+    Memory) and "entered" are names of the compiled function and are not available to the rules. A rule with a
+    syntax error, another kind of statement or another name raises a ValueError naming the rule and the transfer
+    when the transfer is added to a TransferGraph, instead of failing when the rule first runs.
+
+    A transfer can route to one of several downstream assets, Downstream is then a dictionary of assets and Route
+    the upstream attribute selecting the downstream asset (i.e. the Bright Tank a Fermenter was allocated). A
+    transfer with a Handshake condition (i.e. "up.ShipToShipCmd") only runs its rules while the condition is true.
+
+    Attributes
+    ----------
+
+    Name (Transfer name, i.e. "MashTun100->BoilKettle100")
+    Stage (Stage of the scan the transfer is evaluated in, see TransferGraph)
+    Upstream (Upstream asset)
+    Downstream (Downstream asset, or dictionary of route value to downstream asset)
+    Route (Upstream attribute selecting the downstream asset, None for a single downstream asset)
+    Rules (List of Always, While and OnEntry rules evaluated in order)
+    Handshake (Condition on handshake signals the rules run under, None to always run the rules)
+    Key (States and status of both assets while they are Ready or Done)
+    Live (The handshake condition was true when the transfer was last evaluated)
+    Settle (Scans the transfer is still evaluated once both assets are Ready or Done)
+
+    """
+
+    # Class Constructor
+    def __init__(self, Name, Stage, Upstream, Downstream, Rules, Route=None, Handshake=None):
+
+        self.Name = Name
+        self.Stage = Stage
+        self.Upstream = Upstream
+        self.Downstream = Downstream
+        self.Route = Route
+        self.Rules = Rules
+        self.Handshake = Handshake
+        self.Key = None
+        self.Live = True
+        self.Settle = 0
+        self.Memory = [False] * len(Rules)
+        self.Function = None
+
+class TransferGraph:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to evaluate the material transfer graph of the plant. The transfers of a stage are evaluated in
+    the order they were added when Run(Stage) is called by the main loop, between the Run() calls of the assets.
+
+    A transfer is only evaluated when it can change something: when the state or status of one of its assets
+    changed, for SettleScans scans after that (motors and valves coming to rest, first scan initialization), and
+    while one of its assets is working (not Ready or Done) or its handshake condition is true. The conditions of
+    the rules must only depend on the states and status of the assets or on values that change while an asset is
+    working. Transfers between idle assets are skipped, so the cost of the graph follows the activity of the
+    plant and not its size.
+
+    Attributes
+    ----------
+
+    Stages (Dictionary of stage name to the list of transfers of the stage)
+    Evaluated (Number of transfer evaluations)
+    Skipped (Number of transfer evaluations skipped)
+
+    Methods
+    -------
+
+    __init__(self, SettleScans) - Class Constructor
+    Add(self, Transfer) - compiles the rules of a transfer and adds it to its stage
+    Run(self, Stage) - evaluates the transfers of a stage
+
+    """
+
+    # States in which an asset does not change the values read by a transfer once it has settled
+    RestingStates = frozenset((NewStateEnum.Ready, NewStateEnum.Done))
+
+    # Class Constructor
+    def __init__(self, SettleScans=10):
+
+        self.SettleScans = SettleScans
+        self.Stages = {}
+        self.Evaluated = 0
+        self.Skipped = 0
+
+        # States and status are referred to by name in the rules
+        self.Names = {member.name: member for member in MachineState}
+        self.Names.update({member.name: member for member in MachineStatus})
+        self._known = set(self.Names) | set(dir(builtins)) | {"up", "down"}
+
+    # Check that a condition or statement of a transfer is valid on its own and only uses the names of the rules
+    def _check(self, Transfer, Rule, Mode):
+
+        try:
+            tree = ast.parse(Rule, "<transfer {0}>".format(Transfer.Name), Mode)
+        except SyntaxError as e:
+            raise ValueError("Invalid rule '{0}' of transfer {1}: {2}".format(Rule, Transfer.Name, e.msg)) from e
+        if (Mode == "exec") and ((len(tree.body) != 1) or not isinstance(tree.body[0], (ast.Assign, ast.AugAssign, ast.Expr))):
+            raise ValueError("Invalid rule '{0}' of transfer {1}: expected one assignment or call".format(Rule, Transfer.Name))
+        unknown = sorted({node.id for node in ast.walk(tree) if isinstance(node, ast.Name)} - self._known)
+        if unknown:
+            raise ValueError("Invalid rule '{0}' of transfer {1}: unknown names {2}, expected up, down, a state, status or builtin".format(Rule, Transfer.Name, ", ".join(unknown)))
+
+    # Compile the rules of a transfer into one function returning True when the handshake condition is true
+    def _compile(self, Transfer):
+
+        if Transfer.Handshake is not None:
+            self._check(Transfer, Transfer.Handshake, "eval")
+        for kind, when, statements, otherwise in Transfer.Rules:
+            if when is not None:
+                self._check(Transfer, when, "eval")
+            for statement in statements + otherwise:
+                self._check(Transfer, statement, "exec")
+
+        lines = ["def transfer(up, down, memory):"]
+        if Transfer.Handshake is not None:
+            lines.append("    if not ({0}):".format(Transfer.Handshake))
+            lines.append("        return False")
+        for number, (kind, when, statements, otherwise) in enumerate(Transfer.Rules):
+            match kind:
+                case "Always":
+                    lines.extend("    " + statement for statement in statements)
+                case "While":
+                    lines.append("    if {0}:".format(when))
+                    lines.extend("        " + statement for statement in statements)
+                    if otherwise:
+                        lines.append("    else:")
+                        lines.extend("        " + statement for statement in otherwise)
+                case "OnEntry":
+                    lines.append("    entered = bool({0})".format(when))
+                    lines.append("    if entered and not memory[{0}]:".format(number))
+                    lines.extend("        " + statement for statement in statements)
+                    lines.append("    memory[{0}] = entered".format(number))
+        lines.append("    return {0}".format(Transfer.Handshake is not None))
+
+        namespace = dict(self.Names)
+        exec(compile("\n".join(lines), "<transfer {0}>".format(Transfer.Name), "exec"), namespace)
+        return namespace["transfer"]
+
+    def Add(self, Transfer):
+
+        Transfer.Function = self._compile(Transfer)
+        self.Stages.setdefault(Transfer.Stage, []).append(Transfer)
+
+    def Run(self, Stage):
+
+        resting = self.RestingStates
+        for transfer in self.Stages[Stage]:
+            up = transfer.Upstream
+            down = transfer.Downstream
+            if transfer.Route is not None:
+                down = down.get(getattr(up, transfer.Route))
+                if down is None:
+                    continue
+
+            # Evaluate while an asset is working or the handshake is on, then until both assets settled
+            if transfer.Live or (up.NewState not in resting) or (down.NewState not in resting):
+                transfer.Key = None
+            else:
+                key = (up.NewState, up.NewStatus, down.NewState, down.NewStatus, down)
+                if key != transfer.Key:
+                    transfer.Key = key
+                    transfer.Settle = self.SettleScans
+                elif transfer.Settle > 0:
+                    transfer.Settle = transfer.Settle - 1
+                else:
+                    self.Skipped = self.Skipped + 1
+                    continue
+
+            self.Evaluated = self.Evaluated + 1
+            transfer.Live = transfer.Function(up, down, transfer.Memory)
@@ -0,0 +1,244 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+from bisect import bisect_left
+
+class Counter:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used for a monotonic Prometheus counter, i.e. the number of scans.
+
+    Attributes
+    ----------
+
+    Name (Metric name, i.e. "brewsim_scans_total")
+    Help (Metric description)
+    Value (Counter value)
+
+    """
+
+    Type = "counter"
+
+    # Class Constructor
+    def __init__(self, Name, Help):
+
+        self.Name = Name
+        self.Help = Help
+        self.Value = 0
+
+    def Inc(self, Amount=1):
+
+        self.Value = self.Value + Amount
+
+    def Samples(self):
+
+        return [[self.Name, {}, self.Value]]
+
+class Gauge:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used for a Prometheus gauge, a value that goes up and down, i.e. the duration of the last scan.
+
+    Attributes
+    ----------
+
+    Name (Metric name)
+    Help (Metric description)
+    Value (Gauge value)
+
+    """
+
+    Type = "gauge"
+
+    # Class Constructor
+    def __init__(self, Name, Help):
+
+        self.Name = Name
+        self.Help = Help
+        self.Value = 0
+
+    def Set(self, Value):
+
+        self.Value = Value
+
+    def Samples(self):
+
+        return [[self.Name, {}, self.Value]]
+
+class MetricHistogram:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used for a Prometheus histogram with fixed bucket bounds, i.e. the scan duration in seconds. Observe()
+    only increments the count of the bucket of the value, the cumulative "le" buckets are built when scraped.
+
+    Attributes
+    ----------
+
+    Name (Metric name)
+    Help (Metric description)
+    Bounds (Upper bounds of the buckets, in increasing order)
+    Counts (Number of values per bucket, the last bucket counts the values above the highest bound)
+    Count (Number of values observed)
+    Sum (Sum of the values observed)
+
+    """
+
+    Type = "histogram"
+
+    # Class Constructor
+    def __init__(self, Name, Help, Bounds):
+
+        self.Name = Name
+        self.Help = Help
+        self.Bounds = sorted(Bounds)
+        self.Counts = [0] * (len(self.Bounds) + 1)
+        self.Count = 0
+        self.Sum = 0.0
+
+    def Observe(self, Value):
+
+        index = bisect_left(self.Bounds, Value)
+        self.Counts[index] = self.Counts[index] + 1
+        self.Count = self.Count + 1
+        self.Sum = self.Sum + Value
+
+    def Samples(self):
+
+        samples = []
+        total = 0
+        for bound, count in zip(self.Bounds + ["+Inf"], list(self.Counts)):
+            total = total + count
+            samples.append([self.Name + "_bucket", {"le": str(bound)}, total])
+        samples.append([self.Name + "_sum", {}, self.Sum])
+        samples.append([self.Name + "_count", {}, total])
+        return samples
+
+class Collector:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used for a metric read when scraped instead of being updated by the simulation, i.e. the depth of the
+    queue of every sink. Function returns a list of [labels, value].
+
+    Attributes
+    ----------
+
+    Name (Metric name)
+    Type (Prometheus metric type - "counter" or "gauge")
+    Help (Metric description)
+    Function (Function returning the list of [labels dictionary, value] of the metric)
+
+    """
+
+    # Class Constructor
+    def __init__(self, Name, Type, Help, Function):
+
+        self.Name = Name
+        self.Type = Type
+        self.Help = Help
+        self.Function = Function
+
+    def Samples(self):
+
+        return [[self.Name, labels, value] for labels, value in self.Function()]
+
+class Metrics:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used as the registry of the metrics of the simulator, served in the Prometheus text format by a
+    MetricsEndpoint. Metrics are registered once at startup. Counters, gauges and histograms are then updated by
+    the simulation scan without a lock - each metric is only written by one thread and a scrape reads the plain
+    values, at worst from the previous scan - and collectors are read when scraped.
+
+    Attributes
+    ----------
+
+    Registered (List of the registered metrics in exposition order)
+
+    Methods
+    -------
+
+    __init__(self) - Class Constructor
+    Counter(self, Name, Help) - registers and returns a Counter
+    Gauge(self, Name, Help) - registers and returns a Gauge
+    Histogram(self, Name, Help, Bounds) - registers and returns a MetricHistogram
+    Collect(self, Name, Type, Help, Function) - registers a metric read from Function when scraped
+    Exposition(self) - returns the metrics in the Prometheus text format
+
+    """
+
+    # Class Constructor
+    def __init__(self):
+
+        self.Registered = []
+
+    def _register(self, Metric):
+
+        if any(metric.Name == Metric.Name for metric in self.Registered):
+            raise ValueError("Metric {0} is already registered".format(Metric.Name))
+        self.Registered.append(Metric)
+        return Metric
+
+    def Counter(self, Name, Help):
+
+        return self._register(Counter(Name, Help))
+
+    def Gauge(self, Name, Help):
+
+        return self._register(Gauge(Name, Help))
+
+    def Histogram(self, Name, Help, Bounds):
+
+        return self._register(MetricHistogram(Name, Help, Bounds))
+
+    def Collect(self, Name, Type, Help, Function):
+
+        return self._register(Collector(Name, Type, Help, Function))
+
+    # Label values escaped as required by the text format
+    def _labels(self, Labels):
+
+        if not Labels:
+            return ""
+        pairs = ['{0}="{1}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+                 for name, value in Labels.items()]
+        return "{" + ",".join(pairs) + "}"
+
+    def Exposition(self):
+
+        lines = []
+        for metric in self.Registered:
+            lines.append("# HELP {0} {1}".format(metric.Name, metric.Help))
+            lines.append("# TYPE {0} {1}".format(metric.Name, metric.Type))
+            for name, labels, value in metric.Samples():
+                lines.append("{0}{1} {2}".format(name, self._labels(labels), value))
+        return "\n".join(lines) + "\n"
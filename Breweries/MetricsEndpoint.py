@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import http.server
+import threading
+
+class MetricsHandler(http.server.BaseHTTPRequestHandler):
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to answer the HTTP requests of a MetricsEndpoint, GET /metrics returns the text of every provider
+    in the Prometheus text format.
+
+    """
+
+    def do_GET(self):
+
+        if self.path.split("?")[0] != "/metrics":
+            self.send_error(404)
+            return
+
+        body = "".join(provider() for provider in self.server.Providers).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    # Scrapes are not logged
+    def log_message(self, format, *args):
+        pass
+
+class MetricsEndpoint(http.server.ThreadingHTTPServer):
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to serve the metrics of the simulator to Prometheus (or any OpenMetrics compatible scraper) at
+    http://host:Port/metrics. Providers are functions returning metrics in the Prometheus text format, they are
+    called on the HTTP thread of the request, so they must only read values updated by the simulation.
+
+    Attributes
+    ----------
+
+    Providers (List of functions returning metrics in the Prometheus text format)
+    Thread (HTTP server thread)
+
+    Methods
+    -------
+
+    __init__(self, Port, Providers, Host) - Class Constructor
+    Start(self) - starts serving requests on a daemon thread
+    Stop(self) - stops serving requests
+
+    """
+
+    daemon_threads = True
+
+    # Class Constructor
+    def __init__(self, Port, Providers, Host="0.0.0.0"):
+
+        super().__init__((Host, Port), MetricsHandler)
+        self.Providers = Providers
+        self.Thread = None
+
+    def Start(self):
+
+        self.Thread = threading.Thread(target=self.serve_forever, name="MetricsEndpoint", daemon=True)
+        self.Thread.start()
+
+    def Stop(self):
+
+        self.shutdown()
+        self.server_close()
@@ -33,6 +33,9 @@ class Motor:
 
     """  
 
+    # Fixed attributes, no per instance __dict__
+    __slots__ = ("EquipmentName", "CmdStart", "presentPosition", "AuxContact", "PV")
+
     # Class Constructor
     def __init__(self, EquipmentName):
         
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import json
+from Sink import Sink
+
+#########################################################################
+# MQTT Library provided by - https://github.com/eclipse/paho.mqtt.python
+# CBOR Library provided by - https://github.com/agronholm/cbor2 (optional)
+try:
+    import paho.mqtt.client as mqtt
+except ImportError:
+    mqtt = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+#########################################################################
+
+class MqttSink(Sink):
+
+    """
+
+    Class Overview
+    ----------
+
+    A sink used to publish the tag values to an MQTT broker, i.e. AWS IoT Core (Basic Ingest) or a local broker
+    bridged by IoT Greengrass. One message is published per asset and scan group to the asset topic built from the
+    property alias scheme (TopicPrefix + /{enterprise}/{plant}/{area}/{asset}). Each message contains the property
+    names once and one row of values per scan in the group:
+
+    {"asset": "/Breweries/IrvinePlant/Roasting/Roaster100", "properties": ["Malt_PV", ...],
+     "scans": [[1700000000.1, 0.0, ...], [1700000000.2, 0.0, ...]]}
+
+    Messages are encoded as compact JSON or CBOR and published with QoS 0 or 1 over a single, reused connection
+    that the MQTT client reconnects automatically.
+
+    Attributes
+    ----------
+
+    Host (MQTT broker host name or IP address)
+    Port (MQTT broker port)
+    Qos (MQTT quality of service, 0 or 1)
+    Format ("json" or "cbor")
+    ScanGroup (Number of scans published in one message per asset)
+    TopicPrefix (Prefix of every topic, i.e. "$aws/rules/BreweryIngest")
+    ClientId (MQTT client id)
+    Client (paho MQTT client)
+    Assets (Tag indexes grouped per asset, see Sink.GroupByAsset)
+    Rows (Rows of values per asset for the current scan group)
+    Messages (Number of messages published)
+    PublishErrors (Number of messages that could not be published, i.e. while disconnected)
+    LastMessage (Message info of the last published message, used to wait for the messages to be sent on Close)
+
+    Methods
+    -------
+
+    __init__(self, Host, Port, Qos, Format, ScanGroup, TopicPrefix, ClientId, QueueSize, Policy) - Class Constructor
+    Open(self) - connects to the MQTT broker
+    Write(self, Snapshot) - adds the Snapshot to the scan group and publishes the group once it is complete
+    Flush(self) - publishes one message per asset for the current scan group
+    Close(self) - publishes the remaining scans and disconnects from the MQTT broker
+
+    """
+
+    # Class Constructor
+    def __init__(self, Host="127.0.0.1", Port=1883, Qos=0, Format="json", ScanGroup=10, TopicPrefix="", ClientId="BrewerySimulator", QueueSize=100, Policy="drop"):
+
+        super().__init__("Mqtt", QueueSize, Policy)
+
+        if mqtt is None:
+            raise ImportError("The MQTT sink requires paho-mqtt, install it with: pip3 install paho-mqtt")
+
+        if Qos not in (0, 1):
+            raise ValueError("Invalid MQTT QoS {0}, expected 0 or 1".format(Qos))
+
+        if Format not in ("json", "cbor"):
+            raise ValueError("Invalid MQTT format '{0}', expected 'json' or 'cbor'".format(Format))
+
+        if (Format == "cbor") and (cbor2 is None):
+            raise ImportError("The MQTT sink cbor format requires cbor2, install it with: pip3 install cbor2")
+
+        self.Host = Host
+        self.Port = Port
+        self.Qos = Qos
+        self.Format = Format
+        self.ScanGroup = max(1, ScanGroup)
+        self.TopicPrefix = TopicPrefix
+        self.ClientId = ClientId
+        self.Client = None
+        self.Assets = []
+        self.Rows = []
+        self.Messages = 0
+        self.PublishErrors = 0
+        self.LastMessage = None
+
+    def Open(self):
+
+        self.Assets = self.GroupByAsset()
+        self.Rows = [[] for asset in self.Assets]
+
+        if hasattr(mqtt, "CallbackAPIVersion"):
+            self.Client = mqtt.Client(mqtt.CallbackAPIVersion.VERSION2, client_id=self.ClientId)
+        else:
+            self.Client = mqtt.Client(client_id=self.ClientId)
+
+        # Allow a full scan group of QoS 1 messages in flight before publish waits for acknowledgements
+        self.Client.max_inflight_messages_set(max(20, len(self.Assets) * 2))
+        self.Client.reconnect_delay_set(min_delay=1, max_delay=30)
+        self.Client.connect_async(self.Host, self.Port, keepalive=60)
+        self.Client.loop_start()
+
+    def Write(self, Snapshot):
+
+        values = Snapshot.Values
+        for row, (area_name, asset_name, prefix, indexes) in zip(self.Rows, self.Assets):
+            row.append([Snapshot.Time] + [values[index] for index in indexes])
+
+        if (self.Rows) and (len(self.Rows[0]) >= self.ScanGroup):
+            self.Flush()
+
+    # Publish one message per asset for the current scan group
+    def Flush(self):
+
+        for number, (area_name, asset_name, prefix, indexes) in enumerate(self.Assets):
+            rows = self.Rows[number]
+            if not rows:
+                continue
+
+            message = {"asset": prefix,
+                       "properties": [self.Tags[index].Property for index in indexes],
+                       "scans": rows}
+
+            if self.Format == "cbor":
+                payload = cbor2.dumps(message)
+            else:
+                payload = json.dumps(message, separators=(",", ":"))
+
+            # Messages published while the broker is not connected are lost
+            info = self.Client.publish(self.TopicPrefix + prefix, payload, qos=self.Qos)
+            if info.rc == mqtt.MQTT_ERR_SUCCESS:
+                self.Messages = self.Messages + 1
+                self.LastMessage = info
+            else:
+                self.PublishErrors = self.PublishErrors + 1
+            self.Rows[number] = []
+
+    def Close(self):
+
+        if self.Client is not None:
+            if self.Assets:
+                self.Flush()
+            # Messages are sent in order, so once the last message is sent all messages are sent
+            if self.LastMessage is not None:
+                try:
+                    self.LastMessage.wait_for_publish(timeout=5)
+                except (RuntimeError, ValueError):
+                    pass
+            self.Client.disconnect()
+            self.Client.loop_stop()
+        self.Client = None
@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+from Sink import Tag
+from GlobalVariables import NewStateEnum
+
+# Counters of a rolling window
+PLANNED = 0     # Seconds in a planned UtilizationState (Runtime, Demand, Downtime or Maintenance)
+RUNTIME = 1     # Seconds in the Runtime UtilizationState
+ACTUAL = 2      # Integral of the speed while running
+IDEAL = 3       # Integral of the speed setpoint while running
+GOOD = 4        # Good production (increase of the production counter)
+SCRAP = 5       # Scrap (increase of Scrap)
+FIELDS = 6
+
+class RollingWindow:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to keep the OEE counters of the last Length seconds. The window is a ring of Buckets buckets of
+    Length / Buckets seconds each. Counters are added to the current bucket and to the window totals, and when a
+    bucket expires its counters are subtracted from the totals, so adding to the window and reading it take
+    constant time whatever its length. The totals cover the last Length seconds to within one bucket.
+
+    Attributes
+    ----------
+
+    Length (Length of the window in seconds)
+    Width (Length of a bucket in seconds)
+    Totals (Counters of the window, see PLANNED, RUNTIME, ACTUAL, IDEAL, GOOD and SCRAP)
+
+    Methods
+    -------
+
+    __init__(self, Length, Buckets) - Class Constructor
+    Add(self, Now, Counters) - adds counters to the current bucket, expiring the buckets older than the window
+
+    """
+
+    # Class Constructor
+    def __init__(self, Length, Buckets=60):
+
+        self.Length = Length
+        self.Width = Length / Buckets
+        self.Buckets = [[0.0] * FIELDS for bucket in range(Buckets)]
+        self.Totals = [0.0] * FIELDS
+        self.Position = 0
+        self.End = None
+
+    def Add(self, Now, Counters):
+
+        if self.End is None:
+            self.End = Now + self.Width
+
+        # Expire the buckets passed since the last add, at most the whole ring
+        expired = 0
+        while (Now >= self.End) and (expired < len(self.Buckets)):
+            self.Position = (self.Position + 1) % len(self.Buckets)
+            bucket = self.Buckets[self.Position]
+            for field in range(FIELDS):
+                # Clamp the rounding errors of the subtraction
+                self.Totals[field] = max(0.0, self.Totals[field] - bucket[field])
+                bucket[field] = 0.0
+            self.End = self.End + self.Width
+            expired = expired + 1
+        if Now >= self.End:
+            self.End = Now + self.Width
+
+        bucket = self.Buckets[self.Position]
+        for field in range(FIELDS):
+            bucket[field] = bucket[field] + Counters[field]
+            self.Totals[field] = self.Totals[field] + Counters[field]
+
+def oee_measures(Totals):
+    """
+    oee_measures - Returns [availability, performance, quality, oee] in percent of the counters of a window, the
+                   way the IoT SiteWise asset models compute them
+    """
+    availability = Totals[RUNTIME] / Totals[PLANNED] * 100 if Totals[PLANNED] > 0 else 0.0
+    # Assets without a speed run at their ideal rate
+    performance = Totals[ACTUAL] / Totals[IDEAL] * 100 if Totals[IDEAL] > 0 else 100.0
+    quality = Totals[GOOD] / (Totals[GOOD] + Totals[SCRAP]) * 100 if (Totals[GOOD] + Totals[SCRAP]) > 0 else 100.0
+    return [round(availability, 2), round(performance, 2), round(quality, 2), round(availability * performance * quality / 10000, 2)]
+
+class OeeCalculator:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to compute the OEE of every asset and every area (line) of the plant in the simulator, over
+    rolling windows of the last 5 minutes, hour and shift, so local dashboards get OEE without the IoT SiteWise
+    metrics. The measures follow the IoT SiteWise asset models:
+
+    Availability - time in the Runtime UtilizationState over the time in any UtilizationState (Runtime, Demand,
+                   Downtime, Maintenance), like statetime() of the models
+    Performance  - speed over speed setpoint while the asset is Running (SpeedPV / SpeedSP of the Bottle Lines),
+                   100% for the assets without a speed, which always run at their ideal rate
+    Quality      - good production over good production and scrap, the good production being the increase of
+                   the production counter of the asset (ProductionCounters) and the scrap the increase of Scrap
+    OEE          - Availability * Performance * Quality
+
+    Update() reads the assets once per scan and adds what changed since the last scan (held states and speeds
+    count from the previous scan until this one, like StreamingAggregate) to the RollingWindow of every window of
+    the asset and of its area, in constant time per asset. The measures are computed from the window totals
+    every Interval seconds.
+
+    Attributes
+    ----------
+
+    Assets (List of [area name, asset name, asset] of the plant)
+    Windows (List of [window name, length in seconds])
+    Interval (Seconds between updates of the measures)
+    Areas (Names of the areas, in the order of their first asset)
+    Tags (Tag of every measure, see Tag, property "{measure}_{window}" of every asset then of every area)
+    Values (Measures of the last update, in the order of Tags)
+    Updates (Number of updates of the measures)
+
+    Methods
+    -------
+
+    __init__(self, Assets, Prefix, ShiftHours, Interval, Buckets) - Class Constructor, creates the tags
+    Update(self, Now) - adds the scan of the assets to the windows, returns True when the measures were updated
+    Measures(self) - returns the measures of every window of the assets and areas as a dictionary
+
+    """
+
+    # Production counter of every asset class, its increase is the good production
+    ProductionCounters = {"Roaster": "MaltPV", "MaltMill": "MaltPV", "Mash": "WortPV", "BoilKettle": "BrewedWortPV",
+                          "Fermenter": "GreenBeerPV", "BrightTank": "BeerPV", "BottleLine": "BottlePV"}
+
+    Names = ("Availability", "Performance", "Quality", "OEE")
+
+    PlannedStates = ("Runtime", "Demand", "Downtime", "Maintenance")
+
+    # Class Constructor
+    def __init__(self, Assets, Prefix, ShiftHours=8, Interval=5, Buckets=60):
+
+        self.Assets = Assets
+        self.Windows = [["5min", 300], ["Hour", 3600], ["Shift", int(ShiftHours * 3600)]]
+        self.Interval = Interval
+        self.Updates = 0
+        self._lastUpdate = None
+        self._lastScan = None
+
+        # Rolling windows of every asset and of every area, areas in the order of their first asset
+        self.Areas = []
+        self.AreaWindows = {}
+        self.AssetWindows = []
+        self._previous = []
+        for areaName, assetName, asset in Assets:
+            if areaName not in self.AreaWindows:
+                self.Areas.append(areaName)
+                self.AreaWindows[areaName] = [RollingWindow(length, Buckets) for name, length in self.Windows]
+            self.AssetWindows.append([RollingWindow(length, Buckets) for name, length in self.Windows])
+            self._previous.append(None)
+
+        self.Tags = []
+        for areaName, assetName, asset in Assets:
+            for windowName, length in self.Windows:
+                for name in self.Names:
+                    self.Tags.append(Tag(areaName, assetName, "{0}_{1}".format(name, windowName), "double", "{0}/{1}/{2}/{3}_{4}".format(Prefix, areaName, assetName, name, windowName)))
+        for areaName in self.Areas:
+            for windowName, length in self.Windows:
+                for name in self.Names:
+                    self.Tags.append(Tag(areaName, areaName, "{0}_{1}".format(name, windowName), "double", "{0}/{1}/{2}_{3}".format(Prefix, areaName, name, windowName)))
+        self.Values = [0.0] * len(self.Tags)
+
+    # Read the state of an asset used by the counters
+    def _read(self, Asset):
+
+        counter = self.ProductionCounters.get(type(Asset).__name__)
+        running = Asset.NewState == NewStateEnum.Running
+        return [Asset.UtilizationState,
+                running,
+                getattr(Asset, "SpeedPV", 0.0) if running else 0.0,
+                getattr(Asset, "SpeedSP", 0.0) if (running) and hasattr(Asset, "SpeedPV") else 0.0,
+                getattr(Asset, counter) if counter is not None else 0.0,
+                getattr(Asset, "Scrap", 0.0)]
+
+    def Update(self, Now):
+
+        elapsed = Now - self._lastScan if self._lastScan is not None else 0.0
+        self._lastScan = Now
+
+        for number, (areaName, assetName, asset) in enumerate(self.Assets):
+            current = self._read(asset)
+            previous = self._previous[number]
+            self._previous[number] = current
+            if previous is None:
+                continue
+
+            # The state and speed of the previous scan held until this scan, counters only count their increase
+            # (they are reset to 0 for every lot)
+            utilizationState, running, speed, setpoint, production, scrap = previous
+            counters = [elapsed if utilizationState in self.PlannedStates else 0.0,
+                        elapsed if utilizationState == "Runtime" else 0.0,
+                        speed * elapsed,
+                        setpoint * elapsed,
+                        max(0.0, current[4] - production),
+                        max(0.0, current[5] - scrap)]
+            for window in self.AssetWindows[number]:
+                window.Add(Now, counters)
+            for window in self.AreaWindows[areaName]:
+                window.Add(Now, counters)
+
+        if (self._lastUpdate is not None) and (Now - self._lastUpdate < self.Interval):
+            return False
+        self._lastUpdate = Now
+
+        values = []
+        for windows in self.AssetWindows + [self.AreaWindows[areaName] for areaName in self.Areas]:
+            for window in windows:
+                values.extend(oee_measures(window.Totals))
+        self.Values = values
+        self.Updates = self.Updates + 1
+        return True
+
+    def Measures(self):
+
+        measures = {}
+        for tag, value in zip(self.Tags, self.Values):
+            measures.setdefault(tag.Asset, {})[tag.Property] = value
+        return measures
@@ -0,0 +1,327 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+from Timer import Timer
+from Roaster import Roaster
+from MaltMill import MaltMill
+from Mash import Mash
+from BoilKettle import BoilKettle
+from Fermenter import Fermenter
+from BrightTank import BrightTank
+from BottleLine import BottleLine
+from LotBuffer import LotBuffer
+from MaterialTransfer import Transfer, TransferGraph, Always, While, OnEntry
+from VesselPool import VesselPool
+from LotNumberGenerator import LotNumberGenerator
+from GlobalVariables import NewStateEnum
+
+class Plant:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used for the Irvine plant of the Brewery: the virtual physical assets (aka IoT SiteWise/TwinMaker
+    digital twins), the material transfer graph between them and the allocation of the Bright Tanks and Bottling
+    Lines. Run() executes one 100 millisecond scan of the control narrative, so the plant runs the same in the
+    simulator and in the benchmarks.
+
+    Attributes
+    ----------
+
+    Roaster100 ... BottleLine403 (Assets of the plant)
+    Assets (Dictionary of asset name to asset, in IoT SiteWise asset order)
+    LotNumbers (LotNumberGenerator of the lots and ProductionIDs of the assets)
+    FerShipToTime100, FerShipToTime200 (Delay between the Bright Tank allocation and the ship of a Fermenter)
+    FermenterShips (List of [Fermenter, number, ship delay Timer])
+    BrightTanks (Dictionary of Bright Tank number to Bright Tank)
+    BottleLines (Dictionary of Bottling Line number to Bottling Line)
+    BrightTankPool (VesselPool of the available Bright Tanks)
+    BottleLinePool (VesselPool of the available Bottling Lines)
+    Transfers (TransferGraph - Roaster->Mash->BoilKettle->Fermenter->Bright Tank->Bottling Line)
+
+    Methods
+    -------
+
+    __init__(self, AllocationPolicy, WipCapacity, WipPolicy, PlantName, LotNumberPath) - Class Constructor
+    Run(self, Profiler) - runs one scan of the plant
+
+    """
+
+    # Class Constructor
+    def __init__(self, AllocationPolicy="lru", WipCapacity=21, WipPolicy="fifo", PlantName=None, LotNumberPath=None):
+
+        # Create instances of virtual physical assets (aka IoT SiteWise/TwinMaker digital twins)
+        self.Roaster100 = Roaster("Roaster100")
+        self.Roaster200 = Roaster("Roaster200")
+        self.MaltMill100 = MaltMill("MaltMill100")
+        self.MaltMill200 = MaltMill("MaltMill200")
+        self.MashTun100 = Mash("MashTun100")
+        self.MashTun200 = Mash("MashTun200")
+        self.BoilKettle100 = BoilKettle("BoilKettle100")
+        self.BoilKettle200 = BoilKettle("BoilKettle200")
+        self.Fermenter100 = Fermenter("Fermenter100")
+        self.Fermenter200 = Fermenter("Fermenter200")
+        self.BrightTank301 = BrightTank("BrightTank301")
+        self.BrightTank302 = BrightTank("BrightTank302")
+        self.BrightTank303 = BrightTank("BrightTank303")
+        self.BrightTank304 = BrightTank("BrightTank304")
+        self.BrightTank305 = BrightTank("BrightTank305")
+        self.BottleLine401 = BottleLine("BottleLine401")
+        self.BottleLine402 = BottleLine("BottleLine402")
+        self.BottleLine403 = BottleLine("BottleLine403")
+
+        self.Assets = {asset.EquipmentName: asset for asset in [
+            self.Roaster100, self.Roaster200, self.MaltMill100, self.MaltMill200, self.MashTun100, self.MashTun200,
+            self.BoilKettle100, self.BoilKettle200, self.Fermenter100, self.Fermenter200,
+            self.BrightTank301, self.BrightTank302, self.BrightTank303, self.BrightTank304, self.BrightTank305,
+            self.BottleLine401, self.BottleLine402, self.BottleLine403]}
+
+        # Lots and ProductionIDs are numbered by plant, the plant name of the host by default, after the seconds
+        # reserved in LotNumberPath by the previous run
+        self.LotNumbers = LotNumberGenerator(PlantName, LotNumberPath)
+        for asset in self.Assets.values():
+            asset.LotNumbers = self.LotNumbers
+
+        # Roaster lots waiting to be consumed by the MashTuns
+        for mashTun in [self.MashTun100, self.MashTun200]:
+            mashTun.ConsList = LotBuffer(mashTun.EquipmentName + ".ConsList", WipCapacity, WipPolicy)
+
+        # Local variables for asset integration
+        self.FerShipToTime100 = Timer("FerShipToTime100")
+        self.FerShipToTime200 = Timer("FerShipToTime200")
+
+        self.FerShipToTime100.PT = 15
+        self.FerShipToTime200.PT = 15
+
+        self.FermenterShips = [[self.Fermenter100, 100, self.FerShipToTime100], [self.Fermenter200, 200, self.FerShipToTime200]]
+
+        self.BrightTanks = {301: self.BrightTank301, 302: self.BrightTank302, 303: self.BrightTank303, 304: self.BrightTank304, 305: self.BrightTank305}
+        self.BottleLines = {401: self.BottleLine401, 402: self.BottleLine402, 403: self.BottleLine403}
+
+        # Ships are routed to the Bright Tank/Bottling Line allocated from the pool of the available vessels
+        self.BrightTankPool = VesselPool("BrightTanks", self.BrightTanks, AllocationPolicy)
+        self.BottleLinePool = VesselPool("BottleLines", self.BottleLines, AllocationPolicy)
+
+        ################################################################################################
+        # Material transfer graph - Roaster->Mash->BoilKettle->Fermenter->Bright Tank->Bottling Line
+        ################################################################################################
+
+        # Transfers are evaluated by stage - "Ship" once the ship commands are set, the others before the named asset runs
+        self.Transfers = transfers = TransferGraph()
+
+        for roaster, maltMill, mashTun, boilKettle, fermenter in [[self.Roaster100, self.MaltMill100, self.MashTun100, self.BoilKettle100, self.Fermenter100],
+                                                                  [self.Roaster200, self.MaltMill200, self.MashTun200, self.BoilKettle200, self.Fermenter200]]:
+
+            # Transfer the Roaster Produced Item/ToLot to the MashTun Consume Item/From Lot
+            transfers.Add(Transfer(roaster.EquipmentName + "->" + mashTun.EquipmentName, mashTun.EquipmentName, roaster, mashTun, [
+                OnEntry("up.NewStatus == Filling",
+                        "down.ConsList.Put({'SelectedProduct': up.SelectedProduct, 'RoastedBarley_ToLot': up.Prod_RoastedBarley_ToLot, 'RoastedBarley_Item': up.Prod_RoastedBarley_Item}, up.ProductPriority)")]))
+
+            # The MashTun follows the state of its MaltMill
+            transfers.Add(Transfer(maltMill.EquipmentName + "->" + mashTun.EquipmentName, mashTun.EquipmentName, maltMill, mashTun, [
+                Always("down.NewState = up.NewState",
+                       "down.Utilization = up.Utilization",
+                       "down.UtilizationState = up.UtilizationState",
+                       "up.MaltSP = round(down.WaterSP * 0.2951328, 2)",
+                       "up.MashTunComplete = down.MashComplete",
+                       "down.MaltMillComplete = up.MaltMillComplete")]))
+
+            # Send ProductionID, MaterialID and Produced Information to the BoilKettle for Consumption
+            transfers.Add(Transfer(mashTun.EquipmentName + "->" + boilKettle.EquipmentName, mashTun.EquipmentName, mashTun, boilKettle, [
+                While("up.NewState == Running", "down.Next_ProductionID = up.ProductionID", "down.Next_ItemID = up.Wort_Item"),
+                While("up.NewStatus == Draining", "down.Cons_Wort_Item = up.Prod_Wort_Item", "down.Cons_Wort_FromLot = up.Prod_Wort_ToLot"),
+                While("down.NewState == Ready", "up.BrewKettleReady = True", Otherwise=["up.BrewKettleReady = False"])]))
+
+            # The BoilKettle starts filling once the MashTun outlet pump runs
+            transfers.Add(Transfer(mashTun.EquipmentName + "->" + boilKettle.EquipmentName, boilKettle.EquipmentName, mashTun, boilKettle, [
+                Always("down.StartCmd = up.OutletPump.AuxContact",
+                       "down.MashShipComplete = up.ShipComplete or (up.NewState == Aborted and down.NewStatus == Filling)"),
+                While("up.NewStatus == Draining and up.NewState == Running", "down.WortPV = up.WortPV"),
+                While("down.NewStatus == Filling and up.NewStatus != Draining", "down.MashShipComplete = True")]))
+
+            # Send ProductionID, MaterialID and Produced Information to the Fermenter for Consumption
+            transfers.Add(Transfer(boilKettle.EquipmentName + "->" + fermenter.EquipmentName, boilKettle.EquipmentName, boilKettle, fermenter, [
+                While("up.NewState == Running", "down.Next_ProductionID = up.DownStream_ProductionID", "down.Next_ItemID = up.DownStream_ItemID"),
+                While("up.NewStatus == Draining", "down.Cons_BrewedWort_Item = up.Prod_BrewedWort_Item", "down.Cons_BrewedWort_FromLot = up.Prod_BrewedWort_ToLot"),
+                While("down.NewState == Ready", "up.FermenterReady = True", Otherwise=["up.FermenterReady = False"])]))
+
+            # The Fermenter starts filling once the BoilKettle outlet pump runs
+            transfers.Add(Transfer(boilKettle.EquipmentName + "->" + fermenter.EquipmentName, fermenter.EquipmentName, boilKettle, fermenter, [
+                Always("down.StartCmd = up.OutletPump.AuxContact",
+                       "down.BrewKettleShipComplete = up.ShipComplete or (up.NewState == Aborted and down.NewStatus == Filling)"),
+                While("up.NewStatus == Draining and up.NewState == Running", "down.BrewedWortPV = up.BrewedWortPV")]))
+
+        # A Fermenter ships to the Bright Tank it allocated once its ship command is set
+        for fermenter in [self.Fermenter100, self.Fermenter200]:
+            transfers.Add(Transfer(fermenter.EquipmentName + "->BrightTank", "Ship", fermenter, self.BrightTanks, [
+                Always("down.StartCmd = True",
+                       "down.BeerShippedFromFermenter = up.GreenBeerPV",
+                       "down.FermenterShipComplete = up.ShipToShipComplete or (up.NewState == Aborted and down.NewStatus == Filling)",
+                       "down.Next_ProductionID = up.DownStream_ProductionID",
+                       "down.Next_ItemID = up.DownStream_ItemID",
+                       "down.Cons_GreenBeer_Item = up.Prod_GreenBeer_Item",
+                       "down.Cons_GreenBeer_FromLot = up.Prod_GreenBeer_ToLot"),
+                While("down.FermenterShipComplete", "up.ShipToShipCmd = False")],
+                Route="ShipTo_Tank", Handshake="up.ShipToAllocated and up.ShipToShipCmd"))
+
+        # A Bright Tank ships to the Bottling Line it allocated once its ship command is set
+        for brightTank in self.BrightTanks.values():
+            transfers.Add(Transfer(brightTank.EquipmentName + "->BottleLine", "Ship", brightTank, self.BottleLines, [
+                Always("down.BeerShippedFromStorage = up.BeerShipped",
+                       "down.StorageShipComplete = up.ShipToShipComplete or (up.NewState == Aborted and down.NewStatus == Filling)",
+                       "down.Next_ProductionID = up.DownStream_ProductionID",
+                       "down.Next_ItemID = up.DownStream_ItemID",
+                       "down.Cons_Beer_Item = up.Prod_Beer_Item",
+                       "down.Cons_Beer_FromLot = up.Prod_Beer_ToLot"),
+                While("up.NewState == Done or up.NewState == Aborted", "up.ShipToShipCmd = False", "down.StorageShipComplete = True")],
+                Route="ShipToTank", Handshake="up.ShipToShipCmd"))
+
+    # One scan of the plant - allocations, material transfers and the Run() of every asset. Profiler records the
+    # allocations of a profiled scan, None when the scan is not profiled
+    def Run(self, Profiler=None):
+
+        # Set assets to run
+        self.FerShipToTime100.Run()
+        self.FerShipToTime200.Run()
+
+        ####################################################################
+        # Start Brewing Train Asset Integration Control
+        ####################################################################
+
+        ############################################################################################################################
+        # Fermenter to Storage Control - Fermenter 100 & 200 are allocated an available Bright Tank 301-305 and Transfer Material
+        ############################################################################################################################
+
+        # Index the Bright Tanks and Bottling Lines that became available or busy since the last scan
+        self.BrightTankPool.Update()
+        self.BottleLinePool.Update()
+
+        for fermenter, number, shipToTime in self.FermenterShips:
+
+            if (fermenter.NewState == NewStateEnum.Running) and (fermenter.HoldTime.DN) and (not fermenter.ShipToAllocated):
+                fermenter.ShipToAutoAllocateCmd = True
+
+            if (fermenter.ShipToAutoAllocateCmd):
+
+                shipToTime.Enabled = True
+                shipToTime.RST = False
+
+                tank = self.BrightTankPool.Allocate()
+                if tank is not None:
+                    fermenter.ShipToAutoAllocateCmd = False
+                    fermenter.ShipToAllocated = True
+                    fermenter.ShipTo_Tank = tank
+                    self.BrightTanks[tank].AllocatedFrom = number
+
+            if (fermenter.NewState == NewStateEnum.Running) and (fermenter.ShipToAllocated):
+
+                if (shipToTime.DN):
+                    shipToTime.Enabled = False
+                    shipToTime.RST = True
+
+                    fermenter.ShipToShipCmd = True
+
+        ########################################################################################################################################
+        # Bright Tanks to Bottling Lines Control - Bright Tanks 301-305 are allocated an available Bottling Line 401-403 and Transfer Material
+        ########################################################################################################################################
+
+        for brightTank in self.BrightTanks.values():
+            if (brightTank.NewState == NewStateEnum.Running) and (brightTank.HoldTime.DN) and (not brightTank.ShipToAllocated):
+                brightTank.ShipToAutoAllocateCmd = True
+
+        for number, brightTank in self.BrightTanks.items():
+            if (brightTank.ShipToAutoAllocateCmd):
+
+                line = self.BottleLinePool.Allocate()
+                if line is not None:
+                    brightTank.ShipToTank = line
+                    brightTank.ShipToAllocated = True
+                    brightTank.ShipToAutoAllocateCmd = False
+                    self.BottleLines[line].AllocatedFrom = number
+                else:
+                    brightTank.ShipToAllocated = False
+                    brightTank.ShipToTank = -1
+
+        for brightTank in self.BrightTanks.values():
+            if (brightTank.NewState == NewStateEnum.Running) and (brightTank.ShipToAllocated):
+                brightTank.ShipToShipCmd = True
+
+        if (Profiler is not None):
+            Profiler.Lap("Allocation")
+
+        # Ship material Fermenters->Bright Tanks and Bright Tanks->Bottling Lines once allocated
+        self.Transfers.Run("Ship")
+
+        #Update Roasters
+        self.Roaster100.Run()
+        self.Roaster200.Run()
+
+        #######################################################
+        # Brew Train 100 - Roaster->Mash->BoilKettle->Fermenter
+        #######################################################
+
+        # Material transfers Roaster100->MashTun100, MaltMill100<->MashTun100 and Mash100->BoilKettle100
+        self.Transfers.Run("MashTun100")
+
+        #Update MaltMill100 and MashTun100
+        self.MashTun100.Run()
+        self.MaltMill100.Run()
+
+        # Material transfers Mash100->BoilKettle100 and BoilKettle100->Fermenter100
+        self.Transfers.Run("BoilKettle100")
+
+        # Update BoilKettle100
+        self.BoilKettle100.Run()
+
+        # Material transfers BoilKettle100->Fermenter100
+        self.Transfers.Run("Fermenter100")
+
+        # Update Fermenter100
+        self.Fermenter100.Run()
+
+        #######################################################
+        # Brew Train 200 - Roaster->Mash->BoilKettle->Fermenter
+        #######################################################
+
+        # Material transfers Roaster200->MashTun200, MaltMill200<->MashTun200 and Mash200->BoilKettle200
+        self.Transfers.Run("MashTun200")
+
+        #Update MaltMill200 and MashTun200
+        self.MashTun200.Run()
+        self.MaltMill200.Run()
+
+        # Material transfers Mash200->BoilKettle200 and BoilKettle200->Fermenter200
+        self.Transfers.Run("BoilKettle200")
+
+        # Update BoilKettle200
+        self.BoilKettle200.Run()
+
+        # Material transfers BoilKettle200->Fermenter200
+        self.Transfers.Run("Fermenter200")
+
+        # Update Fermenter200
+        self.Fermenter200.Run()
+
+        # Update Bright Tanks
+        self.BrightTank301.Run()
+        self.BrightTank302.Run()
+        self.BrightTank303.Run()
+        self.BrightTank304.Run()
+        self.BrightTank305.Run()
+
+        #Update Bottling Lines
+        self.BottleLine401.Run()
+        self.BottleLine402.Run()
+        self.BottleLine403.Run()
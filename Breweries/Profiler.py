@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+from time import perf_counter_ns
+from Histogram import Histogram
+from GlobalVariables import NewStateEnum, NewStateNames, NewStatusNames
+
+#########################################################################
+# OPC UA Library provided by - https://github.com/FreeOpcUa/python-opcua
+from opcua import ua
+#########################################################################
+
+class Profiler:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to profile the scan of the simulation: the Run() of every asset (in total and per phase), the
+    stages of the material transfer graph, and the sections of the main loop marked with Lap() (i.e. the OPC UA
+    update and the hand over to the sinks). Durations are measured with perf_counter_ns and recorded in a
+    Histogram per section and phase.
+
+    Only one scan out of SampleEvery is profiled. The timed Run() wrappers are installed on the assets by
+    BeginScan() of a profiled scan and removed by EndScan(), so the other scans run the assets unchanged and
+    only pay for the BeginScan(), Lap() and EndScan() calls.
+
+    Results are published under a Diagnostics object of the OPC UA address space with Publish(), one object per
+    section (one child object per phase) with Count, Mean_us, P50_us, P99_us and Max_us variables, and as a
+    Prometheus summary with Exposition().
+
+    Attributes
+    ----------
+
+    Assets (Dictionary of asset name to asset profiled)
+    Transfers (TransferGraph profiled per stage, None to not profile the transfers)
+    SampleEvery (Profile one scan out of SampleEvery)
+    Histograms (Dictionary of (section, phase) to Histogram, phase is "" for a section without phases)
+    Scans (Number of scans)
+    Sampling (The current scan is profiled)
+    Objects (Dictionary of section to its OPC UA object)
+    Nodes (Dictionary of (section, phase) to the OPC UA variables of the histogram)
+
+    Methods
+    -------
+
+    __init__(self, Assets, Transfers, SampleEvery) - Class Constructor
+    BeginScan(self) - starts a scan, returns True when it is profiled
+    Mark(self) - starts the next Lap() section
+    Lap(self, Section) - records the time since the last Mark(), Lap() or BeginScan() in Section
+    EndScan(self) - records the scan duration and removes the timed Run() wrappers
+    Sections(self) - returns the histograms with the total of every asset merged from its phases
+    Publish(self, Node, Namespace) - updates the OPC UA diagnostics variables under Node
+    Exposition(self) - returns the histograms in the Prometheus text format
+
+    """
+
+    Quantiles = (50, 90, 99, 99.9)
+
+    # OPC UA variables of a histogram
+    Variables = (("Count", ua.VariantType.Int64), ("Mean_us", ua.VariantType.Double), ("P50_us", ua.VariantType.Double),
+                 ("P99_us", ua.VariantType.Double), ("Max_us", ua.VariantType.Double))
+
+    # Class Constructor
+    def __init__(self, Assets, Transfers=None, SampleEvery=10):
+
+        self.Assets = Assets
+        self.Transfers = Transfers
+        self.SampleEvery = max(1, SampleEvery)
+        self.Histograms = {}
+        self.Scans = 0
+        self.Sampling = False
+        self.Objects = {}
+        self.Nodes = {}
+        self._scanStart = 0
+        self._last = 0
+
+        # Timed Run() of every asset and of the transfer graph, installed while a scan is profiled
+        self._wrappers = [[asset, self._timedAsset(name, asset)] for name, asset in Assets.items()]
+        if Transfers is not None:
+            self._wrappers.append([Transfers, self._timedTransfers(Transfers)])
+
+    def _histogram(self, Section, Phase):
+
+        histogram = self.Histograms.get((Section, Phase))
+        if histogram is None:
+            histogram = self.Histograms[(Section, Phase)] = Histogram()
+        return histogram
+
+    def _timedAsset(self, Name, Asset):
+
+        run = type(Asset).Run
+        phases = {}
+
+        def timedRun():
+            key = (Asset.NewState, Asset.NewStatus)
+            histogram = phases.get(key)
+            if histogram is None:
+                # Phase while Running, state otherwise
+                if Asset.NewState == NewStateEnum.Running:
+                    histogram = phases[key] = self._histogram(Name, NewStatusNames[Asset.NewStatus])
+                else:
+                    histogram = phases[key] = self._histogram(Name, NewStateNames[Asset.NewState])
+            start = perf_counter_ns()
+            run(Asset)
+            histogram.Record(perf_counter_ns() - start)
+
+        return timedRun
+
+    def _timedTransfers(self, Transfers):
+
+        run = type(Transfers).Run
+
+        def timedRun(Stage):
+            start = perf_counter_ns()
+            run(Transfers, Stage)
+            self._histogram("Transfers", Stage).Record(perf_counter_ns() - start)
+
+        return timedRun
+
+    def BeginScan(self):
+
+        self.Scans = self.Scans + 1
+        self.Sampling = (self.Scans % self.SampleEvery) == 0
+        if self.Sampling:
+            for target, wrapper in self._wrappers:
+                target.Run = wrapper
+            self._scanStart = self._last = perf_counter_ns()
+        return self.Sampling
+
+    def Mark(self):
+
+        if self.Sampling:
+            self._last = perf_counter_ns()
+
+    def Lap(self, Section):
+
+        if self.Sampling:
+            now = perf_counter_ns()
+            self._histogram(Section, "").Record(now - self._last)
+            self._last = now
+
+    def EndScan(self):
+
+        if self.Sampling:
+            self._histogram("Scan", "").Record(perf_counter_ns() - self._scanStart)
+            for target, wrapper in self._wrappers:
+                del target.Run
+            self.Sampling = False
+
+    # Histograms of the phases and sections, with the total of every asset over its phases
+    def Sections(self):
+
+        sections = {}
+        for (section, phase), histogram in list(self.Histograms.items()):
+            sections[(section, phase)] = histogram
+            if section in self.Assets:
+                total = sections.get((section, ""))
+                if total is None:
+                    total = sections[(section, "")] = Histogram()
+                total.Merge(histogram)
+        return sections
+
+    # Update the OPC UA diagnostics variables, creating the objects of the new sections and phases
+    def Publish(self, Node, Namespace):
+
+        for (section, phase), histogram in sorted(self.Sections().items()):
+            variables = self.Nodes.get((section, phase))
+            if variables is None:
+                objectNode = self.Objects.get(section)
+                if objectNode is None:
+                    objectNode = self.Objects[section] = Node.add_object(Namespace, section)
+                if phase != "":
+                    objectNode = objectNode.add_object(Namespace, phase)
+                variables = [objectNode.add_variable(Namespace, name, 0, varianttype) for name, varianttype in self.Variables]
+                self.Nodes[(section, phase)] = variables
+
+            values = [histogram.Count, histogram.Mean() / 1000, histogram.Percentile(50) / 1000,
+                      histogram.Percentile(99) / 1000, histogram.Max / 1000]
+            for variable, value in zip(variables, values):
+                variable.set_value(value)
+
+    # Histograms as a Prometheus summary in seconds
+    def Exposition(self):
+
+        lines = ["# HELP brewsim_profile_seconds Duration of the profiled sections of the simulation scan",
+                 "# TYPE brewsim_profile_seconds summary"]
+        for (section, phase), histogram in sorted(self.Sections().items()):
+            labels = 'section="{0}",phase="{1}"'.format(section, phase)
+            for quantile in self.Quantiles:
+                lines.append('brewsim_profile_seconds{{{0},quantile="{1:g}"}} {2:.9f}'.format(labels, quantile / 100, histogram.Percentile(quantile) / 1e9))
+            lines.append("brewsim_profile_seconds_sum{{{0}}} {1:.9f}".format(labels, histogram.Sum / 1e9))
+            lines.append("brewsim_profile_seconds_count{{{0}}} {1}".format(labels, histogram.Count))
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import json
+import math
+import struct
+from Sink import Sink
+from TagLogReader import (Magic, Version, HeaderFormat, Scale, MaxScaled, NoneKind, FalseKind, TrueKind, IntKind, ScaledKind, FloatKind,
+                          StringKind, zigzag, write_varint)
+
+class RecordSink(Sink):
+
+    """
+
+    Class Overview
+    ----------
+
+    A sink used to record the tag stream to a compact append only binary tag log, replayed with TagReplayer, see
+    TagLogReader.py for the layout. Every scan appends one record with only the tags that changed since the
+    previous scan. Numeric values are stored as the difference with the previous value of the tag (floats in
+    thousandths when they are a whole number of thousandths, otherwise as doubles) and strings as their number
+    in a dictionary of the log, so a value is usually 1 to 3 bytes. Values are stored losslessly with their
+    python type.
+
+    Attributes
+    ----------
+
+    Path (Tag log file path)
+    File (Tag log file, the log is created when the sink opens)
+    Bytes (Number of bytes of the tag log)
+    Changes (Number of changed values recorded)
+
+    Methods
+    -------
+
+    __init__(self, Path, QueueSize, Policy) - Class Constructor
+    Open(self) - creates the tag log and writes its header and tag directory
+    Write(self, Snapshot) - appends the changed tags of the Snapshot
+    Close(self) - closes the tag log
+
+    """
+
+    # Class Constructor
+    def __init__(self, Path, QueueSize=100, Policy="drop"):
+
+        super().__init__("Record", QueueSize, Policy)
+
+        self.Path = Path
+        self.File = None
+        self.Bytes = 0
+        self.Changes = 0
+        self._previous = None
+        self._microseconds = 0
+
+    def Open(self):
+
+        directory = json.dumps([[tag.Alias, tag.DataType] for tag in self.Tags]).encode("utf-8")
+        self.File = open(self.Path, "wb")
+        self.File.write(struct.pack(HeaderFormat, Magic, Version, len(directory)) + directory)
+        self.Bytes = struct.calcsize(HeaderFormat) + len(directory)
+        self._previous = None
+        self._microseconds = 0
+        self._ints = [0] * len(self.Tags)
+        self._scaled = [0] * len(self.Tags)
+        self._strings = {}
+
+    # Append the encoding of the value of a tag to the record
+    def _encode(self, Buffer, Index, Value):
+
+        if Value is None:
+            Buffer.append(NoneKind)
+        elif isinstance(Value, bool):
+            Buffer.append(TrueKind if Value else FalseKind)
+        elif isinstance(Value, int):
+            write_varint(Buffer, zigzag(Value - self._ints[Index]) << 3 | IntKind)
+            self._ints[Index] = Value
+        elif isinstance(Value, float):
+            scaled = round(Value * Scale) if math.isfinite(Value) and abs(Value) < MaxScaled / Scale else None
+            if (scaled is not None) and (scaled / Scale == Value):
+                write_varint(Buffer, zigzag(scaled - self._scaled[Index]) << 3 | ScaledKind)
+                self._scaled[Index] = scaled
+            else:
+                Buffer.append(FloatKind)
+                Buffer.extend(struct.pack("<d", Value))
+        else:
+            Value = str(Value)
+            number = self._strings.get(Value)
+            if number is not None:
+                write_varint(Buffer, number << 3 | StringKind)
+            else:
+                number = len(self._strings)
+                self._strings[Value] = number
+                encoded = Value.encode("utf-8")
+                write_varint(Buffer, number << 3 | StringKind)
+                write_varint(Buffer, len(encoded))
+                Buffer.extend(encoded)
+
+    def Write(self, Snapshot):
+
+        values = Snapshot.Values
+        previous = self._previous
+        if previous is None:
+            changed = range(len(values))
+        else:
+            changed = [index for index, value in enumerate(values) if (value != previous[index]) or (type(value) is not type(previous[index]))]
+        self._previous = list(values)
+
+        microseconds = int(round(Snapshot.Time * 1000000))
+        body = bytearray()
+        write_varint(body, zigzag(microseconds - self._microseconds))
+        self._microseconds = microseconds
+        write_varint(body, len(changed))
+        last = -1
+        for index in changed:
+            write_varint(body, index - last - 1)
+            last = index
+            self._encode(body, index, values[index])
+
+        record = bytearray()
+        write_varint(record, len(body))
+        record.extend(body)
+        self.File.write(record)
+        self.File.flush()
+        self.Bytes = self.Bytes + len(record)
+        self.Changes = self.Changes + len(changed)
+
+    def Close(self):
+
+        if self.File is not None:
+            self.File.close()
+        self.File = None
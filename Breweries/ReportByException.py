@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+class ReportByException:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to decide if a property value should be published to IoT SiteWise, modeled after the
+    "Report by Exception" behavior of industrial historians and gateways. A value is only reported when it has
+    changed by more than its deadband since it was last reported, or when the heartbeat time has elapsed since
+    the last report so that IoT SiteWise metrics and transforms keep receiving data for constant properties.
+    Check() only decides, a value counts as reported once Commit() records it after IoT SiteWise accepted it, so
+    a value that failed to publish is checked again on the next interval instead of waiting for the heartbeat.
+
+    Numeric values ("double", "integer") are compared against a deadband, all other values ("string", "boolean")
+    are reported on any change.
+
+    Attributes
+    ----------
+
+    Deadband (Default numeric deadband used when a property has no specific deadband configured)
+    Deadbands (Dictionary of property name or property alias to numeric deadband, i.e. {"Temperature_PV": 0.5})
+    Heartbeat (Seconds after which a value is reported again even if it has not changed, 0 disables the heartbeat)
+    LastReported (Dictionary of property alias to the last reported [value, time])
+    Reported (Count of values reported since the last statistics report)
+    Suppressed (Count of values suppressed since the last statistics report)
+    StatsInterval (Seconds between statistics reports)
+
+    Methods
+    -------
+
+    __init__(self, Deadband, Heartbeat, Deadbands) - Class Constructor
+    Check(self, PropertyAlias, PropertyName, DataType, Value, Now) - returns True if the value should be reported
+    Commit(self, PropertyAlias, Value, Now) - records a value accepted by IoT SiteWise as the last reported value
+    Report(self, Now) - prints the reduction in reported values (billable TVQs) once every StatsInterval
+    ParseDeadbands(Text) - parses a "PropertyName=Deadband,..." string into a Deadbands dictionary
+
+    """
+
+    # Class Constructor
+    def __init__(self, Deadband=0.0, Heartbeat=600, Deadbands=None):
+
+        self.Deadband = Deadband
+        self.Deadbands = Deadbands if Deadbands is not None else {}
+        self.Heartbeat = Heartbeat
+        self.LastReported = {}
+        self.Reported = 0
+        self.Suppressed = 0
+        self.StatsInterval = 3600
+        self.StatsStartTime = None
+
+    # Check if a property value should be reported
+    def Check(self, PropertyAlias, PropertyName, DataType, Value, Now):
+
+        last = self.LastReported.get(PropertyAlias)
+
+        if last is None:
+            report = True
+        elif (self.Heartbeat > 0) and ((Now - last[1]) >= self.Heartbeat):
+            report = True
+        elif DataType in ("double", "integer"):
+            deadband = self.Deadbands.get(PropertyAlias, self.Deadbands.get(PropertyName, self.Deadband))
+            report = (Value != last[0]) and (abs(Value - last[0]) > deadband)
+        else:
+            report = Value != last[0]
+
+        if not report:
+            self.Suppressed = self.Suppressed + 1
+
+        return report
+
+    # Record a value accepted by IoT SiteWise
+    def Commit(self, PropertyAlias, Value, Now):
+
+        self.LastReported[PropertyAlias] = [Value, Now]
+        self.Reported = self.Reported + 1
+
+    # Print the reduction in reported values once every StatsInterval
+    def Report(self, Now):
+
+        if self.StatsStartTime is None:
+            self.StatsStartTime = Now
+            return
+
+        elapsed = Now - self.StatsStartTime
+        if elapsed < self.StatsInterval:
+            return
+
+        total = self.Reported + self.Suppressed
+        if total > 0:
+            perHour = 3600.0 / elapsed
+            print("SiteWise report by exception: {0} of {1} TVQs published ({2:.0f} TVQs/hour), {3:.1f}% reduction".format(
+                self.Reported, total, self.Reported * perHour, self.Suppressed / total * 100.0))
+
+        self.Reported = 0
+        self.Suppressed = 0
+        self.StatsStartTime = Now
+
+    # Parse a "PropertyName=Deadband,..." argument into a Deadbands dictionary
+    @staticmethod
+    def ParseDeadbands(Text):
+
+        deadbands = {}
+        for item in Text.split(","):
+            if item.strip() == "":
+                continue
+            name, value = item.split("=")
+            deadbands[name.strip()] = float(value)
+
+        return deadbands
@@ -12,15 +12,14 @@
 # ---------------------------------------------------------------------------
 # Imports
 # ---------------------------------------------------------------------------
-import datetime
-import random
 from random import randint, choice
 from Motor import Motor
 from Timer import Timer
 from pidLoop import pidLoop
-from GlobalVariables import NewStateEnum, NewStatusEnum, UtilizationList, UtilizationStateList
+from StateMachine import StateMachine
+from GlobalVariables import NewStateEnum, NewStatusEnum, CommandEnum, ProductPriorities
 
-class Roaster:    
+class Roaster(StateMachine):    
 
     """
 
@@ -93,9 +92,14 @@ class Roaster:
 
     __init__(self, EquipmentName) - Class Constructor
     Run(self) - method to simulate equipment data
+    StateX(self) - run every scan in state X, registered in StateHandlers
+    PhaseX(self) - run every scan in phase X while Running, registered in PhaseHandlers
 
     """
 
+    # Attributes changed by the runtime configuration, see RuntimeConfig
+    Tunables = ("PerformanceTargetPercent", "MaltSPRange", "TemperatureSPRange")
+
     # Class Constructor
     def __init__(self, EquipmentName):
 
@@ -120,6 +124,9 @@ class Roaster:
         self.Scrap = 0.0
         self.newScrap = 0.0
         self.PerformanceTargetPercent = 98 
+        # Ranges the setpoints of every production run are drawn from
+        self.MaltSPRange = (750, 3000)
+        self.TemperatureSPRange = (430, 495)
         self.ProductionID = ""
         self.MaterialID = ""
         self.Cons_RawBarley_Item = ""
@@ -127,6 +134,7 @@ class Roaster:
         self.Prod_RoastedBarley_ToLot = ""
         self.Prod_RoastedBarley_Item = ""
         self.SelectedProduct = ""
+        self.ProductPriority = 0
         self.ProductNames = ['Red','Pale','Dark','Green']         
 
         # Create contained assets
@@ -144,176 +152,12 @@ class Roaster:
 
     # Run method to simulate equipment data 
     def Run(self):                  
-    
-        if self.StartCmd:
-            self.StartCmd = False
-            if self.NewState == NewStateEnum.Ready:
-                self.NewState = NewStateEnum.Running
-                self.NewStatus = NewStatusEnum.Filling
-
-        if self.RestartCmd:
-            self.RestartCmd = False
-            if self.NewState == NewStateEnum.Paused:
-                self.NewState = NewStateEnum.Running
-
-        if self.StopCmd:
-            self.StopCmd = False
-            if self.NewState == NewStateEnum.Running:
-                self.NewState = NewStateEnum.Paused
-
-        if self.EStopCmd:        
-            if self.NewState == NewStateEnum.Running:
-                self.NewState = NewStateEnum.Paused  
-        
-        if self.ResetCmd:    
-            self.ResetCmd = False    
-            if self.NewState == NewStateEnum.Done or self.NewState == NewStateEnum.Aborted:
-                self.NewState = NewStateEnum.Ready
-
-        if self.AbortCmd:
-            self.AbortCmd = False
-            if self.NewState == NewStateEnum.Paused:
-                self.NewState = NewStateEnum.Aborted
-
-        match self.NewState:
-
-            case NewStateEnum.Aborted:
-                # Put everything in safe state
-                self.MaltPV = 0.0
-                self.TemperaturePV = 80.0
-                self.HoldTime.Enabled = False
-                self.MaltAuger.CmdStart = False
-
-            case NewStateEnum.Done:
-                self.NewState = NewStateEnum.Ready
-                self.NewStatus = NewStatusEnum.Idle
-                self.HoldTime.Enabled = False
-                self.SettleTime.RST = False
-                self.SettleTime.PT = randint(10,25) 
-
-            case NewStateEnum.Paused:
-                self.NewState = NewStateEnum.Paused
-                self.MaltAuger.CmdStart = False
-                self.HoldTime.Enabled = False
-                self.CheckDownTime.Enabled = False 
-
-                if (self.MaltPV > 100) and (self.Scrap < self.MaltPV):
-                    self.newScrap = self.MaltPV * 0.00001
-                    self.Scrap = round(self.Scrap + self.newScrap, 2)                 
-
-                self.DownTime.Enabled = True
-                if (self.DownTime.DN):
-                    self.RestartCmd = True
-                    self.UtilizationState = "Runtime"
-                    self.Utilization = "Running (Normal)"
-                    self.DownTime.RST = True
-
-            case NewStateEnum.Ready:
-                self.NewStatus = NewStatusEnum.Idle
-
-                # Reset inital values for next production run
-                self.MaltPV = 0.0
-                self.TemperatureSP = 0
-                self.Scrap = 0.0
-                self.newScrap = 0.0
-                self.ProductionID = ""
-                self.MaterialID = ""
-                self.Cons_RawBarley_Item = ""
-                self.Cons_RawBarley_FromLot = ""
-                self.Prod_RoastedBarley_ToLot = ""
-                self.Prod_RoastedBarley_Item = ""                
-                self.HoldTime.RST = True
-
-                self.SettleTime.Enabled = True
-                if (self.SettleTime.DN):
-                    # Randomize measurements for next Production Run                
-                    self.MaltSP = randint(750,3000)
-                    self.TemperatureSP = randint(430,495)
-                    self.HoldTime.PT = randint(6,12) * 60   
-
-                    #uniquePre = choice(self.ProductNames)  
-                    self.SelectedProduct = choice(self.ProductNames)                
-                    self.MaterialID = "{0}{1}".format(self.SelectedProduct," Malt")                    
-                    self.Cons_RawBarley_Item = "{0}{1}".format(self.SelectedProduct," Barley")
-
-                    self.Cons_RawBarley_FromLot = "{0}{1}".format("BL-A", str(randint(1,10001)).zfill(5))
-
-                    now = datetime.datetime.now()
-                    self.ProductionID = "{0}{1}{2}".format("PR-A", self.EquipmentName[-3], now.strftime("%m%d%H%S"))
-                    self.Prod_RoastedBarley_ToLot = "{0}{1}{2}".format("RB-", self.EquipmentName[-3], now.strftime("%H%d%S%m"))
-                    self.Prod_RoastedBarley_Item = self.MaterialID
-
-                    self.SettleTime.Enabled = False
-                    self.SettleTime.RST = True
-
-                    self.NewState = NewStateEnum.Running
-                    self.NewStatus = NewStatusEnum.Filling
-
-            case NewStateEnum.Running:
-
-                match self.NewStatus:
-
-                    case NewStatusEnum.Idle:
-                        # Automatically set it to the first phase, Filling
-                        self.NewStatus = NewStatusEnum.Filling
-
-                    case NewStatusEnum.Filling:
-                        # Ramp up the Malt
-                        if (self.MaltPV <= self.MaltSP):
-                            self.MaltAuger.CmdStart = True
-                        else:
-                            self.MaltAuger.CmdStart = False
-                            # Set to next phase in process
-                            self.NewStatus = NewStatusEnum.RampingUp
-
-                        self.HoldTime.RST = True      
-
-                    case NewStatusEnum.RampingUp:
-                        # Ramp up the Temperature
-                        if (self.TemperaturePV >= self.TemperatureSP):
-                            self.NewStatus = NewStatusEnum.Holding
-                            self.HoldTime.RST = False
-
-                    case NewStatusEnum.Holding:
-                        self.HoldTime.Enabled = True
-                        if self.HoldTime.DN:
-                            self.HoldTime.Enabled = False
-                            self.NewStatus = NewStatusEnum.RampingDown
-                            
-                    case NewStatusEnum.RampingDown:
-                        # Simulate Temperature drop off to "Safe" level 
-                        self.TemperaturePV = round(self.TemperaturePV - ((self.TemperaturePV - (self.TemperatureSafe - 10.0)) / (2000.0 / 99.0)), 2)
-
-                        if (self.TemperatureSafe >= self.TemperaturePV):
-                            self.NewState = NewStateEnum.Done  
-
-                # Check for a downtime condition while running once every minute
-                self.CheckDownTime.RST = False
-                self.CheckDownTime.Enabled = True
-                if self.CheckDownTime.DN:
-                    dtNow = datetime.datetime.now()
-                    random.seed(int(self.EquipmentName[-3]) + int(dtNow.strftime("%f")))
-                    dtTest = random.random()
-                    self.CheckDownTime.RST = True
-
-                    if (dtTest > (self.PerformanceTargetPercent/100)):
-                        # Downtime has occured, put system into pause and randomize downtime timer
-                        self.StopCmd = True  
-                        dtMin = randint(97,121)
-                        dtMax = randint(173,600)
-                        self.DownTime.PT = randint(dtMin,dtMax) 
-                        self.DownTime.RST = False                         
-
-                        # Assign a random dowtime for the asset
-                        self.UtilizationState = choice(UtilizationStateList)
-
-                        match self.UtilizationState:
-                            case "Demand":
-                                self.Utilization = UtilizationList[randint(0,2)]
-                            case "Downtime":
-                                self.Utilization = UtilizationList[randint(3,8)]
-                            case "Maintenance":
-                                self.Utilization = UtilizationList[randint(9,10)]
+
+        # Commands are only evaluated when one is set
+        if self.Commands:
+            self.RunCommands()
+
+        self.RunState()
 
         # Reduce the weight of the barley the longer it gets roasted above 180 Deg. (if not in paused state)
         if (self.NewState != NewStateEnum.Paused):
@@ -338,4 +182,136 @@ class Roaster:
         self.HoldTime.Run() 
         self.SettleTime.Run() 
         self.CheckDownTime.Run()   
-        self.DownTime.Run() 
\ No newline at end of file
+        self.DownTime.Run()
+
+    # State handlers
+
+    def StateAborted(self):
+        # Put everything in safe state
+        self.MaltPV = 0.0
+        self.TemperaturePV = 80.0
+        self.HoldTime.Enabled = False
+        self.MaltAuger.CmdStart = False
+
+    def StateDone(self):
+        self.NewState = NewStateEnum.Ready
+        self.NewStatus = NewStatusEnum.Idle
+        self.HoldTime.Enabled = False
+        self.SettleTime.RST = False
+        self.SettleTime.PT = randint(10,25) 
+
+    def StatePaused(self):
+        self.NewState = NewStateEnum.Paused
+        self.MaltAuger.CmdStart = False
+        self.HoldTime.Enabled = False
+        self.CheckDownTime.Enabled = False 
+
+        if (self.MaltPV > 100) and (self.Scrap < self.MaltPV):
+            self.newScrap = self.MaltPV * 0.00001
+            self.Scrap = round(self.Scrap + self.newScrap, 2)                 
+
+        self.WaitForDowntime()
+
+    def StateReady(self):
+        self.NewStatus = NewStatusEnum.Idle
+
+        # Reset inital values for next production run
+        self.MaltPV = 0.0
+        self.TemperatureSP = 0
+        self.Scrap = 0.0
+        self.newScrap = 0.0
+        self.ProductionID = ""
+        self.MaterialID = ""
+        self.Cons_RawBarley_Item = ""
+        self.Cons_RawBarley_FromLot = ""
+        self.Prod_RoastedBarley_ToLot = ""
+        self.Prod_RoastedBarley_Item = ""                
+        self.HoldTime.RST = True
+
+        self.SettleTime.Enabled = True
+        if (self.SettleTime.DN):
+            # Randomize measurements for next Production Run                
+            self.MaltSP = randint(*self.MaltSPRange)
+            self.TemperatureSP = randint(*self.TemperatureSPRange)
+            self.HoldTime.PT = randint(6,12) * 60   
+
+            #uniquePre = choice(self.ProductNames)  
+            self.SelectedProduct = choice(self.ProductNames)                
+            self.ProductPriority = ProductPriorities.get(self.SelectedProduct, 0)
+            self.MaterialID = "{0}{1}".format(self.SelectedProduct," Malt")                    
+            self.Cons_RawBarley_Item = "{0}{1}".format(self.SelectedProduct," Barley")
+
+            self.Cons_RawBarley_FromLot = "{0}{1}".format("BL-A", str(randint(1,10001)).zfill(5))
+
+            self.ProductionID = self.LotNumbers.Next("PR-", self.EquipmentName[-3])
+            self.Prod_RoastedBarley_ToLot = self.LotNumbers.Next("RB-", self.EquipmentName[-3])
+            self.Prod_RoastedBarley_Item = self.MaterialID
+
+            self.SettleTime.Enabled = False
+            self.SettleTime.RST = True
+
+            self.NewState = NewStateEnum.Running
+            self.NewStatus = NewStatusEnum.Filling
+
+    def StateRunning(self):
+        self.RunPhase()
+
+        # Check for a downtime condition while running once every minute
+        self.CheckForDowntime()
+
+    # Phase handlers (while Running)
+
+    def PhaseIdle(self):
+        # Automatically set it to the first phase, Filling
+        self.NewStatus = NewStatusEnum.Filling
+
+    def PhaseFilling(self):
+        # Ramp up the Malt
+        if (self.MaltPV <= self.MaltSP):
+            self.MaltAuger.CmdStart = True
+        else:
+            self.MaltAuger.CmdStart = False
+            # Set to next phase in process
+            self.NewStatus = NewStatusEnum.RampingUp
+
+        self.HoldTime.RST = True      
+
+    def PhaseRampingUp(self):
+        # Ramp up the Temperature
+        if (self.TemperaturePV >= self.TemperatureSP):
+            self.NewStatus = NewStatusEnum.Holding
+            self.HoldTime.RST = False
+
+    def PhaseHolding(self):
+        self.HoldTime.Enabled = True
+        if self.HoldTime.DN:
+            self.HoldTime.Enabled = False
+            self.NewStatus = NewStatusEnum.RampingDown
+
+    def PhaseRampingDown(self):
+        # Simulate Temperature drop off to "Safe" level 
+        self.TemperaturePV = round(self.TemperaturePV - ((self.TemperaturePV - (self.TemperatureSafe - 10.0)) / (2000.0 / 99.0)), 2)
+
+        if (self.TemperatureSafe >= self.TemperaturePV):
+            self.NewState = NewStateEnum.Done  
+
+    # The Roaster starts filling as soon as it is started
+    Transitions = (
+        (CommandEnum.Start, (NewStateEnum.Ready,), None, NewStateEnum.Running, NewStatusEnum.Filling),
+    ) + StateMachine.Transitions[1:]
+
+    StateHandlers = {
+        NewStateEnum.Aborted: StateAborted,
+        NewStateEnum.Done: StateDone,
+        NewStateEnum.Paused: StatePaused,
+        NewStateEnum.Ready: StateReady,
+        NewStateEnum.Running: StateRunning
+    }
+
+    PhaseHandlers = {
+        NewStatusEnum.Idle: PhaseIdle,
+        NewStatusEnum.Filling: PhaseFilling,
+        NewStatusEnum.RampingUp: PhaseRampingUp,
+        NewStatusEnum.Holding: PhaseHolding,
+        NewStatusEnum.RampingDown: PhaseRampingDown
+    }
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import json
+import os
+
+class RuntimeConfig:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to change the tunables of the simulation while it runs, without restarting the simulator and
+    losing the state of the plant, from a JSON configuration document:
+
+    {
+        "version": "2026-10-19.1",
+        "interval": 5,
+        "assets": {
+            "Roaster": {"MaltSPRange": [750, 3000], "PerformanceTargetPercent": 98},
+            "BottleLine403": {"SpeedSPRange": [700, 900]}
+        }
+    }
+
+    "version" tags the document and is required, "interval" is the interval in seconds to publish to IoT
+    SiteWise, and "assets" sets the tunables (Tunables of the asset class) of every asset of a class, or of one
+    asset by name, applied after its class. Ranges ("...Range") are the [minimum, maximum] integers the asset
+    draws its next setpoints from, PerformanceTargetPercent the chance in percent an asset keeps running at every
+    downtime check. A tunable the document does not set has its value from when the simulator started, so the
+    document describes the whole configuration.
+
+    Poll() is called between two scans, and checks the modification time and size of the document every
+    CheckInterval seconds. A changed document is read and validated as a whole, and only applied when all of it
+    is valid, so the plant never runs on half a configuration: an invalid document is reported and the
+    configuration in use is kept. A document with other settings must have another version. Setpoints already
+    drawn are kept, new ranges apply from the next production run of every asset.
+
+    Attributes
+    ----------
+
+    Path (Path of the configuration document)
+    Assets (Dictionary of asset name to asset)
+    CheckInterval (Seconds between checks of the document)
+    Defaults (Dictionary of [asset name, tunable] to its value when the simulator started)
+    Interval (Interval in seconds to publish to IoT SiteWise)
+    Version (Version of the document applied, "" before the first one)
+    Applied (Number of documents applied)
+    Rejected (Number of invalid documents)
+    Error (Reason the last document was rejected, "" when it was applied)
+
+    Methods
+    -------
+
+    __init__(self, Path, Assets, Interval, CheckInterval) - Class Constructor
+    Poll(self, Now) - applies the document when it changed and is valid, returns True when it was applied
+    Load(self, Document) - returns the settings of a document, raises ValueError when it is invalid
+    Apply(self, Version, Interval, Settings) - applies the settings of a document
+
+    """
+
+    Keys = ("version", "interval", "assets")
+
+    # Class Constructor
+    def __init__(self, Path, Assets, Interval=5, CheckInterval=2):
+
+        self.Path = Path
+        self.Assets = Assets
+        self.CheckInterval = CheckInterval
+        self.Interval = Interval
+        self.DefaultInterval = Interval
+        self.Defaults = {(name, tunable): getattr(asset, tunable) for name, asset in Assets.items() for tunable in asset.Tunables}
+        self.Version = ""
+        self.Applied = 0
+        self.Rejected = 0
+        self.Error = ""
+        self._document = None
+        self._signature = None
+        self._lastCheck = None
+
+    # Validated value of a tunable
+    def _value(self, Owner, Tunable, Value):
+
+        if Tunable.endswith("Range"):
+            if (not isinstance(Value, list)) or (len(Value) != 2) or any(isinstance(limit, bool) or not isinstance(limit, int) for limit in Value):
+                raise ValueError("{0}.{1} must be [minimum, maximum] integers".format(Owner, Tunable))
+            if not (0 <= Value[0] <= Value[1]):
+                raise ValueError("{0}.{1} must have 0 <= minimum <= maximum".format(Owner, Tunable))
+            return tuple(Value)
+        if (isinstance(Value, bool)) or (not isinstance(Value, (int, float))) or not (0 < Value <= 100):
+            raise ValueError("{0}.{1} must be a number above 0 and up to 100".format(Owner, Tunable))
+        return Value
+
+    def Load(self, Document):
+
+        if not isinstance(Document, dict):
+            raise ValueError("the document must be a JSON object")
+        unknown = [key for key in Document if key not in self.Keys]
+        if unknown:
+            raise ValueError("unknown keys {0}, expected {1}".format(", ".join(unknown), ", ".join(self.Keys)))
+        version = Document.get("version")
+        if (not isinstance(version, str)) or (not version):
+            raise ValueError("version must be a non empty string")
+        interval = Document.get("interval", self.DefaultInterval)
+        if (isinstance(interval, bool)) or (not isinstance(interval, int)) or (interval < 1):
+            raise ValueError("interval must be an integer of at least 1 second")
+        assets = Document.get("assets", {})
+        if not isinstance(assets, dict):
+            raise ValueError("assets must be a JSON object of asset class or asset name to tunables")
+
+        classes = {type(asset).__name__ for asset in self.Assets.values()}
+        for owner, tunables in assets.items():
+            if (owner not in classes) and (owner not in self.Assets):
+                raise ValueError("unknown asset class or asset {0}".format(owner))
+            if not isinstance(tunables, dict):
+                raise ValueError("{0} must be a JSON object of tunable to value".format(owner))
+
+        # Every tunable of every asset, from the defaults, its class then the asset
+        settings = dict(self.Defaults)
+        for name, asset in self.Assets.items():
+            for owner in (type(asset).__name__, name):
+                for tunable, value in assets.get(owner, {}).items():
+                    if tunable not in asset.Tunables:
+                        raise ValueError("{0} has no tunable {1}, expected one of {2}".format(owner, tunable, ", ".join(asset.Tunables)))
+                    settings[(name, tunable)] = self._value(owner, tunable, value)
+        return version, interval, settings
+
+    def Apply(self, Version, Interval, Settings):
+
+        for (name, tunable), value in Settings.items():
+            setattr(self.Assets[name], tunable, value)
+        self.Interval = Interval
+        self.Version = Version
+        self.Applied = self.Applied + 1
+        self.Error = ""
+
+    def Poll(self, Now):
+
+        if (self._lastCheck is not None) and (Now - self._lastCheck < self.CheckInterval):
+            return False
+        self._lastCheck = Now
+
+        try:
+            stat = os.stat(self.Path)
+        except OSError:
+            # No document (yet), the configuration in use is kept
+            return False
+        signature = (stat.st_mtime_ns, stat.st_size)
+        if signature == self._signature:
+            return False
+        self._signature = signature
+
+        try:
+            with open(self.Path) as file:
+                document = json.load(file)
+            if document == self._document:
+                return False
+            version, interval, settings = self.Load(document)
+            if (version == self.Version) and (self._document is not None):
+                raise ValueError("version {0} is already applied with other settings, change the version".format(version))
+        except (OSError, ValueError) as e:
+            self.Rejected = self.Rejected + 1
+            self.Error = str(e)
+            print("Configuration {0} rejected, keeping version {1}: {2}".format(self.Path, self.Version or "(none)", self.Error))
+            return False
+
+        self.Apply(version, interval, settings)
+        self._document = document
+        print("Configuration version {0} applied from {1}".format(self.Version, self.Path))
+        return True
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import array
+import json
+import mmap
+import os
+import struct
+from Sink import Sink
+from SharedTagTableReader import Magic, Version, HeaderFormat, HeaderSize, SequenceOffset, ScanOffset, SlotSize, default_path
+
+class SharedMemorySink(Sink):
+
+    """
+
+    Class Overview
+    ----------
+
+    A sink used to expose every tag in a memory mapped, fixed layout shared tag table so processes on the same
+    host can read the latest plant state with SharedTagTableReader, see SharedTagTableReader.py for the layout.
+
+    Numeric and boolean values are stored in an array of doubles. Strings are interned in a table of fixed size
+    string slots, a string tag stores the slot number of its current string and slots are reference counted so
+    strings shared by several tags (i.e. "Running") are stored once and slots are reused when no tag refers to
+    them. Every scan is written under a sequence lock (seqlock): the sequence is odd while the table is written
+    and even when it is consistent.
+
+    Attributes
+    ----------
+
+    Path (Shared tag table file path)
+    Map (Memory map of the shared tag table)
+    Sequence (Seqlock sequence number)
+    Slots (Dictionary of string to [slot number, reference count])
+    SlotCount (Number of string slots, one per string tag)
+    FreeSlots (Unused slot numbers)
+    TagStrings (Current string of each string tag)
+    Array (Values of the last scan, copied to the table at once)
+
+    Methods
+    -------
+
+    __init__(self, Path, QueueSize, Policy) - Class Constructor
+    Open(self) - creates the shared tag table and writes the tag directory
+    Write(self, Snapshot) - writes the Snapshot under the seqlock
+    Close(self) - unmaps and removes the shared tag table
+
+    """
+
+    # Class Constructor
+    def __init__(self, Path=None, QueueSize=100, Policy="drop"):
+
+        super().__init__("SharedMemory", QueueSize, Policy)
+
+        self.Path = Path if Path is not None else default_path()
+        self.Map = None
+        self.Sequence = 0
+        self.Slots = {}
+        self.FreeSlots = []
+        self.TagStrings = {}
+
+    def Open(self):
+
+        count = len(self.Tags)
+        self.StringTags = [index for index, tag in enumerate(self.Tags) if tag.DataType == "string"]
+        self.NumericTags = [index for index, tag in enumerate(self.Tags) if tag.DataType != "string"]
+
+        # Every string tag refers to at most one string, so one slot per string tag is enough
+        slots = max(1, len(self.StringTags))
+        stringOffset = HeaderSize + count * 8
+        directory = json.dumps([[tag.Alias, tag.DataType] for tag in self.Tags]).encode("utf-8")
+        directoryOffset = stringOffset + slots * SlotSize
+        size = directoryOffset + len(directory)
+
+        # Write the new table to a temporary file and rename it, so readers never map a partial table
+        temporaryPath = "{0}.{1}".format(self.Path, os.getpid())
+        with open(temporaryPath, "wb") as file:
+            file.truncate(size)
+        with open(temporaryPath, "r+b") as file:
+            self.Map = mmap.mmap(file.fileno(), size)
+        struct.pack_into(HeaderFormat, self.Map, 0, Magic, Version, count, 0, 0, 0.0, directoryOffset, len(directory), slots, SlotSize)
+        self.Map[directoryOffset:size] = directory
+        os.replace(temporaryPath, self.Path)
+
+        self.StringOffset = stringOffset
+        self.Sequence = 0
+        self.Slots = {}
+        self.SlotCount = slots
+        self.FreeSlots = list(range(slots - 1, -1, -1))
+        self.TagStrings = {}
+        self.Array = array.array("d", [0.0] * count)
+
+    # Return the slot of a string, interning it in a free slot if it is not in the table yet
+    def _intern(self, Value):
+
+        slot = self.Slots.get(Value)
+        if slot is not None:
+            slot[1] = slot[1] + 1
+            return slot[0]
+
+        # A string tag releases its previous string before interning the new one, so the table never needs more
+        # slots than string tags
+        if not self.FreeSlots:
+            raise RuntimeError("All {0} string slots of {1} are in use, one slot per string tag".format(self.SlotCount, self.Path))
+        number = self.FreeSlots.pop()
+
+        # Long strings are cut on a character boundary, so the slot always holds valid UTF-8
+        encoded = Value.encode("utf-8")[:SlotSize - 2].decode("utf-8", "ignore").encode("utf-8")
+        offset = self.StringOffset + number * SlotSize
+        struct.pack_into("<H", self.Map, offset, len(encoded))
+        self.Map[offset + 2:offset + 2 + len(encoded)] = encoded
+        self.Slots[Value] = [number, 1]
+        return number
+
+    # Release the slot of a string that is no longer referred to by a tag
+    def _release(self, Value):
+
+        slot = self.Slots[Value]
+        slot[1] = slot[1] - 1
+        if slot[1] == 0:
+            del self.Slots[Value]
+            self.FreeSlots.append(slot[0])
+
+    def Write(self, Snapshot):
+
+        values = Snapshot.Values
+        table = self.Array
+
+        # Odd sequence - readers retry until the scan is written
+        self.Sequence = self.Sequence + 1
+        struct.pack_into("<Q", self.Map, SequenceOffset, self.Sequence)
+
+        struct.pack_into("<Qd", self.Map, ScanOffset, Snapshot.Scan, Snapshot.Time)
+
+        for index in self.NumericTags:
+            table[index] = float(values[index])
+
+        for index in self.StringTags:
+            value = str(values[index])
+            previous = self.TagStrings.get(index)
+            if value == previous:
+                continue
+            if previous is not None:
+                self._release(previous)
+            self.TagStrings[index] = value
+            table[index] = float(self._intern(value))
+
+        # Copy all values to the table at once
+        self.Map[HeaderSize:HeaderSize + len(table) * 8] = table.tobytes()
+
+        # Even sequence - the scan is consistent
+        self.Sequence = self.Sequence + 1
+        struct.pack_into("<Q", self.Map, SequenceOffset, self.Sequence)
+
+    def Close(self):
+
+        if self.Map is not None:
+            self.Map.close()
+            self.Map = None
+            try:
+                os.remove(self.Path)
+            except OSError:
+                pass
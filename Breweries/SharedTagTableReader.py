@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import json
+import mmap
+import os
+import struct
+import tempfile
+import time
+
+# ---------------------------------------------------------------------------
+# Shared tag table layout (little endian), written by SharedMemorySink
+#
+#   Header (64 bytes)
+#     0  magic           8s   b"BREWTAGS"
+#     8  version         I
+#     12 tag count       I
+#     16 sequence        Q    seqlock, odd while the writer updates the table
+#     24 scan            Q
+#     32 time            d    scan time in epoch seconds
+#     40 directory       Q    offset of the JSON tag directory
+#     48 directory size  Q
+#     56 string slots    I    number of string slots
+#     60 slot size       I    bytes per string slot
+#   Values        tag count * d   numeric and boolean values, string slot number for string tags
+#   String slots  string slots * slot size   H length + UTF-8 bytes
+#   Directory     JSON [[alias, datatype], ...]
+# ---------------------------------------------------------------------------
+Magic = b"BREWTAGS"
+Version = 1
+HeaderFormat = "<8sIIQQdQQII"
+HeaderSize = 64
+SequenceOffset = 16
+ScanOffset = 24
+SlotSize = 64
+
+def default_path():
+    """
+    default_path - Returns the default shared tag table path, in /dev/shm (memory backed) when available
+    """
+    directory = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+    return os.path.join(directory, "brewery_tags")
+
+class SharedTagTableReader:
+
+    """
+
+    Class Overview
+    ----------
+
+    A tiny library used by processes on the same host as the simulator (i.e. analytics sidecars) to read the
+    latest plant state from the memory mapped shared tag table written by SharedMemorySink, without an OPC UA
+    session, serialization or sockets.
+
+    The writer updates the table under a sequence lock (seqlock). Read() copies the table and retries if the
+    writer updated it during the copy, so every result is a consistent scan. Values gives zero copy access to
+    the numeric values for readers that do not need a consistent scan.
+
+    Example:
+
+        reader = SharedTagTableReader()
+        scan, scanTime, values = reader.Read()
+        print(values["/Breweries/IrvinePlant/Roasting/Roaster100/Temperature_PV"])
+
+    Attributes
+    ----------
+
+    Path (Shared tag table file path)
+    Aliases (Property aliases in table order)
+    DataTypes (IoT SiteWise datatypes in table order)
+    Index (Dictionary of property alias to table index)
+    Values (Zero copy memoryview of the numeric values, string tags hold their string slot number)
+    Retries (Number of reads retried because the writer updated the table)
+
+    Methods
+    -------
+
+    __init__(self, Path) - Class Constructor, opens and maps the shared tag table
+    Sequence(self) - returns the current sequence number, it changes with every scan
+    Read(self) - returns a consistent (scan, time, {alias: value}) of the latest scan
+    Get(self, Alias) - returns the latest value of one tag
+    Close(self) - unmaps the shared tag table
+
+    """
+
+    # Class Constructor
+    def __init__(self, Path=None):
+
+        self.Path = Path if Path is not None else default_path()
+        with open(self.Path, "rb") as file:
+            self.Map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, version, count, sequence, scan, scanTime, directory, directorySize, slots, slotSize = struct.unpack_from(HeaderFormat, self.Map, 0)
+        if (magic != Magic) or (version != Version):
+            raise ValueError("{0} is not a version {1} shared tag table".format(self.Path, Version))
+
+        self.Count = count
+        self.SlotSize = slotSize
+        self.StringOffset = HeaderSize + count * 8
+        directoryEntries = json.loads(bytes(self.Map[directory:directory + directorySize]).decode("utf-8"))
+        self.Aliases = [entry[0] for entry in directoryEntries]
+        self.DataTypes = [entry[1] for entry in directoryEntries]
+        self.Index = {alias: index for index, alias in enumerate(self.Aliases)}
+        self.Strings = [datatype == "string" for datatype in self.DataTypes]
+        self.Booleans = [datatype == "boolean" for datatype in self.DataTypes]
+        self.ValuesFormat = "<{0}d".format(count)
+        self.Values = memoryview(self.Map)[HeaderSize:HeaderSize + count * 8].cast("d")
+        self.Retries = 0
+
+    # Return the current sequence number
+    def Sequence(self):
+
+        return struct.unpack_from("<Q", self.Map, SequenceOffset)[0]
+
+    # Decode the string of a string slot
+    def _string(self, Slot):
+
+        offset = self.StringOffset + int(Slot) * self.SlotSize
+        length = struct.unpack_from("<H", self.Map, offset)[0]
+        # A slot being rewritten while it is read decodes with replacement characters, the seqlock then retries
+        return self.Map[offset + 2:offset + 2 + length].decode("utf-8", errors="replace")
+
+    # Return a consistent (scan, time, {alias: value}) of the latest scan
+    def Read(self):
+
+        while True:
+            sequence = self.Sequence()
+            if sequence & 1:
+                # The writer is updating the table
+                self.Retries = self.Retries + 1
+                time.sleep(0)
+                continue
+
+            scan, scanTime = struct.unpack_from("<Qd", self.Map, ScanOffset)
+            raw = struct.unpack_from(self.ValuesFormat, self.Map, HeaderSize)
+            values = {}
+            for alias, value, isString, isBoolean in zip(self.Aliases, raw, self.Strings, self.Booleans):
+                if isString:
+                    values[alias] = self._string(value)
+                elif isBoolean:
+                    values[alias] = value != 0.0
+                else:
+                    values[alias] = value
+
+            if self.Sequence() == sequence:
+                return scan, scanTime, values
+
+            self.Retries = self.Retries + 1
+
+    # Return the latest value of one tag
+    def Get(self, Alias):
+
+        index = self.Index[Alias]
+        while True:
+            sequence = self.Sequence()
+            if not (sequence & 1):
+                value = self.Values[index]
+                if self.Strings[index]:
+                    value = self._string(value)
+                elif self.Booleans[index]:
+                    value = value != 0.0
+                if self.Sequence() == sequence:
+                    return value
+            self.Retries = self.Retries + 1
+
+    def Close(self):
+
+        self.Values.release()
+        self.Map.close()
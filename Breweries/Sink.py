@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import queue
+import threading
+import time
+
+class Tag:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to describe one asset property published by the simulator, i.e. "Roaster100.TemperaturePV".
+    The tag list is created once at startup and shared by all sinks, every Snapshot holds the tag values in the
+    same order as the tag list.
+
+    Attributes
+    ----------
+
+    Area (Area name, i.e. "Roasting")
+    Asset (Asset name, i.e. "Roaster100")
+    Property (Property name, i.e. "Temperature_PV")
+    DataType (IoT SiteWise datatype - "double", "integer", "string" or "boolean")
+    Alias (Property alias - /{enterprise}/{plant}/{area}/{asset}/{property})
+
+    """
+
+    # Class Constructor
+    def __init__(self, Area, Asset, Property, DataType, Alias):
+
+        self.Area = Area
+        self.Asset = Asset
+        self.Property = Property
+        self.DataType = DataType
+        self.Alias = Alias
+
+class Snapshot:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to hold the tag values of one scan of the simulation. A Snapshot is created once per scan and
+    handed to every sink, so it must not be modified after it has been created.
+
+    Attributes
+    ----------
+
+    Scan (Scan number)
+    Time (Time of the scan in epoch seconds)
+    Values (Tag values in the same order as the tag list)
+
+    """
+
+    # Class Constructor
+    def __init__(self, Scan, Time, Values):
+
+        self.Scan = Scan
+        self.Time = Time
+        self.Values = Values
+
+class Sink:
+
+    """
+
+    Class Overview
+    ----------
+
+    A base class used to represent an output of the simulation (IoT SiteWise, file, MQTT, UDP, ...). Every sink
+    runs on its own worker thread and consumes the per scan Snapshots through a bounded queue, so a slow output
+    never slows down the 100 millisecond scan of the simulation.
+
+    When the queue is full the "drop" policy discards the new Snapshot and counts it as dropped, the "block"
+    policy makes the scan wait until the sink has caught up (only use it for outputs that must not lose data).
+
+    Sub classes implement Open(), Write(Snapshot) and Close().
+
+    Attributes
+    ----------
+
+    Name (Name of the sink used for statistics)
+    Policy ("drop" or "block")
+    Queue (Bounded queue of Snapshots waiting to be written)
+    Tags (Tag list, see Tag)
+    Received (Number of Snapshots put to the sink)
+    Processed (Number of Snapshots written by the sink)
+    Dropped (Number of Snapshots dropped because the queue was full)
+    Errors (Number of Snapshots that failed to be written)
+    Lag (Seconds between the scan and the write of the last written Snapshot)
+
+    Methods
+    -------
+
+    __init__(self, Name, QueueSize, Policy) - Class Constructor
+    Start(self, Tags) - opens the sink and starts the worker thread
+    Stop(self) - writes the queued Snapshots, stops the worker thread and closes the sink
+    Put(self, Snapshot) - queues a Snapshot, called from the scan
+    Run(self) - worker thread loop
+    Stats(self, Now) - returns the sink statistics including throughput (Snapshots per second)
+    GroupByAsset(self) - returns the tag indexes grouped per asset
+    Open(self) - opens the output (override)
+    Write(self, Snapshot) - writes a Snapshot to the output (override)
+    Close(self) - closes the output (override)
+
+    """
+
+    # Class Constructor
+    def __init__(self, Name, QueueSize=100, Policy="drop"):
+
+        if Policy not in ("drop", "block"):
+            raise ValueError("Invalid sink policy '{0}', expected 'drop' or 'block'".format(Policy))
+
+        self.Name = Name
+        self.Policy = Policy
+        self.Queue = queue.Queue(maxsize=QueueSize)
+        self.Tags = []
+        self.Received = 0
+        self.Processed = 0
+        self.Dropped = 0
+        self.Errors = 0
+        self.Lag = 0.0
+        self.Thread = None
+        self.StatsTime = time.time()
+        self.StatsProcessed = 0
+
+    # Open the sink and start the worker thread
+    def Start(self, Tags):
+
+        self.Tags = Tags
+        self.Open()
+        self.Thread = threading.Thread(target=self.Run, name="{0}Sink".format(self.Name), args=())
+        self.Thread.daemon = True
+        self.Thread.start()
+
+    # Write the queued Snapshots and stop the worker thread
+    def Stop(self):
+
+        if self.Thread is not None:
+            self.Queue.put(None)
+            self.Thread.join()
+            self.Thread = None
+
+    # Queue a Snapshot, called from the scan
+    def Put(self, Snapshot):
+
+        self.Received = self.Received + 1
+
+        if self.Policy == "block":
+            self.Queue.put(Snapshot)
+        else:
+            try:
+                self.Queue.put_nowait(Snapshot)
+            except queue.Full:
+                self.Dropped = self.Dropped + 1
+
+    # Worker thread loop
+    def Run(self):
+
+        while True:
+            snapshot = self.Queue.get()
+            if snapshot is None:
+                break
+
+            try:
+                self.Write(snapshot)
+            except Exception as e:
+                self.Errors = self.Errors + 1
+                print("{0} sink: {1}".format(self.Name, str(e)))
+
+            self.Processed = self.Processed + 1
+            self.Lag = time.time() - snapshot.Time
+
+        self.Close()
+
+    # Return the sink statistics, throughput is calculated since the last call
+    def Stats(self, Now):
+
+        elapsed = Now - self.StatsTime
+        processed = self.Processed
+        throughput = (processed - self.StatsProcessed) / elapsed if elapsed > 0 else 0.0
+        self.StatsTime = Now
+        self.StatsProcessed = processed
+
+        return {"Name": self.Name,
+                "Received": self.Received,
+                "Processed": processed,
+                "Dropped": self.Dropped,
+                "Errors": self.Errors,
+                "QueueDepth": self.Queue.qsize(),
+                "Lag": round(self.Lag, 3),
+                "Throughput": round(throughput, 2)}
+
+    # Return [[area name, asset name, alias prefix, [tag indexes]], ...] with one entry per asset
+    def GroupByAsset(self):
+
+        groups = {}
+        for index, tag in enumerate(self.Tags):
+            prefix = tag.Alias[:-(len(tag.Property) + 1)]
+            if prefix not in groups:
+                groups[prefix] = [tag.Area, tag.Asset, prefix, []]
+            groups[prefix][3].append(index)
+
+        return list(groups.values())
+
+    def Open(self):
+        pass
+
+    def Write(self, Snapshot):
+        pass
+
+    def Close(self):
+        pass
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import time
+from Sink import Sink
+from StreamingAggregate import StreamingAggregate
+
+class SiteWiseSink(Sink):
+
+    """
+
+    Class Overview
+    ----------
+
+    A sink used to publish the tag values to IoT SiteWise with the BatchPutAssetPropertyValue API at the
+    specified interval. Every tag is published to its property alias (/{enterprise}/{plant}/{area}/{asset}/{property}).
+
+    Optionally values are only published when they changed (see ReportByException), and aggregated properties are
+    published as interval aggregates (see StreamingAggregate) calculated from every scan instead of raw samples.
+    The aggregates of an interval are only computed once, so the aggregates a failed call did not send are kept
+    with the timestamp of their interval and sent first by the next publish, up to MaxPendingAggregates entries
+    (the oldest are dropped and counted beyond).
+
+    Attributes
+    ----------
+
+    Client (boto3 IoT SiteWise client)
+    Interval (Interval in seconds to publish to IoT SiteWise)
+    Rbe (ReportByException filter, None to publish every value on every interval)
+    AggregateProperties (Property names published as interval aggregates)
+    Aggregates (List of [tag index, StreamingAggregate] for the aggregated tags)
+    Published (Tag indexes published as raw values)
+    LastPublishTime (Time of the last publish in epoch seconds)
+    ApiCalls (Number of BatchPutAssetPropertyValue calls)
+    ApiErrors (Number of failed BatchPutAssetPropertyValue calls)
+    RejectedEntries (Number of entries IoT SiteWise returned in the errorEntries of a call)
+    PendingAggregates (List of the aggregate entries a failed call did not send, sent by the next publish)
+    DroppedAggregates (Number of aggregate entries dropped beyond MaxPendingAggregates)
+
+    Methods
+    -------
+
+    __init__(self, Client, Interval, Rbe, AggregateProperties, QueueSize, Policy) - Class Constructor
+    Open(self) - creates the interval aggregates
+    Write(self, Snapshot) - updates the aggregates and publishes when the interval has elapsed
+    Publish(self, Snapshot) - publishes the values and aggregates to IoT SiteWise
+
+    """
+
+    # Maximum number of entries in one BatchPutAssetPropertyValue request
+    MaxEntries = 10
+
+    # Seconds to wait after a failed publish
+    ErrorBackoff = 5
+
+    # Maximum number of aggregate entries kept for the next publish after failed calls
+    MaxPendingAggregates = 10000
+
+    # Class Constructor
+    def __init__(self, Client, Interval, Rbe=None, AggregateProperties=None, QueueSize=600, Policy="drop"):
+
+        super().__init__("SiteWise", QueueSize, Policy)
+
+        self.Client = Client
+        self.Interval = Interval
+        self.Rbe = Rbe
+        self.AggregateProperties = AggregateProperties if AggregateProperties is not None else []
+        self.Aggregates = []
+        self.Published = []
+        self.LastPublishTime = 0.0
+        self.ApiCalls = 0
+        self.ApiErrors = 0
+        self.RejectedEntries = 0
+        self.PendingAggregates = []
+        self.DroppedAggregates = 0
+
+    # Create the interval aggregates of the aggregated tags
+    def Open(self):
+
+        self.Aggregates = []
+        self.Published = []
+        for index, tag in enumerate(self.Tags):
+            if (tag.Property in self.AggregateProperties) and (tag.DataType in ("double", "integer")):
+                self.Aggregates.append([index, StreamingAggregate(tag.Alias)])
+            else:
+                self.Published.append(index)
+
+        print("Publishing values to SiteWise")
+        self.LastPublishTime = time.time()
+
+    # Update the aggregates with every scan and publish once the interval has elapsed
+    def Write(self, Snapshot):
+
+        for index, aggregate in self.Aggregates:
+            aggregate.Add(Snapshot.Values[index], Snapshot.Time)
+
+        if (Snapshot.Time - self.LastPublishTime) >= self.Interval:
+            self.LastPublishTime = Snapshot.Time
+            self.Publish(Snapshot)
+
+    # Publish the values and aggregates of a Snapshot to IoT SiteWise
+    def Publish(self, Snapshot):
+
+        timeInSeconds = int(Snapshot.Time)
+
+        if self.Rbe is not None:
+            self.Rbe.Report(timeInSeconds)
+
+        entries = []
+        for index in self.Published:
+            tag = self.Tags[index]
+            value = Snapshot.Values[index]
+
+            # Only publish values that changed outside of their deadband or are due for a heartbeat
+            if (self.Rbe is not None) and (not self.Rbe.Check(tag.Alias, tag.Property, tag.DataType, value, timeInSeconds)):
+                continue
+
+            entries.append([tag.Alias, tag.DataType, value, True, timeInSeconds])
+
+        # Aggregates a failed call did not send go first, with the timestamp of their interval
+        entries.extend(self.PendingAggregates)
+        self.PendingAggregates = []
+
+        # Aggregated properties are published as derived properties, i.e. ".../Temperature_PV_Avg"
+        for index, aggregate in self.Aggregates:
+            result = aggregate.Take(Snapshot.Time)
+            if result is None:
+                continue
+            for suffix, datatype in StreamingAggregate.Aggregates:
+                entries.append(["{0}_{1}".format(self.Tags[index].Alias, suffix), datatype, result[suffix], False, timeInSeconds])
+
+        failed = False
+        for start in range(0, len(entries), self.MaxEntries):
+            batch = [
+                {
+                    'entryId': str(number),
+                    'propertyAlias': alias,
+                    'propertyValues': [
+                        {
+                            'value': {
+                                datatype+'Value': value
+                            },
+                            'timestamp': {'timeInSeconds': seconds, 'offsetInNanos': 0},
+                            'quality': 'GOOD'
+                        },
+                    ]
+                } for number, (alias, datatype, value, checked, seconds) in enumerate(entries[start:start + self.MaxEntries])
+            ]
+
+            try:
+                self.ApiCalls = self.ApiCalls + 1
+                response = self.Client.batch_put_asset_property_value(
+                    entries=batch
+                )
+            except Exception as e:
+                # The remaining batches of this publish are not sent, report by exception sends their values again
+                # and their aggregates are kept for the next publish
+                self.ApiErrors = self.ApiErrors + 1
+                print(str(e))
+                self._keepAggregates(entries[start:])
+                failed = True
+                break
+
+            # Values rejected by IoT SiteWise are not recorded as reported, report by exception sends them again
+            rejected = {error['entryId'] for error in response.get('errorEntries', [])}
+            self.RejectedEntries = self.RejectedEntries + len(rejected)
+            if self.Rbe is not None:
+                for number, (alias, datatype, value, checked, seconds) in enumerate(entries[start:start + self.MaxEntries]):
+                    if (checked) and (str(number) not in rejected):
+                        self.Rbe.Commit(alias, value, timeInSeconds)
+
+        # Back off once per failed publish, not once per batch
+        if failed:
+            time.sleep(self.ErrorBackoff)
+
+    # Keep the aggregates of the entries not sent for the next publish, dropping the oldest beyond MaxPendingAggregates
+    def _keepAggregates(self, Entries):
+
+        self.PendingAggregates = [entry for entry in Entries if not entry[3]]
+        dropped = len(self.PendingAggregates) - self.MaxPendingAggregates
+        if dropped > 0:
+            self.DroppedAggregates = self.DroppedAggregates + dropped
+            self.PendingAggregates = self.PendingAggregates[dropped:]
@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import datetime
+import random
+from random import randint, choice
+from GlobalVariables import NewStateEnum, CommandEnum, UtilizationList, UtilizationStateList
+from LotNumberGenerator import LotNumberGenerator
+
+class Command:
+
+    """
+
+    Class Overview
+    ----------
+
+    A descriptor used to expose one bit of the StateMachine Commands bit field as a boolean attribute, so the
+    commands keep their names (i.e. Roaster100.StartCmd = True) while Run() checks all of them with a single test.
+
+    Attributes
+    ----------
+
+    Bit (Command bit, see CommandEnum)
+
+    """
+
+    # Class Constructor
+    def __init__(self, Bit):
+
+        self.Bit = Bit
+
+    def __get__(self, instance, owner):
+
+        if instance is None:
+            return self
+        return (instance.Commands & self.Bit) != 0
+
+    def __set__(self, instance, value):
+
+        if value:
+            instance.Commands = instance.Commands | self.Bit
+        else:
+            instance.Commands = instance.Commands & ~self.Bit
+
+class SharedLotNumbers:
+
+    """
+
+    Class Overview
+    ----------
+
+    A descriptor used to give the assets outside of a Plant (i.e. an asset of a benchmark) one shared
+    LotNumberGenerator, created when it is first used instead of when the module is imported. A Plant sets the
+    LotNumbers of its assets to its own generator, which hides the shared one, so a simulator never creates it.
+
+    Attributes
+    ----------
+
+    Generator (Shared LotNumberGenerator, None until it is first used)
+
+    """
+
+    # Class Constructor
+    def __init__(self):
+
+        self.Generator = None
+
+    def __get__(self, instance, owner):
+
+        if instance is None:
+            return self
+        if self.Generator is None:
+            self.Generator = LotNumberGenerator()
+        return self.Generator
+
+class StateMachine:
+
+    """
+
+    Class Overview
+    ----------
+
+    A base class used by the brewery equipment assets to share the command handling and downtime simulation.
+
+    Commands (StartCmd, RestartCmd, StopCmd, EStopCmd, ResetCmd, AbortCmd) are bits of a single integer, so Run()
+    only evaluates the transition table when a command is set. The transition table lists, in evaluation order,
+    the command bit, the states and status the command is accepted in (None for any), and the new state and status
+    (None to keep). Every command except EStopCmd is cleared once evaluated, EStopCmd holds the asset paused
+    until it is cleared. An asset class overrides Transitions to change the table, and registers CommandActions
+    to run when a command is accepted (i.e. take the lot numbers from the upstream asset on start).
+
+    Each asset class registers its state handlers (StateHandlers, one per NewState) and phase handlers
+    (PhaseHandlers, one per NewStatus while Running), RunState() calls the handler of the current state.
+
+    Attributes
+    ----------
+
+    Commands (Command bit field, see CommandEnum)
+    StartCmd, RestartCmd, StopCmd, EStopCmd, ResetCmd, AbortCmd (Command bits as booleans)
+    Transitions (Transition table - [command bit, from states, from status, to state, to status])
+    CommandActions (Dictionary of command bit to the method run when the command is accepted)
+    StateHandlers (Dictionary of NewState to the method run every scan in that state)
+    PhaseHandlers (Dictionary of NewStatus to the method run every scan in that phase while Running)
+    DowntimeExcluded (Phases in which the asset is never put into downtime, i.e. while transferring material)
+    Tunables (Attributes changed by the runtime configuration, see RuntimeConfig)
+    LotNumbers (LotNumberGenerator of the lots and ProductionIDs, the generator of the Plant of the asset)
+
+    Methods
+    -------
+
+    RunCommands(self) - evaluates the transition table for the commands that are set
+    RunState(self) - runs the handler of the current state
+    RunPhase(self) - runs the handler of the current phase, registered as the Running state handler
+    CheckForDowntime(self) - once every minute while running, randomly puts the asset into downtime
+    WaitForDowntime(self) - while paused, restarts the asset once the downtime has elapsed
+
+    """
+
+    StartCmd = Command(CommandEnum.Start)
+    RestartCmd = Command(CommandEnum.Restart)
+    StopCmd = Command(CommandEnum.Stop)
+    EStopCmd = Command(CommandEnum.EStop)
+    ResetCmd = Command(CommandEnum.Reset)
+    AbortCmd = Command(CommandEnum.Abort)
+
+    # Command bit, from states, from status, to state, to status
+    Transitions = (
+        (CommandEnum.Start, (NewStateEnum.Ready,), None, NewStateEnum.Running, None),
+        (CommandEnum.Restart, (NewStateEnum.Paused,), None, NewStateEnum.Running, None),
+        (CommandEnum.Stop, (NewStateEnum.Running,), None, NewStateEnum.Paused, None),
+        (CommandEnum.EStop, (NewStateEnum.Running,), None, NewStateEnum.Paused, None),
+        (CommandEnum.Reset, (NewStateEnum.Done, NewStateEnum.Aborted), None, NewStateEnum.Ready, None),
+        (CommandEnum.Abort, (NewStateEnum.Paused,), None, NewStateEnum.Aborted, None)
+    )
+
+    # Commands that stay set after they are evaluated
+    LatchedCommands = CommandEnum.EStop
+
+    CommandActions = {}
+    StateHandlers = {}
+    PhaseHandlers = {}
+    DowntimeExcluded = ()
+    Tunables = ()
+
+    Commands = 0
+
+    # Assets outside of a Plant share this generator
+    LotNumbers = SharedLotNumbers()
+
+    # Evaluate the transition table for the commands that are set
+    def RunCommands(self):
+
+        commands = self.Commands
+        self.Commands = commands & self.LatchedCommands
+
+        for bit, states, status, newState, newStatus in self.Transitions:
+            if not (commands & bit):
+                continue
+            if (states is not None) and (self.NewState not in states):
+                continue
+            if (status is not None) and (self.NewStatus != status):
+                continue
+
+            action = self.CommandActions.get(bit)
+            if action is not None:
+                action(self)
+            if newState is not None:
+                self.NewState = newState
+            if newStatus is not None:
+                self.NewStatus = newStatus
+
+    # Run the handler of the current state
+    def RunState(self):
+
+        handler = self.StateHandlers.get(self.NewState)
+        if handler is not None:
+            handler(self)
+
+    # Run the handler of the current phase while Running
+    def RunPhase(self):
+
+        handler = self.PhaseHandlers.get(self.NewStatus)
+        if handler is not None:
+            handler(self)
+
+    # Check for a downtime condition while running once every minute
+    def CheckForDowntime(self):
+
+        self.CheckDownTime.RST = False
+        self.CheckDownTime.Enabled = True
+        if (self.CheckDownTime.DN) and (self.NewStatus not in self.DowntimeExcluded):
+            dtNow = datetime.datetime.now()
+            random.seed(int(self.EquipmentName[-3]) + int(dtNow.strftime("%f")))
+            dtTest = random.random()
+            self.CheckDownTime.RST = True
+
+            if (dtTest > (self.PerformanceTargetPercent/100)):
+                # Downtime has occured, put system into pause and randomize downtime timer
+                self.StopCmd = True
+                dtMin = randint(97,121)
+                dtMax = randint(173,600)
+                self.DownTime.PT = randint(dtMin,dtMax)
+                self.DownTime.RST = False
+
+                # Assign a random dowtime for the asset
+                self.UtilizationState = choice(UtilizationStateList)
+
+                match self.UtilizationState:
+                    case "Demand":
+                        self.Utilization = UtilizationList[randint(0,2)]
+                    case "Downtime":
+                        self.Utilization = UtilizationList[randint(3,8)]
+                    case "Maintenance":
+                        self.Utilization = UtilizationList[randint(9,10)]
+
+    # Restart once the downtime has elapsed while paused
+    def WaitForDowntime(self):
+
+        self.DownTime.Enabled = True
+        if (self.DownTime.DN):
+            self.RestartCmd = True
+            self.UtilizationState = "Runtime"
+            self.Utilization = "Running (Normal)"
+            self.DownTime.RST = True
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+class StreamingAggregate:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to compute per interval aggregates of a numeric value at the edge, so that only the aggregates
+    are published to IoT SiteWise instead of every raw 100 millisecond sample. Every aggregate is updated
+    incrementally in constant time and memory when a sample is added.
+
+    The time weighted average treats each sample as holding its value until the next sample arrives (step
+    interpolation), which matches how IoT SiteWise computes time weighted averages for metrics.
+
+    Attributes
+    ----------
+
+    Name (Name provided by calling Class)
+    Min (Minimum sample value in the interval)
+    Max (Maximum sample value in the interval)
+    Sum (Sum of the sample values in the interval)
+    Count (Number of samples in the interval)
+    Last (Last sample value)
+    LastTime (Time of the last sample in epoch seconds)
+    StartTime (Start of the interval in epoch seconds)
+    Area (Integral of the value over time since StartTime, used for the time weighted average)
+
+    Methods
+    -------
+
+    __init__(self, Name) - Class Constructor
+    Add(self, Value, Now) - adds a sample to the interval
+    Take(self, Now) - returns the aggregates of the interval and starts a new interval
+
+    """
+
+    # Names of the aggregates returned by Take(), used as property name suffixes
+    Aggregates = (("Min", "double"), ("Max", "double"), ("Avg", "double"), ("Last", "double"), ("Count", "integer"), ("TWA", "double"))
+
+    # Class Constructor
+    def __init__(self, Name):
+
+        self.Name = Name
+        self.Min = 0.0
+        self.Max = 0.0
+        self.Sum = 0.0
+        self.Count = 0
+        self.Last = None
+        self.LastTime = 0.0
+        self.StartTime = None
+        self.Area = 0.0
+
+    # Add a sample to the interval
+    def Add(self, Value, Now):
+
+        if self.StartTime is None:
+            self.StartTime = Now
+        elif self.Last is not None:
+            # The previous value held from the last sample until now
+            self.Area = self.Area + self.Last * (Now - self.LastTime)
+
+        if self.Count == 0:
+            self.Min = Value
+            self.Max = Value
+        elif Value < self.Min:
+            self.Min = Value
+        elif Value > self.Max:
+            self.Max = Value
+
+        self.Sum = self.Sum + Value
+        self.Count = self.Count + 1
+        self.Last = Value
+        self.LastTime = Now
+
+    # Return the aggregates of the interval as a dictionary and start a new interval
+    def Take(self, Now):
+
+        if self.Count == 0:
+            return None
+
+        area = self.Area + self.Last * (Now - self.LastTime)
+        duration = Now - self.StartTime
+
+        result = {"Min": round(self.Min, 2),
+                  "Max": round(self.Max, 2),
+                  "Avg": round(self.Sum / self.Count, 2),
+                  "Last": round(self.Last, 2),
+                  "Count": self.Count,
+                  "TWA": round(area / duration, 2) if duration > 0 else round(self.Last, 2)}
+
+        # The last value carries forward into the next interval for the time weighted average
+        self.Min = self.Last
+        self.Max = self.Last
+        self.Sum = 0.0
+        self.Count = 0
+        self.Area = 0.0
+        self.StartTime = Now
+        self.LastTime = Now
+
+        return result
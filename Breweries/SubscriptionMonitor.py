@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import asyncio
+
+class SubscriptionMonitor:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to measure the backlog of the OPC UA subscriptions of the server, python-opcua or asyncua (both
+    have the same subscription service internals): the data change notifications queued for the next publish,
+    the publish results not acknowledged by the clients yet, and the notifications dropped because the queue of a
+    monitored item was full (a value changed more often than the client's publishing interval and queue size
+    allow, the oldest queued value is discarded).
+
+    The servers do not count dropped notifications, so Sample() installs a counting wrapper on the
+    enqueue_datachange_event() of every new subscription, like the Profiler wraps the Run() of the assets.
+
+    Attributes
+    ----------
+
+    Service (Subscription service of the server)
+    Subscriptions (Number of subscriptions at the last sample)
+    MonitoredItems (Number of monitored items at the last sample)
+    Queued (Number of data change notifications waiting for the next publish at the last sample)
+    Unacknowledged (Number of publish results not acknowledged at the last sample)
+    Dropped (Number of notifications dropped because the queue of the monitored item was full)
+
+    Methods
+    -------
+
+    __init__(self, Service) - Class Constructor
+    Sample(self) - samples the subscriptions, returns False when they changed during the sample
+
+    """
+
+    # Class Constructor
+    def __init__(self, Service):
+
+        self.Service = Service
+        self.Subscriptions = 0
+        self.MonitoredItems = 0
+        self.Queued = 0
+        self.Unacknowledged = 0
+        self.Dropped = 0
+
+    # Count the notifications dropped by a subscription, the wrapper keeps the signature of the server
+    def _countDrops(self, Subscription):
+
+        enqueue = Subscription.enqueue_datachange_event
+
+        def overflow(Mid, MaxSize):
+            if (MaxSize != 0) and (len(Subscription._triggered_datachanges.get(Mid, ())) >= MaxSize):
+                self.Dropped = self.Dropped + 1
+
+        if asyncio.iscoroutinefunction(enqueue):
+            async def countedEnqueue(Mid, EventData, MaxSize):
+                overflow(Mid, MaxSize)
+                await enqueue(Mid, EventData, MaxSize)
+        else:
+            def countedEnqueue(Mid, EventData, MaxSize):
+                overflow(Mid, MaxSize)
+                enqueue(Mid, EventData, MaxSize)
+
+        countedEnqueue.Counted = True
+        Subscription.enqueue_datachange_event = countedEnqueue
+
+    def Sample(self):
+
+        # The subscriptions are served on the server threads, a sample is skipped when they change meanwhile
+        try:
+            subscriptions = list(self.Service.subscriptions.values())
+            monitoredItems = 0
+            queued = 0
+            unacknowledged = 0
+            for subscription in subscriptions:
+                if not hasattr(subscription.enqueue_datachange_event, "Counted"):
+                    self._countDrops(subscription)
+                monitoredItems = monitoredItems + len(subscription.monitored_item_srv._monitored_items)
+                queued = queued + sum(len(queue) for queue in list(subscription._triggered_datachanges.values()))
+                unacknowledged = unacknowledged + len(subscription._not_acknowledged_results)
+        except RuntimeError:
+            return False
+
+        self.Subscriptions = len(subscriptions)
+        self.MonitoredItems = monitoredItems
+        self.Queued = queued
+        self.Unacknowledged = unacknowledged
+        return True
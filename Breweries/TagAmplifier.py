@@ -0,0 +1,148 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+from Sink import Tag
+
+#########################################################################
+# NumPy - https://numpy.org (optional, required for tag amplification)
+try:
+    import numpy
+except ImportError:
+    numpy = None
+#########################################################################
+
+class TagAmplifier:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to amplify the tags of the plant into many derived tags, to stress test collectors and
+    gateways with tag counts of production sites (50k+) instead of the about 500 tags of the plant.
+
+    Every base tag (a tag whose property ends with one of the Suffixes, i.e. every Temperature_PV, Level_PV or
+    InletValve_PV) is cloned into Copies derived tags of the derived asset "{asset}_{copy}" of the Area, with
+    the alias "/{enterprise}/{plant}/{Area}/{asset}_{copy}/{property}". Every derived tag follows its base tag
+    with its own phase offset, a delay of 0 to MaxLag scans. Numeric derived tags are also scaled by their own
+    gain (0.9 to 1.1) and get gaussian noise of Noise times their value, so a base value of 0 (i.e. a stopped
+    pump) stays 0. String (and boolean) derived tags only get the phase offset.
+
+    The base values of every scan are kept in a ring buffer of the last MaxLag scans, and the derived values are
+    computed every Every scans from the ring buffer with NumPy, as one gather, multiply and add over all the
+    derived tags, so 50k derived tags at 1 Hz take a few milliseconds. Strings are stored in the ring buffer as
+    their number in a dictionary of the strings seen.
+
+    Attributes
+    ----------
+
+    Tags (Derived tag list, see Tag, copy by copy in the order of the base tags)
+    Values (Derived values of the last update, in the order of Tags)
+    Every (Number of scans between updates of the derived values)
+    Numeric (Indexes of the numeric base tags)
+    Discrete (Indexes of the string and boolean base tags)
+    Lags (Phase offset in scans of every derived tag, one row per copy)
+    Gains (Gain of every numeric derived tag, one row per copy)
+    Updates (Number of updates of the derived values)
+
+    Methods
+    -------
+
+    __init__(self, Tags, Copies, Suffixes, Every, MaxLag, Noise, Seed, Area) - Class Constructor, creates the derived tags
+    Update(self, Values) - adds the base values of a scan, returns True when the derived values were updated
+
+    """
+
+    # Class Constructor
+    def __init__(self, Tags, Copies, Suffixes=("_PV",), Every=10, MaxLag=50, Noise=0.01, Seed=None, Area="Synthetic"):
+
+        if numpy is None:
+            raise ImportError("Tag amplification requires numpy, install it with: pip3 install numpy")
+
+        self.Every = max(1, Every)
+        self.Noise = Noise
+        self.Updates = 0
+        self.Numeric = [index for index, tag in enumerate(Tags) if tag.Property.endswith(tuple(Suffixes)) and tag.DataType in ("double", "integer")]
+        self.Discrete = [index for index, tag in enumerate(Tags) if tag.Property.endswith(tuple(Suffixes)) and tag.DataType in ("string", "boolean")]
+
+        # Derived tags, copy by copy with the numeric then the discrete base tags of every copy
+        self.Tags = []
+        width = len(str(Copies))
+        for copy in range(1, Copies + 1):
+            for number, index in enumerate(self.Numeric + self.Discrete):
+                base = Tags[index]
+                asset = "{0}_{1:0{2}d}".format(base.Asset, copy, width)
+                # Alias of the plant, the base alias without "/{area}/{asset}/{property}"
+                prefix = base.Alias[:-(len(base.Property) + len(base.Asset) + len(base.Area) + 3)]
+                datatype = "double" if number < len(self.Numeric) else base.DataType
+                self.Tags.append(Tag(Area, asset, base.Property, datatype, "{0}/{1}/{2}/{3}".format(prefix, Area, asset, base.Property)))
+
+        # Phase offsets (delays in scans) and gains of every derived tag, one row per copy
+        random = numpy.random.default_rng(Seed)
+        self.Random = random
+        self.Length = max(0, MaxLag) + 1
+        self.Lags = random.integers(0, self.Length, size=(Copies, len(self.Numeric) + len(self.Discrete)))
+        self.Gains = random.uniform(0.9, 1.1, size=(Copies, len(self.Numeric)))
+        self.Columns = numpy.arange(len(self.Numeric) + len(self.Discrete))
+
+        # Ring buffers of the base values of the last Length scans
+        self.NumericHistory = numpy.zeros((self.Length, len(self.Numeric)))
+        self.DiscreteHistory = numpy.zeros((self.Length, len(self.Discrete)), dtype=numpy.int64)
+        self.Position = -1
+        self.Symbols = []
+        self.SymbolIndex = {}
+        self.Scans = 0
+        self.Values = [None] * len(self.Tags)
+
+    # Return the number of a string (or boolean) in the dictionary of the strings seen
+    def _symbol(self, Value):
+
+        number = self.SymbolIndex.get(Value)
+        if number is None:
+            number = self.SymbolIndex[Value] = len(self.Symbols)
+            self.Symbols.append(Value)
+        return number
+
+    def Update(self, Values):
+
+        numericValues = numpy.array([Values[index] for index in self.Numeric], dtype=float)
+        discreteValues = [self._symbol(Values[index]) for index in self.Discrete]
+        if self.Position < 0:
+            # The first scan fills the whole ring buffer, so every phase offset has a value
+            self.NumericHistory[:] = numericValues
+            self.DiscreteHistory[:] = discreteValues
+        self.Position = (self.Position + 1) % self.Length
+        self.NumericHistory[self.Position] = numericValues
+        self.DiscreteHistory[self.Position] = discreteValues
+
+        self.Scans = self.Scans + 1
+        if (self.Scans - 1) % self.Every != 0:
+            return False
+
+        # Gather the delayed base value of every derived tag, one row per copy
+        rows = (self.Position - self.Lags) % self.Length
+        numericCount = len(self.Numeric)
+        delayed = self.NumericHistory[rows[:, :numericCount], self.Columns[:numericCount]]
+        numericDerived = delayed * self.Gains
+        if self.Noise > 0:
+            numericDerived = numericDerived + self.Random.standard_normal(delayed.shape) * self.Noise * numpy.abs(delayed)
+        discreteDerived = self.DiscreteHistory[rows[:, numericCount:], self.Columns[:len(self.Discrete)]]
+
+        symbols = self.Symbols
+        values = []
+        for numericRow, discreteRow in zip(numericDerived.tolist(), discreteDerived.tolist()):
+            values.extend(numericRow)
+            values.extend([symbols[number] for number in discreteRow])
+        self.Values = values
+        self.Updates = self.Updates + 1
+        return True
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import json
+import struct
+
+# ---------------------------------------------------------------------------
+# Tag log layout (little endian), an append only log of the changed tags of every scan written by RecordSink
+#
+#   Header
+#     magic           4s   b"BRTL"
+#     version         H
+#     directory size  I
+#     directory       JSON [[alias, datatype], ...]
+#   Scan records, appended once per scan
+#     size            varint  size of the record after this field, a truncated last record is ignored
+#     time            varint  zigzag microseconds since the previous scan (since the epoch for the first scan)
+#     count           varint  number of changed tags
+#     changes         count * (varint tag index - previous changed tag index - 1, value)
+#
+#   A value starts with a varint, payload << 3 | kind:
+#     0 None
+#     1 False, 2 True
+#     3 int     payload is the zigzag difference with the previous int of the tag
+#     4 float   payload is the zigzag difference with the previous float of the tag in thousandths, when
+#               the float is a whole number of thousandths
+#     5 float   followed by the 8 bytes of the double (payload 0)
+#     6 string  payload is the number of the string in the dictionary of the log, a new string is numbered
+#               with the size of the dictionary and followed by varint length + UTF-8 bytes
+#
+#   The first scan record holds every tag, the following records only the tags that changed.
+# ---------------------------------------------------------------------------
+Magic = b"BRTL"
+Version = 1
+HeaderFormat = "<4sHI"
+Scale = 1000
+MaxScaled = 2 ** 53
+NoneKind = 0
+FalseKind = 1
+TrueKind = 2
+IntKind = 3
+ScaledKind = 4
+FloatKind = 5
+StringKind = 6
+
+def zigzag(Value):
+    """
+    zigzag - Returns the zigzag encoding of a signed integer, small negative and positive integers are small
+    """
+    return Value << 1 if Value >= 0 else ((-Value) << 1) - 1
+
+def unzigzag(Value):
+    """
+    unzigzag - Returns the signed integer of a zigzag encoded integer
+    """
+    return Value >> 1 if not Value & 1 else -((Value + 1) >> 1)
+
+def write_varint(Buffer, Value):
+    """
+    write_varint - Appends an unsigned integer to a bytearray, 7 bits per byte, least significant first
+    """
+    while Value >= 0x80:
+        Buffer.append((Value & 0x7F) | 0x80)
+        Value = Value >> 7
+    Buffer.append(Value)
+
+def read_varint(Data, Offset):
+    """
+    read_varint - Returns the unsigned integer at Offset and the offset after it
+    """
+    value = 0
+    shift = 0
+    while True:
+        byte = Data[Offset]
+        Offset = Offset + 1
+        value = value | ((byte & 0x7F) << shift)
+        if byte < 0x80:
+            return value, Offset
+        shift = shift + 7
+
+class TagLogReader:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to read the tag logs recorded by RecordSink, see TagReplayer to replay them to the OPC UA Server
+    and the outputs. Scans() decodes the records one at a time, so logs of any length are replayed from memory
+    without decoding them up front.
+
+    Example:
+
+        reader = TagLogReader("brewery.tlog")
+        for scanTime, changes in reader.Scans():
+            for index, value in changes:
+                print(scanTime, reader.Aliases[index], value)
+
+    Attributes
+    ----------
+
+    Path (Tag log file path)
+    Aliases (Property aliases in log order)
+    DataTypes (IoT SiteWise datatypes in log order)
+    Data (Content of the tag log)
+    Truncated (True when the last record of the log is incomplete, i.e. the recorder was killed)
+
+    Methods
+    -------
+
+    __init__(self, Path) - Class Constructor, reads the tag log and its directory
+    Scans(self) - yields [time, [[tag index, value], ...]] of every scan record
+
+    """
+
+    # Class Constructor
+    def __init__(self, Path):
+
+        self.Path = Path
+        with open(Path, "rb") as file:
+            self.Data = file.read()
+
+        magic, version, directorySize = struct.unpack_from(HeaderFormat, self.Data, 0)
+        if (magic != Magic) or (version != Version):
+            raise ValueError("{0} is not a version {1} tag log".format(Path, Version))
+
+        self.Start = struct.calcsize(HeaderFormat) + directorySize
+        directory = json.loads(self.Data[struct.calcsize(HeaderFormat):self.Start].decode("utf-8"))
+        self.Aliases = [entry[0] for entry in directory]
+        self.DataTypes = [entry[1] for entry in directory]
+        self.Truncated = False
+
+    def Scans(self):
+
+        data = self.Data
+        ints = [0] * len(self.Aliases)
+        scaled = [0] * len(self.Aliases)
+        strings = []
+        microseconds = 0
+        offset = self.Start
+
+        while offset < len(data):
+            try:
+                size, offset = read_varint(data, offset)
+            except IndexError:
+                self.Truncated = True
+                return
+            end = offset + size
+            if end > len(data):
+                self.Truncated = True
+                return
+
+            delta, offset = read_varint(data, offset)
+            microseconds = microseconds + unzigzag(delta)
+            count, offset = read_varint(data, offset)
+            changes = []
+            index = -1
+            for number in range(count):
+                skip, offset = read_varint(data, offset)
+                index = index + skip + 1
+                header, offset = read_varint(data, offset)
+                kind = header & 0x07
+                payload = header >> 3
+                if kind == ScaledKind:
+                    scaled[index] = scaled[index] + unzigzag(payload)
+                    value = scaled[index] / Scale
+                elif kind == StringKind:
+                    if payload == len(strings):
+                        length, offset = read_varint(data, offset)
+                        strings.append(data[offset:offset + length].decode("utf-8"))
+                        offset = offset + length
+                    value = strings[payload]
+                elif kind == IntKind:
+                    ints[index] = ints[index] + unzigzag(payload)
+                    value = ints[index]
+                elif kind == FloatKind:
+                    value = struct.unpack_from("<d", data, offset)[0]
+                    offset = offset + 8
+                elif kind == NoneKind:
+                    value = None
+                else:
+                    value = kind == TrueKind
+                changes.append([index, value])
+
+            offset = end
+            yield [microseconds / 1000000, changes]
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import time
+from TagLogReader import TagLogReader
+
+class TagReplayer:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to replay a tag log recorded by RecordSink instead of simulating the plant, so load tests get
+    identical data every run and at rates the simulation can not produce. Replay() applies the changes of every
+    recorded scan to the current tag values and yields the scan time and the changed tags, for the simulator to
+    write them to the OPC UA Server and the outputs.
+
+    Scans are paced at Speed times the recorded rate (1 for the recorded rate, 0 for as fast as possible). Scan
+    times are rebased on the time the replay started, so they follow the wall clock at the recorded rate, and
+    keep increasing across loops: when Loop is set the log is replayed again from its first record (which holds
+    every tag) one recorded scan interval after its last record.
+
+    The tags of the log are matched to the tags of the simulator by alias, tags missing from the log keep their
+    current value.
+
+    Attributes
+    ----------
+
+    Reader (TagLogReader of the tag log)
+    Speed (Replay speed, multiple of the recorded rate, 0 for as fast as possible)
+    Loop (True to replay the tag log again when it ends)
+    Indexes (Simulator tag index of every tag of the log, None when the simulator has no such tag)
+    Missing (Number of simulator tags without values in the log)
+    Scans (Number of scans replayed)
+    Loops (Number of times the whole tag log was replayed)
+
+    Methods
+    -------
+
+    __init__(self, Path, Tags, Speed, Loop) - Class Constructor, reads the tag log
+    Replay(self, Values) - updates Values with every replayed scan and yields [time, changed tag indexes]
+
+    """
+
+    # Class Constructor
+    def __init__(self, Path, Tags, Speed=1.0, Loop=True):
+
+        self.Reader = TagLogReader(Path)
+        self.Speed = Speed
+        self.Loop = Loop
+        tagIndexes = {tag.Alias: index for index, tag in enumerate(Tags)}
+        self.Indexes = [tagIndexes.get(alias) for alias in self.Reader.Aliases]
+        self.Missing = len(Tags) - sum(1 for index in self.Indexes if index is not None)
+        self.Scans = 0
+        self.Loops = 0
+
+    def Replay(self, Values):
+
+        start = time.time()
+        offset = 0.0
+        indexes = self.Indexes
+
+        while True:
+            first = None
+            last = None
+            interval = 0.1
+            for recordedTime, changes in self.Reader.Scans():
+                if first is None:
+                    first = recordedTime
+                elif last is not None:
+                    interval = recordedTime - last
+                last = recordedTime
+
+                if self.Speed > 0:
+                    scanTime = start + (offset + recordedTime - first) / self.Speed
+                    delay = scanTime - time.time()
+                    if delay > 0:
+                        time.sleep(delay)
+                else:
+                    scanTime = time.time()
+
+                changed = []
+                for logIndex, value in changes:
+                    index = indexes[logIndex]
+                    if index is not None:
+                        Values[index] = value
+                        changed.append(index)
+                self.Scans = self.Scans + 1
+                yield [scanTime, changed]
+
+            if first is None:
+                raise ValueError("{0} has no scans to replay".format(self.Reader.Path))
+            self.Loops = self.Loops + 1
+            if not self.Loop:
+                return
+            offset = offset + (last - first) + interval
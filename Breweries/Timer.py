@@ -44,6 +44,9 @@ class Timer:
 
     """
 
+    # Fixed attributes, no per instance __dict__
+    __slots__ = ("Name", "t0", "ET", "PT", "DN", "RST", "Enabled", "EnabledOS")
+
     # Class Constructor
     def __init__(self, Name):
         
@@ -0,0 +1,198 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import ipaddress
+import json
+import socket
+import struct
+from Sink import Sink
+from UadpSubscriber import (UadpVersion, PublisherIdFlag, GroupHeaderFlag, PayloadHeaderFlag, ExtendedFlags1Flag, PublisherIdUInt16,
+                            TimestampFlag, WriterGroupIdFlag, NetworkMessageNumberFlag, SequenceNumberFlag, DataSetValidFlag,
+                            DataSetSequenceNumberFlag, DataSetFlags2Flag, KeyFrame, DeltaFrame, DataSetTimestampFlag, to_datetime)
+
+# UADP flags of the NetworkMessages and DataSetMessages sent by the sink
+NetworkFlags = UadpVersion | PublisherIdFlag | GroupHeaderFlag | PayloadHeaderFlag | ExtendedFlags1Flag
+NetworkExtendedFlags1 = PublisherIdUInt16 | TimestampFlag
+NetworkGroupFlags = WriterGroupIdFlag | NetworkMessageNumberFlag | SequenceNumberFlag
+DataSetFlags1 = DataSetValidFlag | DataSetSequenceNumberFlag | DataSetFlags2Flag
+
+# Size of a NetworkMessage header without the DataSetWriterIds and Sizes of its DataSetMessages
+HeaderSize = struct.calcsize("<BBHBHHHBq")
+
+def encode_variant(Value, DataType):
+    """
+    encode_variant - Returns the scalar Variant of a value of an IoT SiteWise datatype, a value that can not be
+                     converted to the datatype (i.e. None) is sent as a null Variant
+    """
+    try:
+        match DataType:
+            case "double":
+                return b"\x0b" + struct.pack("<d", float(Value))
+            case "integer":
+                return b"\x08" + struct.pack("<q", int(Value))
+            case "boolean":
+                return b"\x01\x01" if Value else b"\x01\x00"
+            case _:
+                if Value is None:
+                    return b"\x00"
+                encoded = str(Value).encode("utf-8")
+                return b"\x0c" + struct.pack("<i", len(encoded)) + encoded
+    except (ValueError, TypeError, OverflowError, struct.error):
+        return b"\x00"
+
+class UadpSink(Sink):
+
+    """
+
+    Class Overview
+    ----------
+
+    A sink used to publish the tags with OPC UA PubSub, as UADP NetworkMessages sent over UDP multicast (or
+    unicast to a list of subscribers), so any number of consumers receive the tags of every scan at no cost for
+    the simulator, unlike OPC UA Client/Server subscriptions which are served per session.
+
+    Every asset is a DataSetWriter (DataSetWriterId 1 to N in the order of the IoT SiteWise assets) of a single
+    WriterGroup. Every scan the DataSetMessage of an asset is a delta frame with only the fields that changed
+    since the previous scan, and assets without changes are not sent. Every KeyFrameCount scans every asset is
+    sent as a key frame with all its fields, so subscribers that joined late or lost datagrams catch up. The
+    DataSetMessages of a scan are packed in as few NetworkMessages as fit in MaxMessageSize bytes.
+
+    Fields are Variants of the IoT SiteWise datatype of the tag (Double, Int64, String, Boolean). The
+    DataSetMetaData (names and datatypes of the fields of every DataSetWriter) is written as JSON to
+    MetaDataPath when the sink opens, see UadpSubscriber.py for the message layout and a reference subscriber.
+    Messages are not signed or encrypted.
+
+    Attributes
+    ----------
+
+    Targets (List of (host, port) the NetworkMessages are sent to, multicast groups or unicast addresses)
+    PublisherId (UInt16 PublisherId of the NetworkMessages)
+    WriterGroupId (WriterGroupId of the NetworkMessages)
+    KeyFrameCount (Number of scans between key frames)
+    MaxMessageSize (Maximum size in bytes of a NetworkMessage)
+    MetaDataPath (DataSetMetaData JSON file, None to not write it)
+    Socket (UDP socket)
+    Writers (List of [DataSetWriterId, tag indexes, datatypes] per asset)
+    NetworkMessages (Number of NetworkMessages sent, per target)
+    Bytes (Number of bytes sent, per target)
+
+    Methods
+    -------
+
+    __init__(self, Targets, PublisherId, WriterGroupId, KeyFrameCount, MaxMessageSize, MetaDataPath, QueueSize, Policy) - Class Constructor
+    Open(self) - creates the UDP socket, assigns the DataSetWriterIds and writes the DataSetMetaData
+    Write(self, Snapshot) - sends the changed fields of the Snapshot
+    Close(self) - closes the UDP socket
+
+    """
+
+    # Class Constructor
+    def __init__(self, Targets, PublisherId=1, WriterGroupId=1, KeyFrameCount=10, MaxMessageSize=1400, MetaDataPath=None, QueueSize=100, Policy="drop"):
+
+        super().__init__("Uadp", QueueSize, Policy)
+
+        self.Targets = Targets
+        self.PublisherId = PublisherId
+        self.WriterGroupId = WriterGroupId
+        self.KeyFrameCount = max(1, KeyFrameCount)
+        self.MaxMessageSize = MaxMessageSize
+        self.MetaDataPath = MetaDataPath
+        self.Socket = None
+        self.Writers = []
+        self.NetworkMessages = 0
+        self.Bytes = 0
+        self._previous = None
+        self._scans = 0
+        self._sequence = 0
+        self._writerSequences = []
+
+    def Open(self):
+
+        self.Writers = []
+        metadata = []
+        for writerId, [area_name, asset_name, prefix, indexes] in enumerate(self.GroupByAsset(), start=1):
+            self.Writers.append([writerId, indexes, [self.Tags[index].DataType for index in indexes]])
+            metadata.append({"DataSetWriterId": writerId, "Name": prefix, "Fields": [[self.Tags[index].Alias, self.Tags[index].DataType] for index in indexes]})
+        self._writerSequences = [0] * len(self.Writers)
+
+        if self.MetaDataPath is not None:
+            with open(self.MetaDataPath, "w") as file:
+                json.dump({"PublisherId": self.PublisherId, "WriterGroupId": self.WriterGroupId, "DataSetWriters": metadata}, file)
+
+        self.Socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        if any(ipaddress.ip_address(host).is_multicast for host, port in self.Targets):
+            self.Socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, 1)
+            self.Socket.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+
+    def Write(self, Snapshot):
+
+        values = Snapshot.Values
+        previous = self._previous
+        keyFrame = (previous is None) or (self._scans % self.KeyFrameCount == 0)
+        self._scans = self._scans + 1
+        timestamp = to_datetime(Snapshot.Time)
+
+        # Encode the DataSetMessage of every asset with changed fields
+        messages = []
+        for number, [writerId, indexes, datatypes] in enumerate(self.Writers):
+            if keyFrame:
+                fields = [encode_variant(values[index], datatype) for index, datatype in zip(indexes, datatypes)]
+                frame = KeyFrame
+            else:
+                fields = [struct.pack("<H", field) + encode_variant(values[index], datatype)
+                          for field, [index, datatype] in enumerate(zip(indexes, datatypes)) if values[index] != previous[index]]
+                if not fields:
+                    continue
+                frame = DeltaFrame
+
+            sequence = self._writerSequences[number]
+            self._writerSequences[number] = (sequence + 1) % 65536
+            header = struct.pack("<BBHqH", DataSetFlags1, frame | DataSetTimestampFlag, sequence, timestamp, len(fields))
+            messages.append([writerId, header + b"".join(fields)])
+        self._previous = list(values)
+
+        # Pack the DataSetMessages in NetworkMessages of at most MaxMessageSize bytes (a DataSetMessage larger
+        # than MaxMessageSize is sent alone, to be fragmented by IP), at most 255 DataSetMessages each
+        networkNumber = 1
+        start = 0
+        while start < len(messages):
+            size = HeaderSize + 2 + len(messages[start][1])
+            end = start + 1
+            while (end < len(messages)) and (end - start < 255) and (size + 4 + len(messages[end][1]) <= self.MaxMessageSize):
+                size = size + 4 + len(messages[end][1])
+                end = end + 1
+            self._send(networkNumber, messages[start:end], timestamp)
+            networkNumber = networkNumber + 1
+            start = end
+
+    def _send(self, NetworkNumber, Messages, Timestamp):
+
+        count = len(Messages)
+        writerIds = [writerId for writerId, message in Messages]
+        header = struct.pack("<BBHBHHHB{0}Hq".format(count), NetworkFlags, NetworkExtendedFlags1, self.PublisherId, NetworkGroupFlags,
+                             self.WriterGroupId, NetworkNumber, self._sequence, count, *writerIds, Timestamp)
+        if count > 1:
+            header = header + struct.pack("<{0}H".format(count), *[len(message) for writerId, message in Messages])
+        data = header + b"".join([message for writerId, message in Messages])
+        self._sequence = (self._sequence + 1) % 65536
+
+        for target in self.Targets:
+            self.Socket.sendto(data, target)
+            self.NetworkMessages = self.NetworkMessages + 1
+            self.Bytes = self.Bytes + len(data)
+
+    def Close(self):
+
+        if self.Socket is not None:
+            self.Socket.close()
+        self.Socket = None
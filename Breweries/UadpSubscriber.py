@@ -0,0 +1,349 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import ipaddress
+import json
+import socket
+import struct
+
+# ---------------------------------------------------------------------------
+# OPC UA PubSub UADP message mapping (OPC 10000-14), the subset written by UadpSink
+#
+#   NetworkMessage
+#     UADPFlags            Byte    version 1, PublisherId, GroupHeader, PayloadHeader, ExtendedFlags1
+#     ExtendedFlags1       Byte    PublisherId type UInt16, Timestamp
+#     PublisherId          UInt16
+#     GroupFlags           Byte    WriterGroupId, NetworkMessageNumber, SequenceNumber
+#     WriterGroupId        UInt16
+#     NetworkMessageNumber UInt16  number of the message in the scan, a scan can need several datagrams
+#     SequenceNumber       UInt16
+#     Count                Byte    number of DataSetMessages
+#     DataSetWriterIds     UInt16[Count]
+#     Timestamp            DateTime
+#     Sizes                UInt16[Count], only when Count > 1
+#     DataSetMessages
+#
+#   DataSetMessage (one per asset, the DataSetWriterId of the asset)
+#     DataSetFlags1        Byte    valid, Variant field encoding, SequenceNumber, DataSetFlags2
+#     DataSetFlags2        Byte    key frame or delta frame, Timestamp
+#     SequenceNumber       UInt16
+#     Timestamp            DateTime (time of the scan)
+#     FieldCount           UInt16
+#     Fields               key frame: Variant[FieldCount], delta frame: (UInt16 field index, Variant)[FieldCount]
+# ---------------------------------------------------------------------------
+UadpVersion = 1
+PublisherIdFlag = 0x10
+GroupHeaderFlag = 0x20
+PayloadHeaderFlag = 0x40
+ExtendedFlags1Flag = 0x80
+PublisherIdUInt16 = 0x01
+TimestampFlag = 0x20
+WriterGroupIdFlag = 0x01
+NetworkMessageNumberFlag = 0x04
+SequenceNumberFlag = 0x08
+DataSetValidFlag = 0x01
+DataSetSequenceNumberFlag = 0x08
+DataSetFlags2Flag = 0x80
+KeyFrame = 0
+DeltaFrame = 1
+DataSetTimestampFlag = 0x10
+
+# DateTime is the number of 100 nanosecond intervals since January 1 1601 (UTC)
+EpochOffset = 11644473600
+
+def to_datetime(Time):
+    """
+    to_datetime - Returns the UADP DateTime of a time in epoch seconds
+    """
+    return int((Time + EpochOffset) * 10000000)
+
+def from_datetime(Ticks):
+    """
+    from_datetime - Returns the time in epoch seconds of a UADP DateTime
+    """
+    return Ticks / 10000000 - EpochOffset
+
+# Fixed size Variant values - built in type: struct format
+VariantFormats = {1: "<?", 2: "<b", 3: "<B", 4: "<h", 5: "<H", 6: "<i", 7: "<I", 8: "<q", 9: "<Q", 10: "<f", 11: "<d", 13: "<q"}
+
+def decode_variant(Data, Offset):
+    """
+    decode_variant - Returns the value of the scalar Variant at Offset and the offset after it
+    """
+    builtInType = Data[Offset]
+    Offset = Offset + 1
+    if builtInType == 0:
+        return None, Offset
+    if builtInType == 12:
+        length = struct.unpack_from("<i", Data, Offset)[0]
+        Offset = Offset + 4
+        if length < 0:
+            return None, Offset
+        return Data[Offset:Offset + length].decode("utf-8"), Offset + length
+    valueFormat = VariantFormats.get(builtInType)
+    if valueFormat is None:
+        raise ValueError("Unsupported Variant encoding 0x{0:02x}".format(builtInType))
+    value = struct.unpack_from(valueFormat, Data, Offset)[0]
+    Offset = Offset + struct.calcsize(valueFormat)
+    if builtInType == 13:
+        value = from_datetime(value)
+    return value, Offset
+
+class UadpSubscriber:
+
+    """
+
+    Class Overview
+    ----------
+
+    A reference subscriber of the OPC UA PubSub UADP messages sent by UadpSink, used by consumers that want the
+    tags of every scan without an OPC UA session: any number of subscribers can join the multicast group at no
+    cost for the simulator. Receive() decodes the NetworkMessages and keeps the latest value of every field of
+    every DataSetWriter (asset). Key frames carry every field of an asset, delta frames only the fields that
+    changed, so a new subscriber has every value after the first key frame of every asset.
+
+    The field names and datatypes are not part of the messages. They are read from the metadata file written by
+    UadpSink (MetaDataPath), without it values are only available by DataSetWriterId and field index.
+
+    Example:
+
+        subscriber = UadpSubscriber("239.0.0.1", 4840, "brewery_uadp.json")
+        while True:
+            subscriber.Receive()
+            print(subscriber.Get("/Breweries/IrvinePlant/Roasting/Roaster100/Temperature_PV"))
+
+    Attributes
+    ----------
+
+    Address (Multicast group, or unicast address, the messages are sent to)
+    Port (UDP port)
+    Socket (UDP socket)
+    Writers (Dictionary of DataSetWriterId to the list of [alias, datatype] of its fields, from the metadata)
+    Aliases (Dictionary of alias to [DataSetWriterId, field index], from the metadata)
+    Values (Dictionary of DataSetWriterId to the dictionary of field index to value)
+    Times (Dictionary of DataSetWriterId to the time of its last scan in epoch seconds)
+    NetworkMessages (Number of NetworkMessages received)
+    KeyFrames (Number of key frame DataSetMessages received)
+    DeltaFrames (Number of delta frame DataSetMessages received)
+    Lost (Number of DataSetMessages missing from the DataSetMessage sequence numbers)
+    Errors (Number of datagrams that could not be decoded)
+
+    Methods
+    -------
+
+    __init__(self, Address, Port, MetaDataPath, Interface) - Class Constructor
+    Receive(self, Timeout) - receives and decodes one datagram, returns the decoded NetworkMessage or None
+    Decode(self, Data) - decodes a NetworkMessage and updates the values
+    Get(self, Alias) - returns the latest value of a tag
+    Close(self) - closes the socket
+
+    """
+
+    # Class Constructor
+    def __init__(self, Address="239.0.0.1", Port=4840, MetaDataPath=None, Interface="0.0.0.0"):
+
+        self.Address = Address
+        self.Port = Port
+        self.Writers = {}
+        self.Aliases = {}
+        self.Values = {}
+        self.Times = {}
+        self.NetworkMessages = 0
+        self.KeyFrames = 0
+        self.DeltaFrames = 0
+        self.Lost = 0
+        self.Errors = 0
+        self._sequences = {}
+
+        if MetaDataPath is not None:
+            with open(MetaDataPath) as file:
+                metadata = json.load(file)
+            for writer in metadata["DataSetWriters"]:
+                self.Writers[writer["DataSetWriterId"]] = writer["Fields"]
+                for index, [alias, datatype] in enumerate(writer["Fields"]):
+                    self.Aliases[alias] = [writer["DataSetWriterId"], index]
+
+        self.Socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_UDP)
+        self.Socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if ipaddress.ip_address(Address).is_multicast:
+            self.Socket.bind(("", Port))
+            membership = socket.inet_aton(Address) + socket.inet_aton(Interface)
+            self.Socket.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, membership)
+        else:
+            self.Socket.bind((Address, Port))
+
+    def Receive(self, Timeout=None):
+
+        self.Socket.settimeout(Timeout)
+        try:
+            data = self.Socket.recv(65535)
+        except socket.timeout:
+            return None
+
+        try:
+            return self.Decode(data)
+        except (ValueError, IndexError, struct.error, UnicodeDecodeError):
+            self.Errors = self.Errors + 1
+            return None
+
+    def Decode(self, Data):
+
+        flags = Data[0]
+        if (flags & 0x0F) != UadpVersion:
+            raise ValueError("Unsupported UADP version {0}".format(flags & 0x0F))
+        offset = 1
+
+        extendedFlags1 = 0
+        if flags & ExtendedFlags1Flag:
+            extendedFlags1 = Data[offset]
+            offset = offset + 1
+            if extendedFlags1 & 0x10:
+                raise ValueError("Secured UADP messages are not supported")
+            if extendedFlags1 & 0x80:
+                raise ValueError("UADP ExtendedFlags2 (chunks, promoted fields) are not supported")
+
+        message = {"PublisherId": None, "WriterGroupId": None, "SequenceNumber": None, "Timestamp": None, "DataSetMessages": []}
+        if flags & PublisherIdFlag:
+            match extendedFlags1 & 0x07:
+                case 0:
+                    message["PublisherId"] = Data[offset]
+                    offset = offset + 1
+                case 1:
+                    message["PublisherId"] = struct.unpack_from("<H", Data, offset)[0]
+                    offset = offset + 2
+                case 2:
+                    message["PublisherId"] = struct.unpack_from("<I", Data, offset)[0]
+                    offset = offset + 4
+                case 3:
+                    message["PublisherId"] = struct.unpack_from("<Q", Data, offset)[0]
+                    offset = offset + 8
+                case 4:
+                    length = struct.unpack_from("<i", Data, offset)[0]
+                    message["PublisherId"] = Data[offset + 4:offset + 4 + length].decode("utf-8")
+                    offset = offset + 4 + max(0, length)
+        if extendedFlags1 & 0x08:
+            # DataSetClassId
+            offset = offset + 16
+
+        if flags & GroupHeaderFlag:
+            groupFlags = Data[offset]
+            offset = offset + 1
+            if groupFlags & WriterGroupIdFlag:
+                message["WriterGroupId"] = struct.unpack_from("<H", Data, offset)[0]
+                offset = offset + 2
+            if groupFlags & 0x02:
+                # GroupVersion
+                offset = offset + 4
+            if groupFlags & NetworkMessageNumberFlag:
+                offset = offset + 2
+            if groupFlags & SequenceNumberFlag:
+                message["SequenceNumber"] = struct.unpack_from("<H", Data, offset)[0]
+                offset = offset + 2
+
+        writerIds = []
+        if flags & PayloadHeaderFlag:
+            count = Data[offset]
+            writerIds = list(struct.unpack_from("<{0}H".format(count), Data, offset + 1))
+            offset = offset + 1 + 2 * count
+
+        if extendedFlags1 & TimestampFlag:
+            message["Timestamp"] = from_datetime(struct.unpack_from("<q", Data, offset)[0])
+            offset = offset + 8
+        if extendedFlags1 & 0x40:
+            # PicoSeconds
+            offset = offset + 2
+
+        if len(writerIds) > 1:
+            sizes = struct.unpack_from("<{0}H".format(len(writerIds)), Data, offset)
+            offset = offset + 2 * len(writerIds)
+        else:
+            sizes = [len(Data) - offset]
+
+        for writerId, size in zip(writerIds, sizes):
+            message["DataSetMessages"].append(self._decodeDataSetMessage(message["PublisherId"], writerId, Data, offset))
+            offset = offset + size
+
+        self.NetworkMessages = self.NetworkMessages + 1
+        return message
+
+    def _decodeDataSetMessage(self, PublisherId, WriterId, Data, Offset):
+
+        flags1 = Data[Offset]
+        Offset = Offset + 1
+        if (flags1 & 0x06) != 0:
+            raise ValueError("Only the Variant field encoding is supported")
+        flags2 = 0
+        if flags1 & DataSetFlags2Flag:
+            flags2 = Data[Offset]
+            Offset = Offset + 1
+
+        sequence = None
+        if flags1 & DataSetSequenceNumberFlag:
+            sequence = struct.unpack_from("<H", Data, Offset)[0]
+            Offset = Offset + 2
+        scanTime = None
+        if flags2 & DataSetTimestampFlag:
+            scanTime = from_datetime(struct.unpack_from("<q", Data, Offset)[0])
+            Offset = Offset + 8
+        if flags2 & 0x20:
+            # PicoSeconds
+            Offset = Offset + 2
+        if flags1 & 0x10:
+            # Status
+            Offset = Offset + 2
+        if flags1 & 0x20:
+            # ConfigurationVersionMajorVersion
+            Offset = Offset + 4
+        if flags1 & 0x40:
+            # ConfigurationVersionMinorVersion
+            Offset = Offset + 4
+
+        # Messages missing from the sequence of the writer, sequence numbers wrap at 65536
+        if sequence is not None:
+            last = self._sequences.get((PublisherId, WriterId))
+            if last is not None:
+                self.Lost = self.Lost + ((sequence - last - 1) % 65536)
+            self._sequences[(PublisherId, WriterId)] = sequence
+
+        messageType = flags2 & 0x0F
+        fields = {}
+        if messageType in (KeyFrame, DeltaFrame):
+            count = struct.unpack_from("<H", Data, Offset)[0]
+            Offset = Offset + 2
+            for number in range(count):
+                if messageType == DeltaFrame:
+                    index = struct.unpack_from("<H", Data, Offset)[0]
+                    Offset = Offset + 2
+                else:
+                    index = number
+                fields[index], Offset = decode_variant(Data, Offset)
+
+            if messageType == KeyFrame:
+                self.KeyFrames = self.KeyFrames + 1
+                self.Values[WriterId] = fields
+            else:
+                self.DeltaFrames = self.DeltaFrames + 1
+                self.Values.setdefault(WriterId, {}).update(fields)
+            if scanTime is not None:
+                self.Times[WriterId] = scanTime
+
+        return [WriterId, messageType, sequence, scanTime, fields]
+
+    def Get(self, Alias):
+
+        writerId, index = self.Aliases[Alias]
+        return self.Values.get(writerId, {}).get(index)
+
+    def Close(self):
+
+        self.Socket.close()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+import json
+import socket
+from Sink import Sink
+
+class UdpSink(Sink):
+
+    """
+
+    Class Overview
+    ----------
+
+    A sink used to send every Snapshot as JSON datagrams over UDP. To stay below the network MTU one datagram
+    is sent per asset and scan, containing the alias prefix of the asset and the values keyed by property name:
+
+    {"scan": 1, "time": 1700000000.1, "asset": "/Breweries/IrvinePlant/Roasting/Roaster100", "values": {"Malt_PV": 0.0, ...}}
+
+    Attributes
+    ----------
+
+    Host (Destination host name or IP address)
+    Port (Destination UDP port)
+    Socket (UDP socket)
+    Assets (Tag indexes grouped per asset, see Sink.GroupByAsset)
+
+    Methods
+    -------
+
+    __init__(self, Host, Port, QueueSize, Policy) - Class Constructor
+    Open(self) - creates the UDP socket
+    Write(self, Snapshot) - sends one datagram per asset
+    Close(self) - closes the UDP socket
+
+    """
+
+    # Class Constructor
+    def __init__(self, Host, Port, QueueSize=100, Policy="drop"):
+
+        super().__init__("Udp", QueueSize, Policy)
+
+        self.Host = Host
+        self.Port = Port
+        self.Socket = None
+        self.Assets = []
+
+    def Open(self):
+
+        self.Assets = self.GroupByAsset()
+        self.Socket = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def Write(self, Snapshot):
+
+        for area_name, asset_name, prefix, indexes in self.Assets:
+            values = {self.Tags[index].Property: Snapshot.Values[index] for index in indexes}
+            message = json.dumps({"scan": Snapshot.Scan, "time": Snapshot.Time, "asset": prefix, "values": values}, separators=(",", ":"))
+            self.Socket.sendto(message.encode("utf-8"), (self.Host, self.Port))
+
+    def Close(self):
+
+        if self.Socket is not None:
+            self.Socket.close()
+        self.Socket = None
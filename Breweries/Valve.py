@@ -36,6 +36,9 @@ class Valve:
 
     """
 
+    # Fixed attributes, no per instance __dict__
+    __slots__ = ("EquipmentName", "CmdOpen", "presentPosition", "PV", "CLS", "OLS")
+
     # Class Constructor
     def __init__(self, EquipmentName):
         
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+# SPDX-License-Identifier: MIT-0
+
+#----------------------------------------------------------------------------
+# Created Date: October 19 2026
+# version ='0.1.0'
+# ---------------------------------------------------------------------------
+
+# ---------------------------------------------------------------------------
+# Imports
+# ---------------------------------------------------------------------------
+from GlobalVariables import NewStateEnum, NewStatusEnum
+
+class VesselPool:
+
+    """
+
+    Class Overview
+    ----------
+
+    A class used to allocate the downstream vessel of a ship (i.e. the Bright Tank a Fermenter ships to, the
+    Bottling Line a Bright Tank ships to) from an index of the vessels that are Ready and Idle.
+
+    Update() is called once per scan and checks the state and status of every vessel of the pool (O(n) per scan,
+    a few comparisons for the 5 Bright Tanks and 3 Bottling Lines), changing the index only for the vessels that
+    became free or busy since the last scan. The free vessels are kept both as a bit mask (bit i for the i-th
+    vessel of the pool) and as a dictionary in the order they were freed, so every policy picks a vessel without
+    walking the pool:
+
+        firstfit   - lowest numbered free vessel (lowest bit of the mask), the allocation of previous versions
+        roundrobin - next free vessel after the last allocated one (lowest bit of the mask above the last bit)
+        lru        - vessel that has been free the longest (first vessel of the dictionary)
+        leastused  - free vessel with the fewest allocations, ties to the lowest numbered vessel
+
+    An allocated vessel is removed from the index and its status set to "Allocated", so the next requester of
+    the same scan gets another vessel.
+
+    Attributes
+    ----------
+
+    Name (Pool name, i.e. "BrightTanks")
+    Vessels (Dictionary of vessel number to asset)
+    Policy (Allocation policy - "firstfit", "roundrobin", "lru", "leastused")
+    Numbers (Vessel numbers in bit order)
+    Free (Dictionary of free vessel number to bit, in the order the vessels were freed)
+    FreeMask (Bit mask of the free vessels)
+    LastBit (Bit of the last allocated vessel)
+    Allocations (Dictionary of vessel number to the number of times it was allocated)
+
+    Methods
+    -------
+
+    __init__(self, Name, Vessels, Policy) - Class Constructor
+    Update(self) - checks every vessel and updates the index with the vessels that became free or busy
+    Allocate(self) - allocates a free vessel, returns its number or None when no vessel is free
+
+    """
+
+    Policies = ("firstfit", "roundrobin", "lru", "leastused")
+
+    # Class Constructor
+    def __init__(self, Name, Vessels, Policy="lru"):
+
+        if Policy not in self.Policies:
+            raise ValueError("Unknown allocation policy {0}, expected one of {1}".format(Policy, ", ".join(self.Policies)))
+
+        self.Name = Name
+        self.Vessels = Vessels
+        self.Policy = Policy
+        self.Numbers = list(Vessels)
+        self.Free = {}
+        self.FreeMask = 0
+        self.LastBit = -1
+        self.Allocations = {number: 0 for number in self.Numbers}
+
+        self._entries = [(1 << bit, number, vessel) for bit, (number, vessel) in enumerate(Vessels.items())]
+        self._select = getattr(self, "_" + Policy)
+
+    # Lowest free vessel
+    def _firstfit(self):
+
+        return (self.FreeMask & -self.FreeMask).bit_length() - 1
+
+    # Lowest free vessel above the last allocated one, wrapping around to the lowest free vessel
+    def _roundrobin(self):
+
+        above = self.FreeMask >> (self.LastBit + 1) << (self.LastBit + 1)
+        mask = above if above else self.FreeMask
+        return (mask & -mask).bit_length() - 1
+
+    # Free vessel freed the longest ago
+    def _lru(self):
+
+        return next(iter(self.Free.values()))
+
+    # Free vessel with the fewest allocations
+    def _leastused(self):
+
+        number = min(self.Free, key=lambda number: (self.Allocations[number], number))
+        return self.Free[number]
+
+    # Check every vessel, add the vessels that became Ready and Idle to the index and remove the others
+    def Update(self):
+
+        mask = self.FreeMask
+        for bit, number, vessel in self._entries:
+            free = (vessel.NewState == NewStateEnum.Ready) and (vessel.NewStatus == NewStatusEnum.Idle)
+            if free != bool(mask & bit):
+                if free:
+                    self.Free[number] = bit.bit_length() - 1
+                else:
+                    del self.Free[number]
+                mask = mask ^ bit
+        self.FreeMask = mask
+
+    # Allocate a free vessel, None when no vessel is free
+    def Allocate(self):
+
+        if not self.FreeMask:
+            return None
+
+        bit = self._select()
+        number = self.Numbers[bit]
+        self.FreeMask = self.FreeMask & ~(1 << bit)
+        del self.Free[number]
+        self.LastBit = bit
+        self.Allocations[number] = self.Allocations[number] + 1
+        self.Vessels[number].NewStatus = NewStatusEnum.Allocated
+        return number
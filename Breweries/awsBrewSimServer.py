@@ -27,19 +27,36 @@
 # Imports
 # ---------------------------------------------------------------------------
 import time
-import datetime
-from Timer import Timer
-from Roaster import Roaster
-from MaltMill import MaltMill
-from Mash import Mash
-from BoilKettle import BoilKettle 
-from Fermenter import Fermenter
-from BrightTank import BrightTank
-from BottleLine import BottleLine
-from GlobalVariables import NewStateEnum, NewStatusEnum
+from Plant import Plant
+from LotBuffer import LotBuffer
+from VesselPool import VesselPool
+from GlobalVariables import NewStateNames, NewStatusNames
+from ReportByException import ReportByException
+from Sink import Tag, Snapshot
+from SiteWiseSink import SiteWiseSink
+from FileSink import FileSink
+from UdpSink import UdpSink
+from MqttSink import MqttSink
+from SharedMemorySink import SharedMemorySink
+from UadpSink import UadpSink
+from RecordSink import RecordSink
+from TagReplayer import TagReplayer
+from TagAmplifier import TagAmplifier
+from OeeCalculator import OeeCalculator
+from LotGenealogy import LotGenealogy
+from GenealogyEndpoint import GenealogyEndpoint
+from RuntimeConfig import RuntimeConfig
+from BurstGenerator import BurstGenerator
+from SubscriptionMonitor import SubscriptionMonitor
+from HistorySink import HistorySink
+from HistoryStorage import HistoryStorage
+from Profiler import Profiler
+from Metrics import Metrics
+from MetricsEndpoint import MetricsEndpoint
+from AsyncOpcServer import AsyncOpcServer
 import boto3
 import argparse
-import threading
+import operator
 
 #########################################################################
 # OPC UA Library provided by - https://github.com/FreeOpcUa/python-opcua
@@ -71,327 +88,381 @@ if __name__ == "__main__":
 
     """   
 
-    def publish_properties_to_sitewise(area_name, asset_name, timeInSeconds, properties):
-        """
-        publish_properties_to_sitewise - Publishes an array of property values from simulatior
-                                         to IoT SiteWise. Parameter construct the property alias
-                                         in IoT SiteWise
-
-        :param area_name: In alias for property, the area name is required (i.e "Mashing", "Roasting", ...)
-        :param asset_name: In alias for property, the asset name is required (i.e "Roaster100", "Roaster200", ...)
-        :param timeInSeconds: epoch time in seconds. This is required for the IoT SiteWise TVQ
-        :param properties: A nested array of property values. Each record contains an array of parameters needed
-                           for the batch_put_asset_property_value API call.
-                           - string reference to local variable containing current value
-                           - datatype
-                           - property name
-        """
-        # properties == [ [".MaltPV","double","Malt_PV"],...]
-        for prop in properties:
-            try:
-                entries = []
-                entries=[
-                        {
-                            'entryId': '{}{}'.format(prop[2],int(time.time())),
-                            'propertyAlias': "/{}/{}/{}/{}/{}".format(enterprise_name,plant_name,area_name,asset_name,prop[2]),
-                            'propertyValues': [
-                                {
-                                    'value': {
-                                        prop[1]+'Value': eval(asset_name+prop[0])
-                                    },
-                                    'timestamp': {
-                                        'timeInSeconds': timeInSeconds,
-                                        'offsetInNanos': 0
-                                    },
-                                    'quality': 'GOOD'
-                                },
-                            ]
-                        },
-                    ]
-                response = client.batch_put_asset_property_value(
-                    entries=entries
-                )
-            except Exception as e:
-                print(str(e))
-                time.sleep(5)
-
-    def publish_to_sitewise_thread():
-        """
-        publish_to_sitewise_thread - Thread function to publish values to IoT SiteWise on a continuous loop.
-
-        """
-        # IoT SiteWise Publish event tracking
-        lastpublishtime = datetime.datetime.now()
-        print("Publishing values to SiteWise")
-        while True:
-            #######################################################################
-            # Publish values to IoT SiteWise if enabled and after interval time has elapsed
-            #######################################################################
-            if((datetime.datetime.now()-lastpublishtime).total_seconds()  >= interval):
-                timeInSeconds = int(datetime.datetime.now().timestamp())
-                # Roasters
-                roaster_properties = [
-                    [".MaltPV","double", "Malt_PV"],
-                    [".MaltPV", "double", "Malt_PV"],
-                    [".MaltSP", "integer", "Malt_SP"],
-                    [".TemperaturePV", "double", "Temperature_PV"],
-                    [".TemperatureSP", "integer", "Temperature_SP"],
-                    [".HoldTime.PT", "integer", "HoldTime_PT"],
-                    [".HoldTime.ET", "integer", "HoldTime_ET"],
-                    [".NewState", "string", "State"],
-                    [".NewStatus", "string", "Status"],
-                    [".MaterialID", "string", "MaterialID"],
-                    [".ProductionID", "string", "ProductionID"],
-                    [".Cons_RawBarley_Item", "string", "Cons_RawBarley_Item"],
-                    [".Cons_RawBarley_FromLot", "string", "Cons_RawBarley_FromLot"],
-                    [".Prod_RoastedBarley_ToLot", "string", "Prod_RoastedBarley_ToLot"],
-                    [".Prod_RoastedBarley_Item", "string", "Prod_RoastedBarley_Item"],
-                    [".UtilizationState", "string", "UtilizationState"],
-                    [".Utilization", "string", "Utilization"],
-                    [".MaltAuger.PV", "string", "MaltAuger_PV"],
-                    [".MaltAuger.AuxContact", "boolean", "MaltAuger_AuxContact"],
-                    [".Scrap", "double", "Scrap"]
-                ]
-                publish_properties_to_sitewise("Roasting", "Roaster100", timeInSeconds, roaster_properties)
-                publish_properties_to_sitewise("Roasting", "Roaster200", timeInSeconds, roaster_properties)  
-
-                # MaltMills
-                maltmill_properties = [
-                    [".MaltPV", "double", "Malt_PV"],
-                    [".MaltSP", "double", "Malt_SP"],
-                    [".MaltAuger.AuxContact", "boolean", "MaltAuger_AuxContact"],
-                    [".MaltAuger.PV", "string", "MaltAuger_PV"],
-                    [".MaltMill.AuxContact", "boolean", "MaltMill_AuxContact"],
-                    [".MaltMill.PV", "string", "MaltMill_PV"],
-                    [".NewState", "string", "State"]
-                ]
-                publish_properties_to_sitewise("Mashing", "MaltMill100", timeInSeconds, maltmill_properties)
-                publish_properties_to_sitewise("Mashing", "MaltMill200", timeInSeconds, maltmill_properties)
-
-                # MashTuns
-                mashtun_properties = [
-                    [".Agitator.AuxContact", "boolean", "Agitator_AuxContact"],
-                    [".Agitator.PV", "string", "Agitator_PV"],
-                    [".Cons_Malt_FromLot", "string", "Cons_Malt_FromLot"],
-                    [".Cons_Malt_Item", "string", "Cons_Malt_Item"],
-                    [".HoldTime.PT", "integer", "HoldTime_PT"],
-                    [".HoldTime.ET", "integer", "HoldTime_ET"],
-                    [".LevelPV", "double", "Level_PV"],
-                    [".MaterialID", "string", "MaterialID"],
-                    [".NewState", "string", "State"],
-                    [".NewStatus", "string", "Status"],
-                    [".OutletPump.AuxContact", "boolean", "OutletPump_AuxContact"],
-                    [".OutletPump.PV", "string", "OutletPump_PV"],
-                    [".OutletValve.CLS", "boolean", "OutletValve_CLS"],
-                    [".OutletValve.OLS", "boolean", "OutletValve_OLS"],
-                    [".OutletValve.PV", "string", "OutletValve_PV"],
-                    [".Prod_Wort_Item", "string", "Prod_Wort_Item"],
-                    [".Prod_Wort_ToLot", "string", "Prod_Wort_ToLot"],
-                    [".ProductionID", "string", "ProductionID"],
-                    [".Scrap", "double", "Scrap"],
-                    [".Scrap_ToLot", "string", "Scrap_ToLot"],
-                    [".ShipComplete", "boolean", "ShipComplete"],
-                    [".SoakTempSP1", "integer", "SoakTempSP1"],
-                    [".SoakTempSP2", "integer", "SoakTempSP2"],
-                    [".SoakTimeSP1", "integer", "SoakTimeSP1"],
-                    [".SoakTimeSP2", "integer", "SoakTimeSP2"],
-                    [".SteamValve.CLS", "boolean", "SteamValve_CLS"],
-                    [".SteamValve.OLS", "boolean", "SteamValve_OLS"],
-                    [".SteamValve.PV", "string", "SteamValve_PV"],
-                    [".TemperaturePV", "double", "Temperature_PV"],
-                    [".TemperatureSP", "integer", "Temperature_SP"],
-                    [".UtilizationState", "string", "UtilizationState"],
-                    [".Utilization", "string", "Utilization"],
-                    [".WaterPV", "double", "Water_PV"],
-                    [".WaterSP", "integer", "Water_SP"],
-                    [".WaterValve.CLS", "boolean", "WaterValve_CLS"],
-                    [".WaterValve.OLS", "boolean", "WaterValve_OLS"],
-                    [".WaterValve.PV", "string", "WaterValve_PV"],
-                    [".Wort_Item", "string", "Wort_Item"],
-                    [".WortPV", "double", "Wort_PV"]
-                ]
-                publish_properties_to_sitewise("Mashing", "MashTun100", timeInSeconds, mashtun_properties)
-                publish_properties_to_sitewise("Mashing", "MashTun200", timeInSeconds, mashtun_properties)
-                
-                # BoilKettles
-                boilkettle_properties = [
-                    [".Cons_Hops_FromLot", "string", "Cons_Hops_FromLot"],                  
-                    [".Cons_Hops_Item", "string", "Cons_Hops_Item"],  
-                    [".Cons_Wort_FromLot", "string", "Cons_Wort_FromLot"],  
-                    [".Cons_Wort_Item", "string", "Cons_Wort_Item"],  
-                    [".HoldTime.PT", "integer", "HoldTime_PT"],  
-                    [".HoldTime.ET", "integer", "HoldTime_ET"],  
-                    [".LevelPV", "double", "Level_PV"],  
-                    [".MaterialID", "string", "MaterialID"],  
-                    [".NewState", "string", "State"],  
-                    [".NewStatus", "string", "Status"],  
-                    [".OutletPump.AuxContact", "boolean", "OutletPump_AuxContact"],  
-                    [".OutletPump.PV", "string", "OutletPump_PV"],  
-                    [".InletValve.CLS", "boolean", "InletValve_CLS"],  
-                    [".InletValve.OLS", "boolean", "InletValve_OLS"],  
-                    [".InletValve.PV", "string", "InletValve_PV"],  
-                    [".OutletValve.CLS", "boolean", "OutletValve_CLS"],  
-                    [".OutletValve.OLS", "boolean", "OutletValve_OLS"],  
-                    [".OutletValve.PV", "string", "OutletValve_PV"],  
-                    [".Prod_BrewedWort_Item", "string", "Prod_BrewedWort_Item"],  
-                    [".Prod_BrewedWort_ToLot", "string", "Prod_BrewedWort_ToLot"],  
-                    [".ProductionID", "string", "ProductionID"],  
-                    [".Scrap", "double", "Scrap"],  
-                    [".SteamValve.CLS", "boolean", "SteamValve_CLS"],  
-                    [".SteamValve.OLS", "boolean", "SteamValve_OLS"],  
-                    [".SteamValve.PV", "string", "SteamValve_PV"],  
-                    [".TemperaturePV", "double", "Temperature_PV"],  
-                    [".TemperatureSP", "integer", "Temperature_SP"],  
-                    [".UtilizationState", "string", "UtilizationState"],  
-                    [".Utilization", "string", "Utilization"],  
-                    [".HopsAuger.AuxContact", "boolean", "HopsAuger_AuxContact"],  
-                    [".HopsAuger.PV", "string", "HopsAuger_PV"],  
-                    [".WortPV", "double", "Wort_PV"],  
-                    [".HopsPV", "double", "Hops_PV"],  
-                    [".HopsSP", "double", "Hops_SP"],  
-                    [".BrewedWortPV", "double", "BrewedWort_PV"]
-                ]
-                publish_properties_to_sitewise("Brewing", "BoilKettle100", timeInSeconds, boilkettle_properties)
-                publish_properties_to_sitewise("Brewing", "BoilKettle200", timeInSeconds, boilkettle_properties)      
-
-                    
-                # Fermenters
-                fermenter_properties = [
-                    [".ChillWaterValve.CLS", "boolean", "ChillWaterValve_CLS"],                
-                    [".ChillWaterValve.OLS", "boolean", "ChillWaterValve_OLS"],
-                    [".ChillWaterValve.PV", "string", "ChillWaterValve_CLS"],
-                    [".Cons_BrewedWort_FromLot", "string", "Cons_BrewedWort_FromLot"],
-                    [".Cons_BrewedWort_Item", "string", "Cons_BrewedWort_Item"],
-                    [".Cons_Yeast_FromLot", "string", "Cons_Yeast_FromLot"],
-                    [".Cons_Yeast_Item", "string", "Cons_Yeast_Item"],
-                    [".HoldTime.PT", "integer", "HoldTime_PT"],
-                    [".HoldTime.ET", "integer", "HoldTime_ET"],
-                    [".LevelPV", "double", "Level_PV"],
-                    [".MaterialID", "string", "MaterialID"],
-                    [".NewState", "string", "State"],
-                    [".NewStatus", "string", "Status"],
-                    [".InletValve.CLS", "boolean", "InletValve_CLS"],
-                    [".InletValve.OLS", "boolean", "InletValve_OLS"],
-                    [".InletValve.PV", "string", "InletValve_PV"],
-                    [".OutletPump.AuxContact", "boolean", "OutletPump_AuxContact"],
-                    [".OutletPump.PV", "string", "OutletPump_PV"],
-                    [".OutletValve.CLS", "boolean", "OutletValve_CLS"],
-                    [".OutletValve.OLS", "boolean", "OutletValve_OLS"],
-                    [".Prod_GreenBeer_Item", "string", "Prod_GreenBeer_Item"],
-                    [".Prod_GreenBeer_ToLot", "string", "Prod_GreenBeer_ToLot"],
-                    [".ProductionID", "string", "ProductionID"],
-                    [".Scrap", "double", "Scrap"],
-                    [".ShipTo_Tank", "integer", "ShipTo_Tank"],
-                    [".TemperaturePV", "double", "Temperature_PV"],
-                    [".TemperatureSP", "integer", "Temperature_SP"],
-                    [".UtilizationState", "string", "UtilizationState"],
-                    [".Utilization", "string", "Utilization"],
-                    [".YeastPV", "double", "Yeast_PV"],
-                    [".YeastSP", "double", "Yeast_SP"],
-                    [".YeastPump.AuxContact", "boolean", "YeastPump_AuxContact"],
-                    [".YeastPump.PV", "string", "YeastPump_PV"],
-                    [".GreenBeerPV", "double", "GreenBeer_PV"]
-                ]
-                publish_properties_to_sitewise("Fermentation", "Fermenter100", timeInSeconds, fermenter_properties)
-                publish_properties_to_sitewise("Fermentation", "Fermenter200", timeInSeconds, fermenter_properties)
-                
-
-                # Bright Tank 301
-                tanks_properties = [
-                    [".AllocatedFrom", "integer", "AllocatedFrom"],                
-                    [".ChillWaterValve.CLS", "boolean", "ChillWaterValve_CLS"],
-                    [".ChillWaterValve.OLS", "boolean", "ChillWaterValve_OLS"],
-                    [".ChillWaterValve.PV", "string", "ChillWaterValve_PV"],
-                    [".Cons_GreenBeer_FromLot", "string", "Cons_GreenBeer_FromLot"],
-                    [".Cons_GreenBeer_Item", "string", "Cons_GreenBeer_Item"],
-                    [".HoldTime.PT", "integer", "HoldTime_PT"],
-                    [".HoldTime.ET", "integer", "HoldTime_ET"],
-                    [".LevelPV", "double", "Level_PV"],
-                    [".MaterialID", "string", "MaterialID"],
-                    [".NewState", "string", "State"],
-                    [".NewStatus", "string", "Status"],
-                    [".BeerPV", "double", "Beer_PV"],
-                    [".BeerSP", "double", "Beer_SP"],
-                    [".InletValve.CLS", "boolean", "InletValve_CLS"],
-                    [".InletValve.OLS", "boolean", "InletValve_OLS"],
-                    [".InletValve.PV", "string", "InletValve_PV"],
-                    [".OutletPump.AuxContact", "boolean", "OutletPump_AuxContact"],
-                    [".OutletPump.PV", "string", "OutletPump_PV"],
-                    [".OutletValve.CLS", "boolean", "OutletValve_CLS"],
-                    [".OutletValve.OLS", "boolean", "OutletValve_OLS"],
-                    [".OutletValve.PV", "string", "OutletValve_PV"],
-                    [".Prod_Beer_Item", "string", "Prod_Beer_Item"],
-                    [".Prod_Beer_ToLot", "string", "Prod_Beer_ToLot"],
-                    [".ProductionID", "string", "ProductionID"],
-                    [".TemperaturePV", "double", "Temperature_PV"],
-                    [".TemperatureSP", "integer", "Temperature_SP"],
-                    [".UtilizationState", "string", "UtilizationState"],
-                    [".Utilization", "string", "Utilization"],
-                    [".BeerShipped", "double", "BeerShipped"],
-                    [".ShipToTank", "integer", "ShipTo_Tank"]
-                ]
-                publish_properties_to_sitewise("BeerStorage", "BrightTank301", timeInSeconds, tanks_properties)
-                publish_properties_to_sitewise("BeerStorage", "BrightTank302", timeInSeconds, tanks_properties)
-                publish_properties_to_sitewise("BeerStorage", "BrightTank303", timeInSeconds, tanks_properties)
-                publish_properties_to_sitewise("BeerStorage", "BrightTank304", timeInSeconds, tanks_properties)
-                publish_properties_to_sitewise("BeerStorage", "BrightTank305", timeInSeconds, tanks_properties)        
-                
-
-                # BottlingLines
-                bottling_properties = [
-                    [".AllocatedFrom", "integer", "AllocatedFrom"],
-                    [".BeerPV", "double", "Beer_PV"],
-                    [".BottlePV", "double", "Bottle_PV"],
-                    [".BottleSP", "double", "Bottle_SP"],
-                    [".Cons_Beer_FromLot", "string", "Cons_Beer_FromLot"],  
-                    [".Cons_Beer_Item", "string", "Cons_Beer_Item"],
-                    [".Cons_Bottle_FromLot", "string", "Cons_Bottle_FromLot"],
-                    [".Cons_Bottle_Item", "string", "Cons_Bottle_Item"],
-                    [".Cons_Cap_FromLot", "string", "Cons_Cap_FromLot"],
-                    [".Cons_Cap_Item", "string", "Cons_Cap_Item"],
-                    [".Cons_Label_FromLot", "string", "Cons_Label_FromLot"],
-                    [".Cons_Label_Item", "string", "Cons_Label_Item"],
-                    [".LevelPV", "double", "Level_PV"],
-                    [".MaterialID", "string", "MaterialID"],
-                    [".Prod_BottledBeer_Item", "string", "Prod_BottledBeer_Item"],
-                    [".Prod_BottledBeer_ToLot", "string", "Prod_BottledBeer_ToLot"],
-                    [".ProductionID", "string", "ProductionID"],
-                    [".TemperaturePV", "double", "Temperature_PV"],
-                    [".TemperatureSP", "integer", "Temperature_SP"],
-                    [".HoldTime.PT", "integer", "HoldTime_PT"],
-                    [".HoldTime.ET", "integer", "HoldTime_ET"],
-                    [".NewState", "string", "State"],
-                    [".NewStatus", "string", "Status"],
-                    [".UtilizationState", "string", "UtilizationState"],
-                    [".Utilization", "string", "Utilization"],
-                    [".Scrap", "double", "Scrap"],
-                    [".SpeedPV", "double", "Speed_PV"],
-                    [".SpeedSP", "integer", "Speed_SP"]    
-                ]
-                publish_properties_to_sitewise("Bottling", "BottleLine401", timeInSeconds, bottling_properties)        
-                publish_properties_to_sitewise("Bottling", "BottleLine402", timeInSeconds, bottling_properties)        
-                publish_properties_to_sitewise("Bottling", "BottleLine403", timeInSeconds, bottling_properties)        
-
-                # reset interval
-                lastpublishtime = datetime.datetime.now()
+    #######################################################################
+    # IoT SiteWise asset properties - [local variable, datatype, property name]
+    #######################################################################
+
+    # Roasters
+    roaster_properties = [
+        [".MaltPV","double", "Malt_PV"],
+        [".MaltPV", "double", "Malt_PV"],
+        [".MaltSP", "integer", "Malt_SP"],
+        [".TemperaturePV", "double", "Temperature_PV"],
+        [".TemperatureSP", "integer", "Temperature_SP"],
+        [".HoldTime.PT", "integer", "HoldTime_PT"],
+        [".HoldTime.ET", "integer", "HoldTime_ET"],
+        [".NewState", "string", "State"],
+        [".NewStatus", "string", "Status"],
+        [".MaterialID", "string", "MaterialID"],
+        [".ProductionID", "string", "ProductionID"],
+        [".Cons_RawBarley_Item", "string", "Cons_RawBarley_Item"],
+        [".Cons_RawBarley_FromLot", "string", "Cons_RawBarley_FromLot"],
+        [".Prod_RoastedBarley_ToLot", "string", "Prod_RoastedBarley_ToLot"],
+        [".Prod_RoastedBarley_Item", "string", "Prod_RoastedBarley_Item"],
+        [".UtilizationState", "string", "UtilizationState"],
+        [".Utilization", "string", "Utilization"],
+        [".MaltAuger.PV", "string", "MaltAuger_PV"],
+        [".MaltAuger.AuxContact", "boolean", "MaltAuger_AuxContact"],
+        [".Scrap", "double", "Scrap"]
+    ]
+
+    # MaltMills
+    maltmill_properties = [
+        [".MaltPV", "double", "Malt_PV"],
+        [".MaltSP", "double", "Malt_SP"],
+        [".MaltAuger.AuxContact", "boolean", "MaltAuger_AuxContact"],
+        [".MaltAuger.PV", "string", "MaltAuger_PV"],
+        [".MaltMill.AuxContact", "boolean", "MaltMill_AuxContact"],
+        [".MaltMill.PV", "string", "MaltMill_PV"],
+        [".NewState", "string", "State"]
+    ]
+
+    # MashTuns
+    mashtun_properties = [
+        [".Agitator.AuxContact", "boolean", "Agitator_AuxContact"],
+        [".Agitator.PV", "string", "Agitator_PV"],
+        [".Cons_Malt_FromLot", "string", "Cons_Malt_FromLot"],
+        [".Cons_Malt_Item", "string", "Cons_Malt_Item"],
+        [".ConsList.Count", "integer", "Cons_Malt_Queued"],
+        [".ConsList.Overflow", "integer", "Cons_Malt_Overflow"],
+        [".HoldTime.PT", "integer", "HoldTime_PT"],
+        [".HoldTime.ET", "integer", "HoldTime_ET"],
+        [".LevelPV", "double", "Level_PV"],
+        [".MaterialID", "string", "MaterialID"],
+        [".NewState", "string", "State"],
+        [".NewStatus", "string", "Status"],
+        [".OutletPump.AuxContact", "boolean", "OutletPump_AuxContact"],
+        [".OutletPump.PV", "string", "OutletPump_PV"],
+        [".OutletValve.CLS", "boolean", "OutletValve_CLS"],
+        [".OutletValve.OLS", "boolean", "OutletValve_OLS"],
+        [".OutletValve.PV", "string", "OutletValve_PV"],
+        [".Prod_Wort_Item", "string", "Prod_Wort_Item"],
+        [".Prod_Wort_ToLot", "string", "Prod_Wort_ToLot"],
+        [".ProductionID", "string", "ProductionID"],
+        [".Scrap", "double", "Scrap"],
+        [".Scrap_ToLot", "string", "Scrap_ToLot"],
+        [".ShipComplete", "boolean", "ShipComplete"],
+        [".SoakTempSP1", "integer", "SoakTempSP1"],
+        [".SoakTempSP2", "integer", "SoakTempSP2"],
+        [".SoakTimeSP1", "integer", "SoakTimeSP1"],
+        [".SoakTimeSP2", "integer", "SoakTimeSP2"],
+        [".SteamValve.CLS", "boolean", "SteamValve_CLS"],
+        [".SteamValve.OLS", "boolean", "SteamValve_OLS"],
+        [".SteamValve.PV", "string", "SteamValve_PV"],
+        [".TemperaturePV", "double", "Temperature_PV"],
+        [".TemperatureSP", "integer", "Temperature_SP"],
+        [".UtilizationState", "string", "UtilizationState"],
+        [".Utilization", "string", "Utilization"],
+        [".WaterPV", "double", "Water_PV"],
+        [".WaterSP", "integer", "Water_SP"],
+        [".WaterValve.CLS", "boolean", "WaterValve_CLS"],
+        [".WaterValve.OLS", "boolean", "WaterValve_OLS"],
+        [".WaterValve.PV", "string", "WaterValve_PV"],
+        [".Wort_Item", "string", "Wort_Item"],
+        [".WortPV", "double", "Wort_PV"]
+    ]
+
+    # BoilKettles
+    boilkettle_properties = [
+        [".Cons_Hops_FromLot", "string", "Cons_Hops_FromLot"],
+        [".Cons_Hops_Item", "string", "Cons_Hops_Item"],
+        [".Cons_Wort_FromLot", "string", "Cons_Wort_FromLot"],
+        [".Cons_Wort_Item", "string", "Cons_Wort_Item"],
+        [".HoldTime.PT", "integer", "HoldTime_PT"],
+        [".HoldTime.ET", "integer", "HoldTime_ET"],
+        [".LevelPV", "double", "Level_PV"],
+        [".MaterialID", "string", "MaterialID"],
+        [".NewState", "string", "State"],
+        [".NewStatus", "string", "Status"],
+        [".OutletPump.AuxContact", "boolean", "OutletPump_AuxContact"],
+        [".OutletPump.PV", "string", "OutletPump_PV"],
+        [".InletValve.CLS", "boolean", "InletValve_CLS"],
+        [".InletValve.OLS", "boolean", "InletValve_OLS"],
+        [".InletValve.PV", "string", "InletValve_PV"],
+        [".OutletValve.CLS", "boolean", "OutletValve_CLS"],
+        [".OutletValve.OLS", "boolean", "OutletValve_OLS"],
+        [".OutletValve.PV", "string", "OutletValve_PV"],
+        [".Prod_BrewedWort_Item", "string", "Prod_BrewedWort_Item"],
+        [".Prod_BrewedWort_ToLot", "string", "Prod_BrewedWort_ToLot"],
+        [".ProductionID", "string", "ProductionID"],
+        [".Scrap", "double", "Scrap"],
+        [".SteamValve.CLS", "boolean", "SteamValve_CLS"],
+        [".SteamValve.OLS", "boolean", "SteamValve_OLS"],
+        [".SteamValve.PV", "string", "SteamValve_PV"],
+        [".TemperaturePV", "double", "Temperature_PV"],
+        [".TemperatureSP", "integer", "Temperature_SP"],
+        [".UtilizationState", "string", "UtilizationState"],
+        [".Utilization", "string", "Utilization"],
+        [".HopsAuger.AuxContact", "boolean", "HopsAuger_AuxContact"],
+        [".HopsAuger.PV", "string", "HopsAuger_PV"],
+        [".WortPV", "double", "Wort_PV"],
+        [".HopsPV", "double", "Hops_PV"],
+        [".HopsSP", "double", "Hops_SP"],
+        [".BrewedWortPV", "double", "BrewedWort_PV"]
+    ]
+
+    # Fermenters
+    fermenter_properties = [
+        [".ChillWaterValve.CLS", "boolean", "ChillWaterValve_CLS"],
+        [".ChillWaterValve.OLS", "boolean", "ChillWaterValve_OLS"],
+        [".ChillWaterValve.PV", "string", "ChillWaterValve_CLS"],
+        [".Cons_BrewedWort_FromLot", "string", "Cons_BrewedWort_FromLot"],
+        [".Cons_BrewedWort_Item", "string", "Cons_BrewedWort_Item"],
+        [".Cons_Yeast_FromLot", "string", "Cons_Yeast_FromLot"],
+        [".Cons_Yeast_Item", "string", "Cons_Yeast_Item"],
+        [".HoldTime.PT", "integer", "HoldTime_PT"],
+        [".HoldTime.ET", "integer", "HoldTime_ET"],
+        [".LevelPV", "double", "Level_PV"],
+        [".MaterialID", "string", "MaterialID"],
+        [".NewState", "string", "State"],
+        [".NewStatus", "string", "Status"],
+        [".InletValve.CLS", "boolean", "InletValve_CLS"],
+        [".InletValve.OLS", "boolean", "InletValve_OLS"],
+        [".InletValve.PV", "string", "InletValve_PV"],
+        [".OutletPump.AuxContact", "boolean", "OutletPump_AuxContact"],
+        [".OutletPump.PV", "string", "OutletPump_PV"],
+        [".OutletValve.CLS", "boolean", "OutletValve_CLS"],
+        [".OutletValve.OLS", "boolean", "OutletValve_OLS"],
+        [".Prod_GreenBeer_Item", "string", "Prod_GreenBeer_Item"],
+        [".Prod_GreenBeer_ToLot", "string", "Prod_GreenBeer_ToLot"],
+        [".ProductionID", "string", "ProductionID"],
+        [".Scrap", "double", "Scrap"],
+        [".ShipTo_Tank", "integer", "ShipTo_Tank"],
+        [".TemperaturePV", "double", "Temperature_PV"],
+        [".TemperatureSP", "integer", "Temperature_SP"],
+        [".UtilizationState", "string", "UtilizationState"],
+        [".Utilization", "string", "Utilization"],
+        [".YeastPV", "double", "Yeast_PV"],
+        [".YeastSP", "double", "Yeast_SP"],
+        [".YeastPump.AuxContact", "boolean", "YeastPump_AuxContact"],
+        [".YeastPump.PV", "string", "YeastPump_PV"],
+        [".GreenBeerPV", "double", "GreenBeer_PV"]
+    ]
+
+    # Bright Tank 301
+    tanks_properties = [
+        [".AllocatedFrom", "integer", "AllocatedFrom"],
+        [".ChillWaterValve.CLS", "boolean", "ChillWaterValve_CLS"],
+        [".ChillWaterValve.OLS", "boolean", "ChillWaterValve_OLS"],
+        [".ChillWaterValve.PV", "string", "ChillWaterValve_PV"],
+        [".Cons_GreenBeer_FromLot", "string", "Cons_GreenBeer_FromLot"],
+        [".Cons_GreenBeer_Item", "string", "Cons_GreenBeer_Item"],
+        [".HoldTime.PT", "integer", "HoldTime_PT"],
+        [".HoldTime.ET", "integer", "HoldTime_ET"],
+        [".LevelPV", "double", "Level_PV"],
+        [".MaterialID", "string", "MaterialID"],
+        [".NewState", "string", "State"],
+        [".NewStatus", "string", "Status"],
+        [".BeerPV", "double", "Beer_PV"],
+        [".BeerSP", "double", "Beer_SP"],
+        [".InletValve.CLS", "boolean", "InletValve_CLS"],
+        [".InletValve.OLS", "boolean", "InletValve_OLS"],
+        [".InletValve.PV", "string", "InletValve_PV"],
+        [".OutletPump.AuxContact", "boolean", "OutletPump_AuxContact"],
+        [".OutletPump.PV", "string", "OutletPump_PV"],
+        [".OutletValve.CLS", "boolean", "OutletValve_CLS"],
+        [".OutletValve.OLS", "boolean", "OutletValve_OLS"],
+        [".OutletValve.PV", "string", "OutletValve_PV"],
+        [".Prod_Beer_Item", "string", "Prod_Beer_Item"],
+        [".Prod_Beer_ToLot", "string", "Prod_Beer_ToLot"],
+        [".ProductionID", "string", "ProductionID"],
+        [".TemperaturePV", "double", "Temperature_PV"],
+        [".TemperatureSP", "integer", "Temperature_SP"],
+        [".UtilizationState", "string", "UtilizationState"],
+        [".Utilization", "string", "Utilization"],
+        [".BeerShipped", "double", "BeerShipped"],
+        [".ShipToTank", "integer", "ShipTo_Tank"]
+    ]
+
+    # BottlingLines
+    bottling_properties = [
+        [".AllocatedFrom", "integer", "AllocatedFrom"],
+        [".BeerPV", "double", "Beer_PV"],
+        [".BottlePV", "double", "Bottle_PV"],
+        [".BottleSP", "double", "Bottle_SP"],
+        [".Cons_Beer_FromLot", "string", "Cons_Beer_FromLot"],
+        [".Cons_Beer_Item", "string", "Cons_Beer_Item"],
+        [".Cons_Bottle_FromLot", "string", "Cons_Bottle_FromLot"],
+        [".Cons_Bottle_Item", "string", "Cons_Bottle_Item"],
+        [".Cons_Cap_FromLot", "string", "Cons_Cap_FromLot"],
+        [".Cons_Cap_Item", "string", "Cons_Cap_Item"],
+        [".Cons_Label_FromLot", "string", "Cons_Label_FromLot"],
+        [".Cons_Label_Item", "string", "Cons_Label_Item"],
+        [".LevelPV", "double", "Level_PV"],
+        [".MaterialID", "string", "MaterialID"],
+        [".Prod_BottledBeer_Item", "string", "Prod_BottledBeer_Item"],
+        [".Prod_BottledBeer_ToLot", "string", "Prod_BottledBeer_ToLot"],
+        [".ProductionID", "string", "ProductionID"],
+        [".TemperaturePV", "double", "Temperature_PV"],
+        [".TemperatureSP", "integer", "Temperature_SP"],
+        [".HoldTime.PT", "integer", "HoldTime_PT"],
+        [".HoldTime.ET", "integer", "HoldTime_ET"],
+        [".NewState", "string", "State"],
+        [".NewStatus", "string", "Status"],
+        [".UtilizationState", "string", "UtilizationState"],
+        [".Utilization", "string", "Utilization"],
+        [".Scrap", "double", "Scrap"],
+        [".SpeedPV", "double", "Speed_PV"],
+        [".SpeedSP", "integer", "Speed_SP"]
+    ]
+
+    # IoT SiteWise assets - [area name, asset name, properties] used to construct the property aliases
+    sitewise_assets = [
+        ["Roasting", "Roaster100", roaster_properties],
+        ["Roasting", "Roaster200", roaster_properties],
+        ["Mashing", "MaltMill100", maltmill_properties],
+        ["Mashing", "MaltMill200", maltmill_properties],
+        ["Mashing", "MashTun100", mashtun_properties],
+        ["Mashing", "MashTun200", mashtun_properties],
+        ["Brewing", "BoilKettle100", boilkettle_properties],
+        ["Brewing", "BoilKettle200", boilkettle_properties],
+        ["Fermentation", "Fermenter100", fermenter_properties],
+        ["Fermentation", "Fermenter200", fermenter_properties],
+        ["BeerStorage", "BrightTank301", tanks_properties],
+        ["BeerStorage", "BrightTank302", tanks_properties],
+        ["BeerStorage", "BrightTank303", tanks_properties],
+        ["BeerStorage", "BrightTank304", tanks_properties],
+        ["BeerStorage", "BrightTank305", tanks_properties],
+        ["Bottling", "BottleLine401", bottling_properties],
+        ["Bottling", "BottleLine402", bottling_properties],
+        ["Bottling", "BottleLine403", bottling_properties]
+    ]
 
     # Parse parameters to start the simulation
     parser = argparse.ArgumentParser(description='Simulation Parameters')
     parser.add_argument('--publishtositewise', dest='publishtositewise', default='False', choices=('True','False'), help='Publish to IoT SiteWise (default=False)')
     parser.add_argument('--interval', dest='interval', default=5, type=int, help='Interval in seconds to publish to IoT SiteWise (default=5)')
+    parser.add_argument('--config', dest='config', default="", type=str, help='JSON runtime configuration document (version, IoT SiteWise interval and asset tunables such as setpoint ranges and PerformanceTargetPercent) watched and applied between scans without a restart, "" to disable (default="")')
+    parser.add_argument('--configcheckinterval', dest='configcheckinterval', default=2, type=float, help='Interval in seconds to check the runtime configuration document for changes (default=2)')
     parser.add_argument('--region', dest='region', default="us-west-2", type=str, help='AWS Region to publish to (default=us-west-2)')
+    parser.add_argument('--reportbyexception', dest='reportbyexception', default='True', choices=('True','False'), help='Only publish changed values to IoT SiteWise (default=True)')
+    parser.add_argument('--deadband', dest='deadband', default=0.0, type=float, help='Default deadband for numeric values when reporting by exception (default=0.0)')
+    parser.add_argument('--deadbands', dest='deadbands', default="", type=str, help='Per property deadbands when reporting by exception, i.e. "Temperature_PV=0.5,Level_PV=0.1" (default="")')
+    parser.add_argument('--aggregate', dest='aggregate', default='False', choices=('True','False'), help='Publish interval aggregates instead of raw samples for the aggregated properties to IoT SiteWise (default=False)')
+    parser.add_argument('--aggregateproperties', dest='aggregateproperties', default="Temperature_PV,Level_PV,Speed_PV,Beer_PV", type=str, help='Properties to aggregate when --aggregate=True (default="Temperature_PV,Level_PV,Speed_PV,Beer_PV")')
+    parser.add_argument('--heartbeat', dest='heartbeat', default=600, type=int, help='Seconds after which unchanged values are published again when reporting by exception (default=600)')
+    parser.add_argument('--sinks', dest='sinks', default="", type=str, help='Additional outputs of the scan values, comma separated list of "stdout", "file", "udp", "mqtt", "shm", "uadp", "record" (default="")')
+    parser.add_argument('--sinkfile', dest='sinkfile', default="brewery.ndjson", type=str, help='File written by the "file" sink (default=brewery.ndjson)')
+    parser.add_argument('--udptarget', dest='udptarget', default="127.0.0.1:4842", type=str, help='Destination host:port of the "udp" sink (default=127.0.0.1:4842)')
+    parser.add_argument('--mqttbroker', dest='mqttbroker', default="127.0.0.1:1883", type=str, help='MQTT broker host:port of the "mqtt" sink (default=127.0.0.1:1883)')
+    parser.add_argument('--mqttqos', dest='mqttqos', default=0, type=int, choices=(0,1), help='MQTT QoS of the "mqtt" sink (default=0)')
+    parser.add_argument('--mqttformat', dest='mqttformat', default='json', choices=('json','cbor'), help='Message format of the "mqtt" sink (default=json)')
+    parser.add_argument('--mqttscangroup', dest='mqttscangroup', default=10, type=int, help='Number of scans published in one message per asset by the "mqtt" sink (default=10)')
+    parser.add_argument('--mqtttopicprefix', dest='mqtttopicprefix', default="", type=str, help='Prefix of the asset topics of the "mqtt" sink, i.e. "$aws/rules/BreweryIngest" (default="")')
+    parser.add_argument('--shmpath', dest='shmpath', default=None, type=str, help='Shared tag table written by the "shm" sink (default=/dev/shm/brewery_tags)')
+    parser.add_argument('--uadptargets', dest='uadptargets', default="239.0.0.1:4840", type=str, help='Comma separated host:port list of the OPC UA PubSub UADP NetworkMessages of the "uadp" sink, multicast groups or unicast subscribers (default=239.0.0.1:4840)')
+    parser.add_argument('--uadppublisherid', dest='uadppublisherid', default=1, type=int, help='UInt16 PublisherId of the "uadp" sink (default=1)')
+    parser.add_argument('--uadpkeyframe', dest='uadpkeyframe', default=10, type=int, help='Number of scans between the key frames (all fields of every asset) of the "uadp" sink, delta frames with the changed fields are sent in between (default=10)')
+    parser.add_argument('--uadpmetadata', dest='uadpmetadata', default="brewery_uadp.json", type=str, help='DataSetMetaData (field names and datatypes of every DataSetWriter) written by the "uadp" sink for the subscribers (default=brewery_uadp.json)')
+    parser.add_argument('--recordpath', dest='recordpath', default="brewery.tlog", type=str, help='Tag log written by the "record" sink, the changed tags of every scan for --replay (default=brewery.tlog)')
+    parser.add_argument('--replay', dest='replay', default="", type=str, help='Tag log recorded by the "record" sink to replay to the OPC UA Server and the outputs instead of simulating the plant (default="")')
+    parser.add_argument('--replayspeed', dest='replayspeed', default=1.0, type=float, help='Replay speed as a multiple of the recorded scan rate, 0 to replay as fast as possible (default=1.0)')
+    parser.add_argument('--replayloop', dest='replayloop', default='True', choices=('True','False'), help='Replay the tag log again when it ends, the scan times keep increasing (default=True)')
+    parser.add_argument('--amplify', dest='amplify', default=0, type=int, help='Number of derived tags each amplified tag is cloned into, under the Synthetic OPC UA object and IoT SiteWise aliases, to stress test collectors, 0 to disable (default=0)')
+    parser.add_argument('--amplifyproperties', dest='amplifyproperties', default="_PV", type=str, help='Comma separated suffixes of the properties amplified by --amplify, i.e. "Temperature_PV,Level_PV" (default="_PV")')
+    parser.add_argument('--amplifyopc', dest='amplifyopc', default='True', choices=('True','False'), help='Publish the derived tags to the OPC UA Server, False to only publish them to IoT SiteWise and the outputs (default=True)')
+    parser.add_argument('--amplifyevery', dest='amplifyevery', default=10, type=int, help='Number of scans between updates of the derived tags, 10 for 1 Hz (default=10)')
+    parser.add_argument('--amplifylag', dest='amplifylag', default=50, type=int, help='Maximum phase offset in scans of the derived tags (default=50)')
+    parser.add_argument('--amplifynoise', dest='amplifynoise', default=0.01, type=float, help='Gaussian noise of the numeric derived tags, relative to their value (default=0.01)')
+    parser.add_argument('--oee', dest='oee', default='False', choices=('True','False'), help='Compute the Availability, Performance, Quality and OEE of every asset and area over rolling 5 minute, hour and shift windows, published to the OPC UA Server and the outputs (default=False)')
+    parser.add_argument('--oeeinterval', dest='oeeinterval', default=5, type=int, help='Interval in seconds to update the OEE measures (default=5)')
+    parser.add_argument('--oeeshifthours', dest='oeeshifthours', default=8, type=float, help='Length of the shift window of the OEE in hours (default=8)')
+    parser.add_argument('--genealogy', dest='genealogy', default='False', choices=('True','False'), help='Record the lot genealogy (which lots were consumed to produce which lots) for trace back and trace forward queries (default=False)')
+    parser.add_argument('--genealogypath', dest='genealogypath', default="brewery_genealogy.ndjson", type=str, help='Append only edge log of the lot genealogy, read back when the simulator starts (default=brewery_genealogy.ndjson)')
+    parser.add_argument('--genealogyport', dest='genealogyport', default=0, type=int, help='Port of the lot genealogy queries http://host:port/genealogy/back?lot=..., /genealogy/forward?lot=... and /genealogy/production?id=..., 0 to disable (default=0)')
+    parser.add_argument('--burst', dest='burst', default='off', choices=('off',) + BurstGenerator.Modes, help='Change storms to test the backpressure of OPC UA clients and collectors, "estop" (plant wide emergency stop) or "values" (offsets every numeric tag every scan) (default=off)')
+    parser.add_argument('--burststart', dest='burststart', default=60, type=float, help='Seconds from the start of the simulation to the first burst (default=60)')
+    parser.add_argument('--burstduration', dest='burstduration', default=10, type=float, help='Duration of a burst in seconds, the OPC UA subscriptions are sampled for as long again after it (default=10)')
+    parser.add_argument('--burstevery', dest='burstevery', default=0, type=float, help='Seconds between the start of two bursts, 0 for a single burst (default=0)')
+    parser.add_argument('--burstrate', dest='burstrate', default=1.0, type=float, help='Fraction of the assets ("estop") or numeric tags ("values") changed every scan of a burst (default=1.0)')
+    parser.add_argument('--burstlog', dest='burstlog', default="brewery_bursts.ndjson", type=str, help='File the OPC UA subscription queue depths and dropped notifications sampled every scan of a burst are appended to (default=brewery_bursts.ndjson)')
+    parser.add_argument('--history', dest='history', default='False', choices=('True','False'), help='Keep the tag history in process for OPC UA HistoryRead (default=False)')
+    parser.add_argument('--historypath', dest='historypath', default="history", type=str, help='Directory of the tag history segment files (default=history)')
+    parser.add_argument('--historymemoryminutes', dest='historymemoryminutes', default=10, type=int, help='Minutes of raw tag history kept in memory (default=10)')
+    parser.add_argument('--historydiskminutes', dest='historydiskminutes', default=60, type=int, help='Minutes of raw tag history kept on disk after the memory history (default=60)')
+    parser.add_argument('--sinkqueuesize', dest='sinkqueuesize', default=100, type=int, help='Number of scans each output can fall behind (default=100)')
+    parser.add_argument('--sinkpolicy', dest='sinkpolicy', default='drop', choices=('drop','block'), help='Drop scans or block the simulation when an output falls behind (default=drop)')
+    parser.add_argument('--sinkstatsinterval', dest='sinkstatsinterval', default=60, type=int, help='Interval in seconds to print the output statistics, 0 to disable (default=60)')
+    parser.add_argument('--allocationpolicy', dest='allocationpolicy', default='lru', choices=VesselPool.Policies, help='Policy used to allocate the Bright Tank a Fermenter and the Bottling Line a Bright Tank ships to, "firstfit" always prefers the lowest numbered vessel (default=lru)')
+    parser.add_argument('--wipcapacity', dest='wipcapacity', default=21, type=int, help='Number of Roaster lots each MashTun can hold waiting to be consumed, further lots are counted as overflow (default=21)')
+    parser.add_argument('--wippolicy', dest='wippolicy', default='fifo', choices=LotBuffer.Policies, help='Order in which a MashTun consumes the waiting Roaster lots (default=fifo)')
+    parser.add_argument('--plantname', dest='plantname', default='', type=str, help='Name of the plant in its lot numbers and ProductionIDs (i.e. GB-A1-0KX3F201), letters and digits, every simulator running at the same time needs its own name, "" for a name derived from the host name (default="")')
+    parser.add_argument('--lotnumberpath', dest='lotnumberpath', default="brewery_lotnumbers.json", type=str, help='File of the seconds reserved by the lot numbers, so a restarted simulator does not number lots again in a second it already used, "" to not reserve them (default=brewery_lotnumbers.json)')
+    parser.add_argument('--profile', dest='profile', default='False', choices=('True','False'), help='Profile the Run() of every asset and the sections of the scan, published under the Diagnostics OPC UA object (default=False)')
+    parser.add_argument('--profileevery', dest='profileevery', default=100, type=int, help='Profile one scan out of N when --profile=True, 1 to profile every scan (default=100)')
+    parser.add_argument('--profileinterval', dest='profileinterval', default=10, type=int, help='Interval in seconds to update the Diagnostics OPC UA object (default=10)')
+    parser.add_argument('--opcserver', dest='opcserver', default='opcua', choices=('opcua','asyncua'), help='OPC UA Server implementation, "opcua" (python-opcua, thread based) or "asyncua" (asyncio event loop, values handed over once per scan) (default=opcua)')
+    parser.add_argument('--metricsport', dest='metricsport', default=0, type=int, help='Port of the Prometheus metrics endpoint http://host:port/metrics (scan duration and overruns, OPC UA writes, output and IoT SiteWise health, assets per state), 0 to disable (default=0)')
 
     args = parser.parse_args()
 
     publishtositewise = args.publishtositewise == 'True'
     interval = int(args.interval)
     region = args.region
+    reportbyexception = args.reportbyexception == 'True'
+    aggregate = args.aggregate == 'True'
+    aggregate_properties = [name.strip() for name in args.aggregateproperties.split(",")]
+    history = args.history == 'True'
+    profile = args.profile == 'True'
+    asyncopc = args.opcserver == 'asyncua'
+    replay = args.replay != ""
+    replayloop = args.replayloop == 'True'
+
+    # Initialize IoT SiteWise Report by Exception filter
+    rbe = ReportByException(args.deadband, args.heartbeat, ReportByException.ParseDeadbands(args.deadbands))
     
     # Initailize IoT SiteWise Client connection
     client = boto3.client('iotsitewise', region_name=region)
+
+    # Initialize outputs (sinks) of the scan values
+    sinks = []
+    if (publishtositewise):
+        sinks.append(SiteWiseSink(client, interval, rbe if reportbyexception else None, aggregate_properties if aggregate else None, args.sinkqueuesize, args.sinkpolicy))
+
+    for sink_name in args.sinks.split(","):
+        match sink_name.strip():
+            case "":
+                pass
+            case "stdout":
+                sinks.append(FileSink("-", args.sinkqueuesize, args.sinkpolicy))
+            case "file":
+                sinks.append(FileSink(args.sinkfile, args.sinkqueuesize, args.sinkpolicy))
+            case "udp":
+                udp_host, udp_port = args.udptarget.rsplit(":", 1)
+                sinks.append(UdpSink(udp_host, int(udp_port), args.sinkqueuesize, args.sinkpolicy))
+            case "mqtt":
+                mqtt_host, mqtt_port = args.mqttbroker.rsplit(":", 1)
+                sinks.append(MqttSink(mqtt_host, int(mqtt_port), args.mqttqos, args.mqttformat, args.mqttscangroup, args.mqtttopicprefix, "BrewerySimulator", args.sinkqueuesize, args.sinkpolicy))
+            case "shm":
+                sinks.append(SharedMemorySink(args.shmpath, args.sinkqueuesize, args.sinkpolicy))
+            case "uadp":
+                uadp_targets = [(host, int(port)) for host, port in [target.strip().rsplit(":", 1) for target in args.uadptargets.split(",")]]
+                sinks.append(UadpSink(uadp_targets, args.uadppublisherid, 1, args.uadpkeyframe, 1400, args.uadpmetadata, args.sinkqueuesize, args.sinkpolicy))
+            case "record":
+                sinks.append(RecordSink(args.recordpath, args.sinkqueuesize, args.sinkpolicy))
+            case _:
+                parser.error("unknown sink '{0}'".format(sink_name))
+
+    # Initialize the in process tag history (segments of 600 scans, 1 minute at the 100 millisecond scan rate)
+    if (history):
+        history_sink = HistorySink(args.historypath, 600, args.historymemoryminutes, args.historydiskminutes, QueueSize=args.sinkqueuesize, Policy=args.sinkpolicy)
+        sinks.append(history_sink)
     
-    # Initailize OPC UA Server
-    server = Server()        
+    # Initailize OPC UA Server - asyncua serves the clients on its own event loop, the values are handed over once per scan
+    if (asyncopc):
+        server = AsyncOpcServer()
+    else:
+        server = Server()
     print("Started OPC server")
     ##############################################################################
     ############################## ATTENTION #####################################
@@ -507,6 +578,8 @@ if __name__ == "__main__":
     M100_Agitator_PV = AssetMashTun100.add_variable(addspace, "Agitator_PV", 0, ua.VariantType.String)
     M100_Cons_Malt_FromLot = AssetMashTun100.add_variable(addspace, "Cons_Malt_FromLot", 0, ua.VariantType.String)
     M100_Cons_Malt_Item = AssetMashTun100.add_variable(addspace, "Cons_Malt_Item", 0, ua.VariantType.String)
+    M100_Cons_Malt_Queued = AssetMashTun100.add_variable(addspace, "Cons_Malt_Queued", 0, ua.VariantType.Int64)
+    M100_Cons_Malt_Overflow = AssetMashTun100.add_variable(addspace, "Cons_Malt_Overflow", 0, ua.VariantType.Int64)
     M100_HoldTime_PT = AssetMashTun100.add_variable(addspace, "HoldTime_PT", 0, ua.VariantType.Int64)
     M100_HoldTime_ET = AssetMashTun100.add_variable(addspace, "HoldTime_ET", 0, ua.VariantType.Int64)
     M100_Level_PV = AssetMashTun100.add_variable(addspace, "Level_PV", 0, ua.VariantType.Double)
@@ -557,6 +630,8 @@ if __name__ == "__main__":
     M200_Agitator_PV = AssetMashTun200.add_variable(addspace, "Agitator_PV", 0, ua.VariantType.String)
     M200_Cons_Malt_FromLot = AssetMashTun200.add_variable(addspace, "Cons_Malt_FromLot", 0, ua.VariantType.String)
     M200_Cons_Malt_Item = AssetMashTun200.add_variable(addspace, "Cons_Malt_Item", 0, ua.VariantType.String)
+    M200_Cons_Malt_Queued = AssetMashTun200.add_variable(addspace, "Cons_Malt_Queued", 0, ua.VariantType.Int64)
+    M200_Cons_Malt_Overflow = AssetMashTun200.add_variable(addspace, "Cons_Malt_Overflow", 0, ua.VariantType.Int64)
     M200_HoldTime_PT = AssetMashTun200.add_variable(addspace, "HoldTime_PT", 0, ua.VariantType.Int64)
     M200_HoldTime_ET = AssetMashTun200.add_variable(addspace, "HoldTime_ET", 0, ua.VariantType.Int64)
     M200_Level_PV = AssetMashTun200.add_variable(addspace, "Level_PV", 0, ua.VariantType.Double)
@@ -996,861 +1071,267 @@ if __name__ == "__main__":
     BL403_Utilization = AssetBottleLine403.add_variable(addspace, "Utilization", 0, ua.VariantType.String)        
     BL403_Scrap = AssetBottleLine403.add_variable(addspace, "Scrap", 0, ua.VariantType.Double)
 
-    # Create instances of virtual physical assets (aka IoT SiteWise/TwinMaker digital twins)
-    Roaster100 = Roaster("Roaster100")
-    Roaster200 = Roaster("Roaster200")
-    MaltMill100 = MaltMill("MaltMill100")
-    MaltMill200 = MaltMill("MaltMill200")
-    MashTun100 = Mash("MashTun100")
-    MashTun200 = Mash("MashTun200")  
-    BoilKettle100 = BoilKettle("BoilKettle100")  
-    BoilKettle200 = BoilKettle("BoilKettle200")
-    Fermenter100 = Fermenter("Fermenter100")
-    Fermenter200 = Fermenter("Fermenter200")
-    BrightTank301 = BrightTank("BrightTank301")
-    BrightTank302 = BrightTank("BrightTank302")
-    BrightTank303 = BrightTank("BrightTank303")
-    BrightTank304 = BrightTank("BrightTank304")
-    BrightTank305 = BrightTank("BrightTank305")
-    BottleLine401 = BottleLine("BottleLine401")
-    BottleLine402 = BottleLine("BottleLine402")
-    BottleLine403 = BottleLine("BottleLine403")    
-
-    # Local variables for asset integration
-    assignmentMade = False    
-
-    R100MatTransOS = False
-    R200MatTransOS = False    
-
-    FerShipToTime100 = Timer("FerShipToTime100")
-    FerShipToTime200 = Timer("FerShipToTime200")
-
-    FerShipToTime100.PT = 15 
-    FerShipToTime200.PT = 15    
+    # Create the plant - virtual physical assets (aka IoT SiteWise/TwinMaker digital twins), material transfers and allocations
+    plant = Plant(args.allocationpolicy, args.wipcapacity, args.wippolicy, args.plantname if args.plantname != "" else None, args.lotnumberpath if args.lotnumberpath != "" else None)
+    print("Lots and ProductionIDs numbered as plant {0}".format(plant.LotNumbers.Plant))
+
+    # Assets of the plant mapped to the OPC Data Items below
+    Roaster100 = plant.Roaster100
+    Roaster200 = plant.Roaster200
+    MaltMill100 = plant.MaltMill100
+    MaltMill200 = plant.MaltMill200
+    MashTun100 = plant.MashTun100
+    MashTun200 = plant.MashTun200
+    BoilKettle100 = plant.BoilKettle100
+    BoilKettle200 = plant.BoilKettle200
+    Fermenter100 = plant.Fermenter100
+    Fermenter200 = plant.Fermenter200
+    BrightTank301 = plant.BrightTank301
+    BrightTank302 = plant.BrightTank302
+    BrightTank303 = plant.BrightTank303
+    BrightTank304 = plant.BrightTank304
+    BrightTank305 = plant.BrightTank305
+    BottleLine401 = plant.BottleLine401
+    BottleLine402 = plant.BottleLine402
+    BottleLine403 = plant.BottleLine403
+
+    # Tags published to the sinks, one per IoT SiteWise asset property - values are read with [asset, getter]
+    tags = []
+    tag_getters = []
+    for area_name, asset_name, properties in sitewise_assets:
+        for prop in properties:
+            alias = "/{}/{}/{}/{}/{}".format(enterprise_name,plant_name,area_name,asset_name,prop[2])
+            # Skip properties listed twice with the same alias
+            if any(tag.Alias == alias for tag in tags):
+                continue
+            tags.append(Tag(area_name, asset_name, prop[2], prop[1], alias))
+            # State and Status are integer codes in the simulation, the outputs receive the display strings
+            match prop[0]:
+                case ".NewState":
+                    getter = lambda asset: NewStateNames[asset.NewState]
+                case ".NewStatus":
+                    getter = lambda asset: NewStatusNames[asset.NewStatus]
+                case _:
+                    getter = operator.attrgetter(prop[0][1:])
+            tag_getters.append([eval(asset_name), getter])
+
+    # Answer OPC UA HistoryRead requests of the asset property nodes from the in process tag history
+    if (history) and (asyncopc):
+        print("OPC UA HistoryRead is not supported by the asyncua OPC UA Server, the tag history is kept but not served")
+    elif (history):
+        history_storage = HistoryStorage(history_sink)
+        server.iserver.history_manager.set_storage(history_storage)
+        for index, tag in enumerate(tags):
+            try:
+                history_storage.Register(eval("Asset" + tag.Asset).get_child(["{0}:{1}".format(addspace, tag.Property)]), index)
+            except ua.UaError:
+                # IoT SiteWise property without an OPC UA node
+                pass
+        print("Tag history enabled for {0} OPC UA nodes".format(len(history_storage.Nodes)))
+
+    # OPC UA variable of every tag, written by the replay and the "values" bursts
+    if (replay) or (args.burst == "values"):
+        tag_variables = []
+        for tag in tags:
+            try:
+                tag_variables.append(eval("Asset" + tag.Asset).get_child(["{0}:{1}".format(addspace, tag.Property)]))
+            except ua.UaError:
+                # IoT SiteWise property without an OPC UA node
+                tag_variables.append(None)
+
+    # Replay a recorded tag log instead of simulating the plant - values are written to the OPC UA variable of every tag
+    replayer = None
+    if (replay):
+        replayer = TagReplayer(args.replay, tags, args.replayspeed, replayloop)
+        replay_values = [getter(asset) for asset, getter in tag_getters]
+        print("Replaying {0} at {1}, {2} tags without recorded values keep their initial value".format(args.replay, "{0}x".format(args.replayspeed) if args.replayspeed > 0 else "max speed", replayer.Missing))
+
+    # Scheduled change storms, the OPC UA subscription backlog is sampled during the bursts
+    burst = None
+    if (args.burst != "off"):
+        subscription_monitor = SubscriptionMonitor(server.Server.aio_obj.iserver.subscription_service if (asyncopc) else server.iserver.subscription_service)
+        burst_variables = []
+        if (args.burst == "values"):
+            burst_variables = [[index, tag_variables[index], tag.DataType] for index, tag in enumerate(tags) if (tag.DataType in ("double", "integer")) and (tag_variables[index] is not None)]
+        burst = BurstGenerator(args.burst, plant.Assets, burst_variables, args.burststart, args.burstduration, args.burstevery, args.burstrate, subscription_monitor, args.burstlog)
+
+    # Amplify the tags into derived tags under the Synthetic object, published to the OPC UA Server and the outputs
+    amplifier = None
+    if (args.amplify > 0):
+        amplifier = TagAmplifier(tags, args.amplify, [name.strip() for name in args.amplifyproperties.split(",")], args.amplifyevery, args.amplifylag, args.amplifynoise)
+        amplifier_variables = []
+        if (args.amplifyopc == 'True'):
+            Synthetic = Site.add_object(addspace, "Synthetic")
+            amplifier_objects = {}
+            for tag in amplifier.Tags:
+                if tag.Asset not in amplifier_objects:
+                    amplifier_objects[tag.Asset] = Synthetic.add_object(addspace, tag.Asset)
+                variant_type = ua.VariantType.Double if tag.DataType == "double" else ua.VariantType.Boolean if tag.DataType == "boolean" else ua.VariantType.String
+                amplifier_variables.append(amplifier_objects[tag.Asset].add_variable(addspace, tag.Property, False if tag.DataType == "boolean" else 0.0 if tag.DataType == "double" else "", variant_type))
+        tags = tags + amplifier.Tags
+        print("Amplified {0} tags into {1} derived tags".format(len(amplifier.Numeric) + len(amplifier.Discrete), len(amplifier.Tags)))
+
+    # Streaming OEE of every asset and area, published under the asset and area objects and to the outputs
+    oee = None
+    if (args.oee == 'True') and (replay):
+        print("The OEE is computed from the simulated plant, it is not computed when replaying a tag log")
+    elif (args.oee == 'True'):
+        oee = OeeCalculator([[area_name, asset_name, eval(asset_name)] for area_name, asset_name, properties in sitewise_assets], "/{}/{}".format(enterprise_name, plant_name), args.oeeshifthours, args.oeeinterval)
+        oee_variables = []
+        for tag in oee.Tags:
+            # Area measures are published on the area object, their asset is the area
+            parent = eval(tag.Area + "Area") if (tag.Asset == tag.Area) else eval("Asset" + tag.Asset)
+            oee_variables.append(parent.add_variable(addspace, tag.Property, 0.0, ua.VariantType.Double))
+        tags = tags + oee.Tags
+        print("OEE of {0} assets and {1} areas over the {2} windows".format(len(oee.Assets), len(oee.Areas), ", ".join(name for name, length in oee.Windows)))
+
+    # Lot genealogy recorded from the lot transfers of the plant, queried over HTTP
+    genealogy = None
+    genealogy_endpoint = None
+    if (args.genealogy == 'True') and (replay):
+        print("The lot genealogy is recorded from the simulated plant, it is not recorded when replaying a tag log")
+    elif (args.genealogy == 'True'):
+        genealogy = LotGenealogy(args.genealogypath, plant.Assets)
+        print("Lot genealogy of {0} lots and {1} lot transfers read from {2}".format(len(genealogy.Lots), genealogy.Loaded, args.genealogypath))
+        if (args.genealogyport > 0):
+            genealogy_endpoint = GenealogyEndpoint(args.genealogyport, genealogy)
+
+    # Runtime configuration - the asset tunables and the IoT SiteWise interval change without restarting the simulator
+    runtime_config = None
+    if (args.config != ""):
+        runtime_config = RuntimeConfig(args.config, plant.Assets, interval, args.configcheckinterval)
+        print("Watching the runtime configuration {0} every {1} seconds".format(args.config, args.configcheckinterval))
+        runtime_config.Poll(time.time())
+        for sink in sinks:
+            if isinstance(sink, SiteWiseSink):
+                sink.Interval = runtime_config.Interval
+
+    # Simulator metrics, updated by the scan or read from the assets and outputs when scraped
+    assets = [eval(asset_name) for area_name, asset_name, properties in sitewise_assets]
+    opc_variables = sum(len(eval("Asset" + asset_name).get_children()) for area_name, asset_name, properties in sitewise_assets)
+    # The OEE variables of the assets are only written every --oeeinterval
+    if (oee is not None):
+        opc_variables = opc_variables - sum(1 for tag in oee.Tags if tag.Asset != tag.Area)
+
+    metrics = Metrics()
+    scans_total = metrics.Counter("brewsim_scans_total", "Scans of the simulation")
+    scan_overruns = metrics.Counter("brewsim_scan_overruns_total", "Scans taking longer than the 100 millisecond scan rate")
+    scan_duration = metrics.Histogram("brewsim_scan_duration_seconds", "Duration of the scan without the wait for the next scan", [0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0])
+    opc_writes = metrics.Counter("brewsim_opc_writes_total", "Values written to the OPC UA variables")
+    metrics.Collect("brewsim_assets", "gauge", "Assets in each state", lambda: [[{"state": name}, sum(1 for asset in assets if asset.NewState == state)] for state, name in enumerate(NewStateNames)])
+    metrics.Collect("brewsim_sink_received_total", "counter", "Scans received by the output", lambda: [[{"sink": sink.Name}, sink.Received] for sink in sinks])
+    metrics.Collect("brewsim_sink_processed_total", "counter", "Scans processed by the output", lambda: [[{"sink": sink.Name}, sink.Processed] for sink in sinks])
+    metrics.Collect("brewsim_sink_dropped_total", "counter", "Scans dropped because the output fell behind", lambda: [[{"sink": sink.Name}, sink.Dropped] for sink in sinks])
+    metrics.Collect("brewsim_sink_errors_total", "counter", "Errors of the output", lambda: [[{"sink": sink.Name}, sink.Errors] for sink in sinks])
+    metrics.Collect("brewsim_sink_queue_depth", "gauge", "Scans waiting in the queue of the output", lambda: [[{"sink": sink.Name}, sink.Queue.qsize()] for sink in sinks])
+    metrics.Collect("brewsim_sink_lag_seconds", "gauge", "Age of the last scan processed by the output", lambda: [[{"sink": sink.Name}, sink.Lag] for sink in sinks])
+    metrics.Collect("brewsim_sitewise_api_calls_total", "counter", "IoT SiteWise BatchPutAssetPropertyValue calls", lambda: [[{}, sink.ApiCalls] for sink in sinks if isinstance(sink, SiteWiseSink)])
+    metrics.Collect("brewsim_sitewise_api_errors_total", "counter", "IoT SiteWise BatchPutAssetPropertyValue errors", lambda: [[{}, sink.ApiErrors] for sink in sinks if isinstance(sink, SiteWiseSink)])
+    metrics.Collect("brewsim_sitewise_rejected_entries_total", "counter", "Entries rejected by IoT SiteWise in the errorEntries of a BatchPutAssetPropertyValue call", lambda: [[{}, sink.RejectedEntries] for sink in sinks if isinstance(sink, SiteWiseSink)])
+    metrics.Collect("brewsim_sitewise_pending_aggregates", "gauge", "Aggregate entries a failed BatchPutAssetPropertyValue call did not send, sent by the next publish", lambda: [[{}, len(sink.PendingAggregates)] for sink in sinks if isinstance(sink, SiteWiseSink)])
+    metrics.Collect("brewsim_sitewise_dropped_aggregates_total", "counter", "Aggregate entries dropped after failed BatchPutAssetPropertyValue calls", lambda: [[{}, sink.DroppedAggregates] for sink in sinks if isinstance(sink, SiteWiseSink)])
+    if (burst is not None):
+        metrics.Collect("brewsim_burst_active", "gauge", "A change storm is running", lambda: [[{"mode": burst.Mode}, 1 if burst.Active else 0]])
+        metrics.Collect("brewsim_subscription_queued_notifications", "gauge", "Data change notifications queued for the next publish, sampled during the bursts", lambda: [[{}, subscription_monitor.Queued]])
+        metrics.Collect("brewsim_subscription_unacknowledged_results", "gauge", "Publish results not acknowledged by the clients, sampled during the bursts", lambda: [[{}, subscription_monitor.Unacknowledged]])
+        metrics.Collect("brewsim_subscription_dropped_notifications_total", "counter", "Notifications dropped because the queue of the monitored item was full", lambda: [[{}, subscription_monitor.Dropped]])
+    if (genealogy is not None):
+        metrics.Collect("brewsim_genealogy_lots", "gauge", "Lots of the lot genealogy", lambda: [[{}, len(genealogy.Lots)]])
+        metrics.Collect("brewsim_genealogy_transfers", "gauge", "Lot transfers (edges) of the lot genealogy", lambda: [[{}, len(genealogy.Edges)]])
+    if (runtime_config is not None):
+        metrics.Collect("brewsim_config_info", "gauge", "Version of the runtime configuration applied", lambda: [[{"version": runtime_config.Version}, 1]])
+        metrics.Collect("brewsim_config_reloads_total", "counter", "Runtime configuration documents applied and rejected", lambda: [[{"result": "applied"}, runtime_config.Applied], [{"result": "rejected"}, runtime_config.Rejected]])
+    if (oee is not None):
+        metrics.Collect("brewsim_oee_percent", "gauge", "Availability, Performance, Quality and OEE of the assets and areas over the rolling windows", lambda: [[{"asset": tag.Asset, "measure": tag.Property.split("_")[0], "window": tag.Property.split("_")[1]}, value] for tag, value in zip(oee.Tags, oee.Values)])
+    metrics_providers = [metrics.Exposition]
+
+    # Profile the scan, the histograms are published under the Diagnostics object and to the metrics endpoint
+    if (profile):
+        profiler = Profiler(plant.Assets, plant.Transfers, args.profileevery)
+        Diagnostics = Site.add_object(addspace, "Diagnostics")
+        metrics_providers.append(profiler.Exposition)
+
+    metrics_endpoint = None
+    if (args.metricsport > 0):
+        metrics_endpoint = MetricsEndpoint(args.metricsport, metrics_providers)
+
+    scan = 0
+    laststatstime = time.time()
+    lastprofiletime = time.time()
 
     # Start the OPC UA Server
     server.start()    
 
     try:
         
-        if(publishtositewise):
-            t = threading.Thread(target=publish_to_sitewise_thread, args=())
-            t.daemon = True
-            t.start()
-        
-        while True:
-
-            # Set assets to run            
-            FerShipToTime100.Run()
-            FerShipToTime200.Run()            
-
-            ####################################################################
-            # Start Brewing Train Asset Integration Control 
-            ####################################################################
-
-            ############################################################################################################################
-            # Fermenter to Storage Control - Fermenter 100 & 200 will search for an available Bright Tank 301-305 and Transfer Material
-            ############################################################################################################################            
-
-            ###############################################################
-            # Fermenter 100 - Search Bright Tank(s) 301-305 for availabilty 
-            ###############################################################
-
-            if (Fermenter100.NewState == NewStateEnum.Running) and (Fermenter100.HoldTime.DN) and (not Fermenter100.ShipToAllocated):
-                Fermenter100.ShipToAutoAllocateCmd = True
-            
-            if (Fermenter100.ShipToAutoAllocateCmd):
-                
-                FerShipToTime100.Enabled = True
-                FerShipToTime100.RST = False
-                
-                if (BrightTank301.NewState == NewStateEnum.Ready) and (BrightTank301.NewStatus == NewStatusEnum.Idle):
-                    BrightTank301.NewStatus = NewStatusEnum.Allocated
-                    Fermenter100.ShipToAutoAllocateCmd = False
-                    Fermenter100.ShipToAllocated = True
-                    Fermenter100.ShipTo_Tank = 301
-                    BrightTank301.AllocatedFrom = 100                    
-                elif (BrightTank302.NewState == NewStateEnum.Ready) and (BrightTank302.NewStatus == NewStatusEnum.Idle):
-                    BrightTank302.NewStatus = NewStatusEnum.Allocated
-                    Fermenter100.ShipToAutoAllocateCmd = False
-                    Fermenter100.ShipToAllocated = True
-                    Fermenter100.ShipTo_Tank = 302
-                    BrightTank302.AllocatedFrom = 100                    
-                elif (BrightTank303.NewState == NewStateEnum.Ready) and (BrightTank303.NewStatus == NewStatusEnum.Idle):
-                    BrightTank303.NewStatus = NewStatusEnum.Allocated
-                    Fermenter100.ShipToAutoAllocateCmd = False
-                    Fermenter100.ShipToAllocated = True
-                    Fermenter100.ShipTo_Tank = 303
-                    BrightTank303.AllocatedFrom = 100                    
-                elif (BrightTank304.NewState == NewStateEnum.Ready) and (BrightTank304.NewStatus == NewStatusEnum.Idle):
-                    BrightTank304.NewStatus = NewStatusEnum.Allocated
-                    Fermenter100.ShipToAutoAllocateCmd = False
-                    Fermenter100.ShipToAllocated = True
-                    Fermenter100.ShipTo_Tank = 304
-                    BrightTank304.AllocatedFrom = 100                    
-                elif (BrightTank305.NewState == NewStateEnum.Ready) and (BrightTank305.NewStatus == NewStatusEnum.Idle):
-                    BrightTank305.NewStatus = NewStatusEnum.Allocated
-                    Fermenter100.ShipToAutoAllocateCmd = False
-                    Fermenter100.ShipToAllocated = True
-                    Fermenter100.ShipTo_Tank = 305
-                    BrightTank305.AllocatedFrom = 100                    
-
-            if (Fermenter100.NewState == NewStateEnum.Running) and (Fermenter100.ShipToAllocated):
-                
-                if (FerShipToTime100.DN):
-                    FerShipToTime100.Enabled = False
-                    FerShipToTime100.RST = True
-                    
-                    Fermenter100.ShipToShipCmd = True
-
-            if (Fermenter100.ShipToAllocated) and (Fermenter100.ShipToShipCmd):
-
-                match Fermenter100.ShipTo_Tank:
-
-                    case 301:
-                        BrightTank301.StartCmd = True
-                        BrightTank301.BeerShippedFromFermenter = Fermenter100.GreenBeerPV
-                        BrightTank301.FermenterShipComplete = Fermenter100.ShipToShipComplete or (Fermenter100.NewState == NewStateEnum.Aborted and BrightTank301.NewStatus == NewStatusEnum.Filling)
-
-                        BrightTank301.Next_ProductionID = Fermenter100.DownStream_ProductionID
-                        BrightTank301.Next_ItemID = Fermenter100.DownStream_ItemID 
-                        BrightTank301.Cons_GreenBeer_Item = Fermenter100.Prod_GreenBeer_Item
-                        BrightTank301.Cons_GreenBeer_FromLot = Fermenter100.Prod_GreenBeer_ToLot
-
-                        if (BrightTank301.FermenterShipComplete):
-                            Fermenter100.ShipToShipCmd = False                            
-
-                    case 302:
-                        BrightTank302.StartCmd = True
-                        BrightTank302.BeerShippedFromFermenter = Fermenter100.GreenBeerPV
-                        BrightTank302.FermenterShipComplete = Fermenter100.ShipToShipComplete or (Fermenter100.NewState == NewStateEnum.Aborted and BrightTank302.NewStatus == NewStatusEnum.Filling)
-
-                        BrightTank302.Next_ProductionID = Fermenter100.DownStream_ProductionID
-                        BrightTank302.Next_ItemID = Fermenter100.DownStream_ItemID 
-                        BrightTank302.Cons_GreenBeer_Item = Fermenter100.Prod_GreenBeer_Item
-                        BrightTank302.Cons_GreenBeer_FromLot = Fermenter100.Prod_GreenBeer_ToLot
-
-                        if (BrightTank302.FermenterShipComplete):
-                            Fermenter100.ShipToShipCmd = False                            
-
-                    case 303:
-                        BrightTank303.StartCmd = True
-                        BrightTank303.BeerShippedFromFermenter = Fermenter100.GreenBeerPV
-                        BrightTank303.FermenterShipComplete = Fermenter100.ShipToShipComplete or (Fermenter100.NewState == NewStateEnum.Aborted and BrightTank303.NewStatus == NewStatusEnum.Filling)
-
-                        BrightTank303.Next_ProductionID = Fermenter100.DownStream_ProductionID
-                        BrightTank303.Next_ItemID = Fermenter100.DownStream_ItemID 
-                        BrightTank303.Cons_GreenBeer_Item = Fermenter100.Prod_GreenBeer_Item
-                        BrightTank303.Cons_GreenBeer_FromLot = Fermenter100.Prod_GreenBeer_ToLot
-
-                        if (BrightTank303.FermenterShipComplete):
-                            Fermenter100.ShipToShipCmd = False                            
-
-                    case 304:
-                        BrightTank304.StartCmd = True
-                        BrightTank304.BeerShippedFromFermenter = Fermenter100.GreenBeerPV
-                        BrightTank304.FermenterShipComplete = Fermenter100.ShipToShipComplete or (Fermenter100.NewState == NewStateEnum.Aborted and BrightTank304.NewStatus == NewStatusEnum.Filling)
-
-                        BrightTank304.Next_ProductionID = Fermenter100.DownStream_ProductionID
-                        BrightTank304.Next_ItemID = Fermenter100.DownStream_ItemID 
-                        BrightTank304.Cons_GreenBeer_Item = Fermenter100.Prod_GreenBeer_Item
-                        BrightTank304.Cons_GreenBeer_FromLot = Fermenter100.Prod_GreenBeer_ToLot
-
-                        if (BrightTank304.FermenterShipComplete):
-                            Fermenter100.ShipToShipCmd = False                            
-
-                    case 305:
-                        BrightTank305.StartCmd = True
-                        BrightTank305.BeerShippedFromFermenter = Fermenter100.GreenBeerPV
-                        BrightTank305.FermenterShipComplete = Fermenter100.ShipToShipComplete or (Fermenter100.NewState == NewStateEnum.Aborted and BrightTank305.NewStatus == NewStatusEnum.Filling)
-
-                        BrightTank305.Next_ProductionID = Fermenter100.DownStream_ProductionID
-                        BrightTank305.Next_ItemID = Fermenter100.DownStream_ItemID 
-                        BrightTank305.Cons_GreenBeer_Item = Fermenter100.Prod_GreenBeer_Item
-                        BrightTank305.Cons_GreenBeer_FromLot = Fermenter100.Prod_GreenBeer_ToLot
-
-                        if (BrightTank305.FermenterShipComplete):
-                            Fermenter100.ShipToShipCmd = False                            
-
-            ###############################################################
-            # Fermenter 200 - Search Bright Tank(s) 401-405 for availabilty 
-            ###############################################################
-
-            if (Fermenter200.NewState == NewStateEnum.Running) and (Fermenter200.HoldTime.DN) and (not Fermenter200.ShipToAllocated):
-                Fermenter200.ShipToAutoAllocateCmd = True
-
-            if (Fermenter200.ShipToAutoAllocateCmd):
-                
-                FerShipToTime200.Enabled = True
-                FerShipToTime200.RST = False
-
-                if (BrightTank301.NewState == NewStateEnum.Ready) and (BrightTank301.NewStatus == NewStatusEnum.Idle):
-                    BrightTank301.NewStatus = NewStatusEnum.Allocated
-                    Fermenter200.ShipToAutoAllocateCmd = False
-                    Fermenter200.ShipToAllocated = True
-                    Fermenter200.ShipTo_Tank = 301
-                    BrightTank301.AllocatedFrom = 200                    
-                elif (BrightTank302.NewState == NewStateEnum.Ready) and (BrightTank302.NewStatus == NewStatusEnum.Idle):
-                    BrightTank302.NewStatus = NewStatusEnum.Allocated
-                    Fermenter200.ShipToAutoAllocateCmd = False
-                    Fermenter200.ShipToAllocated = True
-                    Fermenter200.ShipTo_Tank = 302
-                    BrightTank302.AllocatedFrom = 200                    
-                elif (BrightTank303.NewState == NewStateEnum.Ready) and (BrightTank303.NewStatus == NewStatusEnum.Idle):
-                    BrightTank303.NewStatus = NewStatusEnum.Allocated
-                    Fermenter200.ShipToAutoAllocateCmd = False
-                    Fermenter200.ShipToAllocated = True
-                    Fermenter200.ShipTo_Tank = 303
-                    BrightTank303.AllocatedFrom = 200                    
-                elif (BrightTank304.NewState == NewStateEnum.Ready) and (BrightTank304.NewStatus == NewStatusEnum.Idle):
-                    BrightTank304.NewStatus = NewStatusEnum.Allocated
-                    Fermenter200.ShipToAutoAllocateCmd = False
-                    Fermenter200.ShipToAllocated = True
-                    Fermenter200.ShipTo_Tank = 304
-                    BrightTank304.AllocatedFrom = 200                    
-                elif (BrightTank305.NewState == NewStateEnum.Ready) and (BrightTank305.NewStatus == NewStatusEnum.Idle):
-                    BrightTank305.NewStatus = NewStatusEnum.Allocated
-                    Fermenter200.ShipToAutoAllocateCmd = False
-                    Fermenter200.ShipToAllocated = True
-                    Fermenter200.ShipTo_Tank = 305
-                    BrightTank305.AllocatedFrom = 200             
-
-            if (Fermenter200.NewState == NewStateEnum.Running) and (Fermenter200.ShipToAllocated):
-                
-                if (FerShipToTime200.DN):
-                    FerShipToTime200.Enabled = False
-                    FerShipToTime200.RST = True
-                    
-                    Fermenter200.ShipToShipCmd = True
-
-            if (Fermenter200.ShipToAllocated) and (Fermenter200.ShipToShipCmd):
-
-                match Fermenter200.ShipTo_Tank:
-
-                    case 301:
-                        BrightTank301.StartCmd = True
-                        BrightTank301.BeerShippedFromFermenter = Fermenter200.GreenBeerPV
-                        BrightTank301.FermenterShipComplete = Fermenter200.ShipToShipComplete or (Fermenter200.NewState == NewStateEnum.Aborted and BrightTank301.NewStatus == NewStatusEnum.Filling)
-
-                        BrightTank301.Next_ProductionID = Fermenter200.DownStream_ProductionID
-                        BrightTank301.Next_ItemID = Fermenter200.DownStream_ItemID 
-                        BrightTank301.Cons_GreenBeer_Item = Fermenter200.Prod_GreenBeer_Item
-                        BrightTank301.Cons_GreenBeer_FromLot = Fermenter200.Prod_GreenBeer_ToLot
-
-                        if (BrightTank301.FermenterShipComplete):
-                            Fermenter200.ShipToShipCmd = False                            
-
-                    case 302:
-                        BrightTank302.StartCmd = True
-                        BrightTank302.BeerShippedFromFermenter = Fermenter200.GreenBeerPV
-                        BrightTank302.FermenterShipComplete = Fermenter200.ShipToShipComplete or (Fermenter200.NewState == NewStateEnum.Aborted and BrightTank302.NewStatus == NewStatusEnum.Filling)
-
-                        BrightTank302.Next_ProductionID = Fermenter200.DownStream_ProductionID
-                        BrightTank302.Next_ItemID = Fermenter200.DownStream_ItemID 
-                        BrightTank302.Cons_GreenBeer_Item = Fermenter200.Prod_GreenBeer_Item
-                        BrightTank302.Cons_GreenBeer_FromLot = Fermenter200.Prod_GreenBeer_ToLot
-
-                        if (BrightTank302.FermenterShipComplete):
-                            Fermenter200.ShipToShipCmd = False                            
-
-                    case 303:
-                        BrightTank303.StartCmd = True
-                        BrightTank303.BeerShippedFromFermenter = Fermenter200.GreenBeerPV
-                        BrightTank303.FermenterShipComplete = Fermenter200.ShipToShipComplete or (Fermenter200.NewState == NewStateEnum.Aborted and BrightTank303.NewStatus == NewStatusEnum.Filling)
-
-                        BrightTank303.Next_ProductionID = Fermenter200.DownStream_ProductionID
-                        BrightTank303.Next_ItemID = Fermenter200.DownStream_ItemID 
-                        BrightTank303.Cons_GreenBeer_Item = Fermenter200.Prod_GreenBeer_Item
-                        BrightTank303.Cons_GreenBeer_FromLot = Fermenter200.Prod_GreenBeer_ToLot
-
-                        if (BrightTank303.FermenterShipComplete):
-                            Fermenter200.ShipToShipCmd = False                            
-
-                    case 304:
-                        BrightTank304.StartCmd = True
-                        BrightTank304.BeerShippedFromFermenter = Fermenter200.GreenBeerPV
-                        BrightTank304.FermenterShipComplete = Fermenter200.ShipToShipComplete or (Fermenter200.NewState == NewStateEnum.Aborted and BrightTank304.NewStatus == NewStatusEnum.Filling)
-
-                        BrightTank304.Next_ProductionID = Fermenter200.DownStream_ProductionID
-                        BrightTank304.Next_ItemID = Fermenter200.DownStream_ItemID 
-                        BrightTank304.Cons_GreenBeer_Item = Fermenter200.Prod_GreenBeer_Item
-                        BrightTank304.Cons_GreenBeer_FromLot = Fermenter200.Prod_GreenBeer_ToLot
-
-                        if (BrightTank304.FermenterShipComplete):
-                            Fermenter200.ShipToShipCmd = False                            
-
-                    case 305:
-                        BrightTank305.StartCmd = True
-                        BrightTank305.BeerShippedFromFermenter = Fermenter200.GreenBeerPV
-                        BrightTank305.FermenterShipComplete = Fermenter200.ShipToShipComplete or (Fermenter200.NewState == NewStateEnum.Aborted and BrightTank305.NewStatus == NewStatusEnum.Filling)
-
-                        BrightTank305.Next_ProductionID = Fermenter200.DownStream_ProductionID
-                        BrightTank305.Next_ItemID = Fermenter200.DownStream_ItemID 
-                        BrightTank305.Cons_GreenBeer_Item = Fermenter200.Prod_GreenBeer_Item
-                        BrightTank305.Cons_GreenBeer_FromLot = Fermenter200.Prod_GreenBeer_ToLot
-
-                        if (BrightTank305.FermenterShipComplete):
-                            Fermenter200.ShipToShipCmd = False                            
-
-            ########################################################################################################################################
-            # Bright Tanks to Bottling Lines Control - Bright Tanks 301-305 will search for an available BottlingLines 401/402 and Transfer Material
-            ########################################################################################################################################
-
-            if (BrightTank301.NewState == NewStateEnum.Running) and (BrightTank301.HoldTime.DN) and (not BrightTank301.ShipToAllocated):                
-                BrightTank301.ShipToAutoAllocateCmd = True                    
-
-            if (BrightTank302.NewState == NewStateEnum.Running) and (BrightTank302.HoldTime.DN) and (not BrightTank302.ShipToAllocated):                
-                BrightTank302.ShipToAutoAllocateCmd = True                    
-
-            if (BrightTank303.NewState == NewStateEnum.Running) and (BrightTank303.HoldTime.DN) and (not BrightTank303.ShipToAllocated):                
-                BrightTank303.ShipToAutoAllocateCmd = True                    
-
-            if (BrightTank304.NewState == NewStateEnum.Running) and (BrightTank304.HoldTime.DN) and (not BrightTank304.ShipToAllocated):                
-                BrightTank304.ShipToAutoAllocateCmd = True                    
-
-            if (BrightTank305.NewState == NewStateEnum.Running) and (BrightTank305.HoldTime.DN) and (not BrightTank305.ShipToAllocated):                
-                BrightTank305.ShipToAutoAllocateCmd = True                             
-
-            assignmentMade = False             
-
-            if (BrightTank301.ShipToAutoAllocateCmd):                
-
-                if (BottleLine401.NewState == NewStateEnum.Ready) and (BottleLine401.NewStatus == NewStatusEnum.Idle):
-                    BottleLine401.NewStatus = NewStatusEnum.Allocated
-                    BrightTank301.ShipToTank = 401
-                    BrightTank301.ShipToAllocated = True
-                    BrightTank301.ShipToAutoAllocateCmd = False                    
-                    BottleLine401.AllocatedFrom = 301                                        
-                    assignmentMade = True
-                elif (BottleLine402.NewState == NewStateEnum.Ready) and (BottleLine402.NewStatus == NewStatusEnum.Idle):
-                    BottleLine402.NewStatus = NewStatusEnum.Allocated
-                    BrightTank301.ShipToTank = 402
-                    BrightTank301.ShipToAllocated = True
-                    BrightTank301.ShipToAutoAllocateCmd = False                    
-                    BottleLine402.AllocatedFrom = 301                                        
-                    assignmentMade = True
-                elif (BottleLine403.NewState == NewStateEnum.Ready) and (BottleLine403.NewStatus == NewStatusEnum.Idle):
-                    BottleLine403.NewStatus = NewStatusEnum.Allocated
-                    BrightTank301.ShipToTank = 403
-                    BrightTank301.ShipToAllocated = True
-                    BrightTank301.ShipToAutoAllocateCmd = False                    
-                    BottleLine403.AllocatedFrom = 301                                        
-                    assignmentMade = True
-                else:
-                    BrightTank301.ShipToAllocated = False
-                    BrightTank301.ShipToTank = -1
-
-            if (BrightTank302.ShipToAutoAllocateCmd):                
-
-                if (BottleLine401.NewState == NewStateEnum.Ready) and (BottleLine401.NewStatus == NewStatusEnum.Idle):
-                    BottleLine401.NewStatus = NewStatusEnum.Allocated
-                    BrightTank302.ShipToTank = 401
-                    BrightTank302.ShipToAllocated = True
-                    BrightTank302.ShipToAutoAllocateCmd = False                    
-                    BottleLine401.AllocatedFrom = 302                                        
-                    assignmentMade = True
-                elif (BottleLine402.NewState == NewStateEnum.Ready) and (BottleLine402.NewStatus == NewStatusEnum.Idle):
-                    BottleLine402.NewStatus = NewStatusEnum.Allocated
-                    BrightTank302.ShipToTank = 402
-                    BrightTank302.ShipToAllocated = True
-                    BrightTank302.ShipToAutoAllocateCmd = False                    
-                    BottleLine402.AllocatedFrom = 302                                        
-                    assignmentMade = True
-                elif (BottleLine403.NewState == NewStateEnum.Ready) and (BottleLine403.NewStatus == NewStatusEnum.Idle):
-                    BottleLine403.NewStatus = NewStatusEnum.Allocated
-                    BrightTank302.ShipToTank = 403
-                    BrightTank302.ShipToAllocated = True
-                    BrightTank302.ShipToAutoAllocateCmd = False                    
-                    BottleLine403.AllocatedFrom = 302                                        
-                    assignmentMade = True
-                else:
-                    BrightTank302.ShipToAllocated = False
-                    BrightTank302.ShipToTank = -1
-
-            if (BrightTank303.ShipToAutoAllocateCmd):                
-
-                if (BottleLine401.NewState == NewStateEnum.Ready) and (BottleLine401.NewStatus == NewStatusEnum.Idle):
-                    BottleLine401.NewStatus = NewStatusEnum.Allocated
-                    BrightTank303.ShipToTank = 401
-                    BrightTank303.ShipToAllocated = True
-                    BrightTank303.ShipToAutoAllocateCmd = False                    
-                    BottleLine401.AllocatedFrom = 303                                        
-                    assignmentMade = True
-                elif (BottleLine402.NewState == NewStateEnum.Ready) and (BottleLine402.NewStatus == NewStatusEnum.Idle):
-                    BottleLine402.NewStatus = NewStatusEnum.Allocated
-                    BrightTank303.ShipToTank = 402
-                    BrightTank303.ShipToAllocated = True
-                    BrightTank303.ShipToAutoAllocateCmd = False                    
-                    BottleLine402.AllocatedFrom = 303                                        
-                    assignmentMade = True
-                elif (BottleLine403.NewState == NewStateEnum.Ready) and (BottleLine403.NewStatus == NewStatusEnum.Idle):
-                    BottleLine403.NewStatus = NewStatusEnum.Allocated
-                    BrightTank303.ShipToTank = 403
-                    BrightTank303.ShipToAllocated = True
-                    BrightTank303.ShipToAutoAllocateCmd = False                    
-                    BottleLine403.AllocatedFrom = 303                                        
-                    assignmentMade = True
-                else:
-                    BrightTank303.ShipToAllocated = False
-                    BrightTank303.ShipToTank = -1
-
-            if (BrightTank304.ShipToAutoAllocateCmd):                
-
-                if (BottleLine401.NewState == NewStateEnum.Ready) and (BottleLine401.NewStatus == NewStatusEnum.Idle):
-                    BottleLine401.NewStatus = NewStatusEnum.Allocated
-                    BrightTank304.ShipToTank = 401
-                    BrightTank304.ShipToAllocated = True
-                    BrightTank304.ShipToAutoAllocateCmd = False                    
-                    BottleLine401.AllocatedFrom = 304                                        
-                    assignmentMade = True
-                elif (BottleLine402.NewState == NewStateEnum.Ready) and (BottleLine402.NewStatus == NewStatusEnum.Idle):
-                    BottleLine402.NewStatus = NewStatusEnum.Allocated
-                    BrightTank304.ShipToTank = 402
-                    BrightTank304.ShipToAllocated = True
-                    BrightTank304.ShipToAutoAllocateCmd = False                    
-                    BottleLine402.AllocatedFrom = 304                                        
-                    assignmentMade = True
-                elif (BottleLine403.NewState == NewStateEnum.Ready) and (BottleLine403.NewStatus == NewStatusEnum.Idle):
-                    BottleLine403.NewStatus = NewStatusEnum.Allocated
-                    BrightTank304.ShipToTank = 403
-                    BrightTank304.ShipToAllocated = True
-                    BrightTank304.ShipToAutoAllocateCmd = False                    
-                    BottleLine403.AllocatedFrom = 304                                        
-                    assignmentMade = True
-                else:
-                    BrightTank304.ShipToAllocated = False
-                    BrightTank304.ShipToTank = -1
-
-            if (BrightTank305.ShipToAutoAllocateCmd):                
-
-                if (BottleLine401.NewState == NewStateEnum.Ready) and (BottleLine401.NewStatus == NewStatusEnum.Idle):
-                    BottleLine401.NewStatus = NewStatusEnum.Allocated
-                    BrightTank305.ShipToTank = 401
-                    BrightTank305.ShipToAllocated = True
-                    BrightTank305.ShipToAutoAllocateCmd = False                    
-                    BottleLine401.AllocatedFrom = 305                                        
-                    assignmentMade = True
-                elif (BottleLine402.NewState == NewStateEnum.Ready) and (BottleLine402.NewStatus == NewStatusEnum.Idle):
-                    BottleLine402.NewStatus = NewStatusEnum.Allocated
-                    BrightTank305.ShipToTank = 402
-                    BrightTank305.ShipToAllocated = True
-                    BrightTank305.ShipToAutoAllocateCmd = False                    
-                    BottleLine402.AllocatedFrom = 305                                        
-                    assignmentMade = True
-                elif (BottleLine403.NewState == NewStateEnum.Ready) and (BottleLine403.NewStatus == NewStatusEnum.Idle):
-                    BottleLine403.NewStatus = NewStatusEnum.Allocated
-                    BrightTank305.ShipToTank = 403
-                    BrightTank305.ShipToAllocated = True
-                    BrightTank305.ShipToAutoAllocateCmd = False                    
-                    BottleLine403.AllocatedFrom = 305                                        
-                    assignmentMade = True
-                else:
-                    BrightTank305.ShipToAllocated = False
-                    BrightTank305.ShipToTank = -1
-
-            if (BrightTank301.NewState == NewStateEnum.Running) and (BrightTank301.ShipToAllocated):                      
-                BrightTank301.ShipToShipCmd = True
-
-            if (BrightTank302.NewState == NewStateEnum.Running) and (BrightTank302.ShipToAllocated):                                    
-                BrightTank302.ShipToShipCmd = True
-
-            if (BrightTank303.NewState == NewStateEnum.Running) and (BrightTank303.ShipToAllocated):                    
-                BrightTank303.ShipToShipCmd = True
-
-            if (BrightTank304.NewState == NewStateEnum.Running) and (BrightTank304.ShipToAllocated):                    
-                BrightTank304.ShipToShipCmd = True
-
-            if (BrightTank305.NewState == NewStateEnum.Running) and (BrightTank305.ShipToAllocated):                    
-                BrightTank305.ShipToShipCmd = True
-
-            if (BrightTank301.ShipToShipCmd):
-
-                match BrightTank301.ShipToTank:
-
-                    case 401:
-                        BottleLine401.BeerShippedFromStorage = BrightTank301.BeerShipped
-                        BottleLine401.StorageShipComplete = BrightTank301.ShipToShipComplete or (BrightTank301.NewState == NewStateEnum.Aborted and BottleLine401.NewStatus == NewStatusEnum.Filling)
-
-                        BottleLine401.Next_ProductionID = BrightTank301.DownStream_ProductionID
-                        BottleLine401.Next_ItemID = BrightTank301.DownStream_ItemID 
-                        BottleLine401.Cons_Beer_Item = BrightTank301.Prod_Beer_Item
-                        BottleLine401.Cons_Beer_FromLot = BrightTank301.Prod_Beer_ToLot
-
-                        if (BrightTank301.NewState == NewStateEnum.Done) or (BrightTank301.NewState == NewStateEnum.Aborted):
-                            BrightTank301.ShipToShipCmd = False
-                            BottleLine401.StorageShipComplete = True                           
-
-                    case 402:
-                        BottleLine402.BeerShippedFromStorage = BrightTank301.BeerShipped
-                        BottleLine402.StorageShipComplete = BrightTank301.ShipToShipComplete or (BrightTank301.NewState == NewStateEnum.Aborted and BottleLine402.NewStatus == NewStatusEnum.Filling)
-
-                        BottleLine402.Next_ProductionID = BrightTank301.DownStream_ProductionID
-                        BottleLine402.Next_ItemID = BrightTank301.DownStream_ItemID 
-                        BottleLine402.Cons_Beer_Item = BrightTank301.Prod_Beer_Item
-                        BottleLine402.Cons_Beer_FromLot = BrightTank301.Prod_Beer_ToLot
-
-                        if (BrightTank301.NewState == NewStateEnum.Done) or (BrightTank301.NewState == NewStateEnum.Aborted):
-                            BrightTank301.ShipToShipCmd = False
-                            BottleLine402.StorageShipComplete = True 
-
-                    case 403:
-                        BottleLine403.BeerShippedFromStorage = BrightTank301.BeerShipped
-                        BottleLine403.StorageShipComplete = BrightTank301.ShipToShipComplete or (BrightTank301.NewState == NewStateEnum.Aborted and BottleLine403.NewStatus == NewStatusEnum.Filling)
-
-                        BottleLine403.Next_ProductionID = BrightTank301.DownStream_ProductionID
-                        BottleLine403.Next_ItemID = BrightTank301.DownStream_ItemID 
-                        BottleLine403.Cons_Beer_Item = BrightTank301.Prod_Beer_Item
-                        BottleLine403.Cons_Beer_FromLot = BrightTank301.Prod_Beer_ToLot
-
-                        if (BrightTank301.NewState == NewStateEnum.Done) or (BrightTank301.NewState == NewStateEnum.Aborted):
-                            BrightTank301.ShipToShipCmd = False
-                            BottleLine403.StorageShipComplete = True
-
-            if (BrightTank302.ShipToShipCmd):
-
-                match BrightTank302.ShipToTank:
-
-                    case 401:
-                        BottleLine401.BeerShippedFromStorage = BrightTank302.BeerShipped
-                        BottleLine401.StorageShipComplete = BrightTank302.ShipToShipComplete or (BrightTank302.NewState == NewStateEnum.Aborted and BottleLine401.NewStatus == NewStatusEnum.Filling)
-
-                        BottleLine401.Next_ProductionID = BrightTank302.DownStream_ProductionID
-                        BottleLine401.Next_ItemID = BrightTank302.DownStream_ItemID 
-                        BottleLine401.Cons_Beer_Item = BrightTank302.Prod_Beer_Item
-                        BottleLine401.Cons_Beer_FromLot = BrightTank302.Prod_Beer_ToLot
-
-                        if (BrightTank302.NewState == NewStateEnum.Done) or (BrightTank302.NewState == NewStateEnum.Aborted):
-                            BrightTank302.ShipToShipCmd = False
-                            BottleLine401.StorageShipComplete = True                            
-
-                    case 402:
-                        BottleLine402.BeerShippedFromStorage = BrightTank302.BeerShipped
-                        BottleLine402.StorageShipComplete = BrightTank302.ShipToShipComplete or (BrightTank302.NewState == NewStateEnum.Aborted and BottleLine402.NewStatus == NewStatusEnum.Filling)
-
-                        BottleLine402.Next_ProductionID = BrightTank302.DownStream_ProductionID
-                        BottleLine402.Next_ItemID = BrightTank302.DownStream_ItemID 
-                        BottleLine402.Cons_Beer_Item = BrightTank302.Prod_Beer_Item
-                        BottleLine402.Cons_Beer_FromLot = BrightTank302.Prod_Beer_ToLot
-
-                        if (BrightTank302.NewState == NewStateEnum.Done) or (BrightTank302.NewState == NewStateEnum.Aborted):
-                            BrightTank302.ShipToShipCmd = False
-                            BottleLine402.StorageShipComplete = True    
-
-                    case 403:
-                        BottleLine403.BeerShippedFromStorage = BrightTank302.BeerShipped
-                        BottleLine403.StorageShipComplete = BrightTank302.ShipToShipComplete or (BrightTank302.NewState == NewStateEnum.Aborted and BottleLine403.NewStatus == NewStatusEnum.Filling)
-
-                        BottleLine403.Next_ProductionID = BrightTank302.DownStream_ProductionID
-                        BottleLine403.Next_ItemID = BrightTank302.DownStream_ItemID 
-                        BottleLine403.Cons_Beer_Item = BrightTank302.Prod_Beer_Item
-                        BottleLine403.Cons_Beer_FromLot = BrightTank302.Prod_Beer_ToLot
-
-                        if (BrightTank302.NewState == NewStateEnum.Done) or (BrightTank302.NewState == NewStateEnum.Aborted):
-                            BrightTank302.ShipToShipCmd = False
-                            BottleLine403.StorageShipComplete = True
-
-            if (BrightTank303.ShipToShipCmd):
-
-                match BrightTank303.ShipToTank:
-
-                    case 401:
-                        BottleLine401.BeerShippedFromStorage = BrightTank303.BeerShipped
-                        BottleLine401.StorageShipComplete = BrightTank303.ShipToShipComplete or (BrightTank303.NewState == NewStateEnum.Aborted and BottleLine401.NewStatus == NewStatusEnum.Filling)
-
-                        BottleLine401.Next_ProductionID = BrightTank303.DownStream_ProductionID
-                        BottleLine401.Next_ItemID = BrightTank303.DownStream_ItemID 
-                        BottleLine401.Cons_Beer_Item = BrightTank303.Prod_Beer_Item
-                        BottleLine401.Cons_Beer_FromLot = BrightTank303.Prod_Beer_ToLot
-
-                        if (BrightTank303.NewState == NewStateEnum.Done) or (BrightTank303.NewState == NewStateEnum.Aborted):
-                            BrightTank303.ShipToShipCmd = False
-                            BottleLine401.StorageShipComplete = True                            
-
-                    case 402:
-                        BottleLine402.BeerShippedFromStorage = BrightTank303.BeerShipped
-                        BottleLine402.StorageShipComplete = BrightTank303.ShipToShipComplete or (BrightTank303.NewState == NewStateEnum.Aborted and BottleLine402.NewStatus == NewStatusEnum.Filling)
-
-                        BottleLine402.Next_ProductionID = BrightTank303.DownStream_ProductionID
-                        BottleLine402.Next_ItemID = BrightTank303.DownStream_ItemID 
-                        BottleLine402.Cons_Beer_Item = BrightTank303.Prod_Beer_Item
-                        BottleLine402.Cons_Beer_FromLot = BrightTank303.Prod_Beer_ToLot
-
-                        if (BrightTank303.NewState == NewStateEnum.Done) or (BrightTank303.NewState == NewStateEnum.Aborted):
-                            BrightTank303.ShipToShipCmd = False
-                            BottleLine402.StorageShipComplete = True  
-
-                    case 403:
-                        BottleLine403.BeerShippedFromStorage = BrightTank303.BeerShipped
-                        BottleLine403.StorageShipComplete = BrightTank303.ShipToShipComplete or (BrightTank303.NewState == NewStateEnum.Aborted and BottleLine403.NewStatus == NewStatusEnum.Filling)
-
-                        BottleLine403.Next_ProductionID = BrightTank303.DownStream_ProductionID
-                        BottleLine403.Next_ItemID = BrightTank303.DownStream_ItemID 
-                        BottleLine403.Cons_Beer_Item = BrightTank303.Prod_Beer_Item
-                        BottleLine403.Cons_Beer_FromLot = BrightTank303.Prod_Beer_ToLot
-
-                        if (BrightTank303.NewState == NewStateEnum.Done) or (BrightTank303.NewState == NewStateEnum.Aborted):
-                            BrightTank303.ShipToShipCmd = False
-                            BottleLine403.StorageShipComplete = True
-
-            if (BrightTank304.ShipToShipCmd):
-
-                match BrightTank304.ShipToTank:
-
-                    case 401:
-                        BottleLine401.BeerShippedFromStorage = BrightTank304.BeerShipped
-                        BottleLine401.StorageShipComplete = BrightTank304.ShipToShipComplete or (BrightTank304.NewState == NewStateEnum.Aborted and BottleLine401.NewStatus == NewStatusEnum.Filling)
-
-                        BottleLine401.Next_ProductionID = BrightTank304.DownStream_ProductionID
-                        BottleLine401.Next_ItemID = BrightTank304.DownStream_ItemID 
-                        BottleLine401.Cons_Beer_Item = BrightTank304.Prod_Beer_Item
-                        BottleLine401.Cons_Beer_FromLot = BrightTank304.Prod_Beer_ToLot
-
-                        if (BrightTank304.NewState == NewStateEnum.Done) or (BrightTank304.NewState == NewStateEnum.Aborted):
-                            BrightTank304.ShipToShipCmd = False
-                            BottleLine401.StorageShipComplete = True                            
-
-                    case 402:
-                        BottleLine402.BeerShippedFromStorage = BrightTank304.BeerShipped
-                        BottleLine402.StorageShipComplete = BrightTank304.ShipToShipComplete or (BrightTank304.NewState == NewStateEnum.Aborted and BottleLine402.NewStatus == NewStatusEnum.Filling)
-
-                        BottleLine402.Next_ProductionID = BrightTank304.DownStream_ProductionID
-                        BottleLine402.Next_ItemID = BrightTank304.DownStream_ItemID 
-                        BottleLine402.Cons_Beer_Item = BrightTank304.Prod_Beer_Item
-                        BottleLine402.Cons_Beer_FromLot = BrightTank304.Prod_Beer_ToLot
-
-                        if (BrightTank304.NewState == NewStateEnum.Done) or (BrightTank304.NewState == NewStateEnum.Aborted):
-                            BrightTank304.ShipToShipCmd = False
-                            BottleLine402.StorageShipComplete = True     
-
-                    case 403:
-                        BottleLine403.BeerShippedFromStorage = BrightTank304.BeerShipped
-                        BottleLine403.StorageShipComplete = BrightTank304.ShipToShipComplete or (BrightTank304.NewState == NewStateEnum.Aborted and BottleLine403.NewStatus == NewStatusEnum.Filling)
-
-                        BottleLine403.Next_ProductionID = BrightTank304.DownStream_ProductionID
-                        BottleLine403.Next_ItemID = BrightTank304.DownStream_ItemID 
-                        BottleLine403.Cons_Beer_Item = BrightTank304.Prod_Beer_Item
-                        BottleLine403.Cons_Beer_FromLot = BrightTank304.Prod_Beer_ToLot
-
-                        if (BrightTank304.NewState == NewStateEnum.Done) or (BrightTank304.NewState == NewStateEnum.Aborted):
-                            BrightTank304.ShipToShipCmd = False
-                            BottleLine403.StorageShipComplete = True
-
-            if (BrightTank305.ShipToShipCmd):
-
-                match BrightTank305.ShipToTank:
-
-                    case 401:
-                        BottleLine401.BeerShippedFromStorage = BrightTank305.BeerShipped
-                        BottleLine401.StorageShipComplete = BrightTank305.ShipToShipComplete or (BrightTank305.NewState == NewStateEnum.Aborted and BottleLine401.NewStatus == NewStatusEnum.Filling)
-
-                        BottleLine401.Next_ProductionID = BrightTank305.DownStream_ProductionID
-                        BottleLine401.Next_ItemID = BrightTank305.DownStream_ItemID 
-                        BottleLine401.Cons_Beer_Item = BrightTank305.Prod_Beer_Item
-                        BottleLine401.Cons_Beer_FromLot = BrightTank305.Prod_Beer_ToLot
-
-                        if (BrightTank305.NewState == NewStateEnum.Done) or (BrightTank305.NewState == NewStateEnum.Aborted):
-                            BrightTank305.ShipToShipCmd = False
-                            BottleLine401.StorageShipComplete = True                            
-
-                    case 402:
-                        BottleLine402.BeerShippedFromStorage = BrightTank305.BeerShipped
-                        BottleLine402.StorageShipComplete = BrightTank305.ShipToShipComplete or (BrightTank305.NewState == NewStateEnum.Aborted and BottleLine402.NewStatus == NewStatusEnum.Filling)
-
-                        BottleLine402.Next_ProductionID = BrightTank305.DownStream_ProductionID
-                        BottleLine402.Next_ItemID = BrightTank305.DownStream_ItemID 
-                        BottleLine402.Cons_Beer_Item = BrightTank305.Prod_Beer_Item
-                        BottleLine402.Cons_Beer_FromLot = BrightTank305.Prod_Beer_ToLot
-
-                        if (BrightTank305.NewState == NewStateEnum.Done) or (BrightTank305.NewState == NewStateEnum.Aborted):
-                            BrightTank305.ShipToShipCmd = False
-                            BottleLine402.StorageShipComplete = True
-
-                    case 403:
-                        BottleLine403.BeerShippedFromStorage = BrightTank305.BeerShipped
-                        BottleLine403.StorageShipComplete = BrightTank305.ShipToShipComplete or (BrightTank305.NewState == NewStateEnum.Aborted and BottleLine403.NewStatus == NewStatusEnum.Filling)
-
-                        BottleLine403.Next_ProductionID = BrightTank305.DownStream_ProductionID
-                        BottleLine403.Next_ItemID = BrightTank305.DownStream_ItemID 
-                        BottleLine403.Cons_Beer_Item = BrightTank305.Prod_Beer_Item
-                        BottleLine403.Cons_Beer_FromLot = BrightTank305.Prod_Beer_ToLot
-
-                        if (BrightTank305.NewState == NewStateEnum.Done) or (BrightTank305.NewState == NewStateEnum.Aborted):
-                            BrightTank305.ShipToShipCmd = False
-                            BottleLine403.StorageShipComplete = True
-
-            #Update Roasters            
-            Roaster100.Run()     
-            Roaster200.Run()
-
-            #######################################################
-            # Brew Train 100 - Roaster->Mash->BoilKettle->Fermenter
-            #######################################################
-
-            # Transfer Roaster100 Produced Item/ToLot to MashTun100 Consume Item/From Lot
-            if (Roaster100.NewStatus == NewStatusEnum.Filling):
-                if (not R100MatTransOS):
-                    R100MatTransOS = True
-                    R100NewProdDict = {"SelectedProduct":Roaster100.SelectedProduct,
-                                        "RoastedBarley_ToLot":Roaster100.Prod_RoastedBarley_ToLot,
-                                        "RoastedBarley_Item":Roaster100.Prod_RoastedBarley_Item}
-
-                    if (len(MashTun100.ConsList) <= 20):
-                        MashTun100.ConsList.append(R100NewProdDict)
-            else:
-                R100MatTransOS = False
-
-            MashTun100.NewState = MaltMill100.NewState
-            MashTun100.Utilization = MaltMill100.Utilization
-            MashTun100.UtilizationState = MaltMill100.UtilizationState
-            MaltMill100.MaltSP = round(MashTun100.WaterSP * 0.2951328, 2)
-            MaltMill100.MashTunComplete = MashTun100.MashComplete
-            MashTun100.MaltMillComplete = MaltMill100.MaltMillComplete
-
-            # Send ProductionID and MaterialID Information to Downstream Assets Mash100->BoilKettle100
-            if (MashTun100.NewState == NewStateEnum.Running):
-                BoilKettle100.Next_ProductionID = MashTun100.ProductionID
-                BoilKettle100.Next_ItemID = MashTun100.Wort_Item
-
-            # Send Produced Information to Downstream Assets Mash100->BoilKettle100 for Consumption
-            if (MashTun100.NewStatus == NewStatusEnum.Draining):
-                BoilKettle100.Cons_Wort_Item = MashTun100.Prod_Wort_Item
-                BoilKettle100.Cons_Wort_FromLot = MashTun100.Prod_Wort_ToLot
-
-            if (BoilKettle100.NewState == NewStateEnum.Ready):
-                MashTun100.BrewKettleReady = True
-            else:
-                MashTun100.BrewKettleReady = False
-
-            #Update MaltMill100 and MashTun100
-            MashTun100.Run()
-            MaltMill100.Run()             
-
-            BoilKettle100.StartCmd = MashTun100.OutletPump.AuxContact            
-            BoilKettle100.MashShipComplete = MashTun100.ShipComplete or (MashTun100.NewState == NewStateEnum.Aborted and BoilKettle100.NewStatus == NewStatusEnum.Filling) 
-
-            if (MashTun100.NewStatus == NewStatusEnum.Draining) and (MashTun100.NewState == NewStateEnum.Running):
-                BoilKettle100.WortPV = MashTun100.WortPV
-
-            # Send ProductionID and MaterialID Information to Downstream Assets BoilKettle100->Fermenter100
-            if (BoilKettle100.NewState == NewStateEnum.Running):
-                Fermenter100.Next_ProductionID = BoilKettle100.DownStream_ProductionID
-                Fermenter100.Next_ItemID = BoilKettle100.DownStream_ItemID
-
-            # Send Produced Information to Downstream Assets BoilKettle100->Fermenter100 for Consumption
-            if (BoilKettle100.NewStatus == NewStatusEnum.Draining):
-                Fermenter100.Cons_BrewedWort_Item = BoilKettle100.Prod_BrewedWort_Item
-                Fermenter100.Cons_BrewedWort_FromLot = BoilKettle100.Prod_BrewedWort_ToLot
-
-            if (Fermenter100.NewState == NewStateEnum.Ready):
-                BoilKettle100.FermenterReady = True
-            else:
-                BoilKettle100.FermenterReady = False                
-
-            if (BoilKettle100.NewStatus == NewStatusEnum.Filling) and (MashTun100.NewStatus != NewStatusEnum.Draining):
-                BoilKettle100.MashShipComplete = True
-
-            # Update BoilKettle100
-            BoilKettle100.Run()                 
-            
-            Fermenter100.StartCmd = BoilKettle100.OutletPump.AuxContact
-            Fermenter100.BrewKettleShipComplete = BoilKettle100.ShipComplete or (BoilKettle100.NewState == NewStateEnum.Aborted and Fermenter100.NewStatus == NewStatusEnum.Filling)
-    
-            if (BoilKettle100.NewStatus == NewStatusEnum.Draining) and (BoilKettle100.NewState == NewStateEnum.Running):
-                Fermenter100.BrewedWortPV = BoilKettle100.BrewedWortPV
-              
-            # Update Fermenter100   
-            Fermenter100.Run()             
-
-            #######################################################
-            # Brew Train 200 - Roaster->Mash->BoilKettle->Fermenter
-            #######################################################
-
-            # Transfer Roaster200 Produced Item/ToLot to MashTun200 Consume Item/From Lot
-            if (Roaster200.NewStatus == NewStatusEnum.Filling):
-                if (not R200MatTransOS):
-                    R200MatTransOS = True
-                    R200NewProdDict = {"SelectedProduct":Roaster200.SelectedProduct,
-                                        "RoastedBarley_ToLot":Roaster200.Prod_RoastedBarley_ToLot,
-                                        "RoastedBarley_Item":Roaster200.Prod_RoastedBarley_Item}
-
-                    if (len(MashTun200.ConsList) <= 20):
-                        MashTun200.ConsList.append(R200NewProdDict)
-            else:
-                R200MatTransOS = False
-
-            MashTun200.NewState = MaltMill200.NewState
-            MashTun200.Utilization = MaltMill200.Utilization
-            MashTun200.UtilizationState = MaltMill200.UtilizationState
-            MaltMill200.MaltSP = round(MashTun200.WaterSP * 0.2951328, 2)
-            MaltMill200.MashTunComplete = MashTun200.MashComplete
-            MashTun200.MaltMillComplete = MaltMill200.MaltMillComplete
-
-            # Send ProductionID and MaterialID Information to Downstream Assets Mash200->BoilKettle200 
-            if (MashTun200.NewState == NewStateEnum.Running):
-                BoilKettle200.Next_ProductionID = MashTun200.ProductionID
-                BoilKettle200.Next_ItemID = MashTun200.Wort_Item
-
-            # Send Produced Information to Downstream Assets Mash200->BoilKettle200 for Consumption
-            if (MashTun200.NewStatus == NewStatusEnum.Draining):
-                BoilKettle200.Cons_Wort_Item = MashTun200.Prod_Wort_Item
-                BoilKettle200.Cons_Wort_FromLot = MashTun200.Prod_Wort_ToLot
-
-            if (BoilKettle200.NewState == NewStateEnum.Ready):
-                MashTun200.BrewKettleReady = True
-            else:
-                MashTun200.BrewKettleReady = False
-
-            #Update MaltMill200 and MashTun200           
-            MashTun200.Run()
-            MaltMill200.Run()                  
-
-            BoilKettle200.StartCmd = MashTun200.OutletPump.AuxContact
-            BoilKettle200.MashShipComplete = MashTun200.ShipComplete or (MashTun200.NewState == NewStateEnum.Aborted and BoilKettle200.NewStatus == NewStatusEnum.Filling) 
-
-            if (MashTun200.NewStatus == NewStatusEnum.Draining) and (MashTun200.NewState == NewStateEnum.Running):
-                BoilKettle200.WortPV = MashTun200.WortPV 
-
-            # Send ProductionID and MaterialID Information to Downstream Assets BoilKettle200->Fermenter200
-            if (BoilKettle200.NewState == NewStateEnum.Running):
-                Fermenter200.Next_ProductionID = BoilKettle200.DownStream_ProductionID
-                Fermenter200.Next_ItemID = BoilKettle200.DownStream_ItemID
-
-            # Send Produced Information to Downstream Assets BoilKettle200->Fermenter200 for Consumption
-            if (BoilKettle200.NewStatus == NewStatusEnum.Draining):
-                Fermenter200.Cons_BrewedWort_Item = BoilKettle200.Prod_BrewedWort_Item
-                Fermenter200.Cons_BrewedWort_FromLot = BoilKettle200.Prod_BrewedWort_ToLot
-
-            if (Fermenter200.NewState == NewStateEnum.Ready):
-                BoilKettle200.FermenterReady = True
-            else:
-                BoilKettle200.FermenterReady = False 
-
-            if (BoilKettle200.NewStatus == NewStatusEnum.Filling) and (MashTun200.NewStatus != NewStatusEnum.Draining):
-                BoilKettle200.MashShipComplete = True     
-
-            # Update BoilKettle200
-            BoilKettle200.Run()
-
-            Fermenter200.StartCmd = BoilKettle200.OutletPump.AuxContact
-            Fermenter200.BrewKettleShipComplete = BoilKettle200.ShipComplete or (BoilKettle200.NewState == NewStateEnum.Aborted and Fermenter200.NewStatus == NewStatusEnum.Filling)
-    
-            if (BoilKettle200.NewStatus == NewStatusEnum.Draining) and (BoilKettle200.NewState == NewStateEnum.Running):
-                Fermenter200.BrewedWortPV = BoilKettle200.BrewedWortPV
-
-            # Update Fermenter200   
-            Fermenter200.Run()
-
-            # Update Bright Tanks
-            BrightTank301.Run()
-            BrightTank302.Run()
-            BrightTank303.Run()
-            BrightTank304.Run()
-            BrightTank305.Run()
-
-            #Update Bottling Lines
-            BottleLine401.Run()
-            BottleLine402.Run()
-            BottleLine403.Run()
+        # Start the outputs, every output runs on its own worker thread
+        for sink in sinks:
+            sink.Start(tags)
+
+        if (metrics_endpoint is not None):
+            metrics_endpoint.Start()
+
+        if (genealogy_endpoint is not None):
+            genealogy_endpoint.Start()
+
+        # Replay the tag log, the plant is not simulated
+        if (replayer is not None):
+            for scantime, changed in replayer.Replay(replay_values):
+                scanstart = time.perf_counter()
+                if (runtime_config is not None) and (runtime_config.Poll(time.time())):
+                    for sink in sinks:
+                        if isinstance(sink, SiteWiseSink):
+                            sink.Interval = runtime_config.Interval
+                for index in changed:
+                    if (tag_variables[index] is not None):
+                        tag_variables[index].set_value(replay_values[index])
+                values = list(replay_values)
+                if (amplifier is not None):
+                    if (amplifier.Update(values)):
+                        for variable, value in zip(amplifier_variables, amplifier.Values):
+                            variable.set_value(value)
+                        opc_writes.Inc(len(amplifier_variables))
+                    values = values + amplifier.Values
+                if (asyncopc):
+                    server.Flush()
+                if (sinks):
+                    scan = scan + 1
+                    snapshot = Snapshot(scan, scantime, values)
+                    for sink in sinks:
+                        sink.Put(snapshot)
+                    if (args.sinkstatsinterval > 0) and ((snapshot.Time - laststatstime) >= args.sinkstatsinterval):
+                        laststatstime = snapshot.Time
+                        for sink in sinks:
+                            print("Sink statistics: {0}".format(sink.Stats(snapshot.Time)))
+                scans_total.Inc()
+                scan_duration.Observe(time.perf_counter() - scanstart)
+                opc_writes.Inc(len(changed))
+            print("Replayed {0} scans of {1}".format(replayer.Scans, args.replay))
+
+        while (replayer is None):
+
+            scanstart = time.perf_counter()
+
+            # Apply the runtime configuration between two scans when its document changed
+            if (runtime_config is not None) and (runtime_config.Poll(time.time())):
+                for sink in sinks:
+                    if isinstance(sink, SiteWiseSink):
+                        sink.Interval = runtime_config.Interval
+
+            # Only one scan out of --profileevery is profiled
+            profiling = profile and profiler.BeginScan()
+
+            # Run the plant - allocations, material transfers and the Run() of every asset
+            plant.Run(profiler if profiling else None)
+
+            if (profiling):
+                profiler.Mark()
+
+            # Record the lot transfers of this scan in the lot genealogy
+            if (genealogy is not None):
+                genealogy.Capture(time.time())
+                if (profiling):
+                    profiler.Lap("Genealogy")
             
             #######################################################################
             # Map asset runtime values to OPC Data Items for OPC Client Consumption
@@ -1863,8 +1344,8 @@ if __name__ == "__main__":
             R100_Temperature_SP.set_value(Roaster100.TemperatureSP)
             R100_HoldTime_PT.set_value(Roaster100.HoldTime.PT)  
             R100_HoldTime_ET.set_value(Roaster100.HoldTime.ET) 
-            R100_State.set_value(Roaster100.NewState)
-            R100_Status.set_value(Roaster100.NewStatus)  
+            R100_State.set_value(NewStateNames[Roaster100.NewState])
+            R100_Status.set_value(NewStatusNames[Roaster100.NewStatus])  
             R100_MaterialID.set_value(Roaster100.MaterialID)    
             R100_ProductionID.set_value(Roaster100.ProductionID)
             R100_Cons_RawBarley_Item.set_value(Roaster100.Cons_RawBarley_Item)
@@ -1884,8 +1365,8 @@ if __name__ == "__main__":
             R200_Temperature_SP.set_value(Roaster200.TemperatureSP)
             R200_HoldTime_PT.set_value(Roaster200.HoldTime.PT)  
             R200_HoldTime_ET.set_value(Roaster200.HoldTime.ET) 
-            R200_State.set_value(Roaster200.NewState)
-            R200_Status.set_value(Roaster200.NewStatus)  
+            R200_State.set_value(NewStateNames[Roaster200.NewState])
+            R200_Status.set_value(NewStatusNames[Roaster200.NewStatus])  
             R200_MaterialID.set_value(Roaster200.MaterialID)       
             R200_ProductionID.set_value(Roaster200.ProductionID)    
             R200_Cons_RawBarley_Item.set_value(Roaster200.Cons_RawBarley_Item)  
@@ -1905,19 +1386,21 @@ if __name__ == "__main__":
             MM100_MaltAuger_PV.set_value(MaltMill100.MaltAuger.PV)
             MM100_MaltMill_AuxContact.set_value(MaltMill100.MaltMill.AuxContact)
             MM100_MaltMill_PV.set_value(MaltMill100.MaltMill.PV)
-            MM100_State.set_value(MaltMill100.NewState)
+            MM100_State.set_value(NewStateNames[MaltMill100.NewState])
 
             # Mash100             
             M100_Agitator_AuxContact.set_value(MashTun100.Agitator.AuxContact)
             M100_Agitator_PV.set_value(MashTun100.Agitator.PV)
             M100_Cons_Malt_FromLot.set_value(MashTun100.Cons_Malt_FromLot)
             M100_Cons_Malt_Item.set_value(MashTun100.Cons_Malt_Item)
+            M100_Cons_Malt_Queued.set_value(MashTun100.ConsList.Count)
+            M100_Cons_Malt_Overflow.set_value(MashTun100.ConsList.Overflow)
             M100_HoldTime_PT.set_value(MashTun100.HoldTime.PT)
             M100_HoldTime_ET.set_value(MashTun100.HoldTime.ET)
             M100_Level_PV.set_value(MashTun100.LevelPV)
             M100_MaterialID.set_value(MashTun100.MaterialID)
-            M100_State.set_value(MashTun100.NewState)
-            M100_Status.set_value(MashTun100.NewStatus)
+            M100_State.set_value(NewStateNames[MashTun100.NewState])
+            M100_Status.set_value(NewStatusNames[MashTun100.NewStatus])
             M100_OutletPump_AuxContact.set_value(MashTun100.OutletPump.AuxContact)
             M100_OutletPump_PV.set_value(MashTun100.OutletPump.PV)
             M100_OutletValve_CLS.set_value(MashTun100.OutletValve.CLS)
@@ -1955,19 +1438,21 @@ if __name__ == "__main__":
             MM200_MaltAuger_PV.set_value(MaltMill200.MaltAuger.PV)
             MM200_MaltMill_AuxContact.set_value(MaltMill200.MaltMill.AuxContact)
             MM200_MaltMill_PV.set_value(MaltMill200.MaltMill.PV)
-            MM200_State.set_value(MaltMill200.NewState)     
+            MM200_State.set_value(NewStateNames[MaltMill200.NewState])     
 
             # Mash200             
             M200_Agitator_AuxContact.set_value(MashTun200.Agitator.AuxContact)
             M200_Agitator_PV.set_value(MashTun200.Agitator.PV)
             M200_Cons_Malt_FromLot.set_value(MashTun200.Cons_Malt_FromLot)
             M200_Cons_Malt_Item.set_value(MashTun200.Cons_Malt_Item)
+            M200_Cons_Malt_Queued.set_value(MashTun200.ConsList.Count)
+            M200_Cons_Malt_Overflow.set_value(MashTun200.ConsList.Overflow)
             M200_HoldTime_PT.set_value(MashTun200.HoldTime.PT)
             M200_HoldTime_ET.set_value(MashTun200.HoldTime.ET)
             M200_Level_PV.set_value(MashTun200.LevelPV)
             M200_MaterialID.set_value(MashTun200.MaterialID)
-            M200_State.set_value(MashTun200.NewState)
-            M200_Status.set_value(MashTun200.NewStatus)
+            M200_State.set_value(NewStateNames[MashTun200.NewState])
+            M200_Status.set_value(NewStatusNames[MashTun200.NewStatus])
             M200_OutletPump_AuxContact.set_value(MashTun200.OutletPump.AuxContact)
             M200_OutletPump_PV.set_value(MashTun200.OutletPump.PV)
             M200_OutletValve_CLS.set_value(MashTun200.OutletValve.CLS)
@@ -2007,8 +1492,8 @@ if __name__ == "__main__":
             BK100_HoldTime_ET.set_value(BoilKettle100.HoldTime.ET)
             BK100_Level_PV.set_value(BoilKettle100.LevelPV)
             BK100_MaterialID.set_value(BoilKettle100.MaterialID)
-            BK100_State.set_value(BoilKettle100.NewState)
-            BK100_Status.set_value(BoilKettle100.NewStatus)
+            BK100_State.set_value(NewStateNames[BoilKettle100.NewState])
+            BK100_Status.set_value(NewStatusNames[BoilKettle100.NewStatus])
             BK100_OutletPump_AuxContact.set_value(BoilKettle100.OutletPump.AuxContact)
             BK100_OutletPump_PV.set_value(BoilKettle100.OutletPump.PV)
             BK100_InletValve_CLS.set_value(BoilKettle100.InletValve.CLS)
@@ -2044,8 +1529,8 @@ if __name__ == "__main__":
             BK200_HoldTime_ET.set_value(BoilKettle200.HoldTime.ET)
             BK200_Level_PV.set_value(BoilKettle200.LevelPV)
             BK200_MaterialID.set_value(BoilKettle200.MaterialID)
-            BK200_State.set_value(BoilKettle200.NewState)
-            BK200_Status.set_value(BoilKettle200.NewStatus)
+            BK200_State.set_value(NewStateNames[BoilKettle200.NewState])
+            BK200_Status.set_value(NewStatusNames[BoilKettle200.NewStatus])
             BK200_OutletPump_AuxContact.set_value(BoilKettle200.OutletPump.AuxContact)
             BK200_OutletPump_PV.set_value(BoilKettle200.OutletPump.PV)
             BK200_InletValve_CLS.set_value(BoilKettle200.InletValve.CLS)
@@ -2084,8 +1569,8 @@ if __name__ == "__main__":
             F100_HoldTime_ET.set_value(Fermenter100.HoldTime.ET)
             F100_Level_PV.set_value(Fermenter100.LevelPV)
             F100_MaterialID.set_value(Fermenter100.MaterialID)
-            F100_State.set_value(Fermenter100.NewState)
-            F100_Status.set_value(Fermenter100.NewStatus)
+            F100_State.set_value(NewStateNames[Fermenter100.NewState])
+            F100_Status.set_value(NewStatusNames[Fermenter100.NewStatus])
             F100_GreenBeer_PV.set_value(Fermenter100.GreenBeerPV)
             F100_InletValve_CLS.set_value(Fermenter100.InletValve.CLS)
             F100_InletValve_OLS.set_value(Fermenter100.InletValve.OLS)
@@ -2121,8 +1606,8 @@ if __name__ == "__main__":
             F200_HoldTime_ET.set_value(Fermenter200.HoldTime.ET)
             F200_Level_PV.set_value(Fermenter200.LevelPV)
             F200_MaterialID.set_value(Fermenter200.MaterialID)
-            F200_State.set_value(Fermenter200.NewState)
-            F200_Status.set_value(Fermenter200.NewStatus)
+            F200_State.set_value(NewStateNames[Fermenter200.NewState])
+            F200_Status.set_value(NewStatusNames[Fermenter200.NewStatus])
             F200_GreenBeer_PV.set_value(Fermenter200.GreenBeerPV)
             F200_InletValve_CLS.set_value(Fermenter200.InletValve.CLS)
             F200_InletValve_OLS.set_value(Fermenter200.InletValve.OLS)
@@ -2157,8 +1642,8 @@ if __name__ == "__main__":
             BT301_HoldTime_ET.set_value(BrightTank301.HoldTime.ET)
             BT301_Level_PV.set_value(BrightTank301.LevelPV)
             BT301_MaterialID.set_value(BrightTank301.MaterialID)
-            BT301_State.set_value(BrightTank301.NewState)
-            BT301_Status.set_value(BrightTank301.NewStatus)
+            BT301_State.set_value(NewStateNames[BrightTank301.NewState])
+            BT301_Status.set_value(NewStatusNames[BrightTank301.NewStatus])
             BT301_Beer_PV.set_value(BrightTank301.BeerPV)
             BT301_Beer_SP.set_value(BrightTank301.BeerSP)
             BT301_InletValve_CLS.set_value(BrightTank301.InletValve.CLS)
@@ -2190,8 +1675,8 @@ if __name__ == "__main__":
             BT302_HoldTime_ET.set_value(BrightTank302.HoldTime.ET)
             BT302_Level_PV.set_value(BrightTank302.LevelPV)
             BT302_MaterialID.set_value(BrightTank302.MaterialID)
-            BT302_State.set_value(BrightTank302.NewState)
-            BT302_Status.set_value(BrightTank302.NewStatus)
+            BT302_State.set_value(NewStateNames[BrightTank302.NewState])
+            BT302_Status.set_value(NewStatusNames[BrightTank302.NewStatus])
             BT302_Beer_PV.set_value(BrightTank302.BeerPV)
             BT302_Beer_SP.set_value(BrightTank302.BeerSP)
             BT302_InletValve_CLS.set_value(BrightTank302.InletValve.CLS)
@@ -2223,8 +1708,8 @@ if __name__ == "__main__":
             BT303_HoldTime_ET.set_value(BrightTank303.HoldTime.ET)
             BT303_Level_PV.set_value(BrightTank303.LevelPV)
             BT303_MaterialID.set_value(BrightTank303.MaterialID)
-            BT303_State.set_value(BrightTank303.NewState)
-            BT303_Status.set_value(BrightTank303.NewStatus)
+            BT303_State.set_value(NewStateNames[BrightTank303.NewState])
+            BT303_Status.set_value(NewStatusNames[BrightTank303.NewStatus])
             BT303_Beer_PV.set_value(BrightTank303.BeerPV)
             BT303_Beer_SP.set_value(BrightTank303.BeerSP)
             BT303_InletValve_CLS.set_value(BrightTank303.InletValve.CLS)
@@ -2256,8 +1741,8 @@ if __name__ == "__main__":
             BT304_HoldTime_ET.set_value(BrightTank304.HoldTime.ET)
             BT304_Level_PV.set_value(BrightTank304.LevelPV)
             BT304_MaterialID.set_value(BrightTank304.MaterialID)
-            BT304_State.set_value(BrightTank304.NewState)
-            BT304_Status.set_value(BrightTank304.NewStatus)
+            BT304_State.set_value(NewStateNames[BrightTank304.NewState])
+            BT304_Status.set_value(NewStatusNames[BrightTank304.NewStatus])
             BT304_Beer_PV.set_value(BrightTank304.BeerPV)
             BT304_Beer_SP.set_value(BrightTank304.BeerSP)
             BT304_InletValve_CLS.set_value(BrightTank304.InletValve.CLS)
@@ -2289,8 +1774,8 @@ if __name__ == "__main__":
             BT305_HoldTime_ET.set_value(BrightTank305.HoldTime.ET)
             BT305_Level_PV.set_value(BrightTank305.LevelPV)
             BT305_MaterialID.set_value(BrightTank305.MaterialID)
-            BT305_State.set_value(BrightTank305.NewState)
-            BT305_Status.set_value(BrightTank305.NewStatus)
+            BT305_State.set_value(NewStateNames[BrightTank305.NewState])
+            BT305_Status.set_value(NewStatusNames[BrightTank305.NewStatus])
             BT305_Beer_PV.set_value(BrightTank305.BeerPV)
             BT305_Beer_SP.set_value(BrightTank305.BeerSP)
             BT305_InletValve_CLS.set_value(BrightTank305.InletValve.CLS)
@@ -2335,8 +1820,8 @@ if __name__ == "__main__":
             BL401_Temperature_SP.set_value(BottleLine401.TemperatureSP)
             BL401_HoldTime_PT.set_value(BottleLine401.HoldTime.PT)
             BL401_HoldTime_ET.set_value(BottleLine401.HoldTime.ET)
-            BL401_State.set_value(BottleLine401.NewState)
-            BL401_Status.set_value(BottleLine401.NewStatus)        
+            BL401_State.set_value(NewStateNames[BottleLine401.NewState])
+            BL401_Status.set_value(NewStatusNames[BottleLine401.NewStatus])        
             BL401_UtilizationState.set_value(BottleLine401.UtilizationState) 
             BL401_Utilization.set_value(BottleLine401.Utilization)        
             BL401_Scrap.set_value(BottleLine401.Scrap)
@@ -2365,8 +1850,8 @@ if __name__ == "__main__":
             BL402_Temperature_SP.set_value(BottleLine402.TemperatureSP)
             BL402_HoldTime_PT.set_value(BottleLine402.HoldTime.PT)
             BL402_HoldTime_ET.set_value(BottleLine402.HoldTime.ET)
-            BL402_State.set_value(BottleLine402.NewState)
-            BL402_Status.set_value(BottleLine402.NewStatus)        
+            BL402_State.set_value(NewStateNames[BottleLine402.NewState])
+            BL402_Status.set_value(NewStatusNames[BottleLine402.NewStatus])        
             BL402_UtilizationState.set_value(BottleLine402.UtilizationState) 
             BL402_Utilization.set_value(BottleLine402.Utilization)        
             BL402_Scrap.set_value(BottleLine402.Scrap)
@@ -2395,16 +1880,102 @@ if __name__ == "__main__":
             BL403_Temperature_SP.set_value(BottleLine403.TemperatureSP)
             BL403_HoldTime_PT.set_value(BottleLine403.HoldTime.PT)
             BL403_HoldTime_ET.set_value(BottleLine403.HoldTime.ET)
-            BL403_State.set_value(BottleLine403.NewState)
-            BL403_Status.set_value(BottleLine403.NewStatus)        
+            BL403_State.set_value(NewStateNames[BottleLine403.NewState])
+            BL403_Status.set_value(NewStatusNames[BottleLine403.NewStatus])        
             BL403_UtilizationState.set_value(BottleLine403.UtilizationState) 
             BL403_Utilization.set_value(BottleLine403.Utilization)        
             BL403_Scrap.set_value(BottleLine403.Scrap)            
 
+            # Change storms - the emergency stop of the assets or offset values written over this scan's values
+            if (burst is not None):
+                burst_stats = burst.Run(time.time())
+                if (burst_stats is not None):
+                    print("Burst statistics: {0}".format(burst_stats))
+
+            # Hand the values changed in this scan over to the asyncua event loop
+            if (asyncopc):
+                server.Flush()
+
+            if (profiling):
+                profiler.Lap("OPC")
+
+            if (sinks) or (amplifier is not None):
+                values = [getter(asset) for asset, getter in tag_getters]
+                if (burst is not None):
+                    burst.Apply(values)
+
+            # Update the derived tags of the amplification from this scan's values
+            if (amplifier is not None):
+                if (amplifier.Update(values)):
+                    for variable, value in zip(amplifier_variables, amplifier.Values):
+                        variable.set_value(value)
+                    opc_writes.Inc(len(amplifier_variables))
+                    if (asyncopc):
+                        server.Flush()
+                values = values + amplifier.Values
+                if (profiling):
+                    profiler.Lap("Amplify")
+
+            # Add this scan to the rolling windows of the OEE, the measures are written every --oeeinterval
+            if (oee is not None):
+                if (oee.Update(time.time())):
+                    for variable, value in zip(oee_variables, oee.Values):
+                        variable.set_value(value)
+                    opc_writes.Inc(len(oee_variables))
+                    if (asyncopc):
+                        server.Flush()
+                if (sinks):
+                    values = values + oee.Values
+                if (profiling):
+                    profiler.Lap("OEE")
+
+            #######################################################################
+            # Hand this scan's values to the outputs (sinks)
+            #######################################################################
+
+            if (sinks):
+                scan = scan + 1
+                snapshot = Snapshot(scan, time.time(), values)
+                for sink in sinks:
+                    sink.Put(snapshot)
+
+                if (args.sinkstatsinterval > 0) and ((snapshot.Time - laststatstime) >= args.sinkstatsinterval):
+                    laststatstime = snapshot.Time
+                    for sink in sinks:
+                        print("Sink statistics: {0}".format(sink.Stats(snapshot.Time)))
+
+            if (profiling):
+                profiler.Lap("Sinks")
+                profiler.EndScan()
+
+            if (profile) and ((time.time() - lastprofiletime) >= args.profileinterval):
+                lastprofiletime = time.time()
+                profiler.Publish(Diagnostics, addspace)
+
+            # Scan metrics, the scan overruns when it takes longer than the scan rate
+            scanduration = time.perf_counter() - scanstart
+            scans_total.Inc()
+            scan_duration.Observe(scanduration)
+            opc_writes.Inc(opc_variables)
+            if (scanduration > 0.1):
+                scan_overruns.Inc()
+
             # Set Scan rate
             time.sleep(.1)   
 
     finally:
         #close connection, remove subcsriptions, etc
         server.stop()
+
+        for sink in sinks:
+            sink.Stop()
+
+        if (metrics_endpoint is not None):
+            metrics_endpoint.Stop()
+
+        if (genealogy_endpoint is not None):
+            genealogy_endpoint.Stop()
+
+        if (genealogy is not None):
+            genealogy.Close()
         
@@ -42,6 +42,9 @@ class pidLoop:
 
     """  
 
+    # Fixed attributes, no per instance __dict__
+    __slots__ = ("Name", "Out", "SP", "PV", "K", "Bias", "MassOffset", "PVincreaseMultiplier", "Ti", "Enabled")
+
     # Class Constructor
     def __init__(self, Name, Bias, K, MassOffset, Ti, PVincreaseMultiplier):
         self.Name = Name